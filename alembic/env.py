@@ -20,6 +20,8 @@ from app.models.companyRecruiterModel import CompanyRecruiter
 from app.models.interviewAvailabilityModel import InterviewAvailabilityModel
 from app.models.jobPostingModel import JobPosting
 from app.models.jobAnalysisModel import JobAnalysisModel
+from app.models.llmResultCacheModel import LLMResultCacheModel
+from app.models.resumeTextModel import ResumeTextModel
 from app.models.aiUsageModel import AIQuotaGrantModel, AIUsageEventModel
 from app.models.userStatsModel import UserStatsModel
 from app.models.resourceModel import ResourceModel, ResourceModuleModel, ResourceLessonModel
@@ -0,0 +1,64 @@
+"""add job postings keyset pagination indexes
+
+Supports cursor pagination of the job board and company listings on the
+``(created_at, id)`` ordering. The company-scoped index supersedes
+``ix_job_postings_company_created_at``, which is a prefix of it.
+
+Revision ID: 0a1b2c3d4e5f
+Revises: e4f6a7b8c9d0
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a1b2c3d4e5f"
+down_revision: Union[str, Sequence[str], None] = "e4f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_indexes() -> set[str]:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("job_postings")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = _existing_indexes()
+    if "ix_job_postings_created_at_id" not in existing:
+        op.create_index(
+            "ix_job_postings_created_at_id",
+            "job_postings",
+            ["created_at", "id"],
+            unique=False,
+        )
+    if "ix_job_postings_company_created_at_id" not in existing:
+        op.create_index(
+            "ix_job_postings_company_created_at_id",
+            "job_postings",
+            ["company_id", "created_at", "id"],
+            unique=False,
+        )
+    if "ix_job_postings_company_created_at" in existing:
+        op.drop_index("ix_job_postings_company_created_at", table_name="job_postings")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = _existing_indexes()
+    if "ix_job_postings_company_created_at" not in existing:
+        op.create_index(
+            "ix_job_postings_company_created_at",
+            "job_postings",
+            ["company_id", "created_at"],
+            unique=False,
+        )
+    if "ix_job_postings_company_created_at_id" in existing:
+        op.drop_index("ix_job_postings_company_created_at_id", table_name="job_postings")
+    if "ix_job_postings_created_at_id" in existing:
+        op.drop_index("ix_job_postings_created_at_id", table_name="job_postings")
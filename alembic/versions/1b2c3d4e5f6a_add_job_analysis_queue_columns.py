@@ -0,0 +1,50 @@
+"""add job analysis queue columns
+
+CV analyses are processed from a table queue on ``job_analysis`` instead of
+in-process background tasks. Workers claim due rows with
+``FOR UPDATE SKIP LOCKED`` and hold them under a lease.
+
+Revision ID: 1b2c3d4e5f6a
+Revises: 0a1b2c3d4e5f
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1b2c3d4e5f6a"
+down_revision: Union[str, Sequence[str], None] = "0a1b2c3d4e5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "job_analysis",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("job_analysis", sa.Column("available_at", sa.DateTime(), nullable=True))
+    op.add_column("job_analysis", sa.Column("lease_expires_at", sa.DateTime(), nullable=True))
+    op.add_column("job_analysis", sa.Column("quota_key", sa.String(length=128), nullable=True))
+    op.add_column("job_analysis", sa.Column("dead_lettered_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_job_analysis_status_available_at",
+        "job_analysis",
+        ["status", "available_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_job_analysis_status_available_at", table_name="job_analysis")
+    op.drop_column("job_analysis", "dead_lettered_at")
+    op.drop_column("job_analysis", "quota_key")
+    op.drop_column("job_analysis", "lease_expires_at")
+    op.drop_column("job_analysis", "available_at")
+    op.drop_column("job_analysis", "attempts")
@@ -0,0 +1,52 @@
+"""add llm result cache
+
+Shared, content-addressed cache of validated resume analyses, plus the text
+hash on ``resumes`` that links a resume to its cache entries so they can be
+purged when the resume is deleted.
+
+Revision ID: 2c3d4e5f6a7b
+Revises: 1b2c3d4e5f6a
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2c3d4e5f6a7b"
+down_revision: Union[str, Sequence[str], None] = "1b2c3d4e5f6a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "llm_result_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("text_sha256", sa.String(length=64), nullable=False),
+        sa.Column("prompt_version", sa.String(length=32), nullable=False),
+        sa.Column("model_name", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_hit_at", sa.DateTime(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index("ix_llm_result_cache_text_sha256", "llm_result_cache", ["text_sha256"], unique=False)
+    op.create_index("ix_llm_result_cache_expires_at", "llm_result_cache", ["expires_at"], unique=False)
+    op.add_column("resumes", sa.Column("text_sha256", sa.String(length=64), nullable=True))
+    op.create_index("ix_resumes_text_sha256", "resumes", ["text_sha256"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_resumes_text_sha256", table_name="resumes")
+    op.drop_column("resumes", "text_sha256")
+    op.drop_index("ix_llm_result_cache_expires_at", table_name="llm_result_cache")
+    op.drop_index("ix_llm_result_cache_text_sha256", table_name="llm_result_cache")
+    op.drop_table("llm_result_cache")
@@ -0,0 +1,40 @@
+"""add resume texts
+
+Extracted resume text, stored compressed once per storage file so consumers
+stop re-downloading and re-parsing the same document.
+
+Revision ID: 3d4e5f6a7b8c
+Revises: 2c3d4e5f6a7b
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d4e5f6a7b8c"
+down_revision: Union[str, Sequence[str], None] = "2c3d4e5f6a7b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "resume_texts",
+        sa.Column("storage_file_id", sa.String(length=255), nullable=False),
+        sa.Column("codec", sa.String(length=16), nullable=False, server_default="zlib"),
+        sa.Column("compressed_text", sa.LargeBinary(), nullable=False),
+        sa.Column("text_length", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("extractor_version", sa.String(length=16), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("storage_file_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("resume_texts")
@@ -0,0 +1,33 @@
+"""add resume content sha256
+
+Hash of the uploaded bytes, so re-uploading an identical file reuses the
+stored object.
+
+Revision ID: 4e5f6a7b8c9d
+Revises: 3d4e5f6a7b8c
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4e5f6a7b8c9d"
+down_revision: Union[str, Sequence[str], None] = "3d4e5f6a7b8c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("resumes", sa.Column("content_sha256", sa.String(length=64), nullable=True))
+    op.create_index("ix_resumes_content_sha256", "resumes", ["content_sha256"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_resumes_content_sha256", table_name="resumes")
+    op.drop_column("resumes", "content_sha256")
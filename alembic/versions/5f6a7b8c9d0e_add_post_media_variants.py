@@ -0,0 +1,34 @@
+"""add post media variants
+
+Manifest of the resized WebP/JPEG variants rendered for a post image.
+
+Revision ID: 5f6a7b8c9d0e
+Revises: 4e5f6a7b8c9d
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f6a7b8c9d0e"
+down_revision: Union[str, Sequence[str], None] = "4e5f6a7b8c9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "posts",
+        sa.Column("media_variants", sa.JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("posts", "media_variants")
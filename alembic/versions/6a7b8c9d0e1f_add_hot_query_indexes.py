@@ -0,0 +1,64 @@
+"""add hot query indexes
+
+Indexes for hot statements whose filter and sort columns had no matching
+index in the schema, so PostgreSQL would have to scan and sort the table.
+Chosen by reading the statements, not from measured plans; the EXPLAIN suite
+(``scripts/explain_hot_queries.py``) checks each one is used once run
+against a seeded database:
+
+* role lookups on ``lower(job_skills.target_role)``;
+* company applicant lists ordered by ``application_date``;
+* a conversation's messages by ``created_at``;
+* a community's feed by ``created_at``;
+* a post's comments (and the feed's per-post comment counts).
+
+Built ``CONCURRENTLY`` on PostgreSQL so writes to these tables are not
+blocked while the indexes are built.
+
+Revision ID: 6a7b8c9d0e1f
+Revises: 5f6a7b8c9d0e
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6a7b8c9d0e1f"
+down_revision: Union[str, Sequence[str], None] = "5f6a7b8c9d0e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns or expressions)
+_INDEXES = (
+    ("ix_job_skills_lower_target_role_job_posting", "job_skills", [sa.text("lower(target_role)"), "job_posting_id"]),
+    ("ix_applications_company_application_date", "applications", ["company_id", "application_date", "created_at"]),
+    ("ix_messages_conversation_created_at", "messages", ["conversation_id", "created_at"]),
+    ("ix_community_posts_community_created_at", "community_posts", ["community_id", "created_at"]),
+    ("ix_community_post_comments_post_created_at", "community_post_comments", ["post_id", "created_at"]),
+)
+
+
+def _existing_indexes(table: str) -> set[str]:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            if name not in _existing_indexes(table):
+                op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(_INDEXES):
+            if name in _existing_indexes(table):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from dotenv import load_dotenv
@@ -14,7 +15,7 @@ from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from app.db import create_db_and_tables
+from app.db import create_db_and_tables, has_read_replica, mark_recent_write
 from app.template_utils import configure_template_helpers
 import os
 
@@ -36,9 +37,20 @@ from app.routes.resourceRoute import router as resource_router
 from app.routes.roadmapRoute import router as roadmap_router
 from app.routes.adminRoute import router as admin_router
 from app.routes.capstoneAnalyticsRoute import router as capstone_analytics_router
+from app.routes.storageRoute import router as storage_router
+from app.routes.metricsRoute import router as metrics_router
 from app.core.resume_analyzer.resume_text_extractor import shutdown_resume_text_extractors
+from app.core.JobsScraper.linkedin_scraper import close_linkedin_client
+from app.services.storage.imageVariants import shutdown_image_variant_workers
+from app.services.storage.s3Service import shutdown_storage_io
+from app.config import CV_ANALYSIS_EMBEDDED_WORKERS
+from app.workers.cvAnalysisWorker import CVAnalysisWorker
 from app.services.roadmaps.roadmapSeedService import seed_roadmaps_on_startup_if_dev
 from app.middleware.rate_limit import RequestRateLimiter
+from app.middleware.sql_instrumentation import instrument_sql
+from app.middleware.request_metrics import measure_requests
+from app.metrics import run_metrics_flusher
+from app.responses import FastJSONResponse
 from fastapi import Response
 from fastapi.responses import FileResponse
 
@@ -109,10 +121,27 @@ async def lifespan(app: FastAPI):
     # Controlled via ENV/AUTO_CREATE_TABLES in app/db.py
     await create_db_and_tables()
     await seed_roadmaps_on_startup_if_dev()
+    cv_analysis_worker = cv_analysis_worker_task = None
+    if CV_ANALYSIS_EMBEDDED_WORKERS > 0:
+        cv_analysis_worker = CVAnalysisWorker(concurrency=CV_ANALYSIS_EMBEDDED_WORKERS)
+        cv_analysis_worker_task = asyncio.create_task(cv_analysis_worker.run())
+    metrics_flusher_task = asyncio.create_task(run_metrics_flusher())
     try:
         yield
     finally:
+        metrics_flusher_task.cancel()
+        await asyncio.gather(metrics_flusher_task, return_exceptions=True)
+        if cv_analysis_worker is not None:
+            cv_analysis_worker.stop()
+            try:
+                await asyncio.wait_for(cv_analysis_worker_task, timeout=10)
+            except asyncio.TimeoutError:
+                # In-flight analyses are retried once their leases lapse.
+                pass
         shutdown_resume_text_extractors()
+        shutdown_image_variant_workers()
+        shutdown_storage_io()
+        await close_linkedin_client()
 
 
 # Hide interactive API docs / schema in production to avoid exposing the full
@@ -121,6 +150,7 @@ from app.config import IS_PRODUCTION
 
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url=None if IS_PRODUCTION else "/docs",
     redoc_url=None if IS_PRODUCTION else "/redoc",
     openapi_url=None if IS_PRODUCTION else "/openapi.json",
@@ -149,6 +179,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -164,6 +195,25 @@ async def apply_rate_limits(request, call_next):
     return await call_next(request)
 
 
+app.middleware("http")(instrument_sql)
+# Wraps the rate limiter so 429s are measured too (as route "unmatched": they
+# never reach routing).
+app.middleware("http")(measure_requests)
+
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+@app.middleware("http")
+async def pin_writers_to_primary(request, call_next):
+    # Read-your-writes: after a successful write, the caller's replica-backed
+    # reads go to the primary for a few seconds (see get_read_session).
+    response = await call_next(request)
+    if has_read_replica() and request.method not in _SAFE_METHODS and response.status_code < 400:
+        await mark_recent_write(request)
+    return response
+
+
 @app.get("/sitemap.xml", include_in_schema=False)
 async def sitemap():
     return Response(content=_build_sitemap_xml(), media_type="application/xml")
@@ -204,3 +254,5 @@ app.include_router(resource_router, prefix="/api/v1", tags=["resources"])
 app.include_router(roadmap_router, prefix="/api/v1", tags=["roadmaps"])
 app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
 app.include_router(capstone_analytics_router, prefix="/api/v1", tags=["capstone"])
+app.include_router(storage_router, prefix="/api/v1", tags=["storage"])
+app.include_router(metrics_router)
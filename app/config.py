@@ -47,11 +47,131 @@ AI_KILL_SWITCH = env_flag("AI_KILL_SWITCH", "0")
 # until a real email provider is wired so existing users are not locked out.
 REQUIRE_VERIFIED_FOR_AI = env_flag("REQUIRE_VERIFIED_FOR_AI", "0")
 
+# Shared cache of validated LLM resume analyses, keyed by resume text, prompt
+# version and model. 0 disables it.
+LLM_RESULT_CACHE_TTL_SECONDS = env_int("LLM_RESULT_CACHE_TTL_SECONDS", 30 * 86_400, minimum=0)
+
+# Per-process Gemini concurrency (see llm_gateway). The limit starts at the
+# initial value, halves when the provider pushes back and creeps back up to
+# the max on success.
+LLM_GATEWAY_INITIAL_CONCURRENCY = env_int("LLM_GATEWAY_INITIAL_CONCURRENCY", 8, minimum=1)
+LLM_GATEWAY_MIN_CONCURRENCY = env_int("LLM_GATEWAY_MIN_CONCURRENCY", 1, minimum=1)
+LLM_GATEWAY_MAX_CONCURRENCY = env_int("LLM_GATEWAY_MAX_CONCURRENCY", 16, minimum=1)
+
 # --- Uploads ---------------------------------------------------------------
 # Hard cap on resume upload size to prevent memory exhaustion / storage abuse.
 MAX_UPLOAD_BYTES = env_int("MAX_UPLOAD_BYTES", 5_000_000, minimum=1)
+# Uploads are read in chunks of this size and kept in memory up to the spool
+# threshold, then rolled over to a temp file.
+UPLOAD_CHUNK_BYTES = env_int("UPLOAD_CHUNK_BYTES", 64 * 1024, minimum=1024)
+UPLOAD_SPOOL_MEMORY_BYTES = env_int("UPLOAD_SPOOL_MEMORY_BYTES", 1024 * 1024, minimum=0)
+# Objects at or above the threshold go to S3 as a multipart upload (S3's
+# minimum part size is 5 MiB).
+STORAGE_MULTIPART_THRESHOLD_BYTES = env_int("STORAGE_MULTIPART_THRESHOLD_BYTES", 8 * 1024 * 1024, minimum=5 * 1024 * 1024)
+STORAGE_MULTIPART_CHUNK_BYTES = env_int("STORAGE_MULTIPART_CHUNK_BYTES", 8 * 1024 * 1024, minimum=5 * 1024 * 1024)
+# Object storage I/O: a dedicated thread pool, a keep-alive connection pool
+# shared by all S3Service instances, and the chunk size used when streaming
+# downloads to clients.
+STORAGE_IO_THREADS = env_int("STORAGE_IO_THREADS", 16, minimum=1)
+STORAGE_MAX_POOL_CONNECTIONS = env_int("STORAGE_MAX_POOL_CONNECTIONS", 32, minimum=1)
+STORAGE_STREAM_CHUNK_BYTES = env_int("STORAGE_STREAM_CHUNK_BYTES", 256 * 1024, minimum=1024)
+# "s3" (default) or "local". The local backend keeps objects under
+# LOCAL_STORAGE_ROOT/<bucket>/ and serves them itself through signed URLs.
+STORAGE_BACKEND = env_str("STORAGE_BACKEND", "s3").lower()
+LOCAL_STORAGE_ROOT = env_str("LOCAL_STORAGE_ROOT", "var/storage")
+# Prefix for the URLs the local backend hands out; empty keeps them relative.
+LOCAL_STORAGE_BASE_URL = env_str("LOCAL_STORAGE_BASE_URL").rstrip("/")
+# Node-local read-through disk cache in front of remote storage. Empty dir
+# disables it; objects above the per-object cap are never cached.
+STORAGE_CACHE_DIR = env_str("STORAGE_CACHE_DIR")
+STORAGE_CACHE_MAX_BYTES = env_int("STORAGE_CACHE_MAX_BYTES", 1024 * 1024 * 1024, minimum=1)
+STORAGE_CACHE_MAX_OBJECT_BYTES = env_int("STORAGE_CACHE_MAX_OBJECT_BYTES", 64 * 1024 * 1024, minimum=1)
+# "proxy" streams downloads through the API; "redirect" answers authorized
+# downloads with a 307 to a short-lived presigned URL, reused per object until
+# shortly before it expires.
+STORAGE_SERVE_MODE = env_str("STORAGE_SERVE_MODE", "proxy").lower()
+STORAGE_PRESIGNED_URL_TTL_SECONDS = env_int("STORAGE_PRESIGNED_URL_TTL_SECONDS", 300, minimum=30)
+# Resume text extraction runs in a process pool so a hostile document cannot
+# pin the API's GIL or memory. 0 workers parses in a thread instead.
+RESUME_EXTRACTION_WORKERS = env_int("RESUME_EXTRACTION_WORKERS", 2, minimum=0)
+RESUME_EXTRACTION_MAX_PAGES = env_int("RESUME_EXTRACTION_MAX_PAGES", 30, minimum=1)
+# CPU budget per document (checked between pages) and a hard cap, counted
+# from when a worker starts the document, after which extraction fails.
+RESUME_EXTRACTION_CPU_SECONDS = env_int("RESUME_EXTRACTION_CPU_SECONDS", 5, minimum=1)
+RESUME_EXTRACTION_TIMEOUT_SECONDS = env_int("RESUME_EXTRACTION_TIMEOUT_SECONDS", 15, minimum=1)
+# Post images get resized WebP/JPEG variants at these widths, rendered after
+# the upload response in a process pool (0 workers renders in a thread).
+MEDIA_VARIANT_WIDTHS = tuple(
+    sorted({int(width) for width in env_str("MEDIA_VARIANT_WIDTHS", "320,640,1080").split(",") if width.strip().isdigit()})
+) or (320, 640, 1080)
+MEDIA_VARIANT_WORKERS = env_int("MEDIA_VARIANT_WORKERS", 1, minimum=0)
+MEDIA_VARIANT_TIMEOUT_SECONDS = env_int("MEDIA_VARIANT_TIMEOUT_SECONDS", 30, minimum=1)
+# Larger images are refused (decompression bombs) and served as uploaded.
+MEDIA_VARIANT_MAX_PIXELS = env_int("MEDIA_VARIANT_MAX_PIXELS", 40_000_000, minimum=1)
+# Variant width the feed picks when the client does not ask for one.
+FEED_IMAGE_WIDTH = env_int("FEED_IMAGE_WIDTH", 640, minimum=1)
+
+# --- SQL instrumentation -----------------------------------------------------
+# Per-request query counts/timings (Server-Timing outside production, per-route
+# aggregates everywhere). A statement shape repeated this often in one request
+# is reported as a likely N+1.
+SQL_INSTRUMENTATION = env_flag("SQL_INSTRUMENTATION", "1")
+SQL_N_PLUS_ONE_THRESHOLD = env_int("SQL_N_PLUS_ONE_THRESHOLD", 5, minimum=2)
+
+# --- Metrics (/metrics) ------------------------------------------------------
+# Shared directory where every worker writes its samples for /metrics to merge
+# (one file per pid; clear it on deploy). Empty: each worker reports its own.
+METRICS_MULTIPROC_DIR = env_str("METRICS_MULTIPROC_DIR")
+METRICS_FLUSH_SECONDS = env_int("METRICS_FLUSH_SECONDS", 5, minimum=1)
+# Bearer token scrapers must send. Without one, only loopback and private
+# addresses may scrape, and never in production.
+METRICS_TOKEN = env_str("METRICS_TOKEN")
+
+# --- Request rate limits ----------------------------------------------------
+# "strict" checks every rate-limited request against the shared store;
+# "hybrid" lets each worker spend GCRA quota it leased from the store in
+# batches of up to RATE_LIMIT_LEASE_SIZE, refilled in the background.
+RATE_LIMIT_MODE = env_str("RATE_LIMIT_MODE", "strict").lower()
+RATE_LIMIT_LEASE_SIZE = env_int("RATE_LIMIT_LEASE_SIZE", 10, minimum=1)
+RATE_LIMIT_LEASE_TTL_SECONDS = env_int("RATE_LIMIT_LEASE_TTL_SECONDS", 2, minimum=1)
 
 # --- Registration abuse controls ------------------------------------------
 REGISTER_RATE_LIMIT_MAX = env_int("REGISTER_RATE_LIMIT_MAX", 5, minimum=1)
 REGISTER_RATE_LIMIT_WINDOW_SECONDS = env_int("REGISTER_RATE_LIMIT_WINDOW_SECONDS", 3600, minimum=1)
 REGISTER_IP_DAILY_ACCOUNT_CAP = env_int("REGISTER_IP_DAILY_ACCOUNT_CAP", 5, minimum=1)
+
+# --- Job search cache ------------------------------------------------------
+# Internal postings are also invalidated on every company posting change, so
+# their TTL only bounds staleness for expiring postings. LinkedIn results are
+# external and change slowly; they are kept longer to spare the scraper.
+JOB_SEARCH_INTERNAL_CACHE_TTL_SECONDS = env_int("JOB_SEARCH_INTERNAL_CACHE_TTL_SECONDS", 60, minimum=0)
+JOB_SEARCH_EXTERNAL_CACHE_TTL_SECONDS = env_int("JOB_SEARCH_EXTERNAL_CACHE_TTL_SECONDS", 900, minimum=0)
+
+# --- Bulk job-posting import ----------------------------------------------
+# Rows per multi-row INSERT (and per progress event) in the streaming import.
+JOB_POSTING_IMPORT_BATCH_SIZE = env_int("JOB_POSTING_IMPORT_BATCH_SIZE", 200, minimum=1)
+# Upper bound on rows per import so one request cannot monopolize the DB.
+JOB_POSTING_IMPORT_MAX_ROWS = env_int("JOB_POSTING_IMPORT_MAX_ROWS", 5000, minimum=1)
+# A single NDJSON line / CSV record larger than this is rejected instead of
+# being buffered, which keeps import memory flat on malformed input.
+JOB_POSTING_IMPORT_MAX_RECORD_BYTES = env_int("JOB_POSTING_IMPORT_MAX_RECORD_BYTES", 65_536, minimum=1024)
+# Per-row error events kept in the import reply; later ones are only counted.
+JOB_POSTING_IMPORT_MAX_REPORTED_ERRORS = env_int("JOB_POSTING_IMPORT_MAX_REPORTED_ERRORS", 500, minimum=1)
+
+# --- CV analysis queue -----------------------------------------------------
+# Claimed analyses processed at once by one worker process.
+CV_ANALYSIS_WORKER_CONCURRENCY = env_int("CV_ANALYSIS_WORKER_CONCURRENCY", 4, minimum=1)
+# Concurrency of the worker started inside the API process. Set to 0 when
+# dedicated workers (python -m app.workers.cvAnalysisWorker) are deployed.
+CV_ANALYSIS_EMBEDDED_WORKERS = env_int("CV_ANALYSIS_EMBEDDED_WORKERS", 1, minimum=0)
+# How often an idle worker polls for new jobs.
+CV_ANALYSIS_POLL_INTERVAL_MS = env_int("CV_ANALYSIS_POLL_INTERVAL_MS", 1000, minimum=50)
+# A claimed job becomes visible to other workers again after this long, so a
+# crashed worker's jobs are picked up. Workers renew the lease every third of
+# it while the analysis runs.
+CV_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS = env_int("CV_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS", 300, minimum=10)
+# Attempts before a job is dead-lettered (marked failed for good).
+CV_ANALYSIS_MAX_ATTEMPTS = env_int("CV_ANALYSIS_MAX_ATTEMPTS", 3, minimum=1)
+# Exponential retry backoff: base * 2^(attempt-1), capped.
+CV_ANALYSIS_RETRY_BACKOFF_SECONDS = env_int("CV_ANALYSIS_RETRY_BACKOFF_SECONDS", 30, minimum=0)
+CV_ANALYSIS_RETRY_BACKOFF_MAX_SECONDS = env_int("CV_ANALYSIS_RETRY_BACKOFF_MAX_SECONDS", 600, minimum=0)
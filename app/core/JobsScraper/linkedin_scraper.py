@@ -8,22 +8,44 @@ Inputs:
 - limit: max number of jobs to return
 - remote: bool to prefer remote (uses LinkedIn's f_WT=2 filter)
 
+Pages are fetched concurrently on a shared, pooled ``httpx.AsyncClient`` so a
+search never blocks the event loop. Request starts are spaced cooperatively
+with ``asyncio.sleep`` and parsed pages are kept in a small TTL cache keyed by
+``(keywords, location, remote, start)``.
+
 Note: LinkedIn may change markup/endpoint; this scraper is best-effort.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+import logging
+import os
 import time
 import urllib.parse
-import requests
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+import httpx
 from bs4 import BeautifulSoup
 
+LOGGER = logging.getLogger(__name__)
+
 USER_AGENT = (
 	"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
 	"AppleWebKit/537.36 (KHTML, like Gecko) "
 	"Chrome/120.0.0.0 Safari/537.36"
 )
 
+BASE_URL = os.getenv(
+	"LINKEDIN_JOBS_BASE_URL",
+	"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search",
+)
+REQUEST_TIMEOUT_SECONDS = 15.0
+# Concurrent in-flight requests to the LinkedIn host, per process.
+MAX_CONCURRENT_PAGES = max(1, int(os.getenv("LINKEDIN_MAX_CONCURRENT_PAGES", "3")))
+PAGE_CACHE_TTL_SECONDS = float(os.getenv("LINKEDIN_PAGE_CACHE_TTL_SECONDS", "600"))
+PAGE_CACHE_MAX_ENTRIES = 512
+
 
 @dataclass
 class JobPosting:
@@ -34,8 +56,100 @@ class JobPosting:
 	listed_at: Optional[str]
 
 
+PageKey = tuple[str, str, bool, int]
+
+
+class _PageCache:
+	"""Process-wide TTL cache of parsed result pages (LRU-bounded)."""
+
+	def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+		self.ttl_seconds = ttl_seconds
+		self.max_entries = max_entries
+		self._entries: "OrderedDict[PageKey, tuple[float, List[JobPosting]]]" = OrderedDict()
+
+	def get(self, key: PageKey) -> Optional[List[JobPosting]]:
+		entry = self._entries.get(key)
+		if entry is None:
+			return None
+		expires_at, jobs = entry
+		if expires_at <= time.monotonic():
+			self._entries.pop(key, None)
+			return None
+		self._entries.move_to_end(key)
+		return jobs
+
+	def set(self, key: PageKey, jobs: List[JobPosting]) -> None:
+		if self.ttl_seconds <= 0:
+			return
+		self._entries[key] = (time.monotonic() + self.ttl_seconds, jobs)
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_entries:
+			self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		self._entries.clear()
+
+
+_page_cache = _PageCache(PAGE_CACHE_TTL_SECONDS, PAGE_CACHE_MAX_ENTRIES)
+
+
+class _HostSession:
+	"""Pooled client, concurrency limit and request pacing for one event loop.
+
+	``httpx.AsyncClient`` connections and ``asyncio.Semaphore`` waiters belong to
+	the loop they were created on, so the session is rebuilt if the running loop
+	changes (e.g. between test cases).
+	"""
+
+	def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+		self.loop = loop
+		self.client = httpx.AsyncClient(
+			headers={"User-Agent": USER_AGENT},
+			timeout=REQUEST_TIMEOUT_SECONDS,
+			limits=httpx.Limits(
+				max_connections=MAX_CONCURRENT_PAGES,
+				max_keepalive_connections=MAX_CONCURRENT_PAGES,
+			),
+		)
+		self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+		self._next_start = 0.0
+
+	async def throttle(self, interval: float) -> None:
+		# Reserve the next start slot before awaiting, so concurrent callers are
+		# spaced ``interval`` apart without a lock.
+		if interval <= 0:
+			return
+		now = time.monotonic()
+		slot = max(now, self._next_start)
+		self._next_start = slot + interval
+		if slot > now:
+			await asyncio.sleep(slot - now)
+
+
+_session: Optional[_HostSession] = None
+
+
+def _get_session() -> _HostSession:
+	global _session
+	loop = asyncio.get_running_loop()
+	if _session is None or _session.loop is not loop:
+		_session = _HostSession(loop)
+	return _session
+
+
+async def close_linkedin_client() -> None:
+	"""Close the pooled HTTP client (called on application shutdown)."""
+	global _session
+	session, _session = _session, None
+	if session is not None and session.loop is asyncio.get_running_loop():
+		await session.client.aclose()
+
+
+def clear_linkedin_page_cache() -> None:
+	_page_cache.clear()
+
+
 def _build_url(keywords: str, location: str, start: int, remote: bool) -> str:
-	base = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
 	params = {
 		"keywords": keywords,
 		"location": location,
@@ -44,7 +158,7 @@ def _build_url(keywords: str, location: str, start: int, remote: bool) -> str:
 	if remote:
 		# LinkedIn remote filter (work from home)
 		params["f_WT"] = "2"
-	return f"{base}?{urllib.parse.urlencode(params)}"
+	return f"{BASE_URL}?{urllib.parse.urlencode(params)}"
 
 
 def _parse_jobs(html: str) -> List[JobPosting]:
@@ -69,7 +183,39 @@ def _parse_jobs(html: str) -> List[JobPosting]:
 	return jobs
 
 
-def fetch_linkedin_jobs(
+async def _fetch_page(
+	keywords: str,
+	location: str,
+	start: int,
+	remote: bool,
+	throttle_seconds: float,
+) -> Optional[List[JobPosting]]:
+	"""Return the parsed page, or ``None`` when the request failed."""
+	key: PageKey = (keywords, location, remote, start)
+	cached = _page_cache.get(key)
+	if cached is not None:
+		return cached
+
+	session = _get_session()
+	async with session.semaphore:
+		await session.throttle(throttle_seconds)
+		try:
+			resp = await session.client.get(_build_url(keywords, location, start, remote))
+		except httpx.HTTPError as exc:
+			LOGGER.warning("LinkedIn page fetch failed: start=%s error=%s", start, exc)
+			return None
+	if resp.status_code != 200:
+		return None
+
+	# BeautifulSoup parsing is CPU-bound; keep it off the event loop.
+	jobs = await asyncio.to_thread(_parse_jobs, resp.text)
+	# An empty page may be a transient block or markup change; don't pin it.
+	if jobs:
+		_page_cache.set(key, jobs)
+	return jobs
+
+
+async def fetch_linkedin_jobs(
 	keywords: str,
 	location: str,
 	limit: int = 25,
@@ -78,38 +224,56 @@ def fetch_linkedin_jobs(
 ) -> List[JobPosting]:
 	"""
 	Scrape LinkedIn jobs (guest endpoint). Returns up to `limit` results.
+
+	The first page is fetched alone to learn the page size LinkedIn is serving;
+	the remaining pages needed to reach ``limit`` are then fetched concurrently.
+	``start`` is an item offset, so each page advances it by the number of cards
+	it actually held. Once LinkedIn serves a short page the offsets of later
+	pages can no longer be predicted and the rest are fetched one at a time.
 	"""
+	keywords = keywords.strip()
+	location = location.strip()
 	results: List[JobPosting] = []
 	seen_urls = set()
-	start = 0
-	page_size = 25  # LinkedIn often returns 10-25 per page
-
-	while len(results) < limit:
-		url = _build_url(keywords, location, start, remote)
-		resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=15)
-		if resp.status_code != 200:
-			break
-
-		batch = _parse_jobs(resp.text)
-		if not batch:
-			break
 
-		new_items = [j for j in batch if j.url and j.url not in seen_urls]
-		for job in new_items:
-			seen_urls.add(job.url)
-			results.append(job)
+	def _collect(batch: List[JobPosting]) -> int:
+		added = 0
+		for job in batch:
+			if job.url and job.url not in seen_urls:
+				seen_urls.add(job.url)
+				results.append(job)
+				added += 1
+		return added
 
-		increment = len(batch)
-		if increment <= 0 or not new_items:
-			break
+	first = await _fetch_page(keywords, location, 0, remote, throttle_seconds)
+	if not first or not _collect(first):
+		return results[:limit]
 
-		if increment != page_size:
-			page_size = increment
-		start += increment
+	page_size = len(first)
+	next_start = len(first)
+	concurrent = True
+	while len(results) < limit:
+		remaining_pages = -(-(limit - len(results)) // page_size) if concurrent else 1
+		starts = [next_start + index * page_size for index in range(remaining_pages)]
+		pages = await asyncio.gather(
+			*(_fetch_page(keywords, location, page_start, remote, throttle_seconds) for page_start in starts)
+		)
 
-		if len(results) >= limit:
+		exhausted = False
+		for page_start, batch in zip(starts, pages):
+			if page_start != next_start:
+				# An earlier page in this round was short, so this one was
+				# requested at the wrong offset; refetch from ``next_start``.
+				break
+			# A failed, empty or fully-duplicated page means LinkedIn has run
+			# out of results for this query.
+			if not batch or not _collect(batch):
+				exhausted = True
+				break
+			next_start = page_start + len(batch)
+			if len(batch) < page_size:
+				concurrent = False
+		if exhausted:
 			break
 
-		time.sleep(throttle_seconds)
-
 	return results[:limit]
@@ -1,7 +1,8 @@
 """Shared classification of LLM provider errors.
 
 Retrying a quota/billing/auth failure just multiplies cost and latency without
-any chance of success, so those are treated as non-retryable.
+any chance of success, so those are treated as non-retryable. Overload errors
+tell the gateway to shed concurrency.
 """
 from __future__ import annotations
 
@@ -26,3 +27,20 @@ _NON_RETRYABLE_MARKERS = (
 def is_non_retryable_llm_error(error: Exception | None) -> bool:
     raw = str(error or "").lower()
     return any(marker in raw for marker in _NON_RETRYABLE_MARKERS)
+
+
+# Substrings (lowercased) that mean the provider is shedding load.
+_OVERLOAD_MARKERS = (
+    "429",
+    "resource_exhausted",
+    "rate limit",
+    "503",
+    "overloaded",
+    "unavailable",
+    "deadline_exceeded",
+)
+
+
+def is_overload_llm_error(error: BaseException | None) -> bool:
+    raw = str(error or "").lower()
+    return any(marker in raw for marker in _OVERLOAD_MARKERS)
@@ -0,0 +1,262 @@
+"""Shared gateway for every Gemini call.
+
+* **Singleflight** — identical requests (same model, prompt and config) that
+  are in flight at the same time share one provider call.
+* **Adaptive concurrency (AIMD)** — the number of concurrent calls grows by
+  roughly one per window of successes and halves when the provider pushes back
+  (429 / quota / overload / timeout), at most once per cooldown.
+* **Priority classes** — when the limit is saturated, interactive callers
+  (e.g. a student waiting on a resume audit) are admitted before background
+  work (queued keyword jobs).
+* **Latency histograms** — per label and outcome, for dashboards.
+
+Retries back off exponentially with jitter and release their slot while
+sleeping. Errors that can never succeed on retry (quota, billing, auth) fail
+fast; see :mod:`app.core.resume_analyzer.llm_errors`.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app.config import (
+    LLM_GATEWAY_INITIAL_CONCURRENCY,
+    LLM_GATEWAY_MAX_CONCURRENCY,
+    LLM_GATEWAY_MIN_CONCURRENCY,
+)
+from app.core.resume_analyzer.llm_errors import is_non_retryable_llm_error, is_overload_llm_error
+from app.metrics import LLM_CALL_ERRORS, LLM_CALL_SECONDS
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LATENCY_BUCKETS_SECONDS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+_DECREASE_COOLDOWN_SECONDS = 1.0
+_RETRY_BASE_DELAY_SECONDS = 0.5
+_RETRY_MAX_DELAY_SECONDS = 8.0
+
+
+class LLMPriority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class AIMDLimiter:
+    """Concurrency limit that adapts to provider feedback, with a priority queue
+    of waiters."""
+
+    def __init__(self, *, initial: int, minimum: int, maximum: int) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(self.maximum, max(self.minimum, initial)))
+        self.in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._last_decrease = 0.0
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self, priority: LLMPriority = LLMPriority.BACKGROUND) -> None:
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot at the moment we were cancelled: hand it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._has_capacity():
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def on_success(self) -> None:
+        # Additive increase: about +1 per `limit` successful calls.
+        self.limit = min(float(self.maximum), self.limit + 1.0 / max(self.limit, 1.0))
+        self._wake()
+
+    def on_overload(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < _DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit / 2)
+        LOGGER.warning("LLM provider pushed back; concurrency limit now %s", int(self.limit))
+
+
+@dataclass
+class LatencyHistogram:
+    buckets: tuple[float, ...] = LATENCY_BUCKETS_SECONDS
+    # (label, outcome) -> [count per bucket..., +Inf], sum, count
+    _series: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+
+    def observe(self, label: str, outcome: str, seconds: float) -> None:
+        series = self._series.setdefault(
+            (label, outcome),
+            {"buckets": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0},
+        )
+        index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))
+        series["buckets"][index] += 1
+        series["sum"] += seconds
+        series["count"] += 1
+
+    def snapshot(self) -> dict[tuple[str, str], dict[str, Any]]:
+        return {
+            key: {"buckets": list(value["buckets"]), "sum": value["sum"], "count": value["count"]}
+            for key, value in self._series.items()
+        }
+
+
+def request_key(*, model: str, contents: Any, config: dict[str, Any]) -> str:
+    raw = json.dumps({"model": model, "contents": contents, "config": config}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMGateway:
+    def __init__(
+        self,
+        *,
+        initial_concurrency: int = LLM_GATEWAY_INITIAL_CONCURRENCY,
+        min_concurrency: int = LLM_GATEWAY_MIN_CONCURRENCY,
+        max_concurrency: int = LLM_GATEWAY_MAX_CONCURRENCY,
+    ) -> None:
+        self.limiter = AIMDLimiter(initial=initial_concurrency, minimum=min_concurrency, maximum=max_concurrency)
+        self.latency = LatencyHistogram()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        key: Optional[str] = None,
+        label: str = "llm",
+        priority: LLMPriority = LLMPriority.BACKGROUND,
+        timeout: float = 30.0,
+        retries: int = 0,
+    ) -> T:
+        """Run ``fn`` (one provider request plus response validation) under the
+        gateway's policies. Callers passing the same ``key`` while a call is
+        in flight receive its result instead of issuing their own."""
+        if key is None:
+            return await self._call_with_retries(fn, label=label, priority=priority, timeout=timeout, retries=retries)
+
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not us: issue the call ourselves.
+                if inflight.cancelled():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._call_with_retries(fn, label=label, priority=priority, timeout=timeout, retries=retries)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an un-awaited failure is not logged as lost.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _call_with_retries(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        label: str,
+        priority: LLMPriority,
+        timeout: float,
+        retries: int,
+    ) -> T:
+        for attempt in range(retries + 1):
+            try:
+                return await self._call_once(fn, label=label, priority=priority, timeout=timeout)
+            except Exception as exc:  # noqa: BLE001
+                # Quota/billing/auth errors will never succeed on retry.
+                if attempt >= retries or is_non_retryable_llm_error(exc):
+                    raise
+                delay = min(_RETRY_MAX_DELAY_SECONDS, _RETRY_BASE_DELAY_SECONDS * 2**attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _call_once(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        label: str,
+        priority: LLMPriority,
+        timeout: float,
+    ) -> T:
+        await self.limiter.acquire(priority)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await asyncio.wait_for(fn(), timeout=timeout)
+            outcome = "ok"
+            self.limiter.on_success()
+            return result
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            self.limiter.on_overload()
+            LLM_CALL_ERRORS.labels(label, "timeout").inc()
+            raise
+        except Exception as exc:  # noqa: BLE001
+            overloaded = is_overload_llm_error(exc)
+            if overloaded:
+                self.limiter.on_overload()
+            LLM_CALL_ERRORS.labels(label, "overload" if overloaded else "error").inc()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.latency.observe(label, outcome, elapsed)
+            LLM_CALL_SECONDS.labels(label, outcome).observe(elapsed)
+            self.limiter.release()
+
+
+_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway()
+    return _gateway
+
+
+def reset_llm_gateway() -> None:
+    """Drop the process-wide gateway (used by tests)."""
+    global _gateway
+    _gateway = None
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import os
 from typing import Optional
 
 from dotenv import load_dotenv
 from google import genai
 
-from app.core.resume_analyzer.llm_errors import is_non_retryable_llm_error
+from app.core.resume_analyzer.llm_gateway import LLMPriority, get_llm_gateway, request_key
 from app.core.resume_analyzer.resume_feature import ResumeFeatureRequest
 
 load_dotenv()
@@ -15,14 +17,13 @@ load_dotenv()
 API_KEY = os.getenv("GENAI_API_KEY")
 client: Optional[genai.Client] = genai.Client(api_key=API_KEY) if API_KEY else None
 
-# Limitar concurrencia: máximo 10 llamadas simultáneas a Gemini
-LLM_SEMAPHORE = asyncio.Semaphore(10)
-
 # Timeout para llamadas al LLM (segundos)
 LLM_TIMEOUT = 30.0
 
 MAX_RESUME_CHARS = 60_000
 
+DEFAULT_LLM_MODEL = "gemini-3-flash-preview"
+
 PROMPT_TEMPLATE = """
 You are an ATS-grade resume parser and job-search keyword strategist.
 Extract structured keywords and signals from the resume text to power online job searches.
@@ -68,6 +69,20 @@ Focus on producing keywords useful for job searching:
 """
 
 
+# Changes whenever the prompt or the output schema changes, so cached results
+# produced by an older prompt are never served.
+RESUME_PROMPT_VERSION = hashlib.sha256(
+    (PROMPT_TEMPLATE + json.dumps(ResumeFeatureRequest.model_json_schema(), sort_keys=True)).encode("utf-8")
+).hexdigest()[:16]
+
+
+def resume_text_sha256(resume_text: str) -> str:
+    """Hash of the text the LLM would see, with whitespace normalized so
+    re-extractions of the same document hash identically."""
+    normalized = " ".join((resume_text or "").strip()[:MAX_RESUME_CHARS].split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def build_resume_prompt(resume_text: str) -> str:
     """Builds the prompt and applies a safety trim for very large resumes."""
     if not resume_text:
@@ -80,7 +95,7 @@ def build_resume_prompt(resume_text: str) -> str:
 
 async def ask_llm_model(
     resume_text: str,
-    model: str = "gemini-3-flash-preview",
+    model: str = DEFAULT_LLM_MODEL,
     timeout: float = LLM_TIMEOUT,
     retries: int = 2,
 ) -> ResumeFeatureRequest:
@@ -105,49 +120,32 @@ async def ask_llm_model(
         raise RuntimeError("LLM service is not configured (missing GENAI_API_KEY).")
 
     prompt = build_resume_prompt(resume_text)
-    schema = ResumeFeatureRequest.model_json_schema()
-
-    last_err: Optional[Exception] = None
-
-    async with LLM_SEMAPHORE:
-        for attempt in range(retries + 1):
-            try:
-                response = await asyncio.wait_for(
-                    client.aio.models.generate_content(
-                        model=model,
-                        contents=prompt,
-                        config={
-                            "response_mime_type": "application/json",
-                            "response_json_schema": schema,
-                        },
-                    ),
-                    timeout=timeout,
-                )
-
-                # Muchas veces esto ya es JSON puro. Pero por seguridad:
-                text = (response.text or "").strip()
-                if not text:
-                    raise RuntimeError("Empty response from LLM.")
-
-                # Validación estricta según tu Pydantic model
-                return ResumeFeatureRequest.model_validate_json(text)
-
-            except asyncio.TimeoutError as e:
-                last_err = e
-                if attempt >= retries:
-                    raise asyncio.TimeoutError(f"LLM call exceeded {timeout}s timeout") from e
-                await asyncio.sleep(0.5 * (attempt + 1))
-
-            except Exception as e:
-                last_err = e
-                # No reintentar errores de quota/billing/auth: solo multiplican
-                # el coste sin posibilidad de éxito.
-                if is_non_retryable_llm_error(e):
-                    raise RuntimeError(f"LLM API/validation error: {e}") from e
-                # reintentar en errores transitorios (red/500) sin overthink:
-                if attempt >= retries:
-                    raise RuntimeError(f"LLM API/validation error: {e}") from e
-                await asyncio.sleep(0.5 * (attempt + 1))
-
-    # Teóricamente no llega aquí
-    raise RuntimeError(f"LLM failed unexpectedly: {last_err}") from last_err
+    config = {
+        "response_mime_type": "application/json",
+        "response_json_schema": ResumeFeatureRequest.model_json_schema(),
+    }
+
+    async def call() -> ResumeFeatureRequest:
+        response = await client.aio.models.generate_content(model=model, contents=prompt, config=config)
+        # Muchas veces esto ya es JSON puro. Pero por seguridad:
+        text = (response.text or "").strip()
+        if not text:
+            raise RuntimeError("Empty response from LLM.")
+        # Validación estricta según tu Pydantic model
+        return ResumeFeatureRequest.model_validate_json(text)
+
+    try:
+        # Concurrencia adaptativa, reintentos con backoff y coalescing de
+        # prompts idénticos en vuelo: ver llm_gateway.
+        return await get_llm_gateway().call(
+            call,
+            key=request_key(model=model, contents=prompt, config=config),
+            label="resume_keywords",
+            priority=LLMPriority.BACKGROUND,
+            timeout=timeout,
+            retries=retries,
+        )
+    except asyncio.TimeoutError as e:
+        raise asyncio.TimeoutError(f"LLM call exceeded {timeout}s timeout") from e
+    except Exception as e:
+        raise RuntimeError(f"LLM API/validation error: {e}") from e
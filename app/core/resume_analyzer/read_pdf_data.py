@@ -1,44 +1,29 @@
-import fitz
-from dotenv import load_dotenv
 import logging
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
-
-LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.INFO)
-load_dotenv()
-
-# Thread pool for CPU-bound PDF extraction
-_pdf_executor: ThreadPoolExecutor | None = None
-
+import time
 
-def _get_pdf_executor() -> ThreadPoolExecutor:
-    global _pdf_executor
-    if _pdf_executor is None:
-        _pdf_executor = ThreadPoolExecutor(max_workers=5)
-    return _pdf_executor
+import fitz
 
+LOGGER = logging.getLogger(__name__)
 
-def shutdown_pdf_executor() -> None:
-    global _pdf_executor
-    if _pdf_executor is not None:
-        _pdf_executor.shutdown(wait=True)
-        _pdf_executor = None
 
+def extract_text_from_pdf_bytes(data: bytes, *, max_pages: int, cpu_seconds: float) -> str:
+    """Extract text from an in-memory PDF using PyMuPDF (fitz).
 
-def _extract_text_from_pdf_sync(upload_file: str) -> str:
-    """Synchronous helper to extract text from PDF using PyMuPDF (fitz)."""
-    text = ""
+    Stops after ``max_pages`` pages, or once the document has used
+    ``cpu_seconds`` of CPU, keeping whatever text was read so far.
+    """
+    started = time.process_time()
+    parts: list[str] = []
     try:
-        with fitz.open(upload_file) as doc:
-            for page in doc:
-                text += page.get_text()
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            for index, page in enumerate(doc):
+                if index >= max_pages:
+                    LOGGER.warning("PDF has more than %s pages; ignoring the rest", max_pages)
+                    break
+                if time.process_time() - started > cpu_seconds:
+                    LOGGER.warning("PDF exceeded %ss of CPU after %s pages; truncating", cpu_seconds, index)
+                    break
+                parts.append(page.get_text())
     except Exception as e:
-        LOGGER.error(f"Error reading {upload_file}: {e}")
-    return text
-
-
-async def extract_text_from_pdf(upload_file: str) -> str:
-    """Async wrapper to extract text from a PDF file using PyMuPDF (fitz)."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_get_pdf_executor(), _extract_text_from_pdf_sync, upload_file)
+        LOGGER.error("Error reading PDF: %s", e)
+    return "".join(parts)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import os
 import re
@@ -11,7 +10,7 @@ from typing import Optional
 from dotenv import load_dotenv
 from google import genai
 
-from app.core.resume_analyzer.llm_errors import is_non_retryable_llm_error
+from app.core.resume_analyzer.llm_gateway import LLMPriority, get_llm_gateway, request_key
 from app.core.resume_analyzer.prompts.resume_audit_prompt import (
     build_resume_audit_system_prompt,
     build_resume_audit_user_prompt,
@@ -23,7 +22,6 @@ load_dotenv()
 API_KEY = os.getenv("GENAI_API_KEY")
 MAX_RESUME_CHARS = 80_000
 LLM_TIMEOUT = 45.0
-LLM_SEMAPHORE = asyncio.Semaphore(8)
 INJECTION_PATTERNS = (
     r"ignore\s+previous\s+instructions",
     r"disregard\s+all\s+instructions",
@@ -93,44 +91,43 @@ class GeminiResumeAuditEvaluator(ResumeAuditEvaluator):
             sanitization.safe_resume_text,
             detected_signals=sanitization.detected_signals,
         )
-        output_schema = ResumeAuditResult.model_json_schema()
-
-        async with LLM_SEMAPHORE:
-            last_error: Optional[Exception] = None
-            for attempt in range(self.retries + 1):
-                try:
-                    system_prompt = build_resume_audit_system_prompt()
-                    response = await asyncio.wait_for(
-                        self.client.aio.models.generate_content(
-                            model=self.model,
-                            contents=user_prompt,
-                            config={
-                                "system_instruction": system_prompt,
-                                "response_mime_type": "application/json",
-                                "response_json_schema": output_schema,
-                                "temperature": 0.2,
-                            },
-                        ),
-                        timeout=self.timeout,
-                    )
-                    text = (response.text or "").strip()
-                    if not text:
-                        raise RuntimeError("Empty response from LLM.")
-
-                    parsed = ResumeAuditResult.model_validate_json(text)
-                    parsed.pass_status = parsed.overall_score >= 8
-                    parsed.prompt_injection_signals_detected = sanitization.detected_signals
-                    return parsed
-                except Exception as exc:  # noqa: BLE001
-                    last_error = exc
-                    # Quota/billing/auth errors will never succeed on retry.
-                    if is_non_retryable_llm_error(exc):
-                        break
-                    if attempt >= self.retries:
-                        break
-                    await asyncio.sleep(0.6 * (attempt + 1))
-
-        raise RuntimeError(f"Resume audit LLM call failed: {last_error}") from last_error
+        config = {
+            "system_instruction": build_resume_audit_system_prompt(),
+            "response_mime_type": "application/json",
+            "response_json_schema": ResumeAuditResult.model_json_schema(),
+            "temperature": 0.2,
+        }
+
+        async def call() -> ResumeAuditResult:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=user_prompt,
+                config=config,
+            )
+            text = (response.text or "").strip()
+            if not text:
+                raise RuntimeError("Empty response from LLM.")
+
+            parsed = ResumeAuditResult.model_validate_json(text)
+            parsed.pass_status = parsed.overall_score >= 8
+            parsed.prompt_injection_signals_detected = sanitization.detected_signals
+            return parsed
+
+        try:
+            # A student is waiting on the audit, so it jumps queued
+            # background analyses when the gateway is saturated.
+            result = await get_llm_gateway().call(
+                call,
+                key=request_key(model=self.model, contents=user_prompt, config=config),
+                label="resume_audit",
+                priority=LLMPriority.INTERACTIVE,
+                timeout=self.timeout,
+                retries=self.retries,
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"Resume audit LLM call failed: {exc}") from exc
+        # Coalesced callers share one result; hand each its own copy.
+        return result.model_copy(deep=True)
 
 
 def serialize_resume_audit_result(result: ResumeAuditResult) -> str:
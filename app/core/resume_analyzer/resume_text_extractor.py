@@ -1,46 +1,158 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import logging
+import multiprocessing
 import os
-import tempfile
+import signal
+import time
 import zipfile
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Optional
 from xml.etree import ElementTree as ET
 
-from app.core.resume_analyzer.read_pdf_data import extract_text_from_pdf, shutdown_pdf_executor
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
-_docx_executor: ThreadPoolExecutor | None = None
+from app.config import (
+    RESUME_EXTRACTION_CPU_SECONDS,
+    RESUME_EXTRACTION_MAX_PAGES,
+    RESUME_EXTRACTION_TIMEOUT_SECONDS,
+    RESUME_EXTRACTION_WORKERS,
+)
+from app.core.resume_analyzer.read_pdf_data import extract_text_from_pdf_bytes
 
+LOGGER = logging.getLogger(__name__)
 
-def _get_docx_executor() -> ThreadPoolExecutor:
-    global _docx_executor
-    if _docx_executor is None:
-        _docx_executor = ThreadPoolExecutor(max_workers=3)
-    return _docx_executor
+# Bump whenever extraction output changes so stored texts are re-extracted.
+RESUME_TEXT_EXTRACTOR_VERSION = "2"
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+# word/document.xml larger than this (uncompressed) is treated as a zip bomb.
+MAX_DOCX_XML_BYTES = 20_000_000
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+_extraction_pool: ProcessPoolExecutor | None = None
+
+
+class ResumeTextExtractionError(RuntimeError):
+    """Extraction did not run to completion; safe to retry later."""
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    global _extraction_pool
+    if _extraction_pool is None:
+        # spawn, not fork: the API process has live threads (DB driver,
+        # executors) that must not be duplicated into the workers.
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=RESUME_EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _extraction_pool
+
+
+def _kill_extraction_pool(pool: ProcessPoolExecutor) -> None:
+    """Tear ``pool`` down without waiting for a stuck document to finish."""
+    global _extraction_pool
+    if _extraction_pool is pool:
+        _extraction_pool = None
+    # ProcessPoolExecutor cannot cancel a running task; terminating its
+    # processes is the only way to reclaim a worker stuck inside MuPDF.
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    # Other documents in flight fail with BrokenProcessPool, not cancellation.
+    pool.shutdown(wait=False)
 
 
 def shutdown_resume_text_extractors() -> None:
-    global _docx_executor
-    if _docx_executor is not None:
-        _docx_executor.shutdown(wait=True)
-        _docx_executor = None
-    shutdown_pdf_executor()
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=True)
+        _extraction_pool = None
 
 
-def _extract_text_from_docx_sync(docx_path: str) -> str:
+def extract_text_from_docx_bytes(data: bytes, *, cpu_seconds: float) -> str:
+    """Stream paragraphs out of an in-memory DOCX without building the full tree."""
+    started = time.process_time()
+    paragraphs: list[str] = []
     try:
-        with zipfile.ZipFile(docx_path) as zf:
-            xml_data = zf.read("word/document.xml")
-        root = ET.fromstring(xml_data)
-        paragraphs: list[str] = []
-        ns = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
-        for paragraph in root.iter(f"{ns}p"):
-            texts = [node.text for node in paragraph.iter(f"{ns}t") if node.text]
-            if texts:
-                paragraphs.append("".join(texts))
-        return "\n".join(paragraphs).strip()
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            if zf.getinfo("word/document.xml").file_size > MAX_DOCX_XML_BYTES:
+                LOGGER.warning("DOCX document.xml exceeds %s bytes; skipping", MAX_DOCX_XML_BYTES)
+                return ""
+            with zf.open("word/document.xml") as xml_file:
+                runs: list[str] = []
+                for _, element in ET.iterparse(xml_file, events=("end",)):
+                    if element.tag == f"{_W_NS}t":
+                        if element.text:
+                            runs.append(element.text)
+                    elif element.tag == f"{_W_NS}p":
+                        if runs:
+                            paragraphs.append("".join(runs))
+                            runs = []
+                        element.clear()
+                        if time.process_time() - started > cpu_seconds:
+                            LOGGER.warning("DOCX exceeded %ss of CPU; truncating", cpu_seconds)
+                            break
     except Exception:
-        return ""
+        # Corrupt archive or malformed XML: keep whatever was read.
+        pass
+    return "\n".join(paragraphs).strip()
+
+
+def _document_kind(filename: str, content_type: str) -> Optional[str]:
+    suffix = os.path.splitext(filename or "")[-1].lower() or ".pdf"
+    if content_type == "application/pdf" or suffix == ".pdf":
+        return "pdf"
+    if content_type == DOCX_CONTENT_TYPE or suffix == ".docx":
+        return "docx"
+    return None
+
+
+def _extract_text_sync(
+    data: bytes,
+    kind: str,
+    max_pages: int = RESUME_EXTRACTION_MAX_PAGES,
+    cpu_seconds: float = RESUME_EXTRACTION_CPU_SECONDS,
+) -> str:
+    if kind == "pdf":
+        return extract_text_from_pdf_bytes(data, max_pages=max_pages, cpu_seconds=cpu_seconds)
+    return extract_text_from_docx_bytes(data, cpu_seconds=cpu_seconds)
+
+
+def _raise_time_limit_exceeded(signum, frame) -> None:
+    raise ResumeTextExtractionError("Resume text extraction exceeded its time limit")
+
+
+def _extract_with_limits(work, timeout_seconds: int) -> str:
+    """Run ``work`` in an extraction worker. Both limits start with the task,
+    not when it was queued: a wall-clock alarm raises
+    :class:`ResumeTextExtractionError` here, and an RLIMIT_CPU soft limit lets
+    the kernel kill a worker stuck inside MuPDF, where no Python handler
+    runs."""
+    if not hasattr(signal, "SIGALRM"):
+        return work()
+    previous = signal.signal(signal.SIGALRM, _raise_time_limit_exceeded)
+    cpu_limits = resource.getrlimit(resource.RLIMIT_CPU) if resource is not None else None
+    if cpu_limits is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = int(usage.ru_utime + usage.ru_stime) + timeout_seconds + 1
+        if cpu_limits[1] == resource.RLIM_INFINITY or soft < cpu_limits[1]:
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, cpu_limits[1]))
+    signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    try:
+        return work()
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        if cpu_limits is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, cpu_limits)
 
 
 async def extract_resume_text_from_bytes(
@@ -49,21 +161,33 @@ async def extract_resume_text_from_bytes(
     filename: str,
     content_type: str,
 ) -> str:
-    suffix = os.path.splitext(filename or "")[-1].lower() or ".pdf"
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(file_bytes)
-        temp_path = tmp.name
+    """Extract plain text from an uploaded PDF/DOCX, entirely in memory.
 
-    try:
-        if content_type == "application/pdf" or suffix == ".pdf":
-            return await extract_text_from_pdf(temp_path)
-        if (
-            content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            or suffix == ".docx"
-        ):
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(_get_docx_executor(), _extract_text_from_docx_sync, temp_path)
+    Parsing runs in a bounded process pool, under limits enforced in the
+    worker once the document starts (time spent queued for a worker does not
+    count). A document that outlives ``RESUME_EXTRACTION_TIMEOUT_SECONDS``, or
+    that loses its worker, raises :class:`ResumeTextExtractionError`, so no
+    empty text is stored and a later read retries.
+    """
+    kind = _document_kind(filename, content_type)
+    if kind is None:
         return ""
-    finally:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    work = partial(_extract_text_sync, file_bytes, kind)
+    if RESUME_EXTRACTION_WORKERS == 0:
+        return await asyncio.to_thread(work)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_extraction_pool()
+    try:
+        return await loop.run_in_executor(
+            pool, partial(_extract_with_limits, work, RESUME_EXTRACTION_TIMEOUT_SECONDS)
+        )
+    except ResumeTextExtractionError:
+        LOGGER.warning("Resume text extraction of %s timed out", filename)
+        raise
+    except BrokenProcessPool:
+        # The kernel killed a worker over its CPU limit (or it crashed); the
+        # pool is unusable and every document in flight fails with it.
+        LOGGER.error("Resume extraction worker died on %s; recycling the extraction pool", filename)
+        _kill_extraction_pool(pool)
+        raise ResumeTextExtractionError(f"Text extraction of {filename} was interrupted") from None
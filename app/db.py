@@ -1,15 +1,21 @@
+import hashlib
+import logging
 from collections.abc import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession
+from dataclasses import dataclass
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
-from fastapi import Depends
+from fastapi import Depends, Request
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "").strip()
+# Optional read replica for GET endpoints that tolerate slight staleness.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", "").strip()
 ENV = os.getenv("ENV", "development").lower()
 
 
@@ -31,39 +37,219 @@ SQLALCHEMY_ECHO = _env_flag("SQLALCHEMY_ECHO", "0")
 AUTO_CREATE_TABLES = _env_flag("AUTO_CREATE_TABLES", "0")
 # Opt back into a connection-per-request engine for true serverless targets.
 DB_DISABLE_POOL = _env_flag("DB_DISABLE_POOL", "0")
+# After a write, the writer's reads stay on the primary this long, so they see
+# their own changes despite replica lag.
+DB_READ_STICKY_SECONDS = _env_int("DB_READ_STICKY_SECONDS", 5, minimum=0)
+
+LOGGER = logging.getLogger(__name__)
+
+
 class Base(DeclarativeBase):
     pass
 
 
-def _build_engine():
-    if not DATABASE_URL:
+# --- Engine profiles ---------------------------------------------------------
+# Each workload gets its own engine, and so its own pool, so batch work never
+# queues interactive requests behind it:
+#   oltp        request handlers (``engine`` / ``get_session``); DB_* settings
+#   read        the read replica (``get_read_session``); DB_READ_*, else DB_*
+#   analytics   heavy reporting reads; DB_ANALYTICS_*; defaults to the replica
+#   background  queue workers, skill syncs, seeds; DB_BACKGROUND_*
+# Settings: <PREFIX>_POOL_SIZE, _MAX_OVERFLOW, _POOL_RECYCLE_SECONDS,
+# _PREPARED_STATEMENTS (auto/on/off), _DIRECT_CONNECTION (auto/on/off),
+# _STATEMENT_CACHE_SIZE, _COMMAND_TIMEOUT_SECONDS, _STATEMENT_TIMEOUT_MS and
+# _FETCH_SIZE. "auto" guesses from the URL (see prepared_statements_safe);
+# request traffic keeps prepared statements off unless DB_PREPARED_STATEMENTS=on,
+# since a wrong guess there fails user requests.
+_PROFILE_DEFAULTS = {
+    "oltp": dict(
+        pool_size=5,
+        max_overflow=10,
+        prepared_statements="off",
+        command_timeout_seconds=0,
+        statement_timeout_ms=0,
+        fetch_size=1000,
+    ),
+    "analytics": dict(
+        pool_size=2,
+        max_overflow=3,
+        prepared_statements="auto",
+        command_timeout_seconds=120,
+        statement_timeout_ms=120_000,
+        fetch_size=5000,
+    ),
+    "background": dict(
+        pool_size=2,
+        max_overflow=4,
+        prepared_statements="auto",
+        command_timeout_seconds=900,
+        statement_timeout_ms=0,
+        fetch_size=5000,
+    ),
+}
+_PROFILE_ENV = {
+    # profile: (env prefix, fallback prefix, defaults)
+    "oltp": ("DB", None, "oltp"),
+    "read": ("DB_READ", "DB", "oltp"),
+    "analytics": ("DB_ANALYTICS", None, "analytics"),
+    "background": ("DB_BACKGROUND", None, "background"),
+}
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    name: str
+    url: str
+    pool_size: int
+    max_overflow: int
+    pool_recycle_seconds: int
+    # False behind a transaction-mode pooler (see prepared_statements_safe).
+    prepared_statements: bool
+    # Not through a pooler, so startup parameters such as statement_timeout
+    # reach the server; PgBouncer rejects them.
+    direct_connection: bool
+    statement_cache_size: int
+    # Client-side cap per statement; 0 = none.
+    command_timeout_seconds: int
+    # Server-side statement_timeout; 0 = server default. Direct connections only.
+    statement_timeout_ms: int
+    # Rows per round trip when a result is streamed (``session.stream``).
+    fetch_size: int
+
+
+def prepared_statements_safe(url: str) -> bool:
+    """Whether asyncpg may cache prepared statements on ``url``.
+
+    Not behind PgBouncer in transaction mode, where consecutive statements may
+    run on different server connections: Neon's pooled endpoints (a
+    ``-pooler`` host, whose direct endpoint is the same host without it) and
+    PgBouncer's default port 6432.
+    """
+    parsed = make_url(url)
+    host = (parsed.host or "").split(".")[0]
+    return not (host.endswith("-pooler") or parsed.port == 6432)
+
+
+def _profile_url(name: str) -> str:
+    if name == "read":
+        return DATABASE_READ_URL
+    if name == "analytics":
+        return os.getenv("DATABASE_ANALYTICS_URL", "").strip() or DATABASE_READ_URL or DATABASE_URL
+    if name == "background":
+        return os.getenv("DATABASE_BACKGROUND_URL", "").strip() or DATABASE_URL
+    return DATABASE_URL
+
+
+def load_engine_profile(name: str) -> EngineProfile:
+    prefix, fallback_prefix, defaults_name = _PROFILE_ENV[name]
+    defaults = _PROFILE_DEFAULTS[defaults_name]
+
+    def setting(key: str, default: int, minimum: int) -> int:
+        if fallback_prefix:
+            default = _env_int(f"{fallback_prefix}_{key}", default, minimum)
+        return _env_int(f"{prefix}_{key}", default, minimum)
+
+    def mode(key: str, default: str) -> bool:
+        value = os.getenv(f"{prefix}_{key}", "").strip().lower()
+        if not value and fallback_prefix:
+            value = os.getenv(f"{fallback_prefix}_{key}", "").strip().lower()
+        value = value or default
+        if value in {"on", "off"}:
+            return value == "on"
+        return bool(url) and prepared_statements_safe(url)
+
+    url = _profile_url(name)
+    return EngineProfile(
+        name=name,
+        url=url,
+        pool_size=setting("POOL_SIZE", defaults["pool_size"], 1),
+        max_overflow=setting("MAX_OVERFLOW", defaults["max_overflow"], 0),
+        pool_recycle_seconds=setting("POOL_RECYCLE_SECONDS", 300, 30),
+        prepared_statements=mode("PREPARED_STATEMENTS", defaults["prepared_statements"]),
+        direct_connection=mode("DIRECT_CONNECTION", "auto"),
+        statement_cache_size=setting("STATEMENT_CACHE_SIZE", 100, 0),
+        command_timeout_seconds=setting("COMMAND_TIMEOUT_SECONDS", defaults["command_timeout_seconds"], 0),
+        statement_timeout_ms=setting("STATEMENT_TIMEOUT_MS", defaults["statement_timeout_ms"], 0),
+        fetch_size=setting("FETCH_SIZE", defaults["fetch_size"], 1),
+    )
+
+
+def _connect_args(profile: EngineProfile) -> dict:
+    if make_url(profile.url).get_driver_name() != "asyncpg":
+        return {}
+    # ``statement_cache_size=0`` unless prepared statements are known to be
+    # safe: PgBouncer in transaction mode (Neon's "-pooler" endpoint) breaks
+    # asyncpg's statement cache.
+    args: dict = {"statement_cache_size": profile.statement_cache_size if profile.prepared_statements else 0}
+    if profile.command_timeout_seconds:
+        args["command_timeout"] = profile.command_timeout_seconds
+    if profile.statement_timeout_ms and profile.direct_connection:
+        args["server_settings"] = {"statement_timeout": str(profile.statement_timeout_ms)}
+    return args
+
+
+def _build_engine(profile: EngineProfile):
+    if not profile.url:
         raise RuntimeError(
             "DATABASE_URL must be configured before starting the API. "
             "Set it in the deployment environment; .env is not copied into the Docker image."
         )
 
-    # Reuse warm connections across requests so each call does not pay a fresh
-    # TCP + TLS handshake to the remote database. ``statement_cache_size=0`` is
-    # required because the Neon "-pooler" endpoint is PgBouncer in transaction
-    # mode, which is incompatible with asyncpg's prepared-statement cache.
     common = dict(
         echo=SQLALCHEMY_ECHO,
-        connect_args={"statement_cache_size": 0},
+        connect_args=_connect_args(profile),
+        execution_options={"max_row_buffer": profile.fetch_size},
     )
     if DB_DISABLE_POOL:
-        return create_async_engine(DATABASE_URL, poolclass=NullPool, **common)
+        return create_async_engine(profile.url, poolclass=NullPool, **common)
+
+    # Reuse warm connections across requests so each call does not pay a fresh
+    # TCP + TLS handshake to the remote database.
     return create_async_engine(
-        DATABASE_URL,
-        pool_size=_env_int("DB_POOL_SIZE", 5, minimum=1),
-        max_overflow=_env_int("DB_MAX_OVERFLOW", 10, minimum=0),
+        profile.url,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
         pool_pre_ping=True,
-        pool_recycle=_env_int("DB_POOL_RECYCLE_SECONDS", 300, minimum=30),
+        pool_recycle=profile.pool_recycle_seconds,
         **common,
     )
 
 
-engine = _build_engine()
+engine = _build_engine(load_engine_profile("oltp"))
 async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+read_engine = _build_engine(load_engine_profile("read")) if DATABASE_READ_URL else engine
+async_read_session = async_sessionmaker(read_engine, expire_on_commit=False, class_=AsyncSession)
+
+# Analytics and background engines are built on first use.
+_profile_engines: dict[str, AsyncEngine] = {}
+_profile_sessions: dict[str, async_sessionmaker[AsyncSession]] = {}
+
+
+def get_engine(profile: str = "oltp") -> AsyncEngine:
+    if profile == "oltp":
+        return engine
+    if profile == "read":
+        return read_engine
+    if profile not in _profile_engines:
+        _profile_engines[profile] = _build_engine(load_engine_profile(profile))
+    return _profile_engines[profile]
+
+
+def session_factory(profile: str = "oltp") -> async_sessionmaker[AsyncSession]:
+    if profile == "oltp":
+        return async_session
+    if profile not in _profile_sessions:
+        _profile_sessions[profile] = async_sessionmaker(get_engine(profile), expire_on_commit=False, class_=AsyncSession)
+    return _profile_sessions[profile]
+
+
+async def dispose_engines() -> None:
+    for db_engine in {engine, read_engine, *_profile_engines.values()}:
+        await db_engine.dispose()
+
+
+# Sessions handed out by ``get_read_session``, by where they went.
+read_routing_stats = {"replica": 0, "primary_sticky": 0, "primary_no_replica": 0}
 
 
 async def create_db_and_tables():
@@ -76,3 +262,100 @@ async def create_db_and_tables():
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
+
+
+async def get_analytics_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session for heavy read-only reporting (the ``analytics`` profile)."""
+    async with session_factory("analytics")() as session:
+        yield session
+
+
+async def get_background_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session for batch work run from a request (the ``background`` profile)."""
+    async with session_factory("background")() as session:
+        yield session
+
+
+def has_read_replica() -> bool:
+    return read_engine is not engine
+
+
+# Session cookies of the user and company auth backends.
+_AUTH_COOKIES = ("studentscompass_auth", "studentscompass_company_auth")
+
+
+def _writer_key(request: Request) -> str | None:
+    """Stickiness key for the caller, derived from its credentials so it needs
+    no auth lookup; None for anonymous requests."""
+    credentials = [request.headers.get("authorization", "")]
+    credentials += [request.cookies.get(name, "") for name in _AUTH_COOKIES]
+    if not any(credentials):
+        return None
+    digest = hashlib.sha256("\n".join(credentials).encode("utf-8")).hexdigest()[:32]
+    return f"db:sticky:{digest}"
+
+
+async def mark_recent_write(request: Request) -> None:
+    """Pin the caller's reads to the primary for ``DB_READ_STICKY_SECONDS``."""
+    key = _writer_key(request)
+    if key is None or not has_read_replica() or not DB_READ_STICKY_SECONDS:
+        return
+    from app.services.ratelimit.counterStore import CounterStoreError, get_counter_store
+
+    try:
+        await get_counter_store().set_str(key, "1", ttl_seconds=DB_READ_STICKY_SECONDS)
+    except CounterStoreError:
+        LOGGER.warning("Could not record a recent write; reads may briefly lag")
+
+
+async def _wrote_recently(request: Request) -> bool:
+    key = _writer_key(request)
+    if key is None:
+        return False
+    from app.services.ratelimit.counterStore import CounterStoreError, get_counter_store
+
+    try:
+        return await get_counter_store().get_str(key) is not None
+    except CounterStoreError:
+        # Without the marker we cannot rule out a recent write.
+        return True
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints that tolerate replica lag. Goes to
+    ``DATABASE_READ_URL`` when configured, except for callers that wrote
+    within the last ``DB_READ_STICKY_SECONDS`` (read-your-writes)."""
+    if not has_read_replica():
+        route = "primary_no_replica"
+    elif await _wrote_recently(request):
+        route = "primary_sticky"
+    else:
+        route = "replica"
+    read_routing_stats[route] += 1
+    factory = async_read_session if route == "replica" else async_session
+    async with factory() as session:
+        yield session
+
+
+def _pool_stats(db_engine) -> dict:
+    pool = db_engine.sync_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+def pool_stats() -> dict:
+    """Connection-pool gauges for the primary, the replica (if configured) and
+    the profile engines built so far, plus how read sessions were routed."""
+    stats = {"primary": _pool_stats(engine), "read_routing": dict(read_routing_stats)}
+    if has_read_replica():
+        stats["replica"] = _pool_stats(read_engine)
+    for name, db_engine in _profile_engines.items():
+        stats[name] = _pool_stats(db_engine)
+    return stats
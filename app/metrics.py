@@ -0,0 +1,391 @@
+"""Prometheus-format metrics for the application's hot paths.
+
+Metrics are module-level objects; ``.labels(...)`` returns a child that holds
+one label set's values. Creating a child takes the metric's lock once;
+updating one takes only that child's own (uncontended) lock, so observing from
+the event loop and from storage threads is safe and cheap.
+
+Workers do not share memory. With ``METRICS_MULTIPROC_DIR`` set, every worker
+writes its samples to ``<dir>/<pid>.json`` every ``METRICS_FLUSH_SECONDS``
+(:func:`run_metrics_flusher`) and when it stops, and :func:`render_metrics`
+merges every file: counters and histograms are summed across all workers,
+including ones that have exited; gauges only across workers still alive. Each
+file has a single writer and is replaced atomically, so no cross-process lock
+is needed. Clear the directory when the service (re)starts. Without the
+directory, ``/metrics`` reports the worker that served the scrape.
+"""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from app.config import METRICS_FLUSH_SECONDS, METRICS_MULTIPROC_DIR
+
+LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request and storage I/O latency (seconds).
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Value:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def sample(self) -> float:
+        return self.value
+
+
+class _HistogramValue:
+    __slots__ = ("_lock", "_bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        # One slot per bucket plus +Inf; not cumulative.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = bisect.bisect_left(self._bounds, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += seconds
+
+    def sample(self) -> list[float]:
+        with self._lock:
+            return [*self.counts, self.sum]
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def _new_child(self):
+        return _Value()
+
+    def labels(self, *values: Any):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children = {}
+
+    def samples(self) -> list[list[Any]]:
+        return [[list(key), child.sample()] for key, child in list(self._children.items())]
+
+    def describe(self) -> dict[str, Any]:
+        return {"type": self.kind, "help": self.documentation, "labels": list(self.labelnames)}
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """Current value per worker; usually set by a collector at scrape time."""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, seconds: float) -> None:
+        self.labels().observe(seconds)
+
+    def describe(self) -> dict[str, Any]:
+        return {**super().describe(), "buckets": list(self.buckets)}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        # Refresh gauges (pool sizes, ...) just before samples are read.
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def snapshot(self) -> dict[str, Any]:
+        """This worker's samples, in the per-worker file format."""
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:  # noqa: BLE001 — a broken collector must not break scraping
+                LOGGER.warning("Metrics collector %r failed", collector, exc_info=True)
+        return {
+            "pid": os.getpid(),
+            "metrics": {
+                name: {**metric.describe(), "samples": metric.samples()} for name, metric in self._metrics.items()
+            },
+        }
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+# A forked child starts with its parent's samples; they are the parent's to report.
+os.register_at_fork(after_in_child=REGISTRY.reset)
+
+
+# --- Multi-process aggregation -----------------------------------------------
+
+
+def _worker_file(directory: str, pid: int) -> Path:
+    return Path(directory) / f"{pid}.json"
+
+
+def flush_metrics(directory: Optional[str] = None) -> None:
+    """Write this worker's samples to its file (atomically)."""
+    directory = directory or METRICS_MULTIPROC_DIR
+    if not directory:
+        return
+    target = _worker_file(directory, os.getpid())
+    target.parent.mkdir(parents=True, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=target.parent, prefix=".metrics-", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            json.dump(REGISTRY.snapshot(), stream, separators=(",", ":"))
+        os.replace(temporary, target)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+async def run_metrics_flusher(interval_seconds: float = METRICS_FLUSH_SECONDS) -> None:
+    """Lifespan task: flush periodically until cancelled, then once more."""
+    if not METRICS_MULTIPROC_DIR:
+        return
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(flush_metrics)
+            except OSError:
+                LOGGER.warning("Could not write metrics to %s", METRICS_MULTIPROC_DIR, exc_info=True)
+    finally:
+        try:
+            flush_metrics()
+        except OSError:
+            LOGGER.warning("Could not write metrics to %s", METRICS_MULTIPROC_DIR, exc_info=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _load_snapshots(directory: str) -> list[dict[str, Any]]:
+    snapshots = []
+    for path in Path(directory).glob("*.json"):
+        try:
+            snapshots.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            # Removed or half-visible mid-scrape: skip this round.
+            LOGGER.debug("Skipping unreadable metrics file %s", path, exc_info=True)
+    return snapshots
+
+
+def merge_snapshots(snapshots: list[dict[str, Any]], *, live_pids: Optional[set[int]] = None) -> dict[str, Any]:
+    """Sum samples per metric and label set. Gauges of workers not in
+    ``live_pids`` (when given) are dropped."""
+    merged: dict[str, Any] = {}
+    for snapshot in snapshots:
+        alive = live_pids is None or snapshot.get("pid") in live_pids
+        for name, metric in snapshot.get("metrics", {}).items():
+            if metric["type"] == "gauge" and not alive:
+                continue
+            target = merged.setdefault(name, {**metric, "samples": {}})
+            for labels, value in metric["samples"]:
+                key = tuple(labels)
+                if isinstance(value, list):
+                    current = target["samples"].get(key)
+                    target["samples"][key] = value if current is None else [a + b for a, b in zip(current, value)]
+                else:
+                    target["samples"][key] = target["samples"].get(key, 0.0) + value
+    return merged
+
+
+def collect_metrics() -> dict[str, Any]:
+    if not METRICS_MULTIPROC_DIR:
+        return merge_snapshots([REGISTRY.snapshot()])
+    flush_metrics()
+    snapshots = _load_snapshots(METRICS_MULTIPROC_DIR)
+    live = {snapshot["pid"] for snapshot in snapshots if _pid_alive(snapshot.get("pid", -1))}
+    return merge_snapshots(snapshots, live_pids=live)
+
+
+# --- Text exposition -----------------------------------------------------------
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def format_metrics(merged: dict[str, Any]) -> str:
+    """Prometheus text format (0.0.4)."""
+    lines: list[str] = []
+    for name in sorted(merged):
+        metric = merged[name]
+        documentation = metric["help"].replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labelnames = metric["labels"]
+        for labels in sorted(metric["samples"]):
+            value = metric["samples"][labels]
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_label_text(labelnames, labels)} {_number(value)}")
+                continue
+            *counts, total = value
+            cumulative = 0
+            for bound, count in zip([*metric["buckets"], "+Inf"], counts):
+                cumulative += count
+                le = f'le="{bound if bound == "+Inf" else _number(bound)}"'
+                lines.append(f"{name}_bucket{_label_text(labelnames, labels, le)} {_number(cumulative)}")
+            lines.append(f"{name}_sum{_label_text(labelnames, labels)} {_number(total)}")
+            lines.append(f"{name}_count{_label_text(labelnames, labels)} {_number(cumulative)}")
+    return "\n".join(lines) + "\n"
+
+
+def render_metrics() -> str:
+    return format_metrics(collect_metrics())
+
+
+# --- Application metrics ---------------------------------------------------------
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template.",
+    ("method", "route", "status"),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections checked out of the SQLAlchemy pool.",
+    ("engine",),
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond the pool size (negative while the pool is not full).",
+    ("engine",),
+)
+EMBEDDING_CACHE_LOOKUPS = Counter(
+    "embedding_cache_lookups_total",
+    "Skill-embedding cache lookups by cache and result (hit/miss).",
+    ("cache", "result"),
+)
+LLM_CALL_SECONDS = Histogram(
+    "llm_call_duration_seconds",
+    "LLM provider call latency by call label and outcome (ok/error/timeout).",
+    ("label", "outcome"),
+    buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+LLM_CALL_ERRORS = Counter(
+    "llm_call_errors_total",
+    "Failed LLM provider calls by call label and kind (timeout/overload/error).",
+    ("label", "kind"),
+)
+CP_SAT_SOLVE_SECONDS = Histogram(
+    "cp_sat_solve_duration_seconds",
+    "Learning-route CP-SAT solve time by solver status.",
+    ("status",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+STORAGE_IO_SECONDS = Histogram(
+    "storage_io_duration_seconds",
+    "Object-storage I/O latency (including the wait for an I/O thread) by backend and operation.",
+    ("backend", "operation"),
+)
+RATE_LIMIT_DECISIONS = Counter(
+    "rate_limit_decisions_total",
+    "Rate-limit decisions: allowed and error (store down, failed open) count every "
+    "rule the request matched; denied counts the rule that refused it.",
+    ("rule", "decision"),
+)
+
+
+def _collect_pool_gauges() -> None:
+    from app.db import pool_stats
+
+    for engine_name, stats in pool_stats().items():
+        if isinstance(stats, dict) and "checked_out" in stats:
+            DB_POOL_CHECKED_OUT.labels(engine_name).set(stats["checked_out"])
+            DB_POOL_OVERFLOW.labels(engine_name).set(stats["overflow"])
+
+
+REGISTRY.add_collector(_collect_pool_gauges)
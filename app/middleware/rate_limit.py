@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Optional
 
 from fastapi import Request
 
@@ -9,13 +9,19 @@ from app.config import (
     REGISTER_IP_DAILY_ACCOUNT_CAP,
     REGISTER_RATE_LIMIT_MAX,
     REGISTER_RATE_LIMIT_WINDOW_SECONDS,
+    RATE_LIMIT_LEASE_SIZE,
+    RATE_LIMIT_LEASE_TTL_SECONDS,
+    RATE_LIMIT_MODE,
     env_int,
 )
+from app.metrics import RATE_LIMIT_DECISIONS
 from app.services.ratelimit.counterStore import (
     CounterStore,
     CounterStoreError,
+    LimitCheck,
     get_counter_store,
 )
+from app.services.ratelimit.quotaLeaser import QuotaLeaser
 
 _ONE_DAY_SECONDS = 86_400
 
@@ -28,6 +34,9 @@ class RateLimitRule:
     methods: tuple[str, ...]
     exact_paths: tuple[str, ...] = ()
     path_prefixes: tuple[str, ...] = ()
+    # "window" (sliding window, exact count) or "gcra" (constant memory per key;
+    # a burst of ``max_requests``, then one per ``window_seconds / max_requests``).
+    algorithm: str = "window"
 
     def matches(self, *, path: str, method: str) -> bool:
         if self.methods and method.upper() not in self.methods:
@@ -39,6 +48,40 @@ class RateLimitRule:
         return False
 
 
+class _RuleMatcher:
+    """Rules precompiled for per-request matching: exact paths in a dict and
+    prefixes in a character trie, so a request costs one dict lookup plus one
+    walk of its path rather than a scan of every rule."""
+
+    def __init__(self, rules: tuple[RateLimitRule, ...]):
+        self._exact: dict[str, list[int]] = {}
+        self._trie: dict = {}
+        for index, rule in enumerate(rules):
+            for path in rule.exact_paths:
+                self._exact.setdefault(path, []).append(index)
+            for prefix in rule.path_prefixes:
+                node = self._trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, []).append(index)
+        self._rules = rules
+
+    def match(self, *, path: str, method: str) -> list[RateLimitRule]:
+        indices = set(self._exact.get(path, ()))
+        node = self._trie
+        indices.update(node.get(None, ()))
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            indices.update(node.get(None, ()))
+        return [
+            rule
+            for rule in (self._rules[index] for index in sorted(indices))
+            if not rule.methods or method in rule.methods
+        ]
+
+
 class RequestRateLimiter:
     """IP-based request rate limiter backed by the shared counter store.
 
@@ -46,6 +89,11 @@ class RequestRateLimiter:
     replica/worker, so the limits hold under horizontal scaling. The limiter
     *fails open*: a Redis outage must never take the whole site down — the
     per-user AI quota and the global budget guard remain the hard cost ceilings.
+
+    Every rule a request matches is checked in one ``check_limits`` call (one
+    Redis round trip); a request denied by any rule is counted against none.
+    With a ``leaser`` (hybrid mode), GCRA rules are instead spent from
+    worker-local leases and only the remaining rules reach the store.
     """
 
     def __init__(
@@ -53,9 +101,12 @@ class RequestRateLimiter:
         rules: Iterable[RateLimitRule],
         *,
         store_factory: Callable[[], CounterStore] = get_counter_store,
+        leaser: Optional[QuotaLeaser] = None,
     ):
         self.rules = tuple(rules)
+        self._matcher = _RuleMatcher(self.rules)
         self._store_factory = store_factory
+        self._leaser = leaser
         # Retained so existing test fixtures that call ``_events.clear()`` keep
         # working; real state lives in the shared counter store.
         self._events: dict[str, object] = {}
@@ -74,25 +125,49 @@ class RequestRateLimiter:
     async def check(self, request: Request) -> tuple[bool, int]:
         path = request.url.path
         method = request.method.upper()
+        rules = self._matcher.match(path=path, method=method)
+        if not rules:
+            return True, 0
+
         ip = self._client_ip(request)
-        store = self._store_factory()
-
-        for rule in self.rules:
-            if not rule.matches(path=path, method=method):
-                continue
-            try:
-                allowed, retry_after = await store.sliding_window_allow(
-                    f"rl:{rule.key}:{ip}",
-                    max_requests=rule.max_requests,
-                    window_seconds=rule.window_seconds,
-                )
-            except CounterStoreError:
-                # Fail open on infrastructure errors.
-                continue
-            if not allowed:
-                return False, retry_after
-
-        return True, 0
+        checks = [
+            LimitCheck(
+                f"rl:{rule.key}:{ip}",
+                limit=rule.max_requests,
+                window_seconds=rule.window_seconds,
+                kind=rule.algorithm,
+            )
+            for rule in rules
+        ]
+        pending = list(zip(rules, checks))
+        try:
+            if self._leaser is not None:
+                # Local leases first: a request refused there never reaches
+                # the store. (A later strict refusal does not refund the cell.)
+                for rule, check in [item for item in pending if item[1].kind == "gcra"]:
+                    result = await self._leaser.acquire(check)
+                    if not result.allowed:
+                        RATE_LIMIT_DECISIONS.labels(rule.key, "denied").inc()
+                        return False, result.retry_after
+                pending = [item for item in pending if item[1].kind != "gcra"]
+                if not pending:
+                    self._count_decisions(rules, "allowed")
+                    return True, 0
+            result = await self._store_factory().check_limits([check for _, check in pending])
+        except CounterStoreError:
+            # Fail open on infrastructure errors.
+            self._count_decisions(rules, "error")
+            return True, 0
+        if result.allowed:
+            self._count_decisions(rules, "allowed")
+        else:
+            RATE_LIMIT_DECISIONS.labels(pending[result.denied_index or 0][0].key, "denied").inc()
+        return result.allowed, result.retry_after
+
+    @staticmethod
+    def _count_decisions(rules, decision: str) -> None:
+        for rule in rules:
+            RATE_LIMIT_DECISIONS.labels(rule.key, decision).inc()
 
     @classmethod
     def from_env(cls) -> "RequestRateLimiter":
@@ -103,6 +178,8 @@ class RequestRateLimiter:
                 window_seconds=env_int("AUTH_LOGIN_RATE_LIMIT_WINDOW_SECONDS", 60, minimum=1),
                 methods=("POST",),
                 exact_paths=("/auth/jwt/login",),
+                # Credential-stuffing bursts: keep memory per IP constant.
+                algorithm="gcra",
             ),
             # Registration burst control: stops scripted account farming (each new
             # account would otherwise unlock free LLM quota).
@@ -112,6 +189,7 @@ class RequestRateLimiter:
                 window_seconds=REGISTER_RATE_LIMIT_WINDOW_SECONDS,
                 methods=("POST",),
                 exact_paths=("/api/v1/auth/register",),
+                algorithm="gcra",
             ),
             # Daily cap on accounts created per IP (a 1-day sliding window).
             RateLimitRule(
@@ -127,6 +205,7 @@ class RequestRateLimiter:
                 window_seconds=env_int("ADMIN_API_RATE_LIMIT_WINDOW_SECONDS", 60, minimum=1),
                 methods=("GET", "POST", "PUT", "PATCH", "DELETE"),
                 path_prefixes=("/api/v1/admin",),
+                algorithm="gcra",
             ),
             RateLimitRule(
                 key="admin_pages",
@@ -135,6 +214,14 @@ class RequestRateLimiter:
                 methods=("GET",),
                 exact_paths=("/admin", "/admin/"),
                 path_prefixes=("/admin/login",),
+                algorithm="gcra",
             ),
         )
-        return cls(rules=rules)
+        leaser = None
+        if RATE_LIMIT_MODE == "hybrid":
+            leaser = QuotaLeaser(
+                get_counter_store,
+                lease_size=RATE_LIMIT_LEASE_SIZE,
+                lease_ttl_seconds=RATE_LIMIT_LEASE_TTL_SECONDS,
+            )
+        return cls(rules=rules, leaser=leaser)
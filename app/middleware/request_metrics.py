@@ -0,0 +1,28 @@
+"""Request latency per route template, for ``/metrics``."""
+from __future__ import annotations
+
+import time
+
+from app.metrics import HTTP_REQUEST_SECONDS
+
+
+def route_template(request) -> str:
+    # The matched route's template (``/api/v1/posts/{post_id}``), never the raw
+    # path, so the number of label sets stays bounded.
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+async def measure_requests(request, call_next):
+    """``@app.middleware("http")`` body. Streaming responses are timed until
+    their headers are sent."""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_REQUEST_SECONDS.labels(request.method, route_template(request), status).observe(
+            time.perf_counter() - started
+        )
@@ -0,0 +1,182 @@
+"""Per-request SQL instrumentation.
+
+Engine-wide cursor hooks time every statement and attribute it to the request
+being served (a ``ContextVar`` set by the ``instrument_sql`` middleware). Each
+request records its query count, total DB time, slowest statements and the
+statement *shapes* it repeated — the same SQL with different parameters run
+``SQL_N_PLUS_ONE_THRESHOLD`` times or more is flagged as a likely N+1.
+
+Outside production the numbers go out as a ``Server-Timing`` header; in every
+environment they are aggregated per route (:func:`sql_route_metrics`).
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import IS_PRODUCTION, SQL_INSTRUMENTATION, SQL_N_PLUS_ONE_THRESHOLD
+
+LOGGER = logging.getLogger(__name__)
+
+_SLOWEST_KEPT = 3
+_SHAPE_MAX_CHARS = 300
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+|:\w+))*\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """``statement`` with literals and expanded IN lists collapsed, so the
+    same query with different parameters has one shape."""
+    shape = _WHITESPACE_RE.sub(" ", statement).strip()
+    shape = _LITERAL_RE.sub("?", shape)
+    return _IN_LIST_RE.sub("(?)", shape)[:_SHAPE_MAX_CHARS]
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    # (seconds, shape), slowest first
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, statement: str, seconds: float) -> None:
+        shape = statement_shape(statement)
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[shape] += 1
+        if len(self.slowest) < _SLOWEST_KEPT or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, shape))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[_SLOWEST_KEPT:]
+
+    def repeated_shapes(self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """Shapes run at least ``threshold`` times: likely N+1 queries."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+# The start time lives on the statement's execution context, so a statement
+# that fails (and never reaches after_cursor_execute) leaves nothing behind.
+_STARTED_AT = "_sql_instrumentation_started_at"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None:
+        setattr(context, _STARTED_AT, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = getattr(context, _STARTED_AT, None)
+    if stats is None or started is None:
+        return
+    stats.record(statement, time.perf_counter() - started)
+
+
+_hooks_installed = False
+
+
+def install_query_hooks() -> None:
+    """Listen on every ``Engine`` (primary, replica and test engines alike)."""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _hooks_installed = True
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Attribute statements run in this context (and tasks it spawns) to the
+    yielded ``QueryStats``."""
+    install_query_hooks()
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@dataclass
+class RouteQueryMetrics:
+    requests: int = 0
+    queries: int = 0
+    seconds: float = 0.0
+    max_queries: int = 0
+    n_plus_one_requests: int = 0
+
+
+_route_metrics: dict[str, RouteQueryMetrics] = {}
+_route_metrics_lock = threading.Lock()
+# Called with (route, stats) after each request; the pytest query-budget
+# plugin registers here.
+request_observers: list[Callable[[str, QueryStats], None]] = []
+
+
+def route_label(request) -> str:
+    route = request.scope.get("route")
+    return f"{request.method} {getattr(route, 'path', None) or 'unmatched'}"
+
+
+def server_timing(stats: QueryStats) -> str:
+    value = f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"'
+    repeated = stats.repeated_shapes()
+    if repeated:
+        value += f', db-repeated;desc="{len(repeated)} shapes, max {repeated[0][1]}x"'
+    return value
+
+
+def record_request(request, response, stats: QueryStats) -> None:
+    label = route_label(request)
+    repeated = stats.repeated_shapes()
+    with _route_metrics_lock:
+        metrics = _route_metrics.setdefault(label, RouteQueryMetrics())
+        metrics.requests += 1
+        metrics.queries += stats.count
+        metrics.seconds += stats.seconds
+        metrics.max_queries = max(metrics.max_queries, stats.count)
+        metrics.n_plus_one_requests += bool(repeated)
+    if repeated:
+        shape, count = repeated[0]
+        LOGGER.warning("Likely N+1 in %s: %d queries, %dx %s", label, stats.count, count, shape)
+    if not IS_PRODUCTION:
+        response.headers.append("Server-Timing", server_timing(stats))
+    for observer in request_observers:
+        observer(label, stats)
+
+
+def sql_route_metrics() -> dict[str, RouteQueryMetrics]:
+    with _route_metrics_lock:
+        return {label: RouteQueryMetrics(**vars(metrics)) for label, metrics in _route_metrics.items()}
+
+
+def reset_sql_route_metrics() -> None:
+    with _route_metrics_lock:
+        _route_metrics.clear()
+
+
+async def instrument_sql(request, call_next):
+    """``@app.middleware("http")`` body; a no-op when ``SQL_INSTRUMENTATION=0``."""
+    if not SQL_INSTRUMENTATION:
+        return await call_next(request)
+    with track_queries() as stats:
+        response = await call_next(request)
+    record_request(request, response, stats)
+    return response
@@ -49,6 +49,8 @@ class ApplicationModel(Base):
         ),
         Index("ix_applications_user_created_at", "user_id", "created_at"),
         Index("ix_applications_company_status_created_at", "company_id", "status", "created_at"),
+        # Company applicant lists, newest application first.
+        Index("ix_applications_company_application_date", "company_id", "application_date", "created_at"),
         Index("ix_applications_job_posting_created_at", "job_posting_id", "created_at"),
         Index(
             "ux_applications_user_job_posting_not_null",
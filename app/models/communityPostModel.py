@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -25,6 +25,11 @@ class CommunityPostModel(Base):
     likes = relationship("CommunityPostLikeModel", back_populates="post", cascade="all, delete-orphan")
     comments = relationship("CommunityPostCommentModel", back_populates="post", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # A community's feed, newest first.
+        Index("ix_community_posts_community_created_at", "community_id", "created_at"),
+    )
+
 
 class CommunityPostLikeModel(Base):
     __tablename__ = "community_post_likes"
@@ -55,3 +60,8 @@ class CommunityPostCommentModel(Base):
 
     post = relationship("CommunityPostModel", back_populates="comments")
     user = relationship("User", back_populates="community_post_comments")
+
+    __table_args__ = (
+        # Comments of a post, and the per-post comment counts of the feed.
+        Index("ix_community_post_comments_post_created_at", "post_id", "created_at"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, Integer, Index, Enum as SQLEnum, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -28,6 +28,18 @@ class JobAnalysisModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
+
+    # Work-queue bookkeeping: the row itself is the queue message (see
+    # app/services/ai/cvAnalysisQueue.py).
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    available_at = Column(DateTime, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    quota_key = Column(String(128), nullable=True)
+    dead_lettered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_job_analysis_status_available_at", "status", "available_at"),
+    )
     
     # Relationship
     user = relationship("User", back_populates="job_analyses")
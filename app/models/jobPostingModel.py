@@ -24,7 +24,10 @@ class JobPosting(Base):
             "expires_at IS NULL OR expires_at >= created_at",
             name="ck_job_postings_expires_after_created",
         ),
-        Index("ix_job_postings_company_created_at", "company_id", "created_at"),
+        # Keyset pagination indexes for the ``(created_at, id)`` ordering of the
+        # public board and the per-company listing.
+        Index("ix_job_postings_created_at_id", "created_at", "id"),
+        Index("ix_job_postings_company_created_at_id", "company_id", "created_at", "id"),
         Index(
             "ix_job_postings_company_active_expires_created",
             "company_id",
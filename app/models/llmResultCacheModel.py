@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from app.db import Base
+
+
+class LLMResultCacheModel(Base):
+    """Validated LLM results keyed by resume content, prompt and model.
+
+    ``payload`` never contains the resume text itself; rows are purged when a
+    resume with the same ``text_sha256`` is deleted.
+    """
+
+    __tablename__ = "llm_result_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    text_sha256 = Column(String(64), nullable=False, index=True)
+    prompt_version = Column(String(32), nullable=False)
+    model_name = Column(String(64), nullable=False)
+    payload = Column(Text, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_hit_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
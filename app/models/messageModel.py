@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -59,3 +59,8 @@ class MessageModel(Base):
 
     conversation = relationship("ConversationModel", back_populates="messages")
     sender = relationship("User", back_populates="sent_messages")
+
+    __table_args__ = (
+        # A conversation's messages in order, its latest message, unread counts.
+        Index("ix_messages_conversation_created_at", "conversation_id", "created_at"),
+    )
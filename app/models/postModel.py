@@ -1,11 +1,13 @@
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, JSON, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from app.db import Base
 from datetime import datetime
 import uuid
 
+JSON_VARIANT = JSON().with_variant(JSONB, "postgresql")
+
 class PostModel(Base):
     __tablename__ = "posts"
 
@@ -14,6 +16,8 @@ class PostModel(Base):
     url = Column(String(255), nullable=False)
     file_type = Column(String(50), nullable=False)
     file_name = Column(String(255), nullable=False)
+    # Manifest of resized image variants, filled in after upload (see imageVariants).
+    media_variants = Column(JSON_VARIANT, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
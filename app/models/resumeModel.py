@@ -17,6 +17,12 @@ class ResumeModel(Base):
     folder_id = Column(String(255), nullable=False)
     ai_summary = Column(Text, nullable=True)
     contact_phone = Column(String(64), nullable=True)
+    # sha256 of the normalized extracted text; links the resume to its
+    # entries in the shared LLM result cache.
+    text_sha256 = Column(String(64), nullable=True, index=True)
+    # sha256 of the uploaded file bytes; lets a re-upload of the same file
+    # reuse the stored object instead of writing it again.
+    content_sha256 = Column(String(64), nullable=True, index=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import zlib
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+
+from app.db import Base
+
+
+class ResumeTextModel(Base):
+    """Extracted text of a stored resume file, parsed once and kept compressed.
+
+    Keyed by ``storage_file_id``: upload keys are unique per upload, so a new
+    file always gets a new row. ``extractor_version`` lets a parser change
+    invalidate old rows without a migration.
+    """
+
+    __tablename__ = "resume_texts"
+
+    storage_file_id = Column(String(255), primary_key=True)
+    codec = Column(String(16), nullable=False, default="zlib")
+    compressed_text = Column(LargeBinary, nullable=False)
+    text_length = Column(Integer, nullable=False, default=0)
+    extractor_version = Column(String(16), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    @staticmethod
+    def compress(text: str) -> bytes:
+        return zlib.compress((text or "").encode("utf-8"), 6)
+
+    @property
+    def text(self) -> str:
+        return zlib.decompress(self.compressed_text).decode("utf-8")
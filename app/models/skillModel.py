@@ -13,6 +13,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
@@ -67,6 +68,8 @@ class JobSkillModel(Base):
         Index("ix_job_skills_job_posting_id", "job_posting_id"),
         Index("ix_job_skills_skill_id", "skill_id"),
         Index("ix_job_skills_target_role", "target_role"),
+        # Role lookups compare ``lower(target_role)``.
+        Index("ix_job_skills_lower_target_role_job_posting", text("lower(target_role)"), "job_posting_id"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -0,0 +1,38 @@
+"""JSON responses serialized by pydantic-core.
+
+:class:`FastJSONResponse` is the application's default response class. It
+renders with ``pydantic_core.to_json`` (Rust) instead of ``json.dumps`` and
+handles UUIDs, datetimes, enums, dataclasses and Pydantic models without a
+``jsonable_encoder`` pass, so a route may also return it with raw values.
+
+:func:`adapter_response` serves list endpoints straight from ORM rows: one
+``TypeAdapter`` validates the rows by attribute and dumps the JSON bytes, so
+no per-row model is built in the route and FastAPI does not validate the
+list a second time. Keep ``response_model`` on such routes for the OpenAPI
+schema.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    rows: Iterable[Any],
+    *,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """``rows`` (ORM objects or mappings) validated and dumped by ``adapter``."""
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    return Response(body, status_code=status_code, headers=headers, media_type="application/json")
@@ -11,12 +11,19 @@ import os
 import uuid
 from urllib.parse import urlparse
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request, Header, Query
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request, Header, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_session
+from app.db import get_read_session, get_session, pool_stats
+from app.models.companyModel import Company
 from app.models.userModel import User
 from app.services.admin.adminService import AdminService, current_admin_user
+from app.services.jobs.jobPostingImportService import (
+    UNSUPPORTED_IMPORT_FORMAT_DETAIL,
+    ImportFormat,
+    JobPostingImportService,
+    detect_import_format,
+)
 from app.services.resources.resourceService import ResourceService
 from app.schemas.resourceSchema import ResourceCreate
 
@@ -31,6 +38,10 @@ def _get_service(session: AsyncSession = Depends(get_session)) -> AdminService:
     return AdminService(session)
 
 
+def _get_read_service(session: AsyncSession = Depends(get_read_session)) -> AdminService:
+    return AdminService(session)
+
+
 def _normalize_origin(value: str | None) -> str | None:
     if not value:
         return None
@@ -138,11 +149,17 @@ def _user_to_dict(u: User) -> dict:
 @router.get("/stats")
 async def admin_stats(
     admin: User = Depends(current_admin_user),
-    svc: AdminService = Depends(_get_service),
+    svc: AdminService = Depends(_get_read_service),
 ):
     return await svc.get_dashboard_stats()
 
 
+@router.get("/db/pools")
+async def admin_db_pools(admin: User = Depends(current_admin_user)):
+    """Connection-pool gauges for the primary and read-replica engines."""
+    return pool_stats()
+
+
 # ---------------------------------------------------------------------------
 # Users
 # ---------------------------------------------------------------------------
@@ -152,7 +169,7 @@ async def list_users(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
     admin: User = Depends(current_admin_user),
-    svc: AdminService = Depends(_get_service),
+    svc: AdminService = Depends(_get_read_service),
 ):
     users = await svc.list_users(skip=skip, limit=limit)
     total = await svc.count_users()
@@ -228,7 +245,7 @@ async def list_communities(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
     admin: User = Depends(current_admin_user),
-    svc: AdminService = Depends(_get_service),
+    svc: AdminService = Depends(_get_read_service),
 ):
     communities = await svc.list_communities(skip=skip, limit=limit)
     return {
@@ -270,7 +287,7 @@ async def list_resources(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
     admin: User = Depends(current_admin_user),
-    svc: AdminService = Depends(_get_service),
+    svc: AdminService = Depends(_get_read_service),
 ):
     resources = await svc.list_resources(skip=skip, limit=limit)
     return {
@@ -419,7 +436,7 @@ async def list_jobs(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
     admin: User = Depends(current_admin_user),
-    svc: AdminService = Depends(_get_service),
+    svc: AdminService = Depends(_get_read_service),
 ):
     jobs = await svc.list_jobs(skip=skip, limit=limit)
     return {
@@ -464,6 +481,29 @@ async def delete_job(
     return {"ok": True}
 
 
+@router.post("/companies/{company_id}/job-postings/import")
+async def import_company_job_postings(
+    company_id: uuid.UUID,
+    request: Request,
+    format: ImportFormat | None = None,
+    _write_guard: None = Depends(require_same_origin_for_write),
+    admin: User = Depends(current_admin_user),
+    session: AsyncSession = Depends(get_session),
+):
+    if await session.get(Company, company_id) is None:
+        raise HTTPException(status_code=404, detail="Company not found")
+    import_format = format or detect_import_format(request.headers.get("content-type"))
+    if import_format is None:
+        raise HTTPException(status_code=415, detail=UNSUPPORTED_IMPORT_FORMAT_DETAIL)
+    # Read the whole body here, before any response is started.
+    content = await JobPostingImportService(session).run_import_ndjson(
+        company_id,
+        request.stream(),
+        import_format=import_format,
+    )
+    return Response(content=content, media_type="application/x-ndjson")
+
+
 # ---------------------------------------------------------------------------
 # Companies
 # ---------------------------------------------------------------------------
@@ -473,7 +513,7 @@ async def list_companies(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
     admin: User = Depends(current_admin_user),
-    svc: AdminService = Depends(_get_service),
+    svc: AdminService = Depends(_get_read_service),
 ):
     companies = await svc.list_companies(skip=skip, limit=limit)
     return {
@@ -513,7 +553,7 @@ async def list_applications(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
     admin: User = Depends(current_admin_user),
-    svc: AdminService = Depends(_get_service),
+    svc: AdminService = Depends(_get_read_service),
 ):
     apps = await svc.list_applications(skip=skip, limit=limit)
     return {
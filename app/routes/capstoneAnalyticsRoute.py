@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_session
+from app.db import get_analytics_session, get_background_session, get_session
 from app.models.userModel import User
 from app.schemas.capstoneAnalyticsSchema import (
     CapstoneAnalyticsRolesRead,
@@ -216,7 +216,7 @@ async def sync_resume_skills_from_summary(
 @router.get("/capstone/analytics/status", response_model=CapstoneAnalyticsStatusRead)
 async def get_capstone_analytics_status(
     user: User = Depends(current_active_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_analytics_session),
 ):
     del user
     service = CapstoneAnalyticsService(session)
@@ -226,7 +226,7 @@ async def get_capstone_analytics_status(
 @router.get("/capstone/analytics/roles", response_model=CapstoneAnalyticsRolesRead)
 async def get_capstone_analytics_roles(
     user: User = Depends(current_active_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_analytics_session),
 ):
     del user
     service = CapstoneAnalyticsService(session)
@@ -236,7 +236,7 @@ async def get_capstone_analytics_roles(
 @router.get("/capstone/catalog/quality", response_model=CapstoneCatalogQualityRead)
 async def get_capstone_catalog_quality(
     user: User = Depends(current_active_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_analytics_session),
 ):
     del user
     service = CapstoneAnalyticsService(session)
@@ -246,7 +246,7 @@ async def get_capstone_catalog_quality(
 @router.post("/capstone/analytics/seed", response_model=CapstoneAnalyticsSeedSummaryRead)
 async def seed_capstone_analytics_catalog(
     user: User = Depends(current_active_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_background_session),
 ):
     _require_capstone_admin(user)
     return await _run_capstone_operation(lambda: seed_capstone_analytics_minimum(session))
@@ -279,7 +279,7 @@ async def sync_job_posting_skills(
 async def sync_open_job_posting_skills(
     limit: int = Query(100, ge=1, le=500),
     user: User = Depends(current_active_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_background_session),
 ):
     _require_capstone_admin(user)
     service = CapstoneAnalyticsService(session)
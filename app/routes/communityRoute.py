@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.userModel import User
 from app.services.accounts.userService import current_active_user
 from app.services.community.communityService import AlreadyMemberError, CommunityService
@@ -43,7 +43,7 @@ async def create_community(
 @router.get("/communities", response_model=list[CommunityRead])
 async def list_communities(
     tags: str | None = Query(default=None, description="Comma-separated list of community tags"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     service = CommunityService(session)
@@ -54,7 +54,7 @@ async def list_communities(
 async def list_community_tags(
     q: str | None = Query(default=None, description="Search term for matching tags"),
     limit: int = Query(default=12, ge=1, le=50, description="Maximum number of tags to return"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     service = CommunityService(session)
@@ -65,7 +65,7 @@ async def list_community_tags(
 @router.get("/communities/{community_id}", response_model=CommunityRead)
 async def get_community(
     community_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     service = CommunityService(session)
@@ -126,7 +126,7 @@ async def leave_community(
 @router.get("/communities/{community_id}/posts", response_model=list[CommunityPostRead])
 async def list_community_posts(
     community_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     service = CommunityService(session)
@@ -208,7 +208,7 @@ async def create_comment(
 @router.get("/community-posts/{post_id}/comments", response_model=list[CommunityPostCommentRead])
 async def list_comments(
     post_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     service = CommunityService(session)
@@ -225,7 +225,7 @@ async def list_comments(
 @router.get("/communities/{community_id}/posts/enriched")
 async def list_community_posts_enriched(
     community_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ) -> list[CommunityPostEnriched]:
     service = CommunityService(session)
@@ -240,7 +240,7 @@ async def list_community_posts_enriched(
 @router.get("/community-posts/{post_id}/comments/enriched")
 async def list_comments_enriched(
     post_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ) -> list[CommunityPostCommentEnriched]:
     service = CommunityService(session)
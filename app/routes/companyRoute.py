@@ -3,13 +3,13 @@ import mimetypes
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from fastapi.responses import HTMLResponse
 from fastapi_users.password import PasswordHelper
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.resume_analyzer.resume_text_extractor import extract_resume_text_from_bytes
+from app.core.resume_analyzer.resume_text_extractor import ResumeTextExtractionError
 from app.db import get_session
 from app.models.applicationModel import ApplicationModel, ApplicationStatus
 from app.models.companyModel import Company
@@ -42,6 +42,12 @@ from app.services.companies.companyService import (
 from app.services.applications.applicationService import ApplicationService
 from app.services.jobs.interviewService import InterviewService
 from app.services.resumes.resumeService import ResumeService
+from app.services.storage.storageStreaming import (
+    RangeNotSatisfiable,
+    parse_range_header,
+    range_not_satisfiable,
+    streaming_file_response,
+)
 
 router = APIRouter()
 
@@ -426,6 +432,7 @@ async def _get_company_resume_response(
     application_id: UUID,
     session: AsyncSession,
     disposition: str,
+    range_header: str | None = None,
 ) -> Response:
     applicant_service = CompanyApplicantService(session)
     application = await applicant_service.get_company_application(
@@ -436,17 +443,29 @@ async def _get_company_resume_response(
         raise HTTPException(status_code=404, detail="Resume not found for this application")
 
     resume_service = ResumeService(session)
-    file_bytes = await resume_service.download_file_from_s3(application.resume.storage_file_id)
-    media_type = mimetypes.guess_type(application.resume.original_filename)[0] or "application/octet-stream"
-    filename = application.resume.original_filename or "resume"
+    resume = application.resume
+    media_type = mimetypes.guess_type(resume.original_filename)[0] or "application/octet-stream"
+    filename = resume.original_filename or "resume"
 
     if disposition == "inline":
         if _is_docx_previewable(filename=filename, media_type=media_type):
-            extracted_text = await extract_resume_text_from_bytes(
-                file_bytes,
-                filename=filename,
-                content_type=media_type,
-            )
+            try:
+                extracted_text = await resume_service.get_resume_text(
+                    resume.storage_file_id,
+                    filename=filename,
+                    content_type=media_type,
+                )
+            except ResumeTextExtractionError:
+                return HTMLResponse(
+                    content=_build_resume_preview_html(
+                        filename=filename,
+                        title="Resume preview unavailable",
+                        body=(
+                            '<p class="empty">This resume could not be rendered right now. '
+                            'Try again shortly or use the download action to inspect the original file.</p>'
+                        ),
+                    )
+                )
             return HTMLResponse(
                 content=_build_resume_preview_html(
                     filename=filename,
@@ -465,13 +484,21 @@ async def _get_company_resume_response(
                 )
             )
 
-    return Response(
-        content=file_bytes,
+    # Anything not rendered server-side can be fetched from storage directly.
+    redirect = await resume_service.redirect_resume_file(
+        resume.storage_file_id,
+        filename=filename,
         media_type=media_type,
-        headers={
-            "Content-Disposition": f'{disposition}; filename="{filename}"',
-        },
+        disposition=disposition,
     )
+    if redirect is not None:
+        return redirect
+
+    try:
+        stream = await resume_service.stream_resume_file(resume.storage_file_id, parse_range_header(range_header))
+    except RangeNotSatisfiable:
+        raise range_not_satisfiable()
+    return streaming_file_response(stream, media_type=media_type, filename=filename, disposition=disposition)
 
 
 @router.get("/companies/me/applications/{application_id}/resume/preview")
@@ -479,12 +506,14 @@ async def preview_company_applicant_resume(
     application_id: UUID,
     company: Company = Depends(current_active_company),
     session: AsyncSession = Depends(get_session),
+    range_header: str | None = Header(default=None, alias="Range"),
 ):
     return await _get_company_resume_response(
         company=company,
         application_id=application_id,
         session=session,
         disposition="inline",
+        range_header=range_header,
     )
 
 
@@ -493,10 +522,12 @@ async def download_company_applicant_resume(
     application_id: UUID,
     company: Company = Depends(current_active_company),
     session: AsyncSession = Depends(get_session),
+    range_header: str | None = Header(default=None, alias="Range"),
 ):
     return await _get_company_resume_response(
         company=company,
         application_id=application_id,
         session=session,
         disposition="attachment",
+        range_header=range_header,
     )
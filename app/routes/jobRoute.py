@@ -1,23 +1,30 @@
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, status
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Literal, Optional, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.services.accounts.userService import current_active_user, current_ai_user
 from app.models.userModel import User
 import logging
 from uuid import UUID
 from app.models.companyModel import Company
-from app.models.jobPostingModel import JobPosting
+from app.responses import adapter_response
 from app.schemas.jobPostingSchema import (
     CompanyJobPostingCreate,
     JobBoardPostingRead,
+    JobBoardPostingSummaryRead,
     JobPostingRead,
     JobPostingUpdate,
 )
 from app.services.companies.companyService import current_active_company
 from app.services.companies.companyService import current_company_job_manager_recruiter
-from app.services.jobs.jobPostingService import JobPostingService
+from app.services.jobs.jobPostingService import InvalidJobPostingCursor, JobPostingPage, JobPostingService
+from app.services.jobs.jobPostingImportService import (
+    UNSUPPORTED_IMPORT_FORMAT_DETAIL,
+    ImportFormat,
+    JobPostingImportService,
+    detect_import_format,
+)
 from app.services.ai.cvAnalysisService import CVAnalysisService, LLM_GENERAL_FAILURE_MESSAGE
 from app.services.jobs.jobSearchService import JobSearchQuery, JobSearchService
 from app.services.ai.aiRequestRateLimitService import ai_analysis_rate_limiter
@@ -27,6 +34,9 @@ LOGGER = logging.getLogger(__name__)
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+JobPostingListView = Literal["full", "summary"]
+
 class JobSearchRequest(BaseModel):
     keywords: str
     location: str
@@ -64,49 +74,60 @@ class JobSearchResultsResponse(BaseModel):
     linkedin: List[JobResponse]
 
 
-@router.get("/jobs/board", response_model=List[JobBoardPostingRead])
+_BOARD_POSTINGS = TypeAdapter(List[JobBoardPostingRead])
+_BOARD_POSTING_SUMMARIES = TypeAdapter(List[JobBoardPostingSummaryRead])
+
+
+def _render_job_posting_page(page: JobPostingPage, *, summary_only: bool) -> Response:
+    """Serialize the page straight from its ORM rows; the cursor for the next
+    page, if any, goes in the ``X-Next-Cursor`` header."""
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    adapter = _BOARD_POSTING_SUMMARIES if summary_only else _BOARD_POSTINGS
+    return adapter_response(adapter, page.items, headers=headers)
+
+
+@router.get(
+    "/jobs/board",
+    response_model=List[Union[JobBoardPostingRead, JobBoardPostingSummaryRead]],
+)
 async def list_job_board_postings(
     keywords: Optional[str] = None,
     location: Optional[str] = None,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    view: JobPostingListView = "full",
     user: User = Depends(current_active_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
+    """List open postings newest first. When more rows exist, the opaque cursor
+    for the next page is returned in the ``X-Next-Cursor`` header."""
     del user
     service = JobPostingService(session)
-    jobs = await service.list_public_job_postings(
-        keywords=keywords,
-        location=location,
-        limit=max(1, min(limit, 100)),
-    )
-    return [
-        JobBoardPostingRead(
-            id=job.id,
-            company_id=job.company_id,
-            title=job.title,
-            description=job.description,
-            requirements=job.requirements,
-            responsibilities=job.responsibilities,
-            location=job.location,
-            job_type=job.job_type,
-            salary_range=job.salary_range,
-            workplace_type=job.workplace_type,
-            seniority_level=job.seniority_level,
-            benefits=job.benefits,
-            listed_context=job.listed_context,
-            source_context=job.source_context,
-            application_url=job.application_url,
-            is_active=job.is_active,
-            expires_at=job.expires_at,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            company_name=job.company.company_name if job.company else None,
-            company_location=job.company.location if job.company else None,
-            company_description=job.company.description if job.company else None,
-            company_website=job.company.website if job.company else None,
+    summary_only = view == "summary"
+    try:
+        page = await service.list_public_job_postings(
+            keywords=keywords,
+            location=location,
+            limit=max(1, min(limit, 100)),
+            cursor=cursor,
+            summary_only=summary_only,
         )
-        for job in jobs
-    ]
+    except InvalidJobPostingCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return _render_job_posting_page(page, summary_only=summary_only)
+
+
+@router.get("/jobs/board/{job_posting_id}", response_model=JobBoardPostingRead)
+async def get_job_board_posting(
+    job_posting_id: UUID,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_read_session),
+):
+    del user
+    job = await JobPostingService(session).get_public_job_posting(job_posting_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+    return job
 
 
 @router.post("/jobs/search", response_model=JobSearchResultsResponse)
@@ -131,43 +152,32 @@ async def search_jobs(
         raise HTTPException(status_code=500, detail=f"Job search failed: {str(e)}")
 
 
-@router.get("/companies/me/job-postings", response_model=List[JobBoardPostingRead])
+@router.get(
+    "/companies/me/job-postings",
+    response_model=List[Union[JobBoardPostingRead, JobBoardPostingSummaryRead]],
+)
 async def list_current_company_job_postings(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    view: JobPostingListView = "full",
     company: Company = Depends(current_active_company),
     recruiter: CompanyRecruiter = Depends(current_company_job_manager_recruiter),
     session: AsyncSession = Depends(get_session),
 ):
     del recruiter
     service = JobPostingService(session)
-    jobs = await service.list_company_job_postings(company.id, include_closed=True, limit=100)
-    return [
-        JobBoardPostingRead(
-            id=job.id,
-            company_id=job.company_id,
-            title=job.title,
-            description=job.description,
-            requirements=job.requirements,
-            responsibilities=job.responsibilities,
-            location=job.location,
-            job_type=job.job_type,
-            salary_range=job.salary_range,
-            workplace_type=job.workplace_type,
-            seniority_level=job.seniority_level,
-            benefits=job.benefits,
-            listed_context=job.listed_context,
-            source_context=job.source_context,
-            application_url=job.application_url,
-            is_active=job.is_active,
-            expires_at=job.expires_at,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            company_name=job.company.company_name if job.company else None,
-            company_location=job.company.location if job.company else None,
-            company_description=job.company.description if job.company else None,
-            company_website=job.company.website if job.company else None,
+    summary_only = view == "summary"
+    try:
+        page = await service.list_company_job_postings(
+            company.id,
+            include_closed=True,
+            limit=max(1, min(limit, 100)),
+            cursor=cursor,
+            summary_only=summary_only,
         )
-        for job in jobs
-    ]
+    except InvalidJobPostingCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return _render_job_posting_page(page, summary_only=summary_only)
 
 
 @router.post(
@@ -187,6 +197,29 @@ async def create_current_company_job_posting(
     return JobPostingRead.model_validate(job)
 
 
+@router.post("/companies/me/job-postings/import")
+async def import_current_company_job_postings(
+    request: Request,
+    format: Optional[ImportFormat] = None,
+    company: Company = Depends(current_active_company),
+    recruiter: CompanyRecruiter = Depends(current_company_job_manager_recruiter),
+    session: AsyncSession = Depends(get_session),
+):
+    """Bulk-create postings from an NDJSON or CSV body. Progress and per-row
+    validation errors are returned as NDJSON events."""
+    del recruiter
+    import_format = format or detect_import_format(request.headers.get("content-type"))
+    if import_format is None:
+        raise HTTPException(status_code=415, detail=UNSUPPORTED_IMPORT_FORMAT_DETAIL)
+    # Read the whole body here, before any response is started.
+    content = await JobPostingImportService(session).run_import_ndjson(
+        company.id,
+        request.stream(),
+        import_format=import_format,
+    )
+    return Response(content=content, media_type="application/x-ndjson")
+
+
 @router.patch("/companies/me/job-postings/{job_posting_id}", response_model=JobPostingRead)
 async def update_current_company_job_posting(
     job_posting_id: UUID,
@@ -240,27 +273,18 @@ class JobStatusResponse(BaseModel):
     completed_at: Optional[str] = None
 
 
-async def process_cv_analysis(job_id: UUID, user_id: UUID, resume_id: UUID, session_factory, reservation=None):
-    """Background task to process CV and extract keywords plus a recruiter-facing summary."""
-    async for session in session_factory():
-        await CVAnalysisService(session).process_job(
-            job_id=job_id,
-            user_id=user_id,
-            resume_id=resume_id,
-            reservation=reservation,
-        )
-        break
-
-
 @router.post("/jobs/keywords/analyze", response_model=JobInitResponse)
 async def start_cv_analysis(
-    background_tasks: BackgroundTasks,
     request: Request,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(current_ai_user),
 
 ):
-    """Start CV analysis job - returns immediately with job_id"""
+    """Queue a CV analysis job - returns immediately with job_id.
+
+    The pending ``job_analysis`` row is the queue entry; a CV analysis worker
+    (app/workers/cvAnalysisWorker.py) claims and processes it.
+    """
     try:
         analysis_service = CVAnalysisService(session)
         resume = await analysis_service.get_latest_resume(user.id)
@@ -290,18 +314,16 @@ async def start_cv_analysis(
         reservation = await analysis_service.reserve_slot(user.id)
 
         try:
-            job = await analysis_service.create_pending_analysis(user_id=user.id, resume_id=resume.id)
+            job = await analysis_service.create_pending_analysis(
+                user_id=user.id,
+                resume_id=resume.id,
+                reservation=reservation,
+            )
         except Exception:
             await reservation.release()
             raise
 
-        LOGGER.info(f"Created job {job.id} for user {user.id}")
-
-        # Schedule background processing
-        from app.db import get_session as get_session_factory
-        background_tasks.add_task(
-            process_cv_analysis, job.id, user.id, resume.id, get_session_factory, reservation
-        )
+        LOGGER.info(f"Queued job {job.id} for user {user.id}")
         
         return JobInitResponse(
             job_id=str(job.id),
@@ -0,0 +1,39 @@
+import asyncio
+import hmac
+import ipaddress
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from app import config
+from app.metrics import CONTENT_TYPE, render_metrics
+
+router = APIRouter()
+
+
+def _is_internal_peer(request: Request) -> bool:
+    host = request.client.host if request.client else ""
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return address.is_loopback or address.is_private
+
+
+def _may_scrape(request: Request) -> bool:
+    if config.METRICS_TOKEN:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(token.encode(), config.METRICS_TOKEN.encode())
+    # Behind a reverse proxy every peer can look internal, so production
+    # always requires the token.
+    return not config.IS_PRODUCTION and _is_internal_peer(request)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus scrape endpoint, for internal scrapers only."""
+    if not _may_scrape(request):
+        # Same answer as any unknown path: do not advertise the endpoint.
+        raise HTTPException(status_code=404, detail="Not Found")
+    # Merging worker files reads the disk.
+    body = await asyncio.to_thread(render_metrics)
+    return Response(content=body, media_type=CONTENT_TYPE)
@@ -1,14 +1,14 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.userModel import User
 from app.schemas.postSchema import PostCreate, PostRead
 from app.services.accounts.userService import current_active_user
-from app.services.community.postService import PostService
+from app.services.community.postService import PostService, generate_post_media_variants
 from app.services.storage.mediaStorageService import get_media_storage_service
 
 LOGGER = logging.getLogger(__name__)
@@ -29,7 +29,7 @@ async def create_post(
 @router.get("/posts/{post_id}", response_model=PostRead)
 async def get_post(
     post_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     post_service = PostService(session)
@@ -40,23 +40,32 @@ async def get_post(
 
 @router.get("/posts", response_model=list[PostRead])
 async def get_all_posts(
-    session: AsyncSession = Depends(get_session),
+    width: int | None = Query(default=None, ge=1, le=4096),
+    image_format: str = Query(default="webp", pattern="^(webp|jpg)$"),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
+    """``width`` is the rendered image width in device pixels; each post's
+    ``display_url`` is the smallest variant covering it."""
     post_service = PostService(session)
-    return await post_service.get_all_posts()
+    options = {"accept_webp": image_format == "webp"}
+    if width is not None:
+        options["width"] = width
+    return await post_service.get_all_posts(**options)
 
 
 @router.post("/upload_post")
 async def upload_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     session: AsyncSession = Depends(get_session),
     caption: str = Form(...),
     user: User = Depends(current_active_user),
 ):
 
+    media_service = get_media_storage_service()
     try:
-        post_data = await get_media_storage_service().upload_media(
+        post_data = await media_service.upload_media(
             file=file,
             file_name=file.filename,
             folder="posts/"
@@ -72,7 +81,20 @@ async def upload_file(
         file_name=post_data.name,
     )
     post_service = PostService(session)
-    return await post_service.create_post(post, user_id=user.id)
+    created = await post_service.create_post(post, user_id=user.id)
+
+    if post_data.file_type == "image" and hasattr(media_service, "create_image_variants"):
+        # Rendered after the response is sent; the feed serves the original
+        # until the variants are recorded.
+        await file.seek(0)
+        background_tasks.add_task(
+            generate_post_media_variants,
+            created.id,
+            media_service,
+            post_data,
+            await file.read(),
+        )
+    return created
 
 
 @router.delete("/delete_post/{post_id}")
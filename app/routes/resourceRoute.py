@@ -1,10 +1,9 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.userModel import User
 from app.schemas.resourceSchema import (
     ResourceDetailRead,
@@ -13,6 +12,12 @@ from app.schemas.resourceSchema import (
     ResourceRead,
 )
 from app.services.resources.resourceService import ResourceService
+from app.services.storage.storageStreaming import (
+    RangeNotSatisfiable,
+    parse_range_header,
+    range_not_satisfiable,
+    streaming_file_response,
+)
 from app.services.accounts.userService import current_active_user
 
 router = APIRouter()
@@ -23,7 +28,7 @@ async def get_resources(
     category: str | None = Query(default=None),
     search: str | None = Query(default=None),
     sort: str = Query(default="recent"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     service = ResourceService(session)
@@ -33,28 +38,30 @@ async def get_resources(
 @router.get("/resources/file")
 async def get_resource_file(
     key: str = Query(...),
+    range_header: str | None = Header(default=None, alias="Range"),
     session: AsyncSession = Depends(get_session),
     user: User = Depends(current_active_user),
 ):
     service = ResourceService(session)
     try:
-        file_bytes, media_type, filename = await service.download_resource_file(key)
+        redirect = await service.redirect_resource_file(key)
+        if redirect is not None:
+            return redirect
+        stream, media_type, filename = await service.stream_resource_file(key, parse_range_header(range_header))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except RangeNotSatisfiable:
+        raise range_not_satisfiable()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch resource file: {str(e)}")
 
-    return Response(
-        content=file_bytes,
-        media_type=media_type,
-        headers={"Content-Disposition": f'inline; filename="{filename}"'},
-    )
+    return streaming_file_response(stream, media_type=media_type, filename=filename)
 
 
 @router.get("/resources/{resource_id}", response_model=ResourceDetailRead)
 async def get_resource(
     resource_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     user: User = Depends(current_active_user),
 ):
     service = ResourceService(session)
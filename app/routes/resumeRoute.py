@@ -17,6 +17,8 @@ from app.schemas.resumeSchema import (
 from app.db import get_session
 from app.services.accounts.userService import current_active_user, current_ai_user
 from app.services.storage.storageService import get_resume_storage_location_id
+from app.services.storage.localStorageService import sign_stored_url
+from app.services.storage.uploadSpool import SpooledUpload, UploadTooLarge, spool_upload
 from app.models.userModel import User
 from uuid import UUID
 import logging
@@ -28,12 +30,12 @@ LOGGER.setLevel(logging.DEBUG)
 router = APIRouter()
 
 
-async def _read_upload_within_limit(cv: UploadFile, request: Request) -> bytes:
-    """Read an upload while enforcing a hard size cap.
+async def _spool_upload_within_limit(cv: UploadFile, request: Request) -> SpooledUpload:
+    """Stream an upload into a spool while enforcing a hard size cap.
 
-    Rejects early via Content-Length (so an oversized body is not buffered into
-    memory) and re-checks the actual bytes. Prevents memory exhaustion and
-    storage abuse from very large files.
+    Rejects early via Content-Length, then reads in chunks and stops as soon
+    as the cap is crossed, so neither an oversized body nor a large valid one
+    is ever held in memory as a whole.
     """
     too_large = HTTPException(
         status_code=413,
@@ -42,10 +44,10 @@ async def _read_upload_within_limit(cv: UploadFile, request: Request) -> bytes:
     content_length = request.headers.get("content-length")
     if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
         raise too_large
-    data = await cv.read()
-    if len(data) > MAX_UPLOAD_BYTES:
-        raise too_large
-    return data
+    try:
+        return await spool_upload(cv, max_bytes=MAX_UPLOAD_BYTES)
+    except UploadTooLarge:
+        raise too_large from None
 
 
 def _require_resume_storage_location_id() -> str:
@@ -71,26 +73,29 @@ async def upload_resume(
         raise HTTPException(status_code=400, detail="Only PDF or DOC/DOCX files are allowed.")
 
     # Size cap is the first gate: reject oversized uploads before any other work.
-    file_bytes = await _read_upload_within_limit(cv, request)
-    storage_location_id = _require_resume_storage_location_id()
-
+    upload = await _spool_upload_within_limit(cv, request)
     try:
+        storage_location_id = _require_resume_storage_location_id()
         LOGGER.debug("Initializing ResumeService")
         resume_service = ResumeService(session)
         resume, file_info = await resume_service.create_resume_from_upload(
             user_id=user.id,
             storage_location_id=storage_location_id,
-            file_bytes=file_bytes,
+            upload=upload,
             file_name=cv.filename,
             mime_type=cv.content_type,
         )
         LOGGER.debug("Resume uploaded to storage and record created: %s", resume.id)
         
         # Desactivado: No se generan ni guardan embeddings para el resume
-        return {"file_url": file_info["view_url"], "resume_id": resume.id}
+        return {"file_url": sign_stored_url(file_info["view_url"]), "resume_id": resume.id}
+    except HTTPException:
+        raise
     except Exception as e:
         LOGGER.exception("Upload failed")
         raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
+    finally:
+        upload.close()
 
 
 @router.post("/profile/cv/course-audit-upload", response_model=ResumeCourseAuditRead)
@@ -105,20 +110,23 @@ async def upload_resume_for_course_audit(
         raise HTTPException(status_code=400, detail="Only PDF or DOCX files are allowed for AI audit.")
 
     # Size cap is the first gate: reject oversized uploads before any other work.
-    file_bytes = await _read_upload_within_limit(cv, request)
-    storage_location_id = _require_resume_storage_location_id()
+    upload = await _spool_upload_within_limit(cv, request)
+    try:
+        storage_location_id = _require_resume_storage_location_id()
 
-    audit_service = ResumeCourseAuditService(session)
-    # Cheap pre-check for fast rejection; the atomic reservation happens inside
-    # upload_and_evaluate_resume before any LLM spend.
-    await audit_service.ensure_daily_limit(user.id)
-    payload, _ = await audit_service.upload_and_evaluate_resume(
-        user_id=user.id,
-        storage_location_id=storage_location_id,
-        file_bytes=file_bytes,
-        filename=cv.filename,
-        content_type=cv.content_type,
-    )
+        audit_service = ResumeCourseAuditService(session)
+        # Cheap pre-check for fast rejection; the atomic reservation happens inside
+        # upload_and_evaluate_resume before any LLM spend.
+        await audit_service.ensure_daily_limit(user.id)
+        payload, _ = await audit_service.upload_and_evaluate_resume(
+            user_id=user.id,
+            storage_location_id=storage_location_id,
+            upload=upload,
+            filename=cv.filename,
+            content_type=cv.content_type,
+        )
+    finally:
+        upload.close()
     return ResumeCourseAuditRead(**payload)
 
 
@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.userModel import User
 from app.schemas.roadmapSchema import (
     ProjectSubmissionRead,
@@ -65,7 +65,7 @@ async def _run_roadmap_operation(operation: Callable[[], Awaitable[T]]) -> T:
 async def list_roadmaps(
     search: str | None = Query(default=None),
     sort: str = Query(default="most_saved"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(current_active_user),
 ):
     service = RoadmapService(session)
@@ -86,7 +86,7 @@ async def get_my_roadmaps(
 @router.get("/roadmaps/{slug}", response_model=RoadmapDetailRead)
 async def get_roadmap(
     slug: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(current_active_user),
 ):
     service = RoadmapService(session)
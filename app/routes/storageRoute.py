@@ -0,0 +1,38 @@
+import mimetypes
+import os
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from app.services.storage.localStorageService import LocalStorageService, verify_signed_url
+
+router = APIRouter()
+
+
+@router.get("/storage/{bucket}/{key:path}")
+async def get_local_storage_file(
+    bucket: str,
+    key: str,
+    expires: int = Query(...),
+    signature: str = Query(...),
+):
+    """Serve an object of the local storage backend from a signed URL.
+
+    The signature stands in for authentication, as with S3 presigned URLs.
+    """
+    if not verify_signed_url(bucket, key, expires, signature):
+        raise HTTPException(status_code=403, detail="Invalid or expired storage URL")
+    try:
+        path = LocalStorageService(bucket_name=bucket).local_path(key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    filename = key.rsplit("/", 1)[-1] or "file"
+    return FileResponse(
+        path,
+        media_type=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        filename=filename,
+        content_disposition_type="inline",
+    )
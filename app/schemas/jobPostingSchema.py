@@ -1,8 +1,13 @@
-from pydantic import BaseModel, UUID4, HttpUrl
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field, UUID4, HttpUrl
 from typing import Optional
 from datetime import datetime
 
 
+def _company_field(name: str, attribute: str):
+    # From ``JobPosting.company`` when validating ORM rows, else by name.
+    return Field(default=None, validation_alias=AliasChoices(AliasPath("company", attribute), name))
+
+
 class JobPostingBase(BaseModel):
     title: str
     description: Optional[str] = None
@@ -58,9 +63,39 @@ class JobPostingRead(JobPostingBase):
 
 
 class JobBoardPostingRead(JobPostingRead):
-    company_name: Optional[str] = None
-    company_location: Optional[str] = None
-    company_description: Optional[str] = None
-    company_website: Optional[str] = None
+    company_name: Optional[str] = _company_field("company_name", "company_name")
+    company_location: Optional[str] = _company_field("company_location", "location")
+    company_description: Optional[str] = _company_field("company_description", "description")
+    company_website: Optional[str] = _company_field("company_website", "website")
+    source: str = "students_compass"
+    source_label: str = "Students Compass"
+
+
+class JobBoardPostingSummaryRead(BaseModel):
+    """List-view projection: omits the long ``description``, ``requirements``
+    and ``benefits`` bodies, which are fetched per posting on demand."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID4
+    company_id: UUID4
+    title: str
+    responsibilities: Optional[str] = None
+    location: Optional[str] = None
+    job_type: Optional[str] = None
+    workplace_type: Optional[str] = None
+    seniority_level: Optional[str] = None
+    salary_range: Optional[str] = None
+    listed_context: Optional[str] = None
+    source_context: Optional[str] = None
+    application_url: Optional[str] = None
+    is_active: bool = True
+    expires_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    company_name: Optional[str] = _company_field("company_name", "company_name")
+    company_location: Optional[str] = _company_field("company_location", "location")
+    company_description: Optional[str] = _company_field("company_description", "description")
+    company_website: Optional[str] = _company_field("company_website", "website")
     source: str = "students_compass"
     source_label: str = "Students Compass"
@@ -12,6 +12,14 @@ class PostCreate(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     
+class PostMediaVariantRead(BaseModel):
+    width: int
+    height: int
+    format: str
+    content_type: str
+    url: str
+
+
 class PostRead(BaseModel):
     id: UUID
     caption: str
@@ -19,4 +27,8 @@ class PostRead(BaseModel):
     file_type: str
     file_name: str
     created_at: datetime
+    # Resized image the feed should render (falls back to ``url``), plus every
+    # variant for srcset.
+    display_url: str | None = None
+    variants: list[PostMediaVariantRead] = []
     model_config = ConfigDict(from_attributes=True)
@@ -3,6 +3,8 @@ import uuid
 from fastapi_users import schemas
 from typing import TYPE_CHECKING, Optional
 
+from app.services.storage.localStorageService import sign_stored_url
+
 if TYPE_CHECKING:
     from app.models.resumeModel import ResumeModel
 
@@ -35,7 +37,7 @@ class ResumeReadSchema(BaseModel):
         return cls(
             id=resume.id,
             user_id=resume.user_id,
-            view_url=resume.view_url,
+            view_url=sign_stored_url(resume.view_url),
             original_filename=resume.original_filename,
             storage_file_id=resume.storage_file_id,
             folder_id=resume.folder_id,
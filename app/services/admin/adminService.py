@@ -28,7 +28,9 @@ from app.models.questionnaireModel import UserQuestionnaire
 from app.models.resumeModel import ResumeModel
 from app.models.userStatsModel import UserStatsModel
 from app.services.accounts.userService import current_active_user
+from app.services.jobs.jobSearchCache import invalidate_internal_job_search_cache
 from app.services.resources.resourceLessonContentCodec import ResourceLessonContentCodec
+from app.services.storage.localStorageService import sign_stored_url
 from app.services.storage.storageService import (
     StorageService,
     get_resource_storage_location_id,
@@ -311,7 +313,7 @@ class AdminService:
         )
         return {
             "file_key": upload_result["file_key"],
-            "file_url": upload_result["file_url"],
+            "file_url": sign_stored_url(upload_result["file_url"]),
             "original_filename": safe_name,
             "content_type": content_type or "application/octet-stream",
         }
@@ -383,6 +385,7 @@ class AdminService:
             return None
         job.is_active = not job.is_active
         await self.session.commit()
+        await invalidate_internal_job_search_cache()
         await self.session.refresh(job)
         return job
 
@@ -395,6 +398,7 @@ class AdminService:
             return False
         await self.session.delete(job)
         await self.session.commit()
+        await invalidate_internal_job_search_cache()
         return True
 
     # ── Companies ──────────────────────────────────────────────────────
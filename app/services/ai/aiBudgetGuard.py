@@ -17,7 +17,7 @@ import logging
 from datetime import datetime
 
 from app.config import AI_GLOBAL_DAILY_BUDGET, AI_LLM_CALLS_PER_MIN
-from app.services.ratelimit.counterStore import CounterStoreError, get_counter_store
+from app.services.ratelimit.counterStore import CounterStoreError, LimitCheck, get_counter_store
 
 LOGGER = logging.getLogger(__name__)
 
@@ -56,30 +56,28 @@ async def ensure_llm_budget(*, units: int = 1) -> None:
         LOGGER.warning("AI kill switch is enabled; refusing LLM call.")
         raise AIBudgetExhausted()
 
-    store = get_counter_store()
-
-    # Per-minute call-rate ceiling (cross-replica smoothing).
+    # Per-minute call-rate ceiling (cross-replica smoothing) and the daily
+    # global budget, checked together in one store round trip. A refused call
+    # consumes neither.
+    checks = (
+        LimitCheck("ai:llm:rate", limit=AI_LLM_CALLS_PER_MIN, window_seconds=_RATE_WINDOW_SECONDS),
+        LimitCheck(
+            _global_budget_key(),
+            limit=AI_GLOBAL_DAILY_BUDGET,
+            window_seconds=_BUDGET_TTL_SECONDS,
+            kind="counter",
+            amount=units,
+        ),
+    )
     try:
-        allowed, _ = await store.sliding_window_allow(
-            "ai:llm:rate",
-            max_requests=AI_LLM_CALLS_PER_MIN,
-            window_seconds=_RATE_WINDOW_SECONDS,
-        )
+        result = await get_counter_store().check_limits(checks)
     except CounterStoreError:
-        LOGGER.error("Budget store unavailable on rate check; failing closed.")
+        LOGGER.error("Budget store unavailable; failing closed.")
         raise AIBudgetExhausted()
-    if not allowed:
+    if result.allowed:
+        return
+    if result.denied_index == 0:
         LOGGER.warning("Global LLM call-rate ceiling reached.")
-        raise AIBudgetExhausted()
-
-    # Daily global budget ceiling.
-    try:
-        new_total = await store.incr(_global_budget_key(), ttl_seconds=_BUDGET_TTL_SECONDS, amount=units)
-    except CounterStoreError:
-        LOGGER.error("Budget store unavailable on budget check; failing closed.")
-        raise AIBudgetExhausted()
-    if new_total > AI_GLOBAL_DAILY_BUDGET:
-        LOGGER.error(
-            "Global daily AI budget exhausted: %s/%s", new_total, AI_GLOBAL_DAILY_BUDGET
-        )
-        raise AIBudgetExhausted()
+    else:
+        LOGGER.error("Global daily AI budget exhausted: %s units", AI_GLOBAL_DAILY_BUDGET)
+    raise AIBudgetExhausted()
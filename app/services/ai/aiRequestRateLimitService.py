@@ -5,6 +5,8 @@ from time import monotonic
 
 from fastapi import HTTPException, Request
 
+from app.services.ratelimit.counterStore import gcra_decision
+
 AI_ANALYSIS_RATE_LIMIT_PER_MINUTE = 5
 AI_ANALYSIS_RATE_LIMIT_WINDOW_SECONDS = 60
 AI_ANALYSIS_RATE_LIMIT_MESSAGE = "Too many analysis requests right now. Please wait a minute and try again."
@@ -16,10 +18,16 @@ class AIRequestRateLimitService:
         *,
         max_requests: int = AI_ANALYSIS_RATE_LIMIT_PER_MINUTE,
         window_seconds: int = AI_ANALYSIS_RATE_LIMIT_WINDOW_SECONDS,
+        algorithm: str = "window",
     ):
+        if algorithm not in {"window", "gcra"}:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self.algorithm = algorithm
         self._events: dict[str, deque[float]] = {}
+        # GCRA keeps one theoretical arrival time per IP instead of a deque.
+        self._arrivals: dict[str, float] = {}
         self._checks_since_sweep = 0
 
     # Run a full sweep of stale IPs once every N checks. This bounds the
@@ -35,6 +43,8 @@ class AIRequestRateLimitService:
         ]
         for ip in stale:
             self._events.pop(ip, None)
+        for ip in [ip for ip, arrival in self._arrivals.items() if arrival <= now]:
+            del self._arrivals[ip]
 
     @staticmethod
     def get_client_ip(request: Request) -> str:
@@ -51,6 +61,15 @@ class AIRequestRateLimitService:
             self._checks_since_sweep = 0
             self._sweep_stale_ips(now)
 
+        if self.algorithm == "gcra":
+            allowed, arrival, _ = gcra_decision(
+                self._arrivals.get(ip), now, limit=self.max_requests, period_seconds=self.window_seconds
+            )
+            if not allowed:
+                raise HTTPException(status_code=429, detail=AI_ANALYSIS_RATE_LIMIT_MESSAGE)
+            self._arrivals[ip] = arrival
+            return
+
         timestamps = self._events.get(ip)
         if timestamps is None:
             timestamps = deque()
@@ -73,4 +92,4 @@ class AIRequestRateLimitService:
         self.check_ip(self.get_client_ip(request))
 
 
-ai_analysis_rate_limiter = AIRequestRateLimitService()
+ai_analysis_rate_limiter = AIRequestRateLimitService(algorithm="gcra")
@@ -13,7 +13,7 @@ from app.config import AI_BASE_DAILY_LIMIT
 from app.models.aiUsageModel import AIQuotaGrantModel, AIUsageEventModel
 from app.models.jobAnalysisModel import JobAnalysisModel
 from app.models.resumeCourseEvaluationModel import ResumeCourseEvaluationModel
-from app.services.ratelimit.counterStore import CounterStore, CounterStoreError, get_counter_store
+from app.services.ratelimit.counterStore import CounterStore, CounterStoreError, QuotaSeed, get_counter_store
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +27,8 @@ class AIFeature:
     RESUME_COURSE_AUDIT = "resume_course_audit"
     MOCK_INTERVIEW = "mock_interview"
 
+    ALL = (CV_JOB_SEARCH, RESUME_COURSE_AUDIT, MOCK_INTERVIEW)
+
 
 @dataclass(frozen=True)
 class AIUsageSummary:
@@ -166,39 +168,110 @@ class AIUsageService:
         day = datetime.utcnow().strftime("%Y%m%d")
         return f"ai:quota:{user_id}:{feature}:{day}"
 
+    @staticmethod
+    def _limit_key(user_id: UUID, feature: str) -> str:
+        day = datetime.utcnow().strftime("%Y%m%d")
+        return f"ai:quota:limit:{user_id}:{feature}:{day}"
+
+    async def _limit_ttl_seconds(self, user_id: UUID) -> int:
+        """Cache a resolved limit until the next time one of the user's grants
+        starts or ends, so scheduled grants take effect without a write."""
+        now = datetime.utcnow()
+        active = [AIQuotaGrantModel.user_id == user_id, AIQuotaGrantModel.is_active.is_(True)]
+        result = await self.session.execute(
+            select(
+                select(func.min(AIQuotaGrantModel.starts_at))
+                .where(*active, AIQuotaGrantModel.starts_at > now)
+                .scalar_subquery(),
+                select(func.min(AIQuotaGrantModel.ends_at))
+                .where(*active, AIQuotaGrantModel.ends_at > now)
+                .scalar_subquery(),
+            )
+        )
+        boundaries = [boundary for boundary in result.one() if boundary is not None]
+        if not boundaries:
+            return _QUOTA_TTL_SECONDS
+        return max(1, min(_QUOTA_TTL_SECONDS, int((min(boundaries) - now).total_seconds()) + 1))
+
+    async def _quota_seed(self, *, user_id: UUID, feature: str) -> QuotaSeed:
+        return QuotaSeed(
+            # Seed the atomic counter from durable DB usage so a counter reset
+            # (process restart / fresh Redis) can never hand back already-spent quota.
+            base=await self.get_used_today(user_id=user_id, feature=feature),
+            limit=await self.get_daily_limit(user_id=user_id, feature=feature),
+            ttl_seconds=_QUOTA_TTL_SECONDS,
+            limit_ttl_seconds=await self._limit_ttl_seconds(user_id),
+        )
+
+    async def invalidate_quota_limits(self, user_id: UUID) -> None:
+        """Drop the user's cached daily limits; the next reservation of each
+        feature re-resolves them from the DB. Call after changing grants."""
+        try:
+            await get_counter_store().delete(*(self._limit_key(user_id, feature) for feature in AIFeature.ALL))
+        except CounterStoreError:
+            LOGGER.warning("Could not invalidate cached AI quota limits for user %s", user_id)
+
+    async def add_quota_grant(
+        self,
+        *,
+        user_id: UUID,
+        daily_extra_units: int,
+        feature: str | None = None,
+        starts_at: datetime | None = None,
+        ends_at: datetime | None = None,
+        reason: str | None = None,
+    ) -> AIQuotaGrantModel:
+        """Record and commit a grant; it applies from the next reservation."""
+        grant = AIQuotaGrantModel(
+            user_id=user_id,
+            feature=feature,
+            daily_extra_units=daily_extra_units,
+            starts_at=starts_at or datetime.utcnow(),
+            ends_at=ends_at,
+            reason=reason,
+        )
+        self.session.add(grant)
+        # Committed before the cached limits are dropped: a reservation in
+        # between would otherwise re-cache the limit without the grant.
+        await self.session.commit()
+        await self.invalidate_quota_limits(user_id)
+        return grant
+
     async def reserve(self, *, user_id: UUID, feature: str) -> QuotaReservation:
         """Atomically claim one daily AI slot *before* spending on the LLM.
 
         Uses an atomic counter (Redis when configured) so that N concurrent
         requests cannot all pass the check and overspend — only callers whose
-        post-increment value stays within the resolved daily limit proceed.
+        increment stays within the resolved daily limit proceed.
         Closes the read-then-write (TOCTOU) race the old ``ensure_available``
-        path had. The caller must :meth:`commit_usage` on success or
+        path had. The resolved limit is cached next to the counter for the
+        day (see :meth:`invalidate_quota_limits`), so DB queries only run when
+        either is missing. The caller must :meth:`commit_usage` on success or
         ``reservation.release()`` on failure before the spend.
         """
-        daily_limit = await self.get_daily_limit(user_id=user_id, feature=feature)
         store = get_counter_store()
         key = self._quota_key(user_id, feature)
-        # Seed the atomic counter from durable DB usage so a counter reset
-        # (process restart / fresh Redis) can never hand back already-spent quota.
-        db_used = await self.get_used_today(user_id=user_id, feature=feature)
+        limit_key = self._limit_key(user_id, feature)
 
         try:
-            new_value = await store.reserve_incr(key, base=db_used, ttl_seconds=_QUOTA_TTL_SECONDS)
+            # Steady state: the counter and the resolved limit are both cached,
+            # so this is one store call and no DB queries.
+            outcome = await store.reserve_quota(key, limit_key=limit_key)
+            if outcome is None:
+                seed = await self._quota_seed(user_id=user_id, feature=feature)
+                outcome = await store.reserve_quota(key, limit_key=limit_key, seed=seed)
         except CounterStoreError:
             # Redis unreachable: best-effort DB count (not atomic, but the global
             # budget guard remains the hard cost ceiling). Fail closed on limit.
             LOGGER.warning("AI quota counter unavailable; falling back to DB count for user %s", user_id)
+            daily_limit = await self.get_daily_limit(user_id=user_id, feature=feature)
             used = await self.get_used_today(user_id=user_id, feature=feature)
             if used >= daily_limit:
                 raise self._limit_exceeded(daily_limit)
             return QuotaReservation(user_id=user_id, feature=feature, key=key, store=store, db_fallback=True)
 
-        if new_value > daily_limit:
-            try:
-                await store.decr(key)
-            except CounterStoreError:
-                pass
+        allowed, daily_limit = outcome
+        if not allowed:
             raise self._limit_exceeded(daily_limit)
 
         return QuotaReservation(user_id=user_id, feature=feature, key=key, store=store)
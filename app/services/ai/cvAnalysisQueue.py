@@ -0,0 +1,175 @@
+"""Durable work queue for CV analyses, backed by the ``job_analysis`` table.
+
+Each pending ``JobAnalysisModel`` row is a queue message. Workers claim due rows
+with ``SELECT ... FOR UPDATE SKIP LOCKED`` (Postgres; other dialects ignore the
+clause, which is fine for the single-worker SQLite test setup), so concurrent
+workers never claim the same row. A claim increments ``attempts`` and sets a
+lease (``lease_expires_at``): if the worker dies, the lease lapses and the job
+becomes visible again, which is the queue's visibility timeout. Workers renew
+the lease while an analysis runs, so only a dead worker's jobs lapse.
+
+A failed attempt is either rescheduled with exponential backoff
+(``available_at``) or, once ``CV_ANALYSIS_MAX_ATTEMPTS`` is reached,
+dead-lettered: marked ``FAILED`` with ``dead_lettered_at`` set, so exhausted
+jobs can be told apart from ordinary failures and replayed by hand.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import (
+    CV_ANALYSIS_MAX_ATTEMPTS,
+    CV_ANALYSIS_RETRY_BACKOFF_MAX_SECONDS,
+    CV_ANALYSIS_RETRY_BACKOFF_SECONDS,
+    CV_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS,
+)
+from app.models.jobAnalysisModel import JobAnalysisModel, JobStatus
+from app.services.ai.aiUsageService import AIFeature, QuotaReservation
+from app.services.ai.cvAnalysisService import friendly_analysis_error_message
+from app.services.ratelimit.counterStore import get_counter_store
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ClaimedAnalysis:
+    job_id: UUID
+    user_id: UUID
+    resume_id: Optional[UUID]
+    attempts: int
+    quota_key: Optional[str]
+
+    def reservation(self) -> QuotaReservation:
+        """Rebuild the quota reservation taken when the job was enqueued."""
+        return QuotaReservation(
+            user_id=self.user_id,
+            feature=AIFeature.CV_JOB_SEARCH,
+            key=self.quota_key or "",
+            store=get_counter_store(),
+            db_fallback=self.quota_key is None,
+        )
+
+
+def retry_backoff_seconds(attempts: int) -> int:
+    return min(
+        CV_ANALYSIS_RETRY_BACKOFF_MAX_SECONDS,
+        CV_ANALYSIS_RETRY_BACKOFF_SECONDS * 2 ** max(0, attempts - 1),
+    )
+
+
+class CVAnalysisQueue:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        visibility_timeout_seconds: int = CV_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS,
+        max_attempts: int = CV_ANALYSIS_MAX_ATTEMPTS,
+    ):
+        self.session = session
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self.max_attempts = max_attempts
+
+    async def claim(self, *, limit: int) -> list[ClaimedAnalysis]:
+        """Lease up to ``limit`` due jobs to the caller."""
+        now = datetime.utcnow()
+        jobs: Sequence[JobAnalysisModel] = (
+            await self.session.scalars(
+                select(JobAnalysisModel)
+                .where(JobAnalysisModel.status.in_([JobStatus.PENDING, JobStatus.PROCESSING]))
+                .where(or_(JobAnalysisModel.available_at.is_(None), JobAnalysisModel.available_at <= now))
+                # A PROCESSING row with a lapsed (or no) lease was abandoned.
+                .where(
+                    or_(
+                        JobAnalysisModel.lease_expires_at.is_(None),
+                        JobAnalysisModel.lease_expires_at <= now,
+                    )
+                )
+                .order_by(JobAnalysisModel.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+
+        lease_expires_at = now + timedelta(seconds=self.visibility_timeout_seconds)
+        claimed = []
+        for job in jobs:
+            job.status = JobStatus.PROCESSING
+            job.attempts = (job.attempts or 0) + 1
+            job.lease_expires_at = lease_expires_at
+            claimed.append(
+                ClaimedAnalysis(
+                    job_id=job.id,
+                    user_id=job.user_id,
+                    resume_id=job.resume_id,
+                    attempts=job.attempts,
+                    quota_key=job.quota_key,
+                )
+            )
+        await self.session.commit()
+        return claimed
+
+    async def extend_lease(self, claimed: ClaimedAnalysis) -> bool:
+        """Renew the lease of a job still running under ``claimed``. Returns
+        ``False`` once the job has left that attempt (finished, rescheduled or
+        reclaimed after a lapse)."""
+        result = await self.session.execute(
+            update(JobAnalysisModel)
+            .where(JobAnalysisModel.id == claimed.job_id)
+            .where(JobAnalysisModel.status == JobStatus.PROCESSING)
+            .where(JobAnalysisModel.attempts == claimed.attempts)
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=self.visibility_timeout_seconds))
+        )
+        await self.session.commit()
+        return result.rowcount == 1
+
+    async def complete(self, claimed: ClaimedAnalysis) -> None:
+        """Drop the lease once the analysis has reached a final state."""
+        job = await self.session.get(JobAnalysisModel, claimed.job_id)
+        if job is not None and job.lease_expires_at is not None:
+            job.lease_expires_at = None
+            await self.session.commit()
+
+    async def fail(self, claimed: ClaimedAnalysis, error: Exception) -> bool:
+        """Record a failed attempt. Returns ``True`` when the job was
+        dead-lettered and ``False`` when it was scheduled for a retry."""
+        job = await self.session.get(JobAnalysisModel, claimed.job_id)
+        if job is None:
+            await claimed.reservation().release()
+            return True
+
+        now = datetime.utcnow()
+        job.lease_expires_at = None
+        if claimed.attempts < self.max_attempts:
+            delay = retry_backoff_seconds(claimed.attempts)
+            job.status = JobStatus.PENDING
+            job.available_at = now + timedelta(seconds=delay)
+            await self.session.commit()
+            LOGGER.warning(
+                "CV analysis %s attempt %s failed (%s); retrying in %ss",
+                claimed.job_id,
+                claimed.attempts,
+                error,
+                delay,
+            )
+            return False
+
+        await claimed.reservation().release()
+        job.status = JobStatus.FAILED
+        job.error_message = friendly_analysis_error_message(error)
+        job.completed_at = now
+        job.dead_lettered_at = now
+        await self.session.commit()
+        LOGGER.error(
+            "CV analysis %s dead-lettered after %s attempts: %s",
+            claimed.job_id,
+            claimed.attempts,
+            error,
+        )
+        return True
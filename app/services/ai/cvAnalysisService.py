@@ -9,12 +9,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.resume_analyzer.contact_parser import extract_phone_number
-from app.core.resume_analyzer.llm_model import ask_llm_model
-from app.core.resume_analyzer.resume_text_extractor import extract_resume_text_from_bytes
+from app.core.resume_analyzer.llm_errors import is_non_retryable_llm_error
+from app.core.resume_analyzer.llm_model import ask_llm_model, resume_text_sha256
 from app.models.jobAnalysisModel import JobAnalysisModel, JobStatus
 from app.models.resumeModel import ResumeModel
-from app.services.ai.aiBudgetGuard import ensure_llm_budget
+from app.services.ai.aiBudgetGuard import AIBudgetExhausted, ensure_llm_budget
 from app.services.ai.aiUsageService import AIFeature, AIUsageService, QuotaReservation
+from app.services.ai.llmResultCache import LLMResultCache
 from app.services.analytics.embeddingService import ResumeEmbeddingService
 from app.services.resumes.resumeService import ResumeService
 
@@ -36,6 +37,13 @@ LLM_GENERAL_FAILURE_MESSAGE = (
 )
 
 
+def is_retryable_analysis_error(error: Exception) -> bool:
+    """Global budget refusals and provider errors the gateway already treats
+    as permanent (exhausted quota, bad credentials) will not clear on a retry;
+    everything else (provider hiccups, storage timeouts, DB blips) might."""
+    return not isinstance(error, AIBudgetExhausted) and not is_non_retryable_llm_error(error)
+
+
 def friendly_analysis_error_message(error: Exception) -> str:
     raw = str(error or "").strip().lower()
 
@@ -63,6 +71,7 @@ class CVAnalysisService:
         self.session = session
         self.resume_service = ResumeService(session)
         self.ai_usage_service = AIUsageService(session)
+        self.llm_result_cache = LLMResultCache(session)
 
     async def reserve_slot(self, user_id: UUID) -> QuotaReservation:
         """Atomically claim a daily slot before any LLM spend (TOCTOU-safe)."""
@@ -112,11 +121,23 @@ class CVAnalysisService:
             .limit(1)
         )
 
-    async def create_pending_analysis(self, *, user_id: UUID, resume_id: UUID) -> JobAnalysisModel:
+    async def create_pending_analysis(
+        self,
+        *,
+        user_id: UUID,
+        resume_id: UUID,
+        reservation: QuotaReservation | None = None,
+    ) -> JobAnalysisModel:
+        """Persist a pending analysis; the row is picked up by a queue worker.
+
+        The reservation's counter key is stored on the row so the worker can
+        release the slot if the analysis never reaches the LLM.
+        """
         job = JobAnalysisModel(
             user_id=user_id,
             resume_id=resume_id,
             status=JobStatus.PENDING,
+            quota_key=None if reservation is None or reservation.db_fallback else reservation.key,
         )
         self.session.add(job)
         await self.session.commit()
@@ -179,7 +200,14 @@ class CVAnalysisService:
         user_id: UUID,
         resume_id: UUID,
         reservation: QuotaReservation | None = None,
+        raise_retryable: bool = False,
     ) -> None:
+        """Run one analysis to completion or failure.
+
+        With ``raise_retryable`` a retryable error is re-raised untouched (the
+        reservation is kept and the job is not failed) so the queue worker can
+        schedule another attempt.
+        """
         try:
             job = await self._get_job(job_id)
             if not job:
@@ -211,6 +239,8 @@ class CVAnalysisService:
 
             await self._process_resume(job=job, resume=resume, user_id=user_id, reservation=reservation)
         except Exception as exc:  # noqa: BLE001
+            if raise_retryable and is_retryable_analysis_error(exc):
+                raise
             LOGGER.exception("Error processing job %s", job_id)
             await self._release(reservation)
             await self._fail_current_job(job_id, friendly_analysis_error_message(exc))
@@ -228,16 +258,13 @@ class CVAnalysisService:
         user_id: UUID,
         reservation: QuotaReservation | None = None,
     ) -> None:
-        LOGGER.info("Downloading CV for job %s: %s", job.id, resume.storage_file_id)
-        file_content = await self.resume_service.download_resume_file(resume.storage_file_id)
-
-        LOGGER.info("Extracting text from CV for job %s", job.id)
-        resume_text = await extract_resume_text_from_bytes(
-            file_content,
+        LOGGER.info("Loading CV text for job %s: %s", job.id, resume.storage_file_id)
+        resume_text = await self.resume_service.get_resume_text(
+            resume.storage_file_id,
             filename=resume.original_filename,
-            content_type="",
         )
         extracted_phone = extract_phone_number(resume_text)
+        resume.text_sha256 = resume_text_sha256(resume_text) if resume_text else None
 
         if not resume_text or len(resume_text.strip()) < 50:
             # No LLM call for unusable text, so the reserved slot is returned.
@@ -251,13 +278,20 @@ class CVAnalysisService:
             LOGGER.warning("CV text too short for job %s", job.id)
             return
 
-        # Global cost ceiling / kill switch — fail closed to "Manual mode".
-        await ensure_llm_budget()
-
-        LOGGER.info("Analyzing CV with LLM for job %s", job.id)
-        resume_feature = await ask_llm_model(resume_text)
-        if reservation is not None:
-            await self._commit_usage(reservation, job_id=job.id)
+        resume_feature = await self.llm_result_cache.get(resume_text)
+        if resume_feature is not None:
+            # Identical text was analyzed before: no LLM spend, slot returned.
+            LOGGER.info("Job %s served from the LLM result cache", job.id)
+            await self._release(reservation)
+        else:
+            # Global cost ceiling / kill switch — fail closed to "Manual mode".
+            await ensure_llm_budget()
+
+            LOGGER.info("Analyzing CV with LLM for job %s", job.id)
+            resume_feature = await ask_llm_model(resume_text)
+            await self.llm_result_cache.put(resume_text, resume_feature)
+            if reservation is not None:
+                await self._commit_usage(reservation, job_id=job.id)
 
         if resume_feature.resume_keywords:
             keywords = ", ".join(resume_feature.resume_keywords[:5])
@@ -0,0 +1,153 @@
+"""Content-addressed cache of validated LLM resume analyses.
+
+Two uploads whose extracted text normalizes to the same string produce the
+same analysis, whoever uploaded them. Results are keyed by
+``sha256(text_sha256, prompt version, model)`` and stored in the database
+with an expiry, so a repeat analysis skips the LLM call, the global budget
+and the user's quota.
+
+Privacy: the stored payload omits ``resume_text``, and deleting a resume
+purges every entry derived from its text (see ``ResumeService.delete_resume``).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from pydantic import ValidationError
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import LLM_RESULT_CACHE_TTL_SECONDS
+from app.core.resume_analyzer.llm_model import DEFAULT_LLM_MODEL, RESUME_PROMPT_VERSION, resume_text_sha256
+from app.core.resume_analyzer.resume_feature import ResumeFeatureRequest
+from app.models.llmResultCacheModel import LLMResultCacheModel
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMResultCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes, "hit_rate": self.hit_rate}
+
+
+_stats = LLMResultCacheStats()
+
+
+def get_llm_result_cache_stats() -> LLMResultCacheStats:
+    """Process-wide lookup counters."""
+    return _stats
+
+
+def reset_llm_result_cache_stats() -> None:
+    global _stats
+    _stats = LLMResultCacheStats()
+
+
+class LLMResultCache:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        ttl_seconds: int = LLM_RESULT_CACHE_TTL_SECONDS,
+        model_name: str = DEFAULT_LLM_MODEL,
+        prompt_version: str = RESUME_PROMPT_VERSION,
+    ):
+        self.session = session
+        self.ttl_seconds = ttl_seconds
+        self.model_name = model_name
+        self.prompt_version = prompt_version
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def key_for(self, text_sha256: str) -> str:
+        raw = "\x1f".join((text_sha256, self.prompt_version, self.model_name))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, resume_text: str) -> ResumeFeatureRequest | None:
+        if not self.enabled:
+            return None
+        row = await self.session.get(LLMResultCacheModel, self.key_for(resume_text_sha256(resume_text)))
+        now = datetime.utcnow()
+        if row is None or row.expires_at <= now:
+            _stats.misses += 1
+            return None
+        try:
+            result = ResumeFeatureRequest.model_validate({**json.loads(row.payload), "resume_text": resume_text})
+        except (ValueError, ValidationError):
+            # Written by an incompatible schema; treat as a miss and let the
+            # fresh result overwrite it.
+            LOGGER.warning("Discarding unreadable LLM cache entry %s", row.cache_key)
+            _stats.misses += 1
+            return None
+        row.hit_count = (row.hit_count or 0) + 1
+        row.last_hit_at = now
+        _stats.hits += 1
+        return result
+
+    async def put(self, resume_text: str, result: ResumeFeatureRequest) -> None:
+        """Stage ``result`` in the session; it is persisted by the caller's commit."""
+        if not self.enabled:
+            return
+        text_sha256 = resume_text_sha256(resume_text)
+        cache_key = self.key_for(text_sha256)
+        now = datetime.utcnow()
+        values = dict(
+            text_sha256=text_sha256,
+            prompt_version=self.prompt_version,
+            model_name=self.model_name,
+            payload=json.dumps(result.model_dump(exclude={"resume_text"}, exclude_none=True)),
+            created_at=now,
+            expires_at=now + timedelta(seconds=self.ttl_seconds),
+        )
+        # Puts happen once per LLM call, so sweeping expired rows here keeps
+        # the table bounded without a separate job.
+        await self.purge_expired()
+        dialect = self.session.get_bind().dialect.name
+        if dialect in {"postgresql", "sqlite"}:
+            # Upsert: a concurrent worker may have stored the same analysis.
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            await self.session.execute(
+                insert(LLMResultCacheModel)
+                .values(cache_key=cache_key, hit_count=0, **values)
+                .on_conflict_do_update(index_elements=["cache_key"], set_=values)
+            )
+        else:
+            row = await self.session.get(LLMResultCacheModel, cache_key)
+            if row is None:
+                self.session.add(LLMResultCacheModel(cache_key=cache_key, hit_count=0, **values))
+            else:
+                for name, value in values.items():
+                    setattr(row, name, value)
+        _stats.writes += 1
+
+    async def purge(self, text_sha256: str) -> int:
+        """Drop every cached result derived from this text (any prompt/model)."""
+        result = await self.session.execute(
+            delete(LLMResultCacheModel).where(LLMResultCacheModel.text_sha256 == text_sha256)
+        )
+        return int(result.rowcount or 0)
+
+    async def purge_expired(self) -> int:
+        result = await self.session.execute(
+            delete(LLMResultCacheModel).where(LLMResultCacheModel.expires_at <= datetime.utcnow())
+        )
+        return int(result.rowcount or 0)
@@ -156,18 +156,14 @@ class CapstoneAnalyticsService:
         Decouples the Career Lab from ``ai_summary`` (which is only populated by
         the separate, quota-limited Jobs CV analysis). No LLM call, no quota.
         """
-        from app.core.resume_analyzer.resume_text_extractor import extract_resume_text_from_bytes
         from app.services.resumes.resumeService import ResumeService
 
         if not resume.storage_file_id:
             return []
         try:
-            resume_service = ResumeService(self.session)
-            file_content = await resume_service.download_resume_file(resume.storage_file_id)
-            resume_text = await extract_resume_text_from_bytes(
-                file_content,
+            resume_text = await ResumeService(self.session).get_resume_text(
+                resume.storage_file_id,
                 filename=resume.original_filename,
-                content_type="",
             )
         except Exception:  # noqa: BLE001 — storage/extraction issues must not 500 the analysis
             LOGGER.exception("Could not read resume file for skill extraction (resume %s)", resume.id)
@@ -239,28 +235,74 @@ class CapstoneAnalyticsService:
 
     async def extract_job_skills_for_open_postings(self, *, limit: int = 100) -> dict[str, int]:
         result = await self.session.execute(
-            select(JobPosting)
+            select(JobPosting.id)
             .where(JobPosting.is_active.is_(True))
             .order_by(JobPosting.created_at.desc())
             .limit(max(1, min(limit, 500)))
         )
-        jobs = list(result.scalars().all())
+        return await self.extract_job_skills_for_job_postings(list(result.scalars().all()))
+
+    async def extract_job_skills_for_job_postings(
+        self,
+        job_posting_ids: list[UUID],
+        *,
+        extraction_method: str = "job_posting_rules_v1",
+        lookup: dict[str, SkillModel] | None = None,
+    ) -> dict[str, int]:
+        """Extract skills for many postings with a constant number of queries.
 
-        # Build the skill lookup once for the whole batch instead of reloading
-        # the full skills + aliases tables for every job.
-        lookup = await self.build_skill_lookup()
+        The skill lookup, the postings and their existing links are each loaded
+        once for the whole batch, and every new link is written in one commit.
+        """
+        if not job_posting_ids:
+            return {"jobs_scanned": 0, "jobs_with_matches": 0, "job_skill_links": 0}
+
+        jobs_result = await self.session.execute(
+            select(JobPosting).where(JobPosting.id.in_(job_posting_ids))
+        )
+        jobs = list(jobs_result.scalars().all())
+        if lookup is None:
+            lookup = await self.build_skill_lookup()
+
+        existing_result = await self.session.execute(
+            select(JobSkillModel.job_posting_id, JobSkillModel.skill_id).where(
+                JobSkillModel.job_posting_id.in_(job_posting_ids),
+                JobSkillModel.extraction_method == extraction_method,
+            )
+        )
+        existing_pairs = {(row.job_posting_id, row.skill_id) for row in existing_result.all()}
 
         total_links = 0
         jobs_with_matches = 0
         for job in jobs:
-            links = await self.extract_job_skills_from_job_posting(
-                job_posting_id=job.id,
+            text = self._job_posting_text(job)
+            if not text.strip():
+                continue
+            matches = await self.skill_extraction_service.extract_known_skills_from_text(
+                text,
                 lookup=lookup,
+                extraction_method=extraction_method,
             )
-            total_links += len(links)
-            if links:
-                jobs_with_matches += 1
+            if not matches:
+                continue
+            jobs_with_matches += 1
+            total_links += len(matches)
+            target_role = self._infer_target_role(job.title)
+            for match in matches:
+                if (job.id, match.skill.id) in existing_pairs:
+                    continue
+                self.session.add(
+                    JobSkillModel(
+                        job_posting_id=job.id,
+                        skill_id=match.skill.id,
+                        target_role=target_role,
+                        importance_score=0.75,
+                        extraction_method=match.extraction_method,
+                        evidence_text=match.evidence_text,
+                    )
+                )
 
+        await self.session.commit()
         return {
             "jobs_scanned": len(jobs),
             "jobs_with_matches": jobs_with_matches,
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.metrics import CP_SAT_SOLVE_SECONDS
 from app.services.analytics.courseCatalogQueries import load_active_course_links
 
 try:
@@ -574,8 +576,10 @@ class ORToolsLearningRouteOptimizer:
         solver.parameters.num_search_workers = 1
         solver.parameters.random_seed = 42
 
+        started = time.perf_counter()
         status = solver.Solve(model)
         solver_status = self._solver_status_name(solver, status)
+        CP_SAT_SOLVE_SECONDS.labels(solver_status).observe(time.perf_counter() - started)
         if solver_status not in {"OPTIMAL", "FEASIBLE"}:
             return {
                 "solver_status": solver_status,
@@ -6,6 +6,7 @@ from typing import Awaitable, Callable
 
 import numpy as np
 
+from app.metrics import EMBEDDING_CACHE_LOOKUPS
 from app.services.analytics.embeddingService import (
     generate_embedding,
     get_embedding_provider,
@@ -252,6 +253,7 @@ class SemanticMatchingService:
         if self._use_shared_cache:
             key = (get_embedding_provider(), text)
             cached = _SKILL_EMBEDDING_CACHE.get(key)
+            EMBEDDING_CACHE_LOOKUPS.labels("shared", "miss" if cached is None else "hit").inc()
             if cached is not None:
                 _SKILL_EMBEDDING_CACHE.move_to_end(key)
                 return cached
@@ -261,6 +263,7 @@ class SemanticMatchingService:
             return embedding
 
         cached = self._local_cache.get(text)
+        EMBEDDING_CACHE_LOOKUPS.labels("local", "miss" if cached is None else "hit").inc()
         if cached is not None:
             return cached
         embedding = await self.embedding_fn(text)
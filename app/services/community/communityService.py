@@ -286,13 +286,13 @@ class CommunityService:
         for post, first_name, last_name, nickname, lc, cc, my_like in rows:
             author = build_display_name(first_name=first_name, last_name=last_name, nickname=nickname)
             enriched.append({
-                "id": str(post.id),
-                "community_id": str(post.community_id),
-                "user_id": str(post.user_id),
+                "id": post.id,
+                "community_id": post.community_id,
+                "user_id": post.user_id,
                 "title": post.title,
                 "content": post.content,
                 "post_type": post.post_type,
-                "created_at": post.created_at.isoformat(),
+                "created_at": post.created_at,
                 "author_name": author,
                 "like_count": lc,
                 "comment_count": cc,
@@ -320,11 +320,11 @@ class CommunityService:
         for comment, first_name, last_name, nickname in rows:
             author = build_display_name(first_name=first_name, last_name=last_name, nickname=nickname)
             enriched.append({
-                "id": str(comment.id),
-                "post_id": str(comment.post_id),
-                "user_id": str(comment.user_id),
+                "id": comment.id,
+                "post_id": comment.post_id,
+                "user_id": comment.user_id,
                 "content": comment.content,
-                "created_at": comment.created_at.isoformat(),
+                "created_at": comment.created_at,
                 "author_name": author,
             })
         return enriched
@@ -1,8 +1,47 @@
+from app.config import FEED_IMAGE_WIDTH
 from app.models.postModel import PostModel
 from sqlalchemy import select
-from app.schemas.postSchema import PostCreate, PostRead
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.postSchema import PostCreate, PostMediaVariantRead, PostRead
+from app.services.storage.imageVariants import select_image_variant
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from uuid import UUID
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+
+def to_post_read(post: PostModel, *, width: int = FEED_IMAGE_WIDTH, accept_webp: bool = True) -> PostRead:
+    manifest = post.media_variants
+    variant = select_image_variant(manifest, width=width, accept_webp=accept_webp)
+    return PostRead.model_validate(post).model_copy(
+        update={
+            "display_url": variant["url"] if variant else post.url,
+            "variants": [PostMediaVariantRead.model_validate(v) for v in (manifest or {}).get("variants", [])],
+        }
+    )
+
+
+async def generate_post_media_variants(
+    post_id: UUID,
+    media_service,
+    media,
+    data: bytes,
+    *,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> None:
+    """Background task: render and store a post image's variants, then record
+    the manifest. Any failure leaves the post serving its original."""
+    try:
+        manifest = await media_service.create_image_variants(media, data)
+    except Exception:  # noqa: BLE001
+        LOGGER.warning("Image variants failed for post %s", post_id, exc_info=True)
+        return
+    if not manifest:
+        return
+    if session_factory is None:
+        from app.db import async_session as session_factory
+    async with session_factory() as session:
+        await PostService(session).set_media_variants(post_id, manifest)
 
 class PostService:
     def __init__(self, session: AsyncSession):
@@ -23,18 +62,44 @@ class PostService:
     
     async def get_post_by_id(self, post_id: UUID) -> PostRead | None:
         result = await self.session.get(PostModel, post_id)
-        return PostRead.model_validate(result) if result else None
+        return to_post_read(result) if result else None
 
-    async def get_all_posts(self) -> list[PostRead]:
+    async def get_all_posts(self, *, width: int = FEED_IMAGE_WIDTH, accept_webp: bool = True) -> list[PostRead]:
         result = await self.session.execute(select(PostModel).order_by(PostModel.created_at.desc()))
         posts = result.scalars().all()
-        return [post for post in posts]
+        return [to_post_read(post, width=width, accept_webp=accept_webp) for post in posts]
+
+    async def set_media_variants(self, post_id: UUID, manifest: dict) -> None:
+        post = await self.session.get(PostModel, post_id)
+        if post is None:
+            # Deleted while its variants were rendering.
+            return
+        post.media_variants = manifest
+        await self.session.commit()
     
     
-    async def delete_post(self, post_id: UUID) -> None:
+    async def delete_post(self, post_id: UUID, media_service=None) -> None:
         post = await self.session.get(PostModel, post_id)
         if post:
+            manifest = post.media_variants
             await self.session.delete(post)
             await self.session.commit()
+            # Only stored variants carry a key; CDN transformations have none.
+            if any(variant.get("key") for variant in (manifest or {}).get("variants", [])):
+                await self._delete_media_variants(post_id, manifest, media_service)
         else:
             raise Exception("Post not found")
+
+    @staticmethod
+    async def _delete_media_variants(post_id: UUID, manifest: dict, media_service) -> None:
+        # Best effort: the post is gone either way, leftovers only cost storage.
+        try:
+            if media_service is None:
+                from app.services.storage.mediaStorageService import get_media_storage_service
+
+                media_service = get_media_storage_service()
+            delete_image_variants = getattr(media_service, "delete_image_variants", None)
+            if delete_image_variants is not None:
+                await delete_image_variants(manifest)
+        except Exception:  # noqa: BLE001
+            LOGGER.warning("Could not delete image variants of post %s", post_id, exc_info=True)
@@ -0,0 +1,213 @@
+"""Registry of the service layer's hot statements.
+
+Each entry rebuilds a statement a service runs on a hot path, with sample
+parameters, and names the index that should answer it. The EXPLAIN suite
+(``scripts/explain_hot_queries.py``) runs them against a seeded PostgreSQL
+and reports sequential scans; ``tests/test_hot_queries.py`` checks that every
+expected index is still declared on the models. Keep an entry in step with
+the service method it names when that query changes.
+"""
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Select, and_, func, or_, select, tuple_
+
+from app.models.applicationModel import ApplicationModel
+from app.models.communityPostModel import CommunityPostCommentModel, CommunityPostModel
+from app.models.jobPostingModel import JobPosting
+from app.models.messageModel import ConversationParticipantModel, MessageModel
+from app.models.skillModel import JobSkillModel
+
+# Sample parameters: plans do not depend on whether the values exist.
+_COMPANY_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+_USER_ID = uuid.UUID("00000000-0000-4000-8000-000000000002")
+_CONVERSATION_ID = uuid.UUID("00000000-0000-4000-8000-000000000003")
+_COMMUNITY_ID = uuid.UUID("00000000-0000-4000-8000-000000000004")
+_POST_ID = uuid.UUID("00000000-0000-4000-8000-000000000005")
+_TARGET_ROLE = "data analyst"
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    name: str
+    # Service method the statement mirrors.
+    source: str
+    table: str
+    expected_index: str
+    build: Callable[[], Select]
+
+
+def _role_skill_demand() -> Select:
+    return (
+        select(JobSkillModel.skill_id, func.count(func.distinct(JobSkillModel.job_posting_id)))
+        .where(
+            func.lower(JobSkillModel.target_role) == _TARGET_ROLE,
+            JobSkillModel.job_posting_id.is_not(None),
+        )
+        .group_by(JobSkillModel.skill_id)
+    )
+
+
+def _role_requirements() -> Select:
+    return select(JobSkillModel).where(
+        func.lower(JobSkillModel.target_role) == _TARGET_ROLE,
+        JobSkillModel.job_posting_id.is_(None),
+    )
+
+
+def _company_applicants() -> Select:
+    return (
+        select(ApplicationModel)
+        .where(ApplicationModel.company_id == _COMPANY_ID)
+        .order_by(ApplicationModel.application_date.desc(), ApplicationModel.created_at.desc())
+    )
+
+
+def _user_applications() -> Select:
+    return (
+        select(ApplicationModel)
+        .where(ApplicationModel.user_id == _USER_ID)
+        .order_by(ApplicationModel.created_at.desc())
+    )
+
+
+def _conversation_messages() -> Select:
+    return (
+        select(MessageModel)
+        .where(MessageModel.conversation_id == _CONVERSATION_ID)
+        .order_by(MessageModel.created_at.asc())
+    )
+
+
+def _latest_message() -> Select:
+    return (
+        select(MessageModel)
+        .where(MessageModel.conversation_id == _CONVERSATION_ID)
+        .order_by(MessageModel.created_at.desc())
+        .limit(1)
+    )
+
+
+def _unread_counts() -> Select:
+    return (
+        select(MessageModel.conversation_id, func.count(MessageModel.id))
+        .join(
+            ConversationParticipantModel,
+            and_(
+                ConversationParticipantModel.conversation_id == MessageModel.conversation_id,
+                ConversationParticipantModel.user_id == _USER_ID,
+            ),
+        )
+        .where(
+            MessageModel.conversation_id.in_([_CONVERSATION_ID]),
+            MessageModel.sender_id != _USER_ID,
+            or_(
+                ConversationParticipantModel.last_read_at.is_(None),
+                MessageModel.created_at > ConversationParticipantModel.last_read_at,
+            ),
+        )
+        .group_by(MessageModel.conversation_id)
+    )
+
+
+def _community_feed() -> Select:
+    return (
+        select(CommunityPostModel)
+        .where(CommunityPostModel.community_id == _COMMUNITY_ID)
+        .order_by(CommunityPostModel.created_at.desc())
+    )
+
+
+def _post_comments() -> Select:
+    return (
+        select(CommunityPostCommentModel)
+        .where(CommunityPostCommentModel.post_id == _POST_ID)
+        .order_by(CommunityPostCommentModel.created_at.asc())
+    )
+
+
+def _job_board_page() -> Select:
+    return (
+        select(JobPosting)
+        .where(tuple_(JobPosting.created_at, JobPosting.id) < tuple_(datetime(2100, 1, 1), uuid.UUID(int=0)))
+        .order_by(JobPosting.created_at.desc(), JobPosting.id.desc())
+        .limit(21)
+    )
+
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    HotQuery(
+        "role_skill_demand",
+        "CapstoneAnalyticsService._get_role_market_signals",
+        "job_skills",
+        "ix_job_skills_lower_target_role_job_posting",
+        _role_skill_demand,
+    ),
+    HotQuery(
+        "role_requirements",
+        "CapstoneAnalyticsService._get_role_required_skill_rows",
+        "job_skills",
+        "ix_job_skills_lower_target_role_job_posting",
+        _role_requirements,
+    ),
+    HotQuery(
+        "company_applicants",
+        "CompanyApplicantService.list_company_applicants",
+        "applications",
+        "ix_applications_company_application_date",
+        _company_applicants,
+    ),
+    HotQuery(
+        "user_applications",
+        "ApplicationService.list_user_applications",
+        "applications",
+        "ix_applications_user_created_at",
+        _user_applications,
+    ),
+    HotQuery(
+        "conversation_messages",
+        "MessageService.list_messages",
+        "messages",
+        "ix_messages_conversation_created_at",
+        _conversation_messages,
+    ),
+    HotQuery(
+        "latest_message",
+        "MessageService._get_latest_message",
+        "messages",
+        "ix_messages_conversation_created_at",
+        _latest_message,
+    ),
+    HotQuery(
+        "unread_counts",
+        "MessageService._count_unread_by_conversation",
+        "messages",
+        "ix_messages_conversation_created_at",
+        _unread_counts,
+    ),
+    HotQuery(
+        "community_feed",
+        "CommunityService.list_posts",
+        "community_posts",
+        "ix_community_posts_community_created_at",
+        _community_feed,
+    ),
+    HotQuery(
+        "post_comments",
+        "CommunityService.list_comments",
+        "community_post_comments",
+        "ix_community_post_comments_post_created_at",
+        _post_comments,
+    ),
+    HotQuery(
+        "job_board_page",
+        "JobPostingService.list_public_job_postings",
+        "job_postings",
+        "ix_job_postings_created_at_id",
+        _job_board_page,
+    ),
+)
@@ -0,0 +1,182 @@
+"""Read PostgreSQL plans for sequential scans and suggest indexes.
+
+:func:`explain` runs ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` on a
+statement in a transaction that is rolled back. By default it also sets
+``enable_seqscan = off``. A small seeded database lets the planner prefer
+sequential scans even where an index exists. With the setting off, a
+sequential scan that remains means no index can answer the query.
+
+:func:`analyze_plan` walks the plan and turns every sequential scan into a
+:class:`ScanFinding`. Each finding suggests an index built from the scan's
+filter: equality columns (or expressions such as ``lower(target_role)``)
+come first, then the order of the ``Sort`` above the scan, or else one range
+column.
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import Select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+_COLUMN = r"(?:\w+\.)?(\w+)"
+# ``lower((target_role)::text) = 'x'``
+_EXPRESSION_EQ_RE = re.compile(rf"\b(lower|upper)\(\(?{_COLUMN}\)?(?:::\w+(?: \w+)?)?\)\s*=")
+# ``(company_id = '...'::uuid)`` and ``(conversation_id = ANY (...))``
+_COLUMN_EQ_RE = re.compile(rf"(?<![\w.]){_COLUMN}\s*=\s*(?!\s)")
+_COLUMN_RANGE_RE = re.compile(rf"(?<![\w.]){_COLUMN}\s*(?:<|>|<=|>=)\s")
+_NULL_TEST_RE = re.compile(rf"(?<![\w.]){_COLUMN} IS (?:NOT )?NULL")
+_ROW_RANGE_RE = re.compile(r"ROW\(([^)]*)\)\s*(?:<|>|<=|>=)")
+_SORT_KEY_RE = re.compile(rf"^\(?{_COLUMN}\)?(?: DESC| ASC)?(?: NULLS (?:FIRST|LAST))?$")
+
+
+@dataclass(frozen=True)
+class IndexSuggestion:
+    table: str
+    # Column names or expressions, in index order.
+    keys: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        parts = [re.sub(r"\W+", "_", key).strip("_") for key in self.keys]
+        return f"ix_{self.table}_{'_'.join(parts)}"[:63]
+
+    def ddl(self) -> str:
+        keys = ", ".join(f"({key})" if "(" in key else key for key in self.keys)
+        return f"CREATE INDEX CONCURRENTLY {self.name} ON {self.table} ({keys});"
+
+
+@dataclass(frozen=True)
+class ScanFinding:
+    relation: str
+    filter: Optional[str]
+    rows_removed: int
+    sort_keys: tuple[str, ...]
+    suggestion: Optional[IndexSuggestion]
+
+
+@dataclass
+class PlanReport:
+    name: str
+    execution_ms: float = 0.0
+    planning_ms: float = 0.0
+    shared_hit_blocks: int = 0
+    shared_read_blocks: int = 0
+    index_names: set[str] = field(default_factory=set)
+    seq_scans: list[ScanFinding] = field(default_factory=list)
+
+
+def compile_postgres(statement: Select) -> str:
+    """``statement`` as PostgreSQL SQL with its parameters inlined."""
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+async def explain(
+    connection: AsyncConnection,
+    statement: Select,
+    *,
+    analyze: bool = True,
+    allow_seqscan: bool = False,
+) -> list[dict[str, Any]]:
+    """EXPLAIN ``statement`` (FORMAT JSON) and return the plan document.
+    ANALYZE executes it, so everything runs in a rolled-back transaction
+    (a savepoint when ``connection`` is already in one)."""
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    transaction = await (connection.begin_nested() if connection.in_transaction() else connection.begin())
+    try:
+        if not allow_seqscan:
+            await connection.execute(text("SET LOCAL enable_seqscan = off"))
+        result = await connection.exec_driver_sql(f"EXPLAIN ({options}) {compile_postgres(statement)}")
+        document = result.scalar_one()
+    finally:
+        await transaction.rollback()
+    return json.loads(document) if isinstance(document, str) else document
+
+
+def _walk(node: dict[str, Any], sort_keys: tuple[str, ...] = ()) -> Iterator[tuple[dict[str, Any], tuple[str, ...]]]:
+    if node.get("Node Type") in {"Sort", "Incremental Sort"}:
+        sort_keys = tuple(node.get("Sort Key", ()))
+    yield node, sort_keys
+    for child in node.get("Plans", ()):
+        yield from _walk(child, sort_keys)
+
+
+def _sort_columns(sort_keys: tuple[str, ...], alias: str) -> list[str]:
+    columns = []
+    for key in sort_keys:
+        if "." in key and not key.lstrip("(").startswith(f"{alias}."):
+            continue
+        match = _SORT_KEY_RE.match(key.strip())
+        if match:
+            columns.append(match.group(1))
+    return columns
+
+
+def suggest_index(table: str, filter_text: Optional[str], sort_columns: list[str] = ()) -> Optional[IndexSuggestion]:
+    """Equality and IS [NOT] NULL keys of ``filter_text`` first, then
+    ``sort_columns`` (or the range columns). None when there is nothing to
+    index."""
+    filter_text = filter_text or ""
+    keys = [f"{function}({column})" for function, column in _EXPRESSION_EQ_RE.findall(filter_text)]
+    expression_free = _EXPRESSION_EQ_RE.sub("", filter_text)
+    trailing = list(sort_columns)
+    if not trailing:
+        row = _ROW_RANGE_RE.search(expression_free)
+        if row:
+            trailing = [part.strip().split(".")[-1] for part in row.group(1).split(",")]
+        else:
+            trailing = _COLUMN_RANGE_RE.findall(expression_free)[:1]
+    for column in [*_COLUMN_EQ_RE.findall(expression_free), *_NULL_TEST_RE.findall(expression_free), *trailing]:
+        if column not in keys:
+            keys.append(column)
+    return IndexSuggestion(table, tuple(keys)) if keys else None
+
+
+def analyze_plan(name: str, document: list[dict[str, Any]]) -> PlanReport:
+    top = document[0]
+    plan = top["Plan"]
+    report = PlanReport(
+        name=name,
+        execution_ms=float(top.get("Execution Time", 0.0)),
+        planning_ms=float(top.get("Planning Time", 0.0)),
+        shared_hit_blocks=int(plan.get("Shared Hit Blocks", 0)),
+        shared_read_blocks=int(plan.get("Shared Read Blocks", 0)),
+    )
+    for node, sort_keys in _walk(plan):
+        if "Index Name" in node:
+            report.index_names.add(node["Index Name"])
+        if node.get("Node Type") != "Seq Scan":
+            continue
+        relation = node.get("Relation Name", "")
+        sort_columns = _sort_columns(sort_keys, node.get("Alias", relation))
+        report.seq_scans.append(
+            ScanFinding(
+                relation=relation,
+                filter=node.get("Filter"),
+                rows_removed=int(node.get("Rows Removed by Filter", 0)),
+                sort_keys=sort_keys,
+                suggestion=suggest_index(relation, node.get("Filter"), sort_columns),
+            )
+        )
+    return report
+
+
+def format_report(report: PlanReport) -> str:
+    lines = [
+        f"{report.name}: {report.execution_ms:.2f} ms (planning {report.planning_ms:.2f} ms), "
+        f"buffers hit={report.shared_hit_blocks} read={report.shared_read_blocks}, "
+        f"indexes: {', '.join(sorted(report.index_names)) or 'none'}"
+    ]
+    for finding in report.seq_scans:
+        lines.append(
+            f"  SEQ SCAN {finding.relation}"
+            + (f" filter {finding.filter}" if finding.filter else "")
+            + (f" ({finding.rows_removed} rows removed)" if finding.rows_removed else "")
+        )
+        if finding.suggestion is not None:
+            lines.append(f"    suggest: {finding.suggestion.ddl()}")
+    return "\n".join(lines)
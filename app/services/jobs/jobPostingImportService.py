@@ -0,0 +1,285 @@
+"""Streaming bulk import of job postings from NDJSON or CSV.
+
+The request body is consumed chunk by chunk and split into records as it
+arrives, so memory stays bounded by one insert batch plus one record no matter
+how large the upload is. Each record is validated with the same
+``CompanyJobPostingCreate`` schema used by the single-posting endpoint; valid
+rows are written with one multi-row ``INSERT`` per batch and the new ids are
+handed to skill extraction in a single call once the stream ends.
+
+``import_stream`` yields progress events (plain dicts) that the route returns
+as NDJSON once the upload has been consumed:
+
+* ``{"event": "row_error", "row": 3, "errors": [...]}``
+* ``{"event": "progress", "rows_processed": 200, "inserted": 198, "failed": 2}``
+* ``{"event": "complete", ..., "skills": {...}}`` — always last.
+"""
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Literal
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import (
+    JOB_POSTING_IMPORT_BATCH_SIZE,
+    JOB_POSTING_IMPORT_MAX_RECORD_BYTES,
+    JOB_POSTING_IMPORT_MAX_REPORTED_ERRORS,
+    JOB_POSTING_IMPORT_MAX_ROWS,
+)
+from app.models.jobPostingModel import JobPosting
+from app.schemas.jobPostingSchema import CompanyJobPostingCreate
+from app.services.jobs.jobSearchCache import invalidate_internal_job_search_cache
+
+LOGGER = logging.getLogger(__name__)
+
+ImportFormat = Literal["ndjson", "csv"]
+
+_CONTENT_TYPE_FORMATS: dict[str, ImportFormat] = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json": "ndjson",
+    "text/csv": "csv",
+    "application/csv": "csv",
+}
+
+
+UNSUPPORTED_IMPORT_FORMAT_DETAIL = (
+    "Send NDJSON (application/x-ndjson) or CSV (text/csv), or pass ?format=ndjson|csv."
+)
+
+
+class JobPostingImportAborted(Exception):
+    """Raised when the stream cannot be read any further."""
+
+
+def detect_import_format(content_type: str | None) -> ImportFormat | None:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    return _CONTENT_TYPE_FORMATS.get(media_type)
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="strict")
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+            if len(pending) > JOB_POSTING_IMPORT_MAX_RECORD_BYTES:
+                raise JobPostingImportAborted(
+                    f"A record exceeds the {JOB_POSTING_IMPORT_MAX_RECORD_BYTES}-byte limit."
+                )
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise JobPostingImportAborted("The upload is not valid UTF-8.") from exc
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def _iter_ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield ValueError(f"Invalid JSON: {exc.msg}")
+
+
+async def _iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    header: list[str] | None = None
+    pending: list[str] = []
+    async for line in _iter_lines(chunks):
+        pending.append(line)
+        record = "\n".join(pending)
+        # A quoted field may span lines; wait until the quotes balance.
+        if record.count('"') % 2:
+            if len(record) > JOB_POSTING_IMPORT_MAX_RECORD_BYTES:
+                raise JobPostingImportAborted(
+                    f"A record exceeds the {JOB_POSTING_IMPORT_MAX_RECORD_BYTES}-byte limit."
+                )
+            continue
+        pending = []
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield ValueError(f"Expected {len(header)} columns, got {len(values)}.")
+            continue
+        # Blank cells mean "not provided" so schema defaults apply.
+        yield {name: value for name, value in zip(header, values) if name and value.strip()}
+    if pending:
+        yield ValueError("Unterminated quoted field at end of file.")
+
+
+def _validation_errors(exc: ValidationError) -> list[dict[str, str]]:
+    return [
+        {
+            "field": ".".join(str(part) for part in error.get("loc", ())) or "row",
+            "message": error.get("msg", "Invalid value"),
+        }
+        for error in exc.errors()
+    ]
+
+
+class JobPostingImportService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _validate_row(raw: Any, *, now: datetime) -> tuple[dict | None, list[dict[str, str]]]:
+        if isinstance(raw, Exception):
+            return None, [{"field": "row", "message": str(raw)}]
+        if not isinstance(raw, dict):
+            return None, [{"field": "row", "message": "Each record must be an object."}]
+        try:
+            payload = CompanyJobPostingCreate.model_validate(raw)
+        except ValidationError as exc:
+            return None, _validation_errors(exc)
+
+        values = payload.model_dump()
+        values["title"] = payload.title.strip()
+        if not values["title"]:
+            return None, [{"field": "title", "message": "Title cannot be blank"}]
+        expires_at = values.get("expires_at")
+        if expires_at is not None:
+            if expires_at.tzinfo is not None:
+                expires_at = expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+            if expires_at < now:
+                return None, [{"field": "expires_at", "message": "expires_at must be in the future"}]
+            values["expires_at"] = expires_at
+        return values, []
+
+    async def _insert_batch(self, company_id: UUID, batch: list[dict], *, now: datetime) -> list[UUID]:
+        rows = [
+            {**values, "id": uuid.uuid4(), "company_id": company_id, "created_at": now, "updated_at": now}
+            for values in batch
+        ]
+        await self.session.execute(insert(JobPosting).values(rows))
+        await self.session.commit()
+        return [row["id"] for row in rows]
+
+    async def _extract_skills(self, job_posting_ids: list[UUID]) -> dict[str, int] | None:
+        from app.services.analytics.capstoneAnalyticsService import CapstoneAnalyticsService
+
+        try:
+            return await CapstoneAnalyticsService(self.session).extract_job_skills_for_job_postings(
+                job_posting_ids
+            )
+        except Exception:  # noqa: BLE001 — postings are already committed
+            LOGGER.exception("Skill extraction failed after job posting import")
+            await self.session.rollback()
+            return None
+
+    async def import_stream(
+        self,
+        company_id: UUID,
+        chunks: AsyncIterator[bytes],
+        *,
+        import_format: ImportFormat,
+    ) -> AsyncIterator[dict]:
+        records = _iter_csv_records(chunks) if import_format == "csv" else _iter_ndjson_records(chunks)
+        now = datetime.utcnow()
+        batch: list[dict] = []
+        inserted_ids: list[UUID] = []
+        rows_processed = 0
+        failed = 0
+        detail: str | None = None
+
+        def progress() -> dict:
+            return {
+                "event": "progress",
+                "rows_processed": rows_processed,
+                "inserted": len(inserted_ids),
+                "failed": failed,
+            }
+
+        try:
+            async for raw in records:
+                if rows_processed >= JOB_POSTING_IMPORT_MAX_ROWS:
+                    raise JobPostingImportAborted(
+                        f"Imports are limited to {JOB_POSTING_IMPORT_MAX_ROWS} rows."
+                    )
+                rows_processed += 1
+                values, errors = self._validate_row(raw, now=now)
+                if errors:
+                    failed += 1
+                    yield {"event": "row_error", "row": rows_processed, "errors": errors}
+                    continue
+                batch.append(values)
+                if len(batch) >= JOB_POSTING_IMPORT_BATCH_SIZE:
+                    inserted_ids.extend(await self._insert_batch(company_id, batch, now=now))
+                    batch = []
+                    yield progress()
+            if batch:
+                inserted_ids.extend(await self._insert_batch(company_id, batch, now=now))
+                batch = []
+                yield progress()
+        except JobPostingImportAborted as exc:
+            failed += len(batch)
+            detail = f"{exc} Rows after the last progress event were not imported."
+        except SQLAlchemyError:
+            LOGGER.exception("Job posting import batch insert failed")
+            await self.session.rollback()
+            failed += len(batch)
+            detail = "A batch could not be saved. Rows after the last progress event were not imported."
+
+        skills = None
+        if inserted_ids:
+            await invalidate_internal_job_search_cache()
+            skills = await self._extract_skills(inserted_ids)
+
+        yield {
+            "event": "complete",
+            "rows_processed": rows_processed,
+            "inserted": len(inserted_ids),
+            "failed": failed,
+            "aborted": detail is not None,
+            "detail": detail,
+            "skills": skills,
+        }
+
+    async def run_import_ndjson(
+        self,
+        company_id: UUID,
+        chunks: AsyncIterator[bytes],
+        *,
+        import_format: ImportFormat,
+    ) -> str:
+        """Drive ``import_stream`` to completion and return its events as NDJSON.
+
+        The body must be consumed by the route handler *before* the response
+        starts: once a streaming response is running, Starlette's disconnect
+        listener and ``BaseHTTPMiddleware`` own ``receive`` and the body is
+        lost. Only events are buffered, and per-row errors past
+        ``JOB_POSTING_IMPORT_MAX_REPORTED_ERRORS`` are counted rather than kept,
+        so the reply stays small however large the upload is.
+        """
+        lines: list[str] = []
+        reported_errors = 0
+        suppressed_errors = 0
+        async for event in self.import_stream(company_id, chunks, import_format=import_format):
+            if event["event"] == "row_error":
+                if reported_errors >= JOB_POSTING_IMPORT_MAX_REPORTED_ERRORS:
+                    suppressed_errors += 1
+                    continue
+                reported_errors += 1
+            if event["event"] == "complete":
+                event["suppressed_row_errors"] = suppressed_errors
+            lines.append(json.dumps(event, default=str))
+        return "\n".join(lines) + "\n"
@@ -1,16 +1,53 @@
 from __future__ import annotations
 
+import base64
+import binascii
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
 from app.models.companyModel import Company
 from app.models.jobPostingModel import JobPosting
 from app.schemas.jobPostingSchema import CompanyJobPostingCreate, JobPostingUpdate
+from app.services.jobs.jobSearchCache import invalidate_internal_job_search_cache
+
+# Long free-text bodies skipped by list views; fetched on demand per posting.
+LIST_VIEW_DEFERRED_COLUMNS = (
+    JobPosting.description,
+    JobPosting.requirements,
+    JobPosting.benefits,
+)
+
+
+class InvalidJobPostingCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_job_posting_cursor(job: JobPosting) -> str:
+    """Opaque keyset cursor for the ``(created_at, id)`` ordering."""
+    raw = f"{job.created_at.isoformat()}|{job.id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_job_posting_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, job_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(job_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidJobPostingCursor("Invalid pagination cursor") from exc
+
+
+@dataclass(frozen=True)
+class JobPostingPage:
+    items: Sequence[JobPosting]
+    next_cursor: str | None = None
 
 
 class JobPostingService:
@@ -53,6 +90,25 @@ class JobPostingService:
             )
         return and_(*token_filters)
 
+    @staticmethod
+    def _paginate(query, *, cursor: str | None, limit: int, summary_only: bool):
+        # Newest first, with ``id`` as the tie-breaker so the keyset is total and
+        # a page boundary never skips or repeats rows sharing a timestamp.
+        query = query.order_by(JobPosting.created_at.desc(), JobPosting.id.desc()).limit(limit + 1)
+        if cursor:
+            created_at, job_id = decode_job_posting_cursor(cursor)
+            query = query.where(tuple_(JobPosting.created_at, JobPosting.id) < tuple_(created_at, job_id))
+        if summary_only:
+            query = query.options(*(defer(column, raiseload=True) for column in LIST_VIEW_DEFERRED_COLUMNS))
+        return query
+
+    @staticmethod
+    def _build_page(rows: Sequence[JobPosting], limit: int) -> JobPostingPage:
+        if len(rows) <= limit:
+            return JobPostingPage(items=rows)
+        items = rows[:limit]
+        return JobPostingPage(items=items, next_cursor=encode_job_posting_cursor(items[-1]))
+
     @staticmethod
     def _location_filter_expression(location: str):
         normalized = f"%{location.strip().lower()}%"
@@ -86,6 +142,7 @@ class JobPostingService:
         )
         self.session.add(job_posting)
         await self.session.commit()
+        await invalidate_internal_job_search_cache()
         await self.session.refresh(job_posting)
         await self.session.refresh(job_posting, attribute_names=["company"])
         return job_posting
@@ -96,19 +153,20 @@ class JobPostingService:
         *,
         include_closed: bool = True,
         limit: int = 50,
-    ) -> Sequence[JobPosting]:
+        cursor: str | None = None,
+        summary_only: bool = False,
+    ) -> JobPostingPage:
         query = (
             select(JobPosting)
             .options(selectinload(JobPosting.company))
             .where(JobPosting.company_id == company_id)
-            .order_by(JobPosting.created_at.desc())
-            .limit(limit)
         )
         if not include_closed:
             query = query.where(*self._is_open_expression())
+        query = self._paginate(query, cursor=cursor, limit=limit, summary_only=summary_only)
 
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return self._build_page(result.scalars().all(), limit)
 
     async def list_public_job_postings(
         self,
@@ -116,14 +174,14 @@ class JobPostingService:
         keywords: str | None = None,
         location: str | None = None,
         limit: int = 50,
-    ) -> Sequence[JobPosting]:
+        cursor: str | None = None,
+        summary_only: bool = False,
+    ) -> JobPostingPage:
         query = (
             select(JobPosting)
             .join(Company, Company.id == JobPosting.company_id)
             .options(selectinload(JobPosting.company))
             .where(*self._is_open_expression())
-            .order_by(JobPosting.created_at.desc())
-            .limit(limit)
         )
 
         if keywords and keywords.strip():
@@ -133,9 +191,18 @@ class JobPostingService:
 
         if location and location.strip():
             query = query.where(self._location_filter_expression(location))
+        query = self._paginate(query, cursor=cursor, limit=limit, summary_only=summary_only)
 
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return self._build_page(result.scalars().all(), limit)
+
+    async def get_public_job_posting(self, job_posting_id: UUID) -> JobPosting | None:
+        result = await self.session.execute(
+            select(JobPosting)
+            .options(selectinload(JobPosting.company))
+            .where(JobPosting.id == job_posting_id, *self._is_open_expression())
+        )
+        return result.scalar_one_or_none()
 
     async def update_company_job_posting(
         self,
@@ -160,6 +227,7 @@ class JobPostingService:
             setattr(job_posting, field, value)
 
         await self.session.commit()
+        await invalidate_internal_job_search_cache()
         await self.session.refresh(job_posting)
         return job_posting
 
@@ -180,4 +248,5 @@ class JobPostingService:
 
         await self.session.delete(job_posting)
         await self.session.commit()
+        await invalidate_internal_job_search_cache()
         return True
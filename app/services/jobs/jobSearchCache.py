@@ -0,0 +1,205 @@
+"""Coalesced, TTL-cached job search results.
+
+Identical ``/jobs/search`` queries are common (students reuse the keywords from
+their CV analysis), so results are cached in two tiers:
+
+* a per-process TTL dict, always on;
+* the shared counter store when it is backed by Redis, so every replica sees a
+  result as soon as one of them has fetched it.
+
+Concurrent misses for the same key are coalesced ("singleflight"): the first
+caller runs the loader and every other caller awaits its result, so N identical
+in-flight queries cost one backend fetch. If the caller running the loader is
+cancelled, the waiting callers are not: one of them takes over the load.
+
+Internal (Students Compass) entries embed a generation number that is bumped
+whenever a company creates, updates or deletes a posting; bumping it makes
+every cached internal result unreachable at once. LinkedIn results are not
+affected by posting changes and only expire by TTL.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from app.config import JOB_SEARCH_EXTERNAL_CACHE_TTL_SECONDS, JOB_SEARCH_INTERNAL_CACHE_TTL_SECONDS
+from app.services.ratelimit.counterStore import CounterStoreError, get_counter_store
+
+LOGGER = logging.getLogger(__name__)
+
+_GENERATION_KEY = "jobsearch:gen"
+_GENERATION_TTL_SECONDS = 7 * 86_400
+_LOCAL_MAX_ENTRIES = 1024
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+def _normalize(value: str) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def _current_task_cancelling() -> bool:
+    task = asyncio.current_task()
+    # Task.cancelling() only exists on Python 3.11+.
+    cancelling = getattr(task, "cancelling", None)
+    return bool(cancelling and cancelling())
+
+
+def _digest(*parts: object) -> str:
+    raw = "\x1f".join(str(part) for part in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+class JobSearchCache:
+    def __init__(self) -> None:
+        # key -> (expires_at_monotonic, value)
+        self._local: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _get_local(self, key: str) -> tuple[bool, Any]:
+        entry = self._local.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            self._local.pop(key, None)
+            return False, None
+        return True, entry[1]
+
+    def _set_local(self, key: str, value: Any, ttl_seconds: int) -> None:
+        if len(self._local) >= _LOCAL_MAX_ENTRIES:
+            now = time.monotonic()
+            for stale_key in [k for k, (expires_at, _) in self._local.items() if expires_at <= now]:
+                self._local.pop(stale_key, None)
+            if len(self._local) >= _LOCAL_MAX_ENTRIES:
+                self._local.pop(next(iter(self._local)))
+        self._local[key] = (time.monotonic() + ttl_seconds, value)
+
+    async def _get_shared(self, key: str) -> tuple[bool, Any]:
+        store = get_counter_store()
+        if not store.is_shared:
+            return False, None
+        try:
+            raw = await store.get_str(key)
+        except CounterStoreError:
+            return False, None
+        if raw is None:
+            return False, None
+        return True, json.loads(raw)
+
+    async def _set_shared(self, key: str, value: Any, ttl_seconds: int) -> None:
+        store = get_counter_store()
+        if not store.is_shared:
+            return
+        try:
+            await store.set_str(key, json.dumps(value), ttl_seconds=ttl_seconds)
+        except CounterStoreError:
+            LOGGER.warning("Job search cache: shared write failed for %s", key)
+
+    async def get_or_load(self, key: str, loader: Loader, *, ttl_seconds: int) -> Any:
+        """Return the cached value for ``key`` or run ``loader`` exactly once
+        across all concurrent callers and cache its JSON-serializable result."""
+        if ttl_seconds <= 0:
+            return await loader()
+
+        while True:
+            hit, value = self._get_local(key)
+            if hit:
+                return value
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not us: take over the load.
+                if inflight.cancelled() and not _current_task_cancelling():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            hit, value = await self._get_shared(key)
+            if not hit:
+                value = await loader()
+                await self._set_shared(key, value, ttl_seconds)
+            self._set_local(key, value, ttl_seconds)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an un-awaited failure is not logged as lost.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def generation(self) -> int:
+        try:
+            return await get_counter_store().get_int(_GENERATION_KEY)
+        except CounterStoreError:
+            # Without a readable generation the cached internal results cannot
+            # be trusted to reflect recent posting changes.
+            return -1
+
+    async def invalidate_internal(self) -> None:
+        try:
+            await get_counter_store().incr(_GENERATION_KEY, ttl_seconds=_GENERATION_TTL_SECONDS)
+        except CounterStoreError:
+            LOGGER.warning("Job search cache: could not bump the internal generation")
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+    async def internal_results(
+        self,
+        *,
+        keywords: str,
+        location: str,
+        limit: int,
+        loader: Loader,
+    ) -> Any:
+        generation = await self.generation()
+        if generation < 0:
+            return await loader()
+        key = "jobsearch:int:" + _digest(generation, _normalize(keywords), _normalize(location), limit)
+        return await self.get_or_load(key, loader, ttl_seconds=JOB_SEARCH_INTERNAL_CACHE_TTL_SECONDS)
+
+    async def external_results(
+        self,
+        *,
+        keywords: str,
+        location: str,
+        limit: int,
+        remote: bool,
+        loader: Loader,
+    ) -> Any:
+        key = "jobsearch:ext:" + _digest(_normalize(keywords), _normalize(location), limit, remote)
+        return await self.get_or_load(key, loader, ttl_seconds=JOB_SEARCH_EXTERNAL_CACHE_TTL_SECONDS)
+
+
+_cache: Optional[JobSearchCache] = None
+
+
+def get_job_search_cache() -> JobSearchCache:
+    global _cache
+    if _cache is None:
+        _cache = JobSearchCache()
+    return _cache
+
+
+async def invalidate_internal_job_search_cache() -> None:
+    await get_job_search_cache().invalidate_internal()
+
+
+def reset_job_search_cache() -> None:
+    """Drop process-local entries (used by tests)."""
+    get_job_search_cache().clear_local()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
@@ -8,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.JobsScraper.linkedin_scraper import fetch_linkedin_jobs
 from app.models.jobPostingModel import JobPosting
 from app.services.jobs.jobPostingService import JobPostingService
+from app.services.jobs.jobSearchCache import get_job_search_cache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -67,29 +69,45 @@ class JobSearchService:
         self.job_posting_service = JobPostingService(session)
 
     async def search(self, query: JobSearchQuery) -> dict:
-        limit = max(1, min(query.limit, 100))
-        internal_jobs = await self.job_posting_service.list_public_job_postings(
+        cache = get_job_search_cache()
+        students_compass, linkedin = await asyncio.gather(
+            cache.internal_results(
+                keywords=query.keywords,
+                location=query.location,
+                limit=max(1, min(query.limit, 100)),
+                loader=lambda: self._search_internal(query),
+            ),
+            cache.external_results(
+                keywords=query.keywords,
+                location=query.location,
+                limit=query.limit,
+                remote=query.remote,
+                loader=lambda: self._search_linkedin(query),
+            ),
+        )
+        return {"students_compass": students_compass, "linkedin": linkedin}
+
+    async def _search_internal(self, query: JobSearchQuery) -> list[dict]:
+        internal_page = await self.job_posting_service.list_public_job_postings(
             keywords=query.keywords,
             location=query.location,
-            limit=limit,
+            limit=max(1, min(query.limit, 100)),
         )
+        return [serialize_internal_job(job) for job in internal_page.items]
 
+    async def _search_linkedin(self, query: JobSearchQuery) -> list[dict]:
         LOGGER.debug(
-            "Searching LinkedIn after Students Compass lookup: keywords=%s, location=%s, limit=%s, remote=%s",
+            "Searching LinkedIn: keywords=%s, location=%s, limit=%s, remote=%s",
             query.keywords,
             query.location,
             query.limit,
             query.remote,
         )
-        linkedin_jobs = fetch_linkedin_jobs(
+        linkedin_jobs = await fetch_linkedin_jobs(
             keywords=query.keywords,
             location=query.location,
             limit=query.limit,
             remote=query.remote,
             throttle_seconds=0.5,
         )
-
-        return {
-            "students_compass": [serialize_internal_job(job) for job in internal_jobs],
-            "linkedin": [serialize_linkedin_job(job) for job in linkedin_jobs],
-        }
+        return [serialize_linkedin_job(job) for job in linkedin_jobs]
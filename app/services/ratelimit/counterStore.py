@@ -11,14 +11,27 @@ Two interchangeable backends sit behind a single async interface:
 Callers decide the failure policy: ``incr``/``sliding_window_allow`` raise
 ``CounterStoreError`` if the Redis backend is unreachable so cost-sensitive
 guards can *fail closed* while best-effort rate limits can *fail open*.
+
+``gcra_allow`` is a Generic Cell Rate Algorithm limiter: it stores a single
+"theoretical arrival time" per key (one ``SET ... PX`` on Redis), so its memory
+does not grow with the limit the way a sliding window's per-request log does.
+It admits a burst of ``limit`` requests, then one every ``period / limit``.
+``lease_tokens`` draws several GCRA cells at once for a worker-local tier
+(see ``quotaLeaser``).
+
+``check_limits`` evaluates several limits (each with its own key, limit and
+window) in one atomic step — a single ``EVALSHA`` on Redis — so a request
+matching N rules pays one round trip instead of N.
 """
 from __future__ import annotations
 
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Sequence
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +40,74 @@ class CounterStoreError(RuntimeError):
     """Raised when the backing store (Redis) is unavailable."""
 
 
+@dataclass(frozen=True)
+class LimitCheck:
+    """One limit in a ``check_limits`` batch.
+
+    * ``kind="window"`` — sliding window: at most ``limit`` events per
+      ``window_seconds``.
+    * ``kind="gcra"`` — GCRA: a burst of ``limit``, refilled at
+      ``limit / window_seconds``; one timestamp per key.
+    * ``kind="counter"`` — fixed counter: ``key`` may be incremented by
+      ``amount`` while it stays at or below ``limit``; ``window_seconds`` is
+      the TTL set when the counter is created.
+    """
+
+    key: str
+    limit: int
+    window_seconds: int
+    kind: str = "window"
+    amount: int = 1
+
+
+@dataclass(frozen=True)
+class LimitResult:
+    allowed: bool
+    retry_after: int = 0
+    # Index in the batch of the first check that denied, if any.
+    denied_index: Optional[int] = None
+
+
+def gcra_decision(
+    tat: Optional[float], now: float, *, limit: int, period_seconds: float
+) -> tuple[bool, float, int]:
+    """One GCRA step. ``tat`` is the key's stored theoretical arrival time
+    (None when unset). Returns ``(allowed, tat_to_store, retry_after)``."""
+    emission_interval = period_seconds / limit
+    tat = now if tat is None or tat < now else tat
+    new_tat = tat + emission_interval
+    allow_at = new_tat - period_seconds
+    if now < allow_at:
+        return False, tat, max(1, math.ceil(allow_at - now))
+    return True, new_tat, 0
+
+
+def gcra_lease(
+    tat: Optional[float], now: float, *, limit: int, period_seconds: float, max_tokens: int
+) -> tuple[int, float, int]:
+    """Take up to ``max_tokens`` GCRA cells, but never more than half of what
+    is left (at least one), so a bucket near its limit is handed out one cell
+    at a time. Returns ``(granted, tat_to_store, retry_after)``."""
+    emission_interval = period_seconds / limit
+    tat = now if tat is None or tat < now else tat
+    available = int((now + period_seconds - tat) / emission_interval + 1e-9)
+    if available < 1:
+        return 0, tat, max(1, math.ceil(tat + emission_interval - period_seconds - now))
+    granted = min(max_tokens, max(1, available // 2))
+    return granted, tat + granted * emission_interval, 0
+
+
+@dataclass(frozen=True)
+class QuotaSeed:
+    """What ``reserve_quota`` needs to create missing quota keys."""
+
+    # Units already used; seeds the counter only when it does not exist yet.
+    base: int
+    limit: int
+    ttl_seconds: int
+    limit_ttl_seconds: int
+
+
 class CounterStore(ABC):
     is_shared: bool = False
 
@@ -43,6 +124,19 @@ class CounterStore(ABC):
         with usage already recorded in the database — this way a counter reset
         (process restart / fresh Redis) cannot hand back already-spent quota."""
 
+    @abstractmethod
+    async def reserve_quota(
+        self, key: str, *, limit_key: str, seed: Optional[QuotaSeed] = None
+    ) -> Optional[tuple[bool, int]]:
+        """Take one unit from the counter at ``key`` if it stays within the
+        limit cached at ``limit_key``; a refusal changes nothing. Returns
+        ``(allowed, limit)``, or None when either key is missing and no
+        ``seed`` was given to create it."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove ``keys`` (any kind); missing keys are ignored."""
+
     @abstractmethod
     async def decr(self, key: str, *, amount: int = 1) -> int:
         """Atomically decrement ``key``, flooring at zero. Used to release a
@@ -58,6 +152,32 @@ class CounterStore(ABC):
     ) -> tuple[bool, int]:
         """Return ``(allowed, retry_after_seconds)`` for a sliding-window limit."""
 
+    @abstractmethod
+    async def gcra_allow(self, key: str, *, limit: int, period_seconds: int) -> tuple[bool, int]:
+        """GCRA rate limit: ``limit`` requests per ``period_seconds`` with a
+        burst of ``limit``. Returns ``(allowed, retry_after_seconds)``."""
+
+    @abstractmethod
+    async def lease_tokens(
+        self, key: str, *, limit: int, period_seconds: int, max_tokens: int
+    ) -> tuple[int, int]:
+        """Atomically take up to ``max_tokens`` cells from the GCRA bucket at
+        ``key`` (see :func:`gcra_lease`). Returns ``(granted, retry_after)``."""
+
+    @abstractmethod
+    async def check_limits(self, checks: Sequence[LimitCheck]) -> LimitResult:
+        """Evaluate every check atomically. Allowed batches record an event
+        against every check; a denied batch records nothing."""
+
+    @abstractmethod
+    async def get_str(self, key: str) -> Optional[str]:
+        """Return the string stored at ``key`` or ``None`` when absent/expired."""
+
+    @abstractmethod
+    async def set_str(self, key: str, value: str, *, ttl_seconds: int) -> None:
+        """Store ``value`` at ``key`` with an expiry. Used for small shared
+        cache entries that must be visible across replicas."""
+
     async def reset(self) -> None:  # pragma: no cover - overridden where needed
         """Clear all state. Only meaningful for the in-memory backend (tests)."""
 
@@ -70,6 +190,23 @@ class InMemoryCounterStore(CounterStore):
         self._counters: dict[str, tuple[int, float]] = {}
         # key -> deque[event_epoch]
         self._windows: dict[str, deque[float]] = {}
+        # key -> (value, expires_at_epoch)
+        self._values: dict[str, tuple[str, float]] = {}
+        # key -> GCRA theoretical arrival time (epoch)
+        self._gcra: dict[str, float] = {}
+        self._gcra_checks = 0
+
+    # Drop GCRA keys whose arrival time has passed (they are equivalent to
+    # unset keys) once every N checks, so one-shot keys do not accumulate.
+    _GCRA_SWEEP_EVERY = 1024
+
+    def _gcra_tat(self, key: str, now: float) -> Optional[float]:
+        self._gcra_checks += 1
+        if self._gcra_checks >= self._GCRA_SWEEP_EVERY:
+            self._gcra_checks = 0
+            for stale in [k for k, tat in self._gcra.items() if tat <= now]:
+                del self._gcra[stale]
+        return self._gcra.get(key)
 
     def _purge_if_expired(self, key: str, now: float) -> None:
         entry = self._counters.get(key)
@@ -95,6 +232,29 @@ class InMemoryCounterStore(CounterStore):
             self._counters[key] = (value, now + ttl_seconds)
         return value
 
+    async def reserve_quota(
+        self, key: str, *, limit_key: str, seed: Optional[QuotaSeed] = None
+    ) -> Optional[tuple[bool, int]]:
+        now = time.time()
+        self._purge_if_expired(key, now)
+        self._purge_if_expired(limit_key, now)
+        if key not in self._counters or limit_key not in self._counters:
+            if seed is None:
+                return None
+            self._counters.setdefault(limit_key, (seed.limit, now + seed.limit_ttl_seconds))
+            self._counters.setdefault(key, (seed.base, now + seed.ttl_seconds))
+        limit = self._counters[limit_key][0]
+        value, expires_at = self._counters[key]
+        if value + 1 > limit:
+            return False, limit
+        self._counters[key] = (value + 1, expires_at)
+        return True, limit
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            for entries in (self._counters, self._windows, self._values, self._gcra):
+                entries.pop(key, None)
+
     async def decr(self, key: str, *, amount: int = 1) -> int:
         now = time.time()
         self._purge_if_expired(key, now)
@@ -127,9 +287,89 @@ class InMemoryCounterStore(CounterStore):
             self._windows.pop(key, None)
         return True, 0
 
+    async def gcra_allow(self, key: str, *, limit: int, period_seconds: int) -> tuple[bool, int]:
+        now = time.time()
+        allowed, tat, retry_after = gcra_decision(
+            self._gcra_tat(key, now), now, limit=limit, period_seconds=period_seconds
+        )
+        if allowed:
+            self._gcra[key] = tat
+        return allowed, retry_after
+
+    async def lease_tokens(
+        self, key: str, *, limit: int, period_seconds: int, max_tokens: int
+    ) -> tuple[int, int]:
+        now = time.time()
+        granted, tat, retry_after = gcra_lease(
+            self._gcra_tat(key, now), now, limit=limit, period_seconds=period_seconds, max_tokens=max_tokens
+        )
+        if granted:
+            self._gcra[key] = tat
+        return granted, retry_after
+
+    def _window_retry_after(self, key: str, *, limit: int, window_seconds: int, now: float) -> int:
+        """0 if one more event fits in the window, else seconds to wait."""
+        events = self._windows.get(key)
+        if events is None:
+            return 0
+        cutoff = now - window_seconds
+        while events and events[0] <= cutoff:
+            events.popleft()
+        if not events:
+            self._windows.pop(key, None)
+            return 0
+        if len(events) < limit:
+            return 0
+        return max(1, int(window_seconds - (now - events[0])))
+
+    async def check_limits(self, checks: Sequence[LimitCheck]) -> LimitResult:
+        now = time.time()
+        gcra_tats: dict[int, float] = {}
+        for index, check in enumerate(checks):
+            if check.kind == "gcra":
+                allowed, gcra_tats[index], retry_after = gcra_decision(
+                    self._gcra_tat(check.key, now), now, limit=check.limit, period_seconds=check.window_seconds
+                )
+            elif check.kind == "window":
+                retry_after = self._window_retry_after(
+                    check.key, limit=check.limit, window_seconds=check.window_seconds, now=now
+                )
+            elif check.kind == "counter":
+                self._purge_if_expired(check.key, now)
+                value, expires_at = self._counters.get(check.key, (0, now + check.window_seconds))
+                retry_after = max(1, int(expires_at - now)) if value + check.amount > check.limit else 0
+            else:
+                raise ValueError(f"Unknown limit kind: {check.kind}")
+            if retry_after:
+                return LimitResult(False, retry_after, index)
+
+        for index, check in enumerate(checks):
+            if check.kind == "gcra":
+                self._gcra[check.key] = gcra_tats[index]
+            elif check.kind == "window":
+                self._windows.setdefault(check.key, deque()).append(now)
+            else:
+                value, expires_at = self._counters.get(check.key, (0, now + check.window_seconds))
+                self._counters[check.key] = (value + check.amount, expires_at)
+        return LimitResult(True)
+
+    async def get_str(self, key: str) -> Optional[str]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            self._values.pop(key, None)
+            return None
+        return entry[0]
+
+    async def set_str(self, key: str, value: str, *, ttl_seconds: int) -> None:
+        self._values[key] = (value, time.time() + ttl_seconds)
+
     async def reset(self) -> None:
         self._counters.clear()
         self._windows.clear()
+        self._values.clear()
+        self._gcra.clear()
 
 
 # Atomic sliding-window check, evaluated entirely inside Redis so concurrent
@@ -157,6 +397,125 @@ return {1, 0}
 """
 
 
+# GCRA over one key holding the theoretical arrival time in epoch ms. ARGV:
+# now_ms, emission_interval_ms, period_ms. The key expires once the arrival
+# time passes, when it is indistinguishable from an unset key.
+_GCRA_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local emission = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', key) or now)
+if tat < now then tat = now end
+local new_tat = tat + emission
+local allow_at = new_tat - period
+if now < allow_at then
+  local retry = math.ceil((allow_at - now) / 1000)
+  if retry < 1 then retry = 1 end
+  return {0, retry}
+end
+redis.call('SET', key, new_tat, 'PX', math.ceil(new_tat - now))
+return {1, 0}
+"""
+
+
+# Multi-cell GCRA take for worker-local leases (same key layout as _GCRA_LUA).
+# ARGV: now_ms, emission_interval_ms, period_ms, max_tokens. Returns
+# {granted, retry_after}.
+_GCRA_LEASE_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local emission = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local max_tokens = tonumber(ARGV[4])
+local tat = tonumber(redis.call('GET', key) or now)
+if tat < now then tat = now end
+local available = math.floor((now + period - tat) / emission + 1e-9)
+if available < 1 then
+  local retry = math.ceil((tat + emission - period - now) / 1000)
+  if retry < 1 then retry = 1 end
+  return {0, retry}
+end
+local granted = math.max(1, math.floor(available / 2))
+if granted > max_tokens then granted = max_tokens end
+local new_tat = tat + granted * emission
+redis.call('SET', key, new_tat, 'PX', math.ceil(new_tat - now))
+return {granted, 0}
+"""
+
+
+# Batched, all-or-nothing limit evaluation. ARGV: now, member, then
+# (kind, limit, window_seconds, amount) per key. Returns {allowed,
+# retry_after, denied_index (1-based, 0 when allowed)}. All keys must hash to
+# the same slot on Redis Cluster; a standalone Redis takes any keys.
+_CHECK_LIMITS_LUA = """
+local now = tonumber(ARGV[1])
+local member = ARGV[2]
+local now_ms = math.floor(now * 1000)
+local gcra_tat = {}
+local n = #KEYS
+for i = 1, n do
+  local key = KEYS[i]
+  local base = 2 + (i - 1) * 4
+  local kind = ARGV[base + 1]
+  local limit = tonumber(ARGV[base + 2])
+  local window = tonumber(ARGV[base + 3])
+  local amount = tonumber(ARGV[base + 4])
+  if kind == 'gcra' then
+    local period = window * 1000
+    local tat = tonumber(redis.call('GET', key) or now_ms)
+    if tat < now_ms then tat = now_ms end
+    gcra_tat[i] = tat + period / limit
+    local allow_at = gcra_tat[i] - period
+    if now_ms < allow_at then
+      local retry = math.ceil((allow_at - now_ms) / 1000)
+      if retry < 1 then retry = 1 end
+      return {0, retry, i}
+    end
+  elseif kind == 'window' then
+    redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+    if redis.call('ZCARD', key) >= limit then
+      local earliest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+      local retry = window
+      if earliest[2] then
+        retry = math.ceil(window - (now - tonumber(earliest[2])))
+      end
+      if retry < 1 then retry = 1 end
+      return {0, retry, i}
+    end
+  elseif kind == 'counter' then
+    local value = tonumber(redis.call('GET', key) or '0')
+    if value + amount > limit then
+      local retry = redis.call('TTL', key)
+      if retry < 1 then retry = 1 end
+      return {0, retry, i}
+    end
+  else
+    return redis.error_reply('unknown limit kind ' .. kind)
+  end
+end
+for i = 1, n do
+  local key = KEYS[i]
+  local base = 2 + (i - 1) * 4
+  local kind = ARGV[base + 1]
+  local window = tonumber(ARGV[base + 3])
+  local amount = tonumber(ARGV[base + 4])
+  if kind == 'gcra' then
+    redis.call('SET', key, gcra_tat[i], 'PX', math.ceil(gcra_tat[i] - now_ms))
+  elseif kind == 'window' then
+    redis.call('ZADD', key, now, member)
+    redis.call('EXPIRE', key, window + 1)
+  else
+    redis.call('INCRBY', key, amount)
+    if redis.call('TTL', key) < 0 then
+      redis.call('EXPIRE', key, window)
+    end
+  end
+end
+return {1, 0, 0}
+"""
+
+
 _RESERVE_INCR_LUA = """
 local key = KEYS[1]
 local base = tonumber(ARGV[1])
@@ -170,6 +529,35 @@ return redis.call('INCR', key)
 """
 
 
+# Bounded quota take (see CounterStore.reserve_quota). KEYS: counter, limit.
+# ARGV (only when seeding): base, limit, ttl, limit_ttl. Returns {-1, 0} on a
+# miss without a seed, else {allowed, limit}.
+_RESERVE_QUOTA_LUA = """
+local key = KEYS[1]
+local limit_key = KEYS[2]
+local limit = redis.call('GET', limit_key)
+local exists = redis.call('EXISTS', key)
+if (not limit) or exists == 0 then
+  if #ARGV == 0 then
+    return {-1, 0}
+  end
+  if not limit then
+    limit = ARGV[2]
+    redis.call('SET', limit_key, limit, 'EX', tonumber(ARGV[4]))
+  end
+  if exists == 0 then
+    redis.call('SET', key, ARGV[1], 'EX', tonumber(ARGV[3]))
+  end
+end
+limit = tonumber(limit)
+if tonumber(redis.call('GET', key)) + 1 > limit then
+  return {0, limit}
+end
+redis.call('INCR', key)
+return {1, limit}
+"""
+
+
 class RedisCounterStore(CounterStore):
     is_shared = True
 
@@ -180,6 +568,10 @@ class RedisCounterStore(CounterStore):
         self._redis = redis_asyncio.from_url(url, encoding="utf-8", decode_responses=True)
         self._sliding_window = self._redis.register_script(_SLIDING_WINDOW_LUA)
         self._reserve_incr = self._redis.register_script(_RESERVE_INCR_LUA)
+        self._check_limits = self._redis.register_script(_CHECK_LIMITS_LUA)
+        self._gcra = self._redis.register_script(_GCRA_LUA)
+        self._gcra_lease = self._redis.register_script(_GCRA_LEASE_LUA)
+        self._reserve_quota = self._redis.register_script(_RESERVE_QUOTA_LUA)
 
     async def reserve_incr(self, key: str, *, base: int, ttl_seconds: int) -> int:
         try:
@@ -188,6 +580,26 @@ class RedisCounterStore(CounterStore):
         except Exception as exc:  # noqa: BLE001
             raise CounterStoreError(str(exc)) from exc
 
+    async def reserve_quota(
+        self, key: str, *, limit_key: str, seed: Optional[QuotaSeed] = None
+    ) -> Optional[tuple[bool, int]]:
+        args = [] if seed is None else [seed.base, seed.limit, seed.ttl_seconds, seed.limit_ttl_seconds]
+        try:
+            allowed, limit = await self._reserve_quota(keys=[key, limit_key], args=args)
+        except Exception as exc:  # noqa: BLE001
+            raise CounterStoreError(str(exc)) from exc
+        if int(allowed) < 0:
+            return None
+        return bool(int(allowed)), int(limit)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self._redis.delete(*keys)
+        except Exception as exc:  # noqa: BLE001
+            raise CounterStoreError(str(exc)) from exc
+
     async def incr(self, key: str, *, ttl_seconds: int, amount: int = 1) -> int:
         try:
             async with self._redis.pipeline(transaction=True) as pipe:
@@ -231,6 +643,58 @@ class RedisCounterStore(CounterStore):
         except Exception as exc:  # noqa: BLE001
             raise CounterStoreError(str(exc)) from exc
 
+    async def gcra_allow(self, key: str, *, limit: int, period_seconds: int) -> tuple[bool, int]:
+        period_ms = period_seconds * 1000
+        try:
+            allowed, retry = await self._gcra(
+                keys=[key],
+                args=[int(time.time() * 1000), period_ms / limit, period_ms],
+            )
+            return bool(int(allowed)), int(retry)
+        except Exception as exc:  # noqa: BLE001
+            raise CounterStoreError(str(exc)) from exc
+
+    async def lease_tokens(
+        self, key: str, *, limit: int, period_seconds: int, max_tokens: int
+    ) -> tuple[int, int]:
+        period_ms = period_seconds * 1000
+        try:
+            granted, retry = await self._gcra_lease(
+                keys=[key],
+                args=[int(time.time() * 1000), period_ms / limit, period_ms, max_tokens],
+            )
+            return int(granted), int(retry)
+        except Exception as exc:  # noqa: BLE001
+            raise CounterStoreError(str(exc)) from exc
+
+    async def check_limits(self, checks: Sequence[LimitCheck]) -> LimitResult:
+        if not checks:
+            return LimitResult(True)
+        now = time.time()
+        args: list = [now, f"{now:.6f}:{id(object())}"]
+        for check in checks:
+            args.extend((check.kind, check.limit, check.window_seconds, check.amount))
+        try:
+            allowed, retry, denied = await self._check_limits(keys=[check.key for check in checks], args=args)
+        except Exception as exc:  # noqa: BLE001
+            raise CounterStoreError(str(exc)) from exc
+        if int(allowed):
+            return LimitResult(True)
+        return LimitResult(False, int(retry), int(denied) - 1)
+
+    async def get_str(self, key: str) -> Optional[str]:
+        try:
+            return await self._redis.get(key)
+        except Exception as exc:  # noqa: BLE001
+            raise CounterStoreError(str(exc)) from exc
+
+    async def set_str(self, key: str, value: str, *, ttl_seconds: int) -> None:
+        try:
+            await self._redis.set(key, value, ex=ttl_seconds)
+        except Exception as exc:  # noqa: BLE001
+            raise CounterStoreError(str(exc)) from exc
+
+
 
 _store: Optional[CounterStore] = None
 
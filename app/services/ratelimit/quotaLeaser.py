@@ -0,0 +1,129 @@
+"""Worker-local tier in front of shared GCRA rate limits.
+
+In hybrid mode (``RATE_LIMIT_MODE=hybrid``) a worker does not ask the shared
+store about every request. It leases a batch of GCRA cells for a key
+(``CounterStore.lease_tokens``) and spends them locally; once a lease is half
+spent it is topped up by a background task, so steady traffic under its limit
+never waits on Redis. When a lease runs dry the request takes the strict path
+and leases inline. The store hands out at most half of a bucket's remaining
+cells per lease, so a key near its limit is checked one request at a time. A
+refusal is remembered locally until its ``retry_after`` has passed, so a
+client hammering a limit it already hit costs no store calls either.
+
+Error bound: leases are drawn from the shared bucket, so each worker can be
+off by at most ``lease_size`` requests per key — admitting cells it leased up
+to ``lease_ttl_seconds`` earlier, or refusing while another worker holds
+unspent cells. Unspent cells are dropped when the lease expires.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from app.services.ratelimit.counterStore import CounterStore, CounterStoreError, LimitCheck, LimitResult
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Lease:
+    tokens: int
+    expires_at: float
+    refilling: bool = False
+    # Set on a strict refusal: refuse locally until ``expires_at``.
+    retry_after: int = 0
+
+
+class QuotaLeaser:
+    # Drop expired leases once every N acquisitions so keys that are seen once
+    # (per-IP limits) do not accumulate.
+    _SWEEP_EVERY = 1024
+
+    def __init__(
+        self,
+        store_factory: Callable[[], CounterStore],
+        *,
+        lease_size: int,
+        lease_ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.lease_size = lease_size
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self._store_factory = store_factory
+        self._clock = clock
+        self._leases: dict[str, _Lease] = {}
+        self._refills: set[asyncio.Task] = set()
+        self._acquisitions = 0
+
+    async def acquire(self, check: LimitCheck) -> LimitResult:
+        """Spend one request of ``check`` (a GCRA limit). Raises
+        ``CounterStoreError`` only when the strict path cannot reach the store."""
+        now = self._clock()
+        self._acquisitions += 1
+        if self._acquisitions >= self._SWEEP_EVERY:
+            self._acquisitions = 0
+            for key in [key for key, lease in self._leases.items() if lease.expires_at <= now]:
+                del self._leases[key]
+
+        lease = self._live_lease(check.key, now)
+        if lease is not None and lease.retry_after:
+            return LimitResult(False, max(1, math.ceil(lease.expires_at - now)), 0)
+        if lease is not None and lease.tokens > 0:
+            lease.tokens -= 1
+            if lease.tokens <= self.lease_size // 2 and not lease.refilling:
+                lease.refilling = True
+                task = asyncio.create_task(self._refill(check, lease))
+                self._refills.add(task)
+                task.add_done_callback(self._refills.discard)
+            return LimitResult(True)
+
+        granted, retry_after = await self._store_factory().lease_tokens(
+            check.key, limit=check.limit, period_seconds=check.window_seconds, max_tokens=self.lease_size
+        )
+        # Concurrent requests for the key may have leased while we waited:
+        # merge into their lease rather than dropping its unspent cells.
+        lease = self._live_lease(check.key, now)
+        if lease is not None and lease.retry_after:
+            lease = None
+        if granted:
+            if lease is None:
+                self._leases[check.key] = _Lease(tokens=granted - 1, expires_at=now + self.lease_ttl_seconds)
+            else:
+                lease.tokens += granted - 1
+                lease.expires_at = now + self.lease_ttl_seconds
+            return LimitResult(True)
+        if lease is not None and lease.tokens > 0:
+            lease.tokens -= 1
+            return LimitResult(True)
+        self._leases[check.key] = _Lease(tokens=0, expires_at=now + retry_after, retry_after=retry_after)
+        return LimitResult(False, retry_after, 0)
+
+    def _live_lease(self, key: str, now: float) -> _Lease | None:
+        lease = self._leases.get(key)
+        return lease if lease is not None and lease.expires_at > now else None
+
+    async def _refill(self, check: LimitCheck, lease: _Lease) -> None:
+        try:
+            granted, _ = await self._store_factory().lease_tokens(
+                check.key,
+                limit=check.limit,
+                period_seconds=check.window_seconds,
+                max_tokens=self.lease_size - lease.tokens,
+            )
+        except CounterStoreError:
+            LOGGER.debug("Could not refill rate-limit lease for %s", check.key, exc_info=True)
+            granted = 0
+        finally:
+            lease.refilling = False
+        if granted and self._leases.get(check.key) is lease:
+            lease.tokens += granted
+            lease.expires_at = self._clock() + self.lease_ttl_seconds
+
+    async def drain(self) -> None:
+        """Wait for in-flight background refills (tests, benchmarks)."""
+        while self._refills:
+            await asyncio.gather(*list(self._refills))
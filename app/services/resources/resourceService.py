@@ -4,6 +4,7 @@ from datetime import datetime
 import mimetypes
 from typing import Iterable
 
+from fastapi.responses import RedirectResponse
 from sqlalchemy import select
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +22,8 @@ from app.models.resumeCourseEvaluationModel import (
     ResumeCourseEvaluationStatus,
 )
 from app.services.resources.resourceLessonContentCodec import ResourceLessonContentCodec
+from app.services.storage.presignedUrls import presigned_redirect
+from app.services.storage.storageStreaming import ByteRange, StorageStream, open_storage_stream
 from app.services.storage.storageService import (
     StorageService,
     get_resource_storage_location_id,
@@ -250,7 +253,7 @@ class ResourceService:
         completed_ids = await self.get_completed_lesson_ids_for_resource(resource_id=resource.id, user_id=user_id)
         return self.to_progress_payload(resource, completed_ids)
 
-    async def download_resource_file(self, key: str) -> tuple[bytes, str, str]:
+    def _safe_resource_key(self, key: str) -> str:
         safe_key = (key or "").strip().lstrip("/")
         if not safe_key:
             raise ValueError("File key is required.")
@@ -258,11 +261,40 @@ class ResourceService:
             raise ValueError("Invalid resource file key.")
         if not self.storage_service:
             raise ValueError("Resource storage is not configured.")
+        return safe_key
 
-        file_bytes = await self.storage_service.download_file(safe_key)
+    @staticmethod
+    def _resource_file_meta(safe_key: str) -> tuple[str, str]:
         media_type = mimetypes.guess_type(safe_key)[0] or "application/octet-stream"
         filename = safe_key.rsplit("/", 1)[-1] or "resource_file"
-        return file_bytes, media_type, filename
+        return media_type, filename
+
+    async def download_resource_file(self, key: str) -> tuple[bytes, str, str]:
+        safe_key = self._safe_resource_key(key)
+        file_bytes = await self.storage_service.download_file(safe_key)
+        return (file_bytes, *self._resource_file_meta(safe_key))
+
+    async def stream_resource_file(
+        self,
+        key: str,
+        byte_range: ByteRange | None = None,
+    ) -> tuple[StorageStream, str, str]:
+        """Like ``download_resource_file`` but streamed, optionally one byte range."""
+        safe_key = self._safe_resource_key(key)
+        stream = await open_storage_stream(self.storage_service, safe_key, byte_range)
+        return (stream, *self._resource_file_meta(safe_key))
+
+    async def redirect_resource_file(self, key: str) -> RedirectResponse | None:
+        """307 to a presigned URL in redirect serving mode, else None."""
+        safe_key = self._safe_resource_key(key)
+        media_type, filename = self._resource_file_meta(safe_key)
+        return await presigned_redirect(
+            self.storage_service,
+            safe_key,
+            filename=filename,
+            media_type=media_type,
+            disposition="inline",
+        )
 
     async def list_user_enrollment_progress(self, user_id: UUID) -> list[dict]:
         resource_result = await self.session.execute(
@@ -16,7 +16,7 @@ from app.core.resume_analyzer.resume_audit_schema import (
     ResumeAuditResult,
     format_resume_audit_report,
 )
-from app.core.resume_analyzer.resume_text_extractor import extract_resume_text_from_bytes
+from app.core.resume_analyzer.resume_text_extractor import ResumeTextExtractionError
 from app.models.resumeCourseEvaluationModel import (
     ResumeCourseEvaluationModel,
     ResumeCourseEvaluationStatus,
@@ -24,6 +24,8 @@ from app.models.resumeCourseEvaluationModel import (
 from app.services.ai.aiBudgetGuard import AIBudgetExhausted, ensure_llm_budget
 from app.services.ai.aiUsageService import AIFeature, AIUsageService, QuotaReservation
 from app.services.resumes.resumeService import ResumeService
+from app.services.storage.localStorageService import sign_stored_url
+from app.services.storage.uploadSpool import SpooledUpload
 
 
 class ResumeCourseAuditService:
@@ -104,7 +106,7 @@ class ResumeCourseAuditService:
         *,
         user_id: UUID,
         storage_location_id: str,
-        file_bytes: bytes,
+        upload: SpooledUpload,
         filename: str,
         content_type: str,
     ) -> tuple[dict, ResumeCourseEvaluationModel]:
@@ -114,18 +116,27 @@ class ResumeCourseAuditService:
         resume, file_info = await self.resume_service.create_resume_from_upload(
             user_id=user_id,
             storage_location_id=storage_location_id,
-            file_bytes=file_bytes,
+            upload=upload,
             file_name=filename,
             mime_type=content_type,
         )
 
         evaluation = await self.create_pending_evaluation(user_id=user_id, resume_id=resume.id)
 
-        extracted_text = await extract_resume_text_from_bytes(
-            file_bytes,
-            filename=filename,
-            content_type=content_type,
-        )
+        # Extracted (and stored) during the upload above, so this is a lookup.
+        try:
+            extracted_text = await self.resume_service.get_resume_text(
+                resume.storage_file_id,
+                filename=filename,
+                content_type=content_type,
+            )
+        except ResumeTextExtractionError as exc:
+            await reservation.release()
+            await self.fail_evaluation(evaluation, str(exc))
+            raise HTTPException(
+                status_code=503,
+                detail="The resume could not be read right now. Please try again shortly.",
+            ) from exc
         if len((extracted_text or "").strip()) < 80:
             # No LLM call happens, so the reserved slot is returned.
             await reservation.release()
@@ -169,7 +180,7 @@ class ResumeCourseAuditService:
         )
         return {
             "resume_id": str(resume.id),
-            "file_url": file_info["view_url"],
+            "file_url": sign_stored_url(file_info["view_url"]),
             "original_filename": filename,
             "evaluation_id": str(completed.id),
             "overall_score": round(completed.overall_score or 0.0, 1),
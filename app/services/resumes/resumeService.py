@@ -1,12 +1,20 @@
+from app.core.resume_analyzer import resume_text_extractor
+from app.core.resume_analyzer.resume_text_extractor import RESUME_TEXT_EXTRACTOR_VERSION
 from app.models.resumeModel import ResumeModel
-from sqlalchemy import select
+from app.models.resumeTextModel import ResumeTextModel
+from sqlalchemy import delete, select
 from app.schemas.resumeSchema import CreateResumeSchema
 from sqlalchemy.ext.asyncio import AsyncSession
-from uuid import UUID
+from fastapi.responses import RedirectResponse
+from uuid import UUID, uuid4
 import logging
 from datetime import datetime
+from app.services.ai.llmResultCache import LLMResultCache
 from app.services.analytics.embeddingService import ResumeEmbeddingService, generate_embedding
+from app.services.storage.presignedUrls import presigned_redirect
 from app.services.storage.storageService import StorageService, get_storage_service
+from app.services.storage.storageStreaming import ByteRange, StorageStream, open_storage_stream
+from app.services.storage.uploadSpool import SpooledUpload
 
 LOGGER = logging.getLogger(__name__)
 
@@ -55,22 +63,57 @@ class ResumeService:
         *,
         user_id: UUID,
         storage_location_id: str,
-        file_bytes: bytes,
+        upload: SpooledUpload,
         file_name: str,
         mime_type: str,
     ) -> tuple[ResumeModel, dict]:
-        file_info = await self.upload_resume_file(file_bytes, file_name, mime_type)
-        resume = await self.create_resume(
-            CreateResumeSchema(
-                view_url=file_info["view_url"],
-                original_filename=file_name,
-                storage_file_id=file_info["file_key"],
-                folder_id=storage_location_id,
-                user_id=user_id,
-            )
+        duplicate = await self._find_user_resume_by_content(user_id, upload.sha256)
+        if duplicate is not None:
+            # Same bytes already stored for this user: no storage write and no
+            # re-extraction, the new record points at the existing object.
+            file_info = {
+                "file_key": duplicate.storage_file_id,
+                "view_url": duplicate.view_url,
+                "original_filename": file_name,
+            }
+        else:
+            file_info = await self._upload_resume_fileobj_to_storage(upload, file_name, mime_type)
+        resume = ResumeModel(
+            user_id=user_id,
+            view_url=file_info["view_url"],
+            original_filename=file_name,
+            storage_file_id=file_info["file_key"],
+            folder_id=storage_location_id,
+            content_sha256=upload.sha256,
+            text_sha256=duplicate.text_sha256 if duplicate is not None else None,
         )
+        self.session.add(resume)
+        await self.session.commit()
+        await self.session.refresh(resume)
+        if duplicate is not None:
+            return resume, file_info
+
+        # Parse once at upload; every later consumer reads the stored text.
+        try:
+            await self.extract_and_save_resume_text(
+                resume.storage_file_id,
+                upload.read_bytes(),
+                filename=file_name,
+                content_type=mime_type,
+            )
+        except Exception:  # noqa: BLE001 — extraction is retried lazily on first read
+            LOGGER.warning("Could not extract text at upload for %s", resume.storage_file_id, exc_info=True)
         return resume, file_info
-    
+
+    async def _find_user_resume_by_content(self, user_id: UUID, content_sha256: str) -> ResumeModel | None:
+        result = await self.session.execute(
+            select(ResumeModel)
+            .where(ResumeModel.user_id == user_id, ResumeModel.content_sha256 == content_sha256)
+            .order_by(ResumeModel.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     async def create_resume_embedding(self, resume_id: UUID, model_name: str, dims: int, embedding: list[float]) -> None:
         embedding_service = ResumeEmbeddingService(self.session)
         await embedding_service.upsert_resume_embedding(
@@ -135,6 +178,13 @@ class ResumeService:
         await self.session.refresh(resume)
         return resume
     
+    @staticmethod
+    def _unique_storage_name(file_name: str) -> str:
+        # Keys must be unique per upload (resume_texts is keyed by them); the
+        # timestamp alone collides for same-named uploads within a second.
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        return f"{timestamp}_{uuid4().hex[:8]}_{file_name}"
+
     async def _upload_resume_file_to_storage(
         self,
         file_bytes: bytes,
@@ -142,11 +192,7 @@ class ResumeService:
         mime_type: str = "application/pdf",
     ) -> dict:
         """Upload resume file to the configured storage provider."""
-        # Generate unique filename with timestamp
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        unique_filename = f"{timestamp}_{file_name}"
-        
-        upload_result = await self.storage_service.upload_file(file_bytes, unique_filename, mime_type)
+        upload_result = await self.storage_service.upload_file(file_bytes, self._unique_storage_name(file_name), mime_type)
         
         return {
             "file_key": upload_result["file_key"],
@@ -154,6 +200,20 @@ class ResumeService:
             "original_filename": file_name
         }
 
+    async def _upload_resume_fileobj_to_storage(self, upload: SpooledUpload, file_name: str, mime_type: str) -> dict:
+        """Stream a spooled upload to storage under a timestamped unique key."""
+        upload_fileobj = getattr(self.storage_service, "upload_fileobj", None)
+        if upload_fileobj is None:
+            # Backends without a streaming path get the bytes (bounded by
+            # MAX_UPLOAD_BYTES) through the regular upload.
+            return await self._upload_resume_file_to_storage(upload.read_bytes(), file_name, mime_type)
+        upload_result = await upload_fileobj(upload.rewind(), self._unique_storage_name(file_name), mime_type)
+        return {
+            "file_key": upload_result["file_key"],
+            "view_url": upload_result["file_url"],
+            "original_filename": file_name
+        }
+
     async def upload_resume_file(self, file_bytes: bytes, file_name: str, mime_type: str = "application/pdf") -> dict:
         """Upload resume file using the configured storage provider."""
         return await self._upload_resume_file_to_storage(file_bytes, file_name, mime_type)
@@ -170,21 +230,113 @@ class ResumeService:
         """Download resume file using the configured storage provider."""
         return await self._download_resume_file_from_storage(file_key)
 
+    async def stream_resume_file(self, file_key: str, byte_range: ByteRange | None = None) -> StorageStream:
+        """Stream a resume file (or one byte range of it) from storage."""
+        return await open_storage_stream(self.storage_service, file_key, byte_range)
+
+    async def redirect_resume_file(
+        self,
+        file_key: str,
+        *,
+        filename: str,
+        media_type: str,
+        disposition: str,
+    ) -> RedirectResponse | None:
+        """307 to a presigned URL in redirect serving mode, else None."""
+        return await presigned_redirect(
+            self.storage_service,
+            file_key,
+            filename=filename,
+            media_type=media_type,
+            disposition=disposition,
+        )
+
     async def download_file_from_s3(self, file_key: str) -> bytes:
         """Backward-compatible alias for existing callers."""
         return await self.download_resume_file(file_key)
 
+    async def get_resume_text(self, storage_file_id: str, *, filename: str, content_type: str = "") -> str:
+        """Extracted text of a stored resume file.
+
+        Served from ``resume_texts`` when present; otherwise the file is
+        downloaded and parsed once, and the result stored for next time.
+        """
+        stored = await self.session.get(ResumeTextModel, storage_file_id)
+        if stored is not None and stored.extractor_version == RESUME_TEXT_EXTRACTOR_VERSION:
+            return stored.text
+        file_bytes = await self.download_resume_file(storage_file_id)
+        return await self.extract_and_save_resume_text(
+            storage_file_id,
+            file_bytes,
+            filename=filename,
+            content_type=content_type,
+        )
+
+    async def extract_and_save_resume_text(
+        self,
+        storage_file_id: str,
+        file_bytes: bytes,
+        *,
+        filename: str,
+        content_type: str = "",
+    ) -> str:
+        text = await resume_text_extractor.extract_resume_text_from_bytes(
+            file_bytes,
+            filename=filename,
+            content_type=content_type,
+        )
+        await self._save_resume_text(storage_file_id, text or "")
+        return text
+
+    async def _save_resume_text(self, storage_file_id: str, text: str) -> None:
+        values = dict(
+            codec="zlib",
+            compressed_text=ResumeTextModel.compress(text),
+            text_length=len(text),
+            extractor_version=RESUME_TEXT_EXTRACTOR_VERSION,
+            created_at=datetime.utcnow(),
+        )
+        dialect = self.session.get_bind().dialect.name
+        if dialect in {"postgresql", "sqlite"}:
+            # Upsert: two consumers may extract the same file concurrently.
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            await self.session.execute(
+                insert(ResumeTextModel)
+                .values(storage_file_id=storage_file_id, **values)
+                .on_conflict_do_update(index_elements=["storage_file_id"], set_=values)
+            )
+        else:
+            await self.session.merge(ResumeTextModel(storage_file_id=storage_file_id, **values))
+        await self.session.commit()
+
     async def delete_resume(self, resume_id: UUID, user_id: UUID) -> bool:
         resume = await self.session.get(ResumeModel, resume_id)
         if not resume or resume.user_id != user_id:
             return False
 
-        # Try deleting from storage, but don't fail DB deletion if file missing
-        try:
-            await self.storage_service.delete_file(resume.storage_file_id)
-        except Exception as e:
-            LOGGER.warning("Storage delete failed for %s: %s", resume.storage_file_id, e)
+        # Re-uploads of identical bytes share one stored object; only remove it
+        # (and its extracted text) once no other resume points at it.
+        shared = await self.session.scalar(
+            select(ResumeModel.id)
+            .where(ResumeModel.storage_file_id == resume.storage_file_id, ResumeModel.id != resume.id)
+            .limit(1)
+        )
+        if shared is None:
+            # Try deleting from storage, but don't fail DB deletion if file missing
+            try:
+                await self.storage_service.delete_file(resume.storage_file_id)
+            except Exception as e:
+                LOGGER.warning("Storage delete failed for %s: %s", resume.storage_file_id, e)
+            await self.session.execute(
+                delete(ResumeTextModel).where(ResumeTextModel.storage_file_id == resume.storage_file_id)
+            )
 
+        if resume.text_sha256:
+            # Cached analyses are derived from the resume content; forget them too.
+            await LLMResultCache(self.session).purge(resume.text_sha256)
         await self.session.delete(resume)
         await self.session.commit()
         return True
@@ -0,0 +1,210 @@
+"""Resized WebP/JPEG variants of uploaded post images.
+
+Rendering decodes untrusted images, so it runs in a bounded process pool
+(``MEDIA_VARIANT_WORKERS``) with a wall-clock cap, after the upload response
+has been sent. Variants never upscale, honour the EXIF orientation and carry
+no metadata (EXIF, ICC, XMP are dropped on save).
+
+A post's manifest records every variant::
+
+    {"version": 1, "width": 4032, "height": 3024,
+     "variants": [{"width": 640, "height": 480, "format": "webp",
+                   "content_type": "image/webp", "bytes": 31877, "url": "...",
+                   "key": "posts/photo.jpg.variants/w640.webp"}]}
+
+and :func:`select_image_variant` picks the one a feed should render. ``key``
+is set for variants stored as objects, so they can be deleted with the post.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Optional
+
+from app.config import (
+    MEDIA_VARIANT_MAX_PIXELS,
+    MEDIA_VARIANT_TIMEOUT_SECONDS,
+    MEDIA_VARIANT_WIDTHS,
+    MEDIA_VARIANT_WORKERS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+VARIANT_FORMATS = (("webp", "WEBP", "image/webp"), ("jpg", "JPEG", "image/jpeg"))
+
+_variant_pool: ProcessPoolExecutor | None = None
+
+
+@dataclass(frozen=True)
+class RenderedImageVariant:
+    width: int
+    height: int
+    format: str
+    content_type: str
+    data: bytes
+
+
+@dataclass(frozen=True)
+class RenderedImage:
+    width: int
+    height: int
+    variants: list[RenderedImageVariant]
+
+
+def variant_widths(image_width: int, widths: tuple[int, ...]) -> list[int]:
+    """Target widths for an image: never upscaled, and always at least one."""
+    return sorted({width for width in widths if width < image_width} | {min(image_width, max(widths))})
+
+
+def _oriented_size(image) -> tuple[int, int]:
+    # EXIF orientations 5-8 rotate by 90 degrees.
+    orientation = image.getexif().get(0x0112, 1)
+    width, height = image.size
+    return (height, width) if orientation in {5, 6, 7, 8} else (width, height)
+
+
+def probe_image_size(data: bytes) -> Optional[tuple[int, int]]:
+    """Displayed (width, height) from the image header, without decoding."""
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if getattr(image, "is_animated", False):
+                return None
+            return _oriented_size(image)
+    except Exception:  # noqa: BLE001 — not an image Pillow understands
+        return None
+
+
+def render_image_variants(data: bytes, widths: tuple[int, ...], max_pixels: int) -> Optional[RenderedImage]:
+    """Decode ``data`` and encode every variant. None for images that should
+    be served as uploaded (animated, or not decodable)."""
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    with Image.open(io.BytesIO(data)) as image:
+        if getattr(image, "is_animated", False):
+            return None
+        original_width, original_height = _oriented_size(image)
+        # JPEG decoders can scale down by powers of two while decoding.
+        image.draft("RGB", (max(widths), max(widths)))
+        oriented = ImageOps.exif_transpose(image)
+        has_alpha = oriented.mode in {"RGBA", "LA", "PA"} or "transparency" in oriented.info
+        base = oriented.convert("RGBA" if has_alpha else "RGB")
+
+    targets = variant_widths(original_width, widths)
+    variants: list[RenderedImageVariant] = []
+    for width in targets:
+        height = max(1, round(base.height * width / base.width))
+        resized = base if width == base.width else base.resize((width, height), Image.Resampling.LANCZOS)
+        for extension, pil_format, content_type in VARIANT_FORMATS:
+            frame = resized
+            if pil_format == "JPEG" and has_alpha:
+                frame = Image.new("RGB", resized.size, (255, 255, 255))
+                frame.paste(resized, mask=resized.getchannel("A"))
+            buffer = io.BytesIO()
+            if pil_format == "WEBP":
+                frame.save(buffer, pil_format, quality=80, method=4)
+            else:
+                frame.save(buffer, pil_format, quality=82, optimize=True, progressive=True)
+            variants.append(RenderedImageVariant(width, height, extension, content_type, buffer.getvalue()))
+    return RenderedImage(width=original_width, height=original_height, variants=variants)
+
+
+def _get_variant_pool() -> ProcessPoolExecutor:
+    global _variant_pool
+    if _variant_pool is None:
+        # spawn, not fork: see resume_text_extractor.
+        _variant_pool = ProcessPoolExecutor(
+            max_workers=MEDIA_VARIANT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _variant_pool
+
+
+def _kill_variant_pool(pool: ProcessPoolExecutor) -> None:
+    global _variant_pool
+    if _variant_pool is pool:
+        _variant_pool = None
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False)
+
+
+def shutdown_image_variant_workers() -> None:
+    global _variant_pool
+    if _variant_pool is not None:
+        _variant_pool.shutdown(wait=True)
+        _variant_pool = None
+
+
+async def build_image_variants(data: bytes, widths: tuple[int, ...] = MEDIA_VARIANT_WIDTHS) -> Optional[RenderedImage]:
+    """Render variants off the event loop. Failures and timeouts are logged
+    and return None: the post keeps serving its original."""
+    work = partial(render_image_variants, data, widths, MEDIA_VARIANT_MAX_PIXELS)
+    try:
+        if MEDIA_VARIANT_WORKERS == 0:
+            return await asyncio.to_thread(work)
+        pool = _get_variant_pool()
+        try:
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(pool, work),
+                timeout=MEDIA_VARIANT_TIMEOUT_SECONDS,
+            )
+        except (asyncio.TimeoutError, BrokenProcessPool):
+            _kill_variant_pool(pool)
+            raise
+    except Exception:  # noqa: BLE001 — undecodable, too large, or a dead worker
+        LOGGER.warning("Could not render image variants", exc_info=True)
+        return None
+
+
+def build_variant_manifest(image: RenderedImage, urls: list[str], keys: list[str]) -> dict[str, Any]:
+    return {
+        "version": MANIFEST_VERSION,
+        "width": image.width,
+        "height": image.height,
+        "variants": [
+            {
+                "width": variant.width,
+                "height": variant.height,
+                "format": variant.format,
+                "content_type": variant.content_type,
+                "bytes": len(variant.data),
+                "url": url,
+                "key": key,
+            }
+            for variant, url, key in zip(image.variants, urls, keys)
+        ],
+    }
+
+
+def select_image_variant(
+    manifest: Optional[dict[str, Any]],
+    *,
+    width: int,
+    accept_webp: bool = True,
+) -> Optional[dict[str, Any]]:
+    """Smallest variant at least ``width`` wide (else the widest), in WebP
+    when the client accepts it."""
+    variants = [
+        variant
+        for variant in (manifest or {}).get("variants", [])
+        if accept_webp or variant.get("format") != "webp"
+    ]
+    if not variants:
+        return None
+    preferred = "webp" if accept_webp else "jpg"
+    variants.sort(key=lambda variant: (variant["width"], variant.get("format") != preferred))
+    for variant in variants:
+        if variant["width"] >= width:
+            return variant
+    widest = variants[-1]["width"]
+    return next(variant for variant in variants if variant["width"] == widest)
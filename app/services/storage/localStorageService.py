@@ -0,0 +1,246 @@
+"""Filesystem-backed storage with the same interface as ``S3Service``.
+
+Objects live under ``LOCAL_STORAGE_ROOT/<bucket>/`` in a two-level tree
+sharded by the SHA-256 of the key (``ab/cd/abcd...``), so no directory grows
+unbounded and keys never reach the filesystem as paths. Writes go to a temp
+file in the target directory and are ``os.replace``-d into place, so readers
+see either the old object or the complete new one.
+
+Clients fetch objects through ``/api/v1/storage/{bucket}/{key}`` with an HMAC
+signature in the query string (see :func:`verify_signed_url`), the local
+counterpart of an S3 presigned URL. Uploads return the unsigned route URL
+(like an S3 object URL) for storage next to the key; :func:`sign_stored_url`
+signs it when it is handed to a client. Routes that serve a ``StorageStream`` with
+a ``path`` hand it to ``FileResponse``, which lets the server send the file
+without copying it through Python.
+"""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, BinaryIO, Callable, Optional, TypeVar
+from urllib.parse import quote, unquote, urlencode
+
+from app.config import LOCAL_STORAGE_BASE_URL, LOCAL_STORAGE_ROOT, STORAGE_STREAM_CHUNK_BYTES
+from app.services.storage.storageStreaming import ByteRange, StorageStream
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LOCAL_STORAGE_ROUTE_PREFIX = "/api/v1/storage"
+_BUCKET_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+_COPY_BUFFER_BYTES = 1024 * 1024
+
+
+def _signing_key() -> bytes:
+    from app.services.accounts.userService import SECRET
+
+    # Derived rather than used directly so a storage signature can never be
+    # replayed as any other token signed with SECRET_KEY.
+    return hmac.new(SECRET.encode("utf-8"), b"local-storage-url", hashlib.sha256).digest()
+
+
+def sign_storage_key(bucket: str, file_key: str, expires: int) -> str:
+    message = f"{bucket}\n{file_key}\n{expires}".encode("utf-8")
+    return hmac.new(_signing_key(), message, hashlib.sha256).hexdigest()
+
+
+def verify_signed_url(bucket: str, file_key: str, expires: int, signature: str, *, now: float | None = None) -> bool:
+    """True when ``signature`` was issued for this object and has not expired.
+    ``expires == 0`` marks a non-expiring (public media) URL."""
+    if expires and expires < (time.time() if now is None else now):
+        return False
+    return hmac.compare_digest(sign_storage_key(bucket, file_key, expires), signature or "")
+
+
+def _normalize_key(file_key: str) -> str:
+    key = (file_key or "").strip().lstrip("/")
+    if not key or "\x00" in key or any(part in {"", ".", ".."} for part in key.split("/")):
+        raise ValueError(f"Invalid storage key: {file_key!r}")
+    return key
+
+
+def write_file_atomic(path: Path, write: Callable[[BinaryIO], None]) -> None:
+    """Write ``path`` through a temp file in the same directory and
+    ``os.replace`` it into place, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            write(handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def file_stream(
+    path: Path,
+    size: int,
+    byte_range: Optional[ByteRange],
+    run: Callable[[Callable[[], T], str], Awaitable[T]],
+) -> StorageStream:
+    """``StorageStream`` over a file on disk; it carries ``path`` so routes can
+    answer with ``FileResponse``. Blocking reads go through ``run(fn, operation)``."""
+    start, end = byte_range.resolve(size) if byte_range is not None else (0, size - 1)
+    remaining = end - start + 1 if size else 0
+    handle: BinaryIO | None = None
+
+    def open_at_start() -> BinaryIO:
+        opened = path.open("rb")
+        opened.seek(start)
+        return opened
+
+    async def read(chunk_size: int) -> bytes:
+        nonlocal handle, remaining
+        if remaining <= 0:
+            return b""
+        if handle is None:
+            handle = await run(open_at_start, "open")
+        chunk = await run(lambda: handle.read(min(chunk_size, remaining)), "read")
+        remaining -= len(chunk)
+        return chunk
+
+    async def close() -> None:
+        if handle is not None:
+            await run(handle.close, "close")
+
+    return StorageStream(
+        read=read,
+        close=close,
+        content_length=remaining,
+        total_size=size,
+        content_range=f"bytes {start}-{end}/{size}" if byte_range is not None else None,
+        chunk_size=STORAGE_STREAM_CHUNK_BYTES,
+        path=str(path),
+    )
+
+
+def sign_stored_url(url: str, expiration: int = 3600) -> str:
+    """Signed URL for a stored object URL of this backend. Any query string
+    (an already expired signature) is replaced; other URLs pass through."""
+    prefix = f"{LOCAL_STORAGE_BASE_URL}{LOCAL_STORAGE_ROUTE_PREFIX}/"
+    if not url or not url.startswith(prefix):
+        return url
+    bucket, _, key = url[len(prefix):].split("?", 1)[0].partition("/")
+    try:
+        return LocalStorageService(bucket_name=bucket).file_url(unquote(key), expiration)
+    except ValueError:
+        return url
+
+
+class LocalStorageService:
+    """Service for handling local filesystem file operations"""
+
+    def __init__(self, bucket_name: Optional[str] = None, *, root: str | os.PathLike | None = None):
+        self.bucket_name = bucket_name or os.getenv("BUCKET_NAME") or "default"
+        if not _BUCKET_RE.match(self.bucket_name):
+            raise ValueError(f"Invalid local storage bucket name: {self.bucket_name!r}")
+        self.root = Path(root or LOCAL_STORAGE_ROOT).resolve() / self.bucket_name
+
+    @staticmethod
+    async def _run(fn: Callable[[], T], operation: str) -> T:
+        from app.services.storage.s3Service import run_storage_io
+
+        return await run_storage_io(fn, backend="local", operation=operation)
+
+    def local_path(self, file_key: str) -> Path:
+        digest = hashlib.sha256(_normalize_key(file_key).encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def object_url(self, file_key: str) -> str:
+        """Unsigned, stable route URL of an object; not fetchable until signed."""
+        return f"{LOCAL_STORAGE_BASE_URL}{LOCAL_STORAGE_ROUTE_PREFIX}/{self.bucket_name}/{quote(file_key)}"
+
+    def file_url(self, file_key: str, expiration: int | None = 3600) -> str:
+        expires = 0 if expiration is None else int(time.time()) + expiration
+        query = urlencode({"expires": expires, "signature": sign_storage_key(self.bucket_name, file_key, expires)})
+        return f"{self.object_url(file_key)}?{query}"
+
+    async def _store(self, write: Callable[[BinaryIO], None], file_name: str, folder: str) -> dict:
+        safe_folder = (folder or "resumes").strip("/") or "resumes"
+        safe_name = os.path.basename(file_name or "file")
+        file_key = f"{safe_folder}/{safe_name}"
+        await self._run(lambda: write_file_atomic(self.local_path(file_key), write), "upload")
+
+        LOGGER.info(f"File stored locally: {file_key}")
+        return {
+            "file_key": file_key,
+            "file_url": self.object_url(file_key),
+            "bucket": self.bucket_name,
+        }
+
+    async def upload_file(
+        self,
+        file_bytes: bytes,
+        file_name: str,
+        content_type: str = "application/pdf",
+        folder: str = "resumes",
+    ) -> dict:
+        return await self._store(lambda handle: handle.write(file_bytes), file_name, folder)
+
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        file_name: str,
+        content_type: str = "application/pdf",
+        folder: str = "resumes",
+    ) -> dict:
+        return await self._store(lambda handle: shutil.copyfileobj(fileobj, handle, _COPY_BUFFER_BYTES), file_name, folder)
+
+    async def download_file(self, file_key: str) -> bytes:
+        try:
+            return await self._run(self.local_path(file_key).read_bytes, "download")
+        except FileNotFoundError as e:
+            LOGGER.error(f"Error downloading local file: {file_key}")
+            raise Exception(f"Failed to download file from local storage: {file_key}") from e
+
+    async def stream_file(self, file_key: str, byte_range: Optional[ByteRange] = None) -> StorageStream:
+        """
+        Open a file for streaming, optionally a single byte range of it
+
+        The returned stream carries the file's ``path``; routes serve it with
+        ``FileResponse``. Iterating it instead reads chunks on the storage pool.
+
+        Raises:
+            RangeNotSatisfiable: the range lies outside the object
+        """
+        path = self.local_path(file_key)
+        try:
+            size = (await self._run(path.stat, "stat")).st_size
+        except FileNotFoundError as e:
+            LOGGER.error(f"Error downloading local file: {file_key}")
+            raise Exception(f"Failed to download file from local storage: {file_key}") from e
+
+        return file_stream(path, size, byte_range, self._run)
+
+    async def delete_file(self, file_key: str) -> bool:
+        try:
+            await self._run(self.local_path(file_key).unlink, "delete")
+        except FileNotFoundError:
+            LOGGER.warning(f"Local file to delete not found: {file_key}")
+            return False
+        LOGGER.info(f"File deleted locally: {file_key}")
+        return True
+
+    def public_url(self, file_key: str) -> str:
+        """Non-expiring signed URL, the counterpart of a public S3 object URL."""
+        return self.file_url(file_key, expiration=None)
+
+    async def generate_presigned_url(self, file_key: str, expiration: int = 3600, **response_overrides) -> Optional[str]:
+        # The serving route derives headers from the key; S3's response
+        # header overrides (filename, content_type, disposition) are ignored.
+        return self.file_url(file_key, expiration)
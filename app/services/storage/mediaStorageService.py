@@ -2,16 +2,25 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+import json
 import mimetypes
 import os
 from pathlib import Path
 import shutil
 import tempfile
-from typing import Protocol
+from typing import Any, Protocol
 
 from fastapi import UploadFile
 from imagekitio import ImageKit
 
+from app.config import MEDIA_VARIANT_WIDTHS
+from app.services.storage.imageVariants import (
+    MANIFEST_VERSION,
+    build_image_variants,
+    build_variant_manifest,
+    probe_image_size,
+    variant_widths,
+)
 from app.services.storage.storageService import (
     StorageService,
     get_media_storage_location_id,
@@ -24,12 +33,24 @@ class MediaUploadResult:
     url: str
     file_type: str
     name: str
+    # Storage key of the original, for backends that address objects by key.
+    key: str | None = None
 
 
 class MediaStorageService(Protocol):
     async def upload_media(self, file: UploadFile, file_name: str, folder: str = "images/") -> MediaUploadResult:
         ...
 
+    async def create_image_variants(self, media: MediaUploadResult, data: bytes) -> dict[str, Any] | None:
+        """Resized variants of an uploaded image as a manifest (see
+        ``imageVariants``); None keeps serving the original. Optional."""
+        ...
+
+    async def delete_image_variants(self, manifest: dict[str, Any]) -> None:
+        """Delete the stored objects of a manifest returned by
+        ``create_image_variants``. Optional."""
+        ...
+
 
 class ImageKitMediaStorageService:
     def __init__(self, private_key: str | None = None):
@@ -38,6 +59,18 @@ class ImageKitMediaStorageService:
     async def upload_media(self, file: UploadFile, file_name: str, folder: str = "images/") -> MediaUploadResult:
         return await asyncio.to_thread(self._upload_media_sync, file, file_name, folder)
 
+    async def create_image_variants(self, media: MediaUploadResult, data: bytes) -> dict[str, Any] | None:
+        # ImageKit resizes, re-encodes and strips metadata at its CDN from URL
+        # transformations, so only the dimensions need computing here.
+        size = await asyncio.to_thread(probe_image_size, data)
+        if size is None:
+            return None
+        return imagekit_variant_manifest(media.url, *size)
+
+    async def delete_image_variants(self, manifest: dict[str, Any]) -> None:
+        # Variants are URL transformations of the original; nothing is stored.
+        return None
+
     def _upload_media_sync(self, file: UploadFile, file_name: str, folder: str) -> MediaUploadResult:
         temp_file_path: str | None = None
         try:
@@ -80,12 +113,72 @@ class S3MediaStorageService:
             content_type=content_type,
             folder=folder.strip("/") or "images",
         )
+        # Post media is embedded indefinitely: prefer a non-expiring URL when
+        # the backend's default one is signed with an expiry.
+        public_url = getattr(self.storage_service, "public_url", None)
         return MediaUploadResult(
-            url=upload_result["file_url"],
+            url=public_url(upload_result["file_key"]) if public_url else upload_result["file_url"],
             file_type=_file_type_from_content_type(content_type),
             name=safe_name,
+            key=upload_result["file_key"],
         )
 
+    async def create_image_variants(self, media: MediaUploadResult, data: bytes) -> dict[str, Any] | None:
+        if media.key is None:
+            return None
+        rendered = await build_image_variants(data)
+        if rendered is None or not rendered.variants:
+            return None
+        # Stored next to the original: posts/photo.png -> posts/photo.png.variants/w640.webp
+        folder = f"{media.key}.variants"
+        public_url = getattr(self.storage_service, "public_url", None)
+        urls: list[str] = []
+        keys: list[str] = []
+        for variant in rendered.variants:
+            upload_result = await self.storage_service.upload_file(
+                file_bytes=variant.data,
+                file_name=f"w{variant.width}.{variant.format}",
+                content_type=variant.content_type,
+                folder=folder,
+            )
+            urls.append(public_url(upload_result["file_key"]) if public_url else upload_result["file_url"])
+            keys.append(upload_result["file_key"])
+        manifest = build_variant_manifest(rendered, urls, keys)
+        await self.storage_service.upload_file(
+            file_bytes=json.dumps(manifest).encode("utf-8"),
+            file_name="manifest.json",
+            content_type="application/json",
+            folder=folder,
+        )
+        return manifest
+
+    async def delete_image_variants(self, manifest: dict[str, Any]) -> None:
+        keys = [variant["key"] for variant in manifest.get("variants", []) if variant.get("key")]
+        # The manifest object sits in the same ``<key>.variants`` folder.
+        folders = sorted({key.rsplit("/", 1)[0] for key in keys})
+        for key in [*keys, *(f"{folder}/manifest.json" for folder in folders)]:
+            await self.storage_service.delete_file(key)
+
+
+def imagekit_variant_manifest(url: str, width: int, height: int) -> dict[str, Any]:
+    # ImageKit takes ``tr`` as one more query parameter of a signed or
+    # versioned URL.
+    separator = "&" if "?" in url else "?"
+    variants = []
+    for variant_width in variant_widths(width, MEDIA_VARIANT_WIDTHS):
+        variant_height = max(1, round(height * variant_width / width))
+        for extension, content_type in (("webp", "image/webp"), ("jpg", "image/jpeg")):
+            variants.append(
+                {
+                    "width": variant_width,
+                    "height": variant_height,
+                    "format": extension,
+                    "content_type": content_type,
+                    "url": f"{url}{separator}tr=w-{variant_width},f-{extension}",
+                }
+            )
+    return {"version": MANIFEST_VERSION, "width": width, "height": height, "variants": variants}
+
 
 def _file_type_from_content_type(content_type: str) -> str:
     media_type = (content_type or "").split("/", 1)[0].strip().lower()
@@ -102,4 +195,10 @@ def get_media_storage_service(provider: str | None = None) -> MediaStorageServic
         return ImageKitMediaStorageService()
     if selected_provider == "s3":
         return S3MediaStorageService()
+    if selected_provider == "local":
+        from app.services.storage.localStorageService import LocalStorageService
+
+        return S3MediaStorageService(
+            storage_service=LocalStorageService(bucket_name=get_media_storage_location_id())
+        )
     raise ValueError(f"Unsupported media storage provider: {selected_provider}")
@@ -0,0 +1,118 @@
+"""Serve authorized downloads by redirecting to presigned storage URLs.
+
+With ``STORAGE_SERVE_MODE=redirect`` download endpoints answer with a ``307``
+to a presigned URL, so file bodies never pass through API workers. URLs are
+cached per object and response headers and reused until
+``STORAGE_PRESIGNED_URL_TTL_SECONDS / 5`` before they expire; a client always
+gets at least that long to follow the redirect. Browsers re-send ``Range`` to
+the redirect target, so ranged reads keep working against the storage backend.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi.responses import RedirectResponse
+
+from app import config
+
+LOGGER = logging.getLogger(__name__)
+
+_MAX_CACHED_URLS = 10_000
+
+
+class PresignedUrlCache:
+    def __init__(self, *, max_entries: int = _MAX_CACHED_URLS):
+        self.max_entries = max_entries
+        self._urls: OrderedDict[tuple, tuple[str, float]] = OrderedDict()
+
+    def get(self, key: tuple, *, now: Optional[float] = None) -> Optional[str]:
+        entry = self._urls.get(key)
+        if entry is None:
+            return None
+        url, refresh_at = entry
+        if (time.monotonic() if now is None else now) >= refresh_at:
+            del self._urls[key]
+            return None
+        return url
+
+    def put(self, key: tuple, url: str, *, ttl_seconds: int, now: Optional[float] = None) -> None:
+        issued_at = time.monotonic() if now is None else now
+        self._urls[key] = (url, issued_at + ttl_seconds - ttl_seconds / 5)
+        self._urls.move_to_end(key)
+        while len(self._urls) > self.max_entries:
+            self._urls.popitem(last=False)
+
+
+_cache = PresignedUrlCache()
+
+
+def redirect_downloads_enabled() -> bool:
+    return config.STORAGE_SERVE_MODE == "redirect"
+
+
+async def get_presigned_download_url(
+    storage_service,
+    file_key: str,
+    *,
+    filename: str,
+    media_type: str,
+    disposition: str,
+) -> Optional[str]:
+    """Cached presigned URL for ``file_key``, or None when the backend cannot
+    presign (callers then proxy the file)."""
+    generate = getattr(storage_service, "generate_presigned_url", None)
+    if generate is None:
+        return None
+    cache_key = (getattr(storage_service, "bucket_name", None), file_key, filename, media_type, disposition)
+    url = _cache.get(cache_key)
+    if url is not None:
+        return url
+
+    ttl = config.STORAGE_PRESIGNED_URL_TTL_SECONDS
+    try:
+        url = await generate(
+            file_key,
+            ttl,
+            filename=filename,
+            content_type=media_type,
+            disposition=disposition,
+        )
+    except Exception:  # noqa: BLE001 — fall back to proxying the file
+        LOGGER.warning("Could not presign %s", file_key, exc_info=True)
+        return None
+    if url:
+        _cache.put(cache_key, url, ttl_seconds=ttl)
+    return url
+
+
+async def presigned_redirect(
+    storage_service,
+    file_key: str,
+    *,
+    filename: str,
+    media_type: str,
+    disposition: str,
+) -> Optional[RedirectResponse]:
+    """``307`` to the object's presigned URL when redirect mode is on and the
+    backend supports it; None means serve the file through the API."""
+    if not redirect_downloads_enabled():
+        return None
+    url = await get_presigned_download_url(
+        storage_service,
+        file_key,
+        filename=filename,
+        media_type=media_type,
+        disposition=disposition,
+    )
+    if url is None:
+        return None
+    # The URL is a bearer credential: keep the redirect out of shared caches.
+    return RedirectResponse(url, status_code=307, headers={"Cache-Control": "private, no-store"})
+
+
+def reset_presigned_url_cache() -> None:
+    global _cache
+    _cache = PresignedUrlCache()
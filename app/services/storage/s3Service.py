@@ -1,13 +1,90 @@
 import boto3
 import os
 import logging
+import threading
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import asyncio
-from typing import Optional
+import time
+from typing import Any, BinaryIO, Callable, Optional, TypeVar
+
+from app.config import (
+    STORAGE_IO_THREADS,
+    STORAGE_MAX_POOL_CONNECTIONS,
+    STORAGE_MULTIPART_CHUNK_BYTES,
+    STORAGE_MULTIPART_THRESHOLD_BYTES,
+    STORAGE_STREAM_CHUNK_BYTES,
+)
+from app.metrics import STORAGE_IO_SECONDS
+from app.services.storage.storageStreaming import ByteRange, RangeNotSatisfiable, StorageStream, content_disposition
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Storage calls block on the network; they get their own pool so they neither
+# starve nor are starved by other run_in_executor users (e.g. DOCX parsing).
+_storage_executor: ThreadPoolExecutor | None = None
+
+# boto3 clients are thread-safe and expensive to build (endpoint resolution,
+# credential chain, a fresh connection pool). S3Service is constructed per
+# request, so clients are shared per credentials/region to reuse connections.
+_clients: dict[tuple, Any] = {}
+_clients_lock = threading.Lock()
+
+_CLIENT_CONFIG = Config(
+    max_pool_connections=STORAGE_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    global _storage_executor
+    if _storage_executor is None:
+        _storage_executor = ThreadPoolExecutor(max_workers=STORAGE_IO_THREADS, thread_name_prefix="storage-io")
+    return _storage_executor
+
+
+async def run_storage_io(fn: Callable[[], T], *, backend: str, operation: str) -> T:
+    """Run blocking storage I/O on the storage pool, timing it for /metrics."""
+    started = time.perf_counter()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_storage_executor(), fn)
+    finally:
+        STORAGE_IO_SECONDS.labels(backend, operation).observe(time.perf_counter() - started)
+
+
+def shutdown_storage_io() -> None:
+    global _storage_executor
+    if _storage_executor is not None:
+        _storage_executor.shutdown(wait=True)
+        _storage_executor = None
+    with _clients_lock:
+        _clients.clear()
+
+
+def _get_s3_client(access_key_id: str, secret_access_key: str, region: str):
+    key = (access_key_id, secret_access_key, region)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = boto3.client(
+                's3',
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                region_name=region,
+                config=_CLIENT_CONFIG,
+            )
+            _clients[key] = client
+        return client
+
+
 class S3Service:
     """Service for handling S3 file operations"""
     
@@ -20,12 +97,11 @@ class S3Service:
         if not all([self.aws_access_key_id, self.aws_secret_access_key, self.bucket_name]):
             raise ValueError("AWS credentials or bucket name not configured. Check your .env file.")
         
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            region_name=self.aws_region
-        )
+        self.s3_client = _get_s3_client(self.aws_access_key_id, self.aws_secret_access_key, self.aws_region)
+
+    @staticmethod
+    async def _run(fn: Callable[[], T], operation: str) -> T:
+        return await run_storage_io(fn, backend="s3", operation=operation)
     
     async def upload_file(
         self,
@@ -47,8 +123,6 @@ class S3Service:
             dict with file_key and file_url
         """
         try:
-            loop = asyncio.get_event_loop()
-            
             safe_folder = (folder or "resumes").strip("/") or "resumes"
             safe_name = os.path.basename(file_name or "file")
             file_key = f"{safe_folder}/{safe_name}"
@@ -63,7 +137,7 @@ class S3Service:
                 )
                 return file_key
             
-            uploaded_key = await loop.run_in_executor(None, do_upload)
+            uploaded_key = await self._run(do_upload, "upload")
             
             # Generate URL
             file_url = f"https://{self.bucket_name}.s3.{self.aws_region}.amazonaws.com/{file_key}"
@@ -80,6 +154,57 @@ class S3Service:
             LOGGER.error(f"Error uploading file to S3: {e}")
             raise Exception(f"Failed to upload file to S3: {str(e)}")
     
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        file_name: str,
+        content_type: str = "application/pdf",
+        folder: str = "resumes",
+    ) -> dict:
+        """
+        Stream a file object to S3 without loading it into memory
+
+        Objects at or above ``STORAGE_MULTIPART_THRESHOLD_BYTES`` are sent as
+        a multipart upload, one ``STORAGE_MULTIPART_CHUNK_BYTES`` part at a time.
+
+        Returns:
+            dict with file_key and file_url
+        """
+        try:
+            safe_folder = (folder or "resumes").strip("/") or "resumes"
+            safe_name = os.path.basename(file_name or "file")
+            file_key = f"{safe_folder}/{safe_name}"
+            transfer_config = TransferConfig(
+                multipart_threshold=STORAGE_MULTIPART_THRESHOLD_BYTES,
+                multipart_chunksize=STORAGE_MULTIPART_CHUNK_BYTES,
+                max_concurrency=4,
+            )
+
+            def do_upload():
+                self.s3_client.upload_fileobj(
+                    fileobj,
+                    self.bucket_name,
+                    file_key,
+                    ExtraArgs={"ContentType": content_type},
+                    Config=transfer_config,
+                )
+                return file_key
+
+            uploaded_key = await self._run(do_upload, "upload")
+            file_url = f"https://{self.bucket_name}.s3.{self.aws_region}.amazonaws.com/{file_key}"
+
+            LOGGER.info(f"File streamed successfully to S3: {file_key}")
+
+            return {
+                "file_key": uploaded_key,
+                "file_url": file_url,
+                "bucket": self.bucket_name
+            }
+
+        except ClientError as e:
+            LOGGER.error(f"Error uploading file to S3: {e}")
+            raise Exception(f"Failed to upload file to S3: {str(e)}")
+
     async def download_file(self, file_key: str) -> bytes:
         """
         Download a file from S3 bucket
@@ -91,8 +216,6 @@ class S3Service:
             File content as bytes
         """
         try:
-            loop = asyncio.get_event_loop()
-            
             def do_download():
                 response = self.s3_client.get_object(
                     Bucket=self.bucket_name,
@@ -100,7 +223,7 @@ class S3Service:
                 )
                 return response['Body'].read()
             
-            file_content = await loop.run_in_executor(None, do_download)
+            file_content = await self._run(do_download, "download")
             
             LOGGER.info(f"File downloaded successfully from S3: {file_key}")
             return file_content
@@ -108,6 +231,49 @@ class S3Service:
         except ClientError as e:
             LOGGER.error(f"Error downloading file from S3: {e}")
             raise Exception(f"Failed to download file from S3: {str(e)}")
+
+    async def stream_file(self, file_key: str, byte_range: Optional[ByteRange] = None) -> StorageStream:
+        """
+        Open a file for streaming, optionally a single byte range of it
+
+        The body is read from S3 in ``STORAGE_STREAM_CHUNK_BYTES`` chunks as
+        the returned stream is iterated, so memory stays bounded however large
+        the object is.
+
+        Raises:
+            RangeNotSatisfiable: the range lies outside the object
+        """
+        params = {"Bucket": self.bucket_name, "Key": file_key}
+        if byte_range is not None:
+            params["Range"] = byte_range.header
+        try:
+            response = await self._run(lambda: self.s3_client.get_object(**params), "open")
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                raise RangeNotSatisfiable() from e
+            LOGGER.error(f"Error downloading file from S3: {e}")
+            raise Exception(f"Failed to download file from S3: {str(e)}")
+
+        body = response["Body"]
+        content_length = int(response.get("ContentLength") or 0)
+        content_range = response.get("ContentRange") if byte_range is not None else None
+        total_size = int(content_range.rsplit("/", 1)[-1]) if content_range else content_length
+
+        async def read(size: int) -> bytes:
+            return await self._run(lambda: body.read(size), "read")
+
+        async def close() -> None:
+            await self._run(body.close, "close")
+
+        return StorageStream(
+            read=read,
+            close=close,
+            content_length=content_length,
+            total_size=total_size,
+            content_range=content_range,
+            content_type=response.get("ContentType"),
+            chunk_size=STORAGE_STREAM_CHUNK_BYTES,
+        )
     
     async def delete_file(self, file_key: str) -> bool:
         """
@@ -120,15 +286,13 @@ class S3Service:
             True if successful
         """
         try:
-            loop = asyncio.get_event_loop()
-            
             def do_delete():
                 self.s3_client.delete_object(
                     Bucket=self.bucket_name,
                     Key=file_key
                 )
             
-            await loop.run_in_executor(None, do_delete)
+            await self._run(do_delete, "delete")
             
             LOGGER.info(f"File deleted successfully from S3: {file_key}")
             return True
@@ -137,31 +301,46 @@ class S3Service:
             LOGGER.warning(f"Error deleting file from S3: {e}")
             return False
     
-    async def generate_presigned_url(self, file_key: str, expiration: int = 3600) -> Optional[str]:
+    async def generate_presigned_url(
+        self,
+        file_key: str,
+        expiration: int = 3600,
+        *,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        disposition: Optional[str] = None,
+    ) -> Optional[str]:
         """
         Generate a presigned URL for temporary access to a file
         
         Args:
             file_key: S3 key of the file
             expiration: Time in seconds for the URL to remain valid (default: 1 hour)
+            filename, content_type, disposition: override the response headers
+                S3 sends, so the browser names and renders the file as the
+                API would have
             
         Returns:
             Presigned URL string or None if failed
         """
         try:
-            loop = asyncio.get_event_loop()
-            
+            params = {
+                'Bucket': self.bucket_name,
+                'Key': file_key
+            }
+            if content_type:
+                params['ResponseContentType'] = content_type
+            if disposition:
+                params['ResponseContentDisposition'] = content_disposition(disposition, filename)
+
             def generate_url():
                 return self.s3_client.generate_presigned_url(
                     'get_object',
-                    Params={
-                        'Bucket': self.bucket_name,
-                        'Key': file_key
-                    },
+                    Params=params,
                     ExpiresIn=expiration
                 )
             
-            url = await loop.run_in_executor(None, generate_url)
+            url = await self._run(generate_url, "presign")
             
             LOGGER.info(f"Presigned URL generated for: {file_key}")
             return url
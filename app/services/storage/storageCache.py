@@ -0,0 +1,288 @@
+"""Node-local, read-through disk cache for remote storage objects.
+
+``CachedStorageService`` wraps any ``StorageService``: reads are served from
+``STORAGE_CACHE_DIR`` when the object is cached and filled from the wrapped
+backend otherwise; uploads and deletes go to the backend and drop the cached
+copy. Cached files are written atomically and evicted least-recently-used
+once the cache exceeds ``STORAGE_CACHE_MAX_BYTES``. Streams served from the
+cache carry their ``path``, so routes answer them with ``FileResponse``.
+
+Invalidation is per node: an object overwritten through another replica stays
+cached here until evicted. Resume keys are unique per upload, so this only
+matters for objects re-uploaded under the same key (resource files).
+
+The LRU index is per process. Workers sharing ``STORAGE_CACHE_DIR`` each
+enforce the byte budget on their own view and may evict files another worker
+still indexes; a read that finds its file gone drops the entry and refills.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, TypeVar
+
+from app.config import STORAGE_CACHE_DIR, STORAGE_CACHE_MAX_BYTES, STORAGE_CACHE_MAX_OBJECT_BYTES
+from app.services.storage.localStorageService import file_stream, write_file_atomic
+from app.services.storage.storageStreaming import ByteRange, StorageStream, open_storage_stream
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def _run(fn: Callable[[], T], operation: str) -> T:
+    from app.services.storage.s3Service import run_storage_io
+
+    return await run_storage_io(fn, backend="cache", operation=operation)
+
+
+@dataclass
+class StorageCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes: int = 0
+    entries: int = 0
+
+
+class DiskLRUCache:
+    """Byte-budgeted LRU of files under ``root``, shared by every wrapped
+    service in the process. Entries are keyed by namespace (bucket) and key."""
+
+    def __init__(self, root: str | os.PathLike, *, max_bytes: int, max_object_bytes: int):
+        self.root = Path(root).resolve()
+        self.max_bytes = max_bytes
+        self.max_object_bytes = min(max_object_bytes, max_bytes)
+        self.stats = StorageCacheStats()
+        self._entries: OrderedDict[str, int] = OrderedDict()  # digest -> size, LRU first
+        self._fills: dict[str, tuple[asyncio.Lock, int]] = {}  # digest -> (lock, users)
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        # Keep what a previous process cached, oldest access first.
+        files = [path for path in self.root.glob("*/*/*") if path.is_file() and not path.name.startswith(".")]
+        for path in sorted(files, key=lambda path: path.stat().st_mtime):
+            self._entries[path.name] = path.stat().st_size
+        self.stats.bytes = sum(self._entries.values())
+        self.stats.entries = len(self._entries)
+        self._unlink(self._evict())
+
+    @staticmethod
+    def _digest(namespace: str, key: str) -> str:
+        return hashlib.sha256(f"{namespace}\n{key}".encode("utf-8")).hexdigest()
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def lookup(self, namespace: str, key: str, *, count: bool = True) -> Optional[tuple[Path, int]]:
+        """Cached file and size, counting a hit or a miss."""
+        digest = self._digest(namespace, key)
+        with self._lock:
+            size = self._entries.get(digest)
+            if size is None:
+                self.stats.misses += count
+                return None
+            self._entries.move_to_end(digest)
+            self.stats.hits += count
+        return self._path(digest), size
+
+    def fill_lock(self, namespace: str, key: str) -> asyncio.Lock:
+        """Lock serializing fills of one object, so concurrent misses fetch it
+        from the backend once. Every call must be paired with
+        ``release_fill_lock``; the lock is dropped when its last user releases."""
+        digest = self._digest(namespace, key)
+        lock, users = self._fills.get(digest, (None, 0))
+        lock = lock or asyncio.Lock()
+        self._fills[digest] = (lock, users + 1)
+        return lock
+
+    def release_fill_lock(self, namespace: str, key: str) -> None:
+        digest = self._digest(namespace, key)
+        lock, users = self._fills[digest]
+        if users > 1:
+            self._fills[digest] = (lock, users - 1)
+        else:
+            del self._fills[digest]
+
+    async def store(self, namespace: str, key: str, data: bytes) -> Optional[Path]:
+        if len(data) > self.max_object_bytes:
+            return None
+        digest = self._digest(namespace, key)
+        path = self._path(digest)
+        await _run(lambda: write_file_atomic(path, lambda handle: handle.write(data)), "write")
+        await self._register(digest, len(data))
+        return path
+
+    async def store_stream(self, namespace: str, key: str, stream: StorageStream) -> tuple[Path, int]:
+        """Cache ``stream`` chunk by chunk, without holding the object in
+        memory. Like ``write_file_atomic`` it writes a temp file next to the
+        entry and renames it into place once complete."""
+        digest = self._digest(namespace, key)
+        path = self._path(digest)
+
+        def open_temp() -> tuple[BinaryIO, str]:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".fill-")
+            return os.fdopen(fd, "wb"), temp_path
+
+        def commit() -> None:
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.close()
+            os.replace(temp_path, path)
+
+        def discard() -> None:
+            handle.close()
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+
+        handle, temp_path = await _run(open_temp, "write")
+        size = 0
+        try:
+            async with aclosing(stream.__aiter__()) as chunks:
+                async for chunk in chunks:
+                    await _run(lambda: handle.write(chunk), "write")
+                    size += len(chunk)
+            await _run(commit, "write")
+        except BaseException:
+            await _run(discard, "write")
+            raise
+        await self._register(digest, size)
+        return path, size
+
+    async def _register(self, digest: str, size: int) -> None:
+        with self._lock:
+            self.stats.bytes += size - self._entries.get(digest, 0)
+            self._entries[digest] = size
+            self._entries.move_to_end(digest)
+            self.stats.entries = len(self._entries)
+            evicted = self._evict()
+        await _run(lambda: self._unlink(evicted), "evict")
+
+    async def invalidate(self, namespace: str, key: str) -> None:
+        digest = self._digest(namespace, key)
+        with self._lock:
+            size = self._entries.pop(digest, None)
+            if size is None:
+                return
+            self.stats.bytes -= size
+            self.stats.entries = len(self._entries)
+        await _run(lambda: self._unlink([digest]), "delete")
+
+    def _evict(self) -> list[str]:
+        evicted: list[str] = []
+        while self.stats.bytes > self.max_bytes and self._entries:
+            digest, size = self._entries.popitem(last=False)
+            self.stats.bytes -= size
+            self.stats.evictions += 1
+            evicted.append(digest)
+        self.stats.entries = len(self._entries)
+        return evicted
+
+    def _unlink(self, digests: list[str]) -> None:
+        for digest in digests:
+            try:
+                self._path(digest).unlink()
+            except FileNotFoundError:
+                pass
+
+
+class CachedStorageService:
+    """``StorageService`` that reads through a ``DiskLRUCache``."""
+
+    def __init__(self, storage_service, cache: DiskLRUCache):
+        self.storage_service = storage_service
+        self.cache = cache
+        self.bucket_name = getattr(storage_service, "bucket_name", None) or "default"
+
+    def __getattr__(self, name: str):
+        # Anything not cache-relevant (presigned URLs, ...) goes to the backend.
+        return getattr(self.storage_service, name)
+
+    async def upload_file(self, file_bytes: bytes, file_name: str, *args, **kwargs) -> dict:
+        result = await self.storage_service.upload_file(file_bytes, file_name, *args, **kwargs)
+        await self.cache.invalidate(self.bucket_name, result["file_key"])
+        return result
+
+    async def upload_fileobj(self, fileobj: BinaryIO, file_name: str, *args, **kwargs) -> dict:
+        result = await self.storage_service.upload_fileobj(fileobj, file_name, *args, **kwargs)
+        await self.cache.invalidate(self.bucket_name, result["file_key"])
+        return result
+
+    async def delete_file(self, file_key: str) -> bool:
+        await self.cache.invalidate(self.bucket_name, file_key)
+        return await self.storage_service.delete_file(file_key)
+
+    async def download_file(self, file_key: str) -> bytes:
+        cached = self.cache.lookup(self.bucket_name, file_key)
+        if cached is not None:
+            try:
+                return await _run(cached[0].read_bytes, "read")
+            except FileNotFoundError:
+                await self.cache.invalidate(self.bucket_name, file_key)
+        data = await self.storage_service.download_file(file_key)
+        await self.cache.store(self.bucket_name, file_key, data)
+        return data
+
+    async def _cached_file(self, file_key: str, *, count: bool = True) -> Optional[tuple[Path, int]]:
+        cached = self.cache.lookup(self.bucket_name, file_key, count=count)
+        if cached is not None and not await _run(cached[0].is_file, "stat"):
+            # Evicted by another worker sharing the cache directory.
+            await self.cache.invalidate(self.bucket_name, file_key)
+            return None
+        return cached
+
+    async def stream_file(self, file_key: str, byte_range: Optional[ByteRange] = None) -> StorageStream:
+        cached = await self._cached_file(file_key)
+        if cached is not None:
+            return file_stream(cached[0], cached[1], byte_range, _run)
+
+        lock = self.cache.fill_lock(self.bucket_name, file_key)
+        try:
+            async with lock:
+                # Filled by a concurrent miss while we waited.
+                cached = await self._cached_file(file_key, count=False)
+                if cached is not None:
+                    return file_stream(cached[0], cached[1], byte_range, _run)
+                stream = await open_storage_stream(self.storage_service, file_key)
+                if stream.total_size > self.cache.max_object_bytes:
+                    # Too big to cache: pass the (ranged) request through.
+                    if byte_range is None:
+                        return stream
+                    await stream.aclose()
+                    return await open_storage_stream(self.storage_service, file_key, byte_range)
+                path, size = await self.cache.store_stream(self.bucket_name, file_key, stream)
+                return file_stream(path, size, byte_range, _run)
+        finally:
+            self.cache.release_fill_lock(self.bucket_name, file_key)
+
+
+_cache: Optional[DiskLRUCache] = None
+
+
+def get_storage_cache() -> Optional[DiskLRUCache]:
+    """Process-wide cache, or None when ``STORAGE_CACHE_DIR`` is unset."""
+    global _cache
+    if _cache is None and STORAGE_CACHE_DIR:
+        _cache = DiskLRUCache(
+            STORAGE_CACHE_DIR,
+            max_bytes=STORAGE_CACHE_MAX_BYTES,
+            max_object_bytes=STORAGE_CACHE_MAX_OBJECT_BYTES,
+        )
+    return _cache
+
+
+def reset_storage_cache() -> None:
+    global _cache
+    _cache = None
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
-from typing import Protocol
+from typing import TYPE_CHECKING, BinaryIO, Optional, Protocol
+
+if TYPE_CHECKING:
+    from app.services.storage.storageStreaming import ByteRange, StorageStream
 
 
 class StorageService(Protocol):
@@ -14,17 +17,43 @@ class StorageService(Protocol):
     ) -> dict:
         ...
 
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        file_name: str,
+        content_type: str = "application/octet-stream",
+        folder: str = "resumes",
+    ) -> dict:
+        """Streaming variant of ``upload_file``; optional for backends that
+        only ever receive small payloads."""
+        ...
+
     async def download_file(self, file_key: str) -> bytes:
         ...
 
+    async def stream_file(self, file_key: str, byte_range: Optional["ByteRange"] = None) -> "StorageStream":
+        """Optional; callers fall back to ``download_file`` when absent."""
+        ...
+
     async def delete_file(self, file_key: str) -> bool:
         ...
 
 
 def get_storage_service(*, bucket_name: str | None = None) -> StorageService:
+    """Storage for one bucket on the backend picked by ``STORAGE_BACKEND``."""
+    from app.config import STORAGE_BACKEND
+
+    if STORAGE_BACKEND == "local":
+        from app.services.storage.localStorageService import LocalStorageService
+
+        return LocalStorageService(bucket_name=bucket_name)
+
     from app.services.storage.s3Service import S3Service
+    from app.services.storage.storageCache import CachedStorageService, get_storage_cache
 
-    return S3Service(bucket_name=bucket_name)
+    service = S3Service(bucket_name=bucket_name)
+    cache = get_storage_cache()
+    return CachedStorageService(service, cache) if cache is not None else service
 
 
 def get_resume_storage_location_id() -> str | None:
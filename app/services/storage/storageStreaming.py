@@ -0,0 +1,185 @@
+"""Bounded-memory streaming of stored objects, with HTTP Range support.
+
+``StorageStream`` is what ``stream_file`` returns: an async iterator of chunks
+plus the length/range metadata needed for response headers. Storage backends
+that can only hand back whole bytes are adapted with
+:meth:`StorageStream.from_bytes`, so callers never branch on the backend.
+Streams backed by a local file carry its ``path`` and are answered with
+``FileResponse``, which lets the server use ``sendfile``.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+_RANGE_RE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested byte range lies outside the object."""
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    start: Optional[int]
+    end: Optional[int]  # inclusive; None means "to the end"
+
+    @property
+    def header(self) -> str:
+        if self.start is None:
+            return f"bytes=-{self.end}"
+        return f"bytes={self.start}-{'' if self.end is None else self.end}"
+
+    def resolve(self, size: int) -> tuple[int, int]:
+        """Absolute inclusive (start, end) within an object of ``size`` bytes."""
+        if self.start is None:
+            start, end = max(0, size - (self.end or 0)), size - 1
+        else:
+            start, end = self.start, size - 1 if self.end is None else min(self.end, size - 1)
+        if size == 0 or start >= size or start > end:
+            raise RangeNotSatisfiable()
+        return start, end
+
+
+def parse_range_header(value: Optional[str]) -> Optional[ByteRange]:
+    """Parse a single-range ``Range`` header. Anything else (absent,
+    multi-range, other units) returns None, which means serve the whole
+    object, as RFC 9110 allows."""
+    match = _RANGE_RE.match(value or "")
+    if not match:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        return ByteRange(start=None, end=int(end)) if int(end) > 0 else None
+    if end and int(end) < int(start):
+        return None
+    return ByteRange(start=int(start), end=int(end) if end else None)
+
+
+class StorageStream:
+    def __init__(
+        self,
+        *,
+        read: Callable[[int], Awaitable[bytes]],
+        close: Callable[[], Awaitable[None]],
+        content_length: int,
+        total_size: int,
+        content_range: Optional[str] = None,
+        content_type: Optional[str] = None,
+        chunk_size: int = 256 * 1024,
+        path: Optional[str] = None,
+    ):
+        self._read = read
+        self._close = close
+        self.content_length = content_length
+        self.total_size = total_size
+        self.content_range = content_range
+        self.content_type = content_type
+        self.chunk_size = chunk_size
+        self.path = path
+
+    @property
+    def partial(self) -> bool:
+        return self.content_range is not None
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        byte_range: Optional[ByteRange] = None,
+        *,
+        content_type: Optional[str] = None,
+    ) -> "StorageStream":
+        content_range = None
+        if byte_range is not None:
+            start, end = byte_range.resolve(len(data))
+            content_range = f"bytes {start}-{end}/{len(data)}"
+            body = memoryview(data)[start : end + 1]
+        else:
+            body = memoryview(data)
+        position = 0
+
+        async def read(size: int) -> bytes:
+            nonlocal position
+            chunk = bytes(body[position : position + size])
+            position += len(chunk)
+            return chunk
+
+        async def close() -> None:
+            return None
+
+        return cls(
+            read=read,
+            close=close,
+            content_length=len(body),
+            total_size=len(data),
+            content_range=content_range,
+            content_type=content_type,
+        )
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            while chunk := await self._read(self.chunk_size):
+                yield chunk
+        finally:
+            await self._close()
+
+    async def aclose(self) -> None:
+        await self._close()
+
+
+async def open_storage_stream(storage_service, file_key: str, byte_range: Optional[ByteRange] = None) -> StorageStream:
+    """``storage_service.stream_file`` when the backend has it, otherwise the
+    whole object adapted into a stream."""
+    stream_file = getattr(storage_service, "stream_file", None)
+    if stream_file is not None:
+        return await stream_file(file_key, byte_range)
+    return StorageStream.from_bytes(await storage_service.download_file(file_key), byte_range)
+
+
+def content_disposition(disposition: str, filename: Optional[str]) -> str:
+    if not filename:
+        return disposition
+    safe_name = filename.replace('"', "").replace("\r", "").replace("\n", "")
+    return f'{disposition}; filename="{safe_name}"'
+
+
+def streaming_file_response(
+    stream: StorageStream,
+    *,
+    media_type: str,
+    filename: str,
+    disposition: str = "inline",
+) -> Response:
+    if stream.path is not None:
+        # FileResponse re-reads the request's Range header itself and streams
+        # straight from the file (zero-copy where the server supports it).
+        return FileResponse(
+            stream.path,
+            media_type=media_type,
+            filename=filename,
+            content_disposition_type=disposition,
+        )
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(stream.content_length),
+        "Content-Disposition": content_disposition(disposition, filename),
+    }
+    if stream.content_range:
+        headers["Content-Range"] = stream.content_range
+    return StreamingResponse(
+        stream.__aiter__(),
+        status_code=206 if stream.partial else 200,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def range_not_satisfiable() -> HTTPException:
+    return HTTPException(status_code=416, detail="Requested range not satisfiable")
@@ -0,0 +1,71 @@
+"""Streaming intake for uploaded files.
+
+``spool_upload`` reads an ``UploadFile`` in fixed-size chunks, enforcing the
+size cap as it goes and hashing the content on the fly. Small files stay in
+memory; anything past ``UPLOAD_SPOOL_MEMORY_BYTES`` rolls over to a temp file,
+so the memory held per concurrent upload is bounded by a constant rather than
+the file size.
+"""
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+from app.config import UPLOAD_CHUNK_BYTES, UPLOAD_SPOOL_MEMORY_BYTES
+
+
+class UploadTooLarge(Exception):
+    """The upload exceeded the caller's byte limit."""
+
+
+@dataclass
+class SpooledUpload:
+    file: BinaryIO
+    size: int
+    sha256: str
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpooledUpload":
+        spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MEMORY_BYTES)
+        spool.write(data)
+        spool.seek(0)
+        return cls(file=spool, size=len(data), sha256=hashlib.sha256(data).hexdigest())
+
+    def rewind(self) -> BinaryIO:
+        self.file.seek(0)
+        return self.file
+
+    def read_bytes(self) -> bytes:
+        return self.rewind().read()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+async def spool_upload(
+    upload: UploadFile,
+    *,
+    max_bytes: int,
+    chunk_size: int = UPLOAD_CHUNK_BYTES,
+) -> SpooledUpload:
+    """Copy ``upload`` into a spool, raising :class:`UploadTooLarge` as soon as
+    more than ``max_bytes`` have been read."""
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MEMORY_BYTES)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while chunk := await upload.read(chunk_size):
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge()
+            digest.update(chunk)
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return SpooledUpload(file=spool, size=size, sha256=digest.hexdigest())
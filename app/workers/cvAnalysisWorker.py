@@ -0,0 +1,174 @@
+"""CV analysis worker: drains the ``job_analysis`` queue.
+
+Run dedicated workers with::
+
+    python -m app.workers.cvAnalysisWorker
+
+and set ``CV_ANALYSIS_EMBEDDED_WORKERS=0`` on the API so LLM work leaves the
+request-serving processes entirely. Each worker keeps up to
+``CV_ANALYSIS_WORKER_CONCURRENCY`` analyses in flight; scale throughput by
+running more workers. A job's lease is renewed every third of
+``CV_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS`` while its analysis runs.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import (
+    CV_ANALYSIS_MAX_ATTEMPTS,
+    CV_ANALYSIS_POLL_INTERVAL_MS,
+    CV_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS,
+    CV_ANALYSIS_WORKER_CONCURRENCY,
+)
+from app.services.ai.cvAnalysisQueue import ClaimedAnalysis, CVAnalysisQueue
+from app.services.ai.cvAnalysisService import CVAnalysisService
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CVAnalysisWorker:
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        *,
+        concurrency: int = CV_ANALYSIS_WORKER_CONCURRENCY,
+        poll_interval_seconds: float = CV_ANALYSIS_POLL_INTERVAL_MS / 1000,
+        visibility_timeout_seconds: int = CV_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS,
+        max_attempts: int = CV_ANALYSIS_MAX_ATTEMPTS,
+        heartbeat_interval_seconds: Optional[float] = None,
+    ):
+        if session_factory is None:
+            from app.db import session_factory as profile_session_factory
+
+            session_factory = profile_session_factory("background")
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self.max_attempts = max_attempts
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds or visibility_timeout_seconds / 3
+        self._stopping = asyncio.Event()
+
+    def _queue(self, session: AsyncSession) -> CVAnalysisQueue:
+        return CVAnalysisQueue(
+            session,
+            visibility_timeout_seconds=self.visibility_timeout_seconds,
+            max_attempts=self.max_attempts,
+        )
+
+    async def _claim(self, limit: int) -> list[ClaimedAnalysis]:
+        async with self.session_factory() as session:
+            return await self._queue(session).claim(limit=limit)
+
+    async def _heartbeat(self, claimed: ClaimedAnalysis) -> None:
+        # Renew the lease until the job leaves this attempt; cancelled by
+        # _process once the analysis returns.
+        while True:
+            await asyncio.sleep(self.heartbeat_interval_seconds)
+            try:
+                async with self.session_factory() as session:
+                    if not await self._queue(session).extend_lease(claimed):
+                        return
+            except Exception:  # noqa: BLE001
+                LOGGER.warning("CV analysis worker could not renew the lease of %s", claimed.job_id, exc_info=True)
+
+    async def _process(self, claimed: ClaimedAnalysis) -> None:
+        async with self.session_factory() as session:
+            heartbeat = asyncio.create_task(self._heartbeat(claimed))
+            try:
+                try:
+                    await CVAnalysisService(session).process_job(
+                        job_id=claimed.job_id,
+                        user_id=claimed.user_id,
+                        resume_id=claimed.resume_id,
+                        reservation=claimed.reservation(),
+                        raise_retryable=True,
+                    )
+                finally:
+                    heartbeat.cancel()
+            except Exception as exc:  # noqa: BLE001
+                await session.rollback()
+                await self._queue(session).fail(claimed, exc)
+                return
+            await self._queue(session).complete(claimed)
+
+    async def _process_safely(self, claimed: ClaimedAnalysis) -> None:
+        try:
+            await self._process(claimed)
+        except Exception:  # noqa: BLE001
+            # The lease will lapse and another attempt will pick the job up.
+            LOGGER.exception("CV analysis worker could not record the outcome of %s", claimed.job_id)
+
+    async def run_once(self) -> int:
+        """Claim one batch of due jobs, process it, and return its size."""
+        claimed = await self._claim(self.concurrency)
+        await asyncio.gather(*(self._process_safely(item) for item in claimed))
+        return len(claimed)
+
+    async def run(self) -> None:
+        """Process jobs until :meth:`stop` is called, refilling free slots as
+        analyses finish instead of waiting for a whole batch."""
+        in_flight: set[asyncio.Task] = set()
+        LOGGER.info("CV analysis worker started (concurrency=%s)", self.concurrency)
+        try:
+            while not self._stopping.is_set():
+                free = self.concurrency - len(in_flight)
+                claimed: list[ClaimedAnalysis] = []
+                if free > 0:
+                    try:
+                        claimed = await self._claim(free)
+                    except Exception:  # noqa: BLE001
+                        LOGGER.exception("CV analysis worker could not claim jobs")
+                for item in claimed:
+                    in_flight.add(asyncio.create_task(self._process_safely(item)))
+
+                # Wake when a slot frees up, on stop, or after the poll interval.
+                stop_waiter = asyncio.ensure_future(self._stopping.wait())
+                try:
+                    done, _ = await asyncio.wait(
+                        {*in_flight, stop_waiter},
+                        timeout=self.poll_interval_seconds,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    stop_waiter.cancel()
+                in_flight -= done
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            # Cancelled mid-analysis: the leases lapse and the jobs are retried.
+            for task in in_flight:
+                task.cancel()
+            LOGGER.info("CV analysis worker stopped")
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+
+async def _main() -> None:
+    worker = CVAnalysisWorker()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        from app.db import dispose_engines
+
+        await dispose_engines()
+
+
+def main() -> None:
+    from app.logging import setup_logging
+
+    setup_logging()
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
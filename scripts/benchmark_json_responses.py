@@ -0,0 +1,172 @@
+"""
+Measure CPU per request of the largest JSON list endpoints: the job board,
+capstone gap analysis and the community feed.
+
+Requests go through the full ASGI app in process (middleware, dependency
+injection, response validation and serialization) against a seeded SQLite
+database, with authentication replaced by a fixed user. The database work
+is part of every figure, so compare runs on the same machine and seed size.
+
+The community feed is measured on ``/posts``: on SQLite the enriched feed's
+join from ``community_posts.user_id`` to ``users.id`` compares two different
+UUID storage formats and returns no rows.
+
+Usage:
+    python scripts/benchmark_json_responses.py [--requests 100] [--rounds 5] [--postings 100] [--posts 200]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("DB_DISABLE_POOL", "1")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.app import app  # noqa: E402
+from app.db import Base, get_analytics_session, get_background_session, get_read_session, get_session  # noqa: E402
+from app.models.communityModel import CommunityMemberModel, CommunityModel  # noqa: E402
+from app.models.communityPostModel import CommunityPostLikeModel, CommunityPostModel  # noqa: E402
+from app.models.companyModel import Company  # noqa: E402
+from app.models.jobPostingModel import JobPosting  # noqa: E402
+from app.models.resumeModel import ResumeModel  # noqa: E402
+from app.models.userModel import User  # noqa: E402
+from app.services.accounts.userService import current_active_user  # noqa: E402
+from app.services.analytics.capstoneAnalyticsSeedService import seed_capstone_analytics_minimum  # noqa: E402
+
+PARAGRAPH = "Build and maintain data pipelines, dashboards and reports for product teams. " * 6
+
+
+def register_sqlite_functions(dbapi_connection, connection_record):
+    # PostgreSQL functions used by the models' CHECK constraints.
+    dbapi_connection.create_function("btrim", 1, lambda value: (value or "").strip())
+    dbapi_connection.create_function("char_length", 1, lambda value: len(value or ""))
+
+
+async def seed(session: AsyncSession, args) -> dict[str, str]:
+    user = User(
+        id=uuid.uuid4(),
+        email="bench@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_verified=True,
+        first_name="Bench",
+        last_name="User",
+    )
+    company = Company(id=uuid.uuid4(), company_name="Bench Corp", location="Toronto, ON", website="https://bench.example")
+    session.add_all([user, company])
+    now = datetime.utcnow()
+    for index in range(args.postings):
+        session.add(
+            JobPosting(
+                company_id=company.id,
+                title=f"Data Analyst {index}",
+                description=PARAGRAPH,
+                requirements=PARAGRAPH,
+                responsibilities=PARAGRAPH,
+                benefits=PARAGRAPH,
+                location="Toronto, ON",
+                job_type="full_time",
+                is_active=True,
+                created_at=now - timedelta(minutes=index),
+                updated_at=now,
+            )
+        )
+    community = CommunityModel(name="Bench community", created_by=user.id, member_count=1)
+    session.add(community)
+    await session.flush()
+    session.add(CommunityMemberModel(community_id=community.id, user_id=user.id))
+    for index in range(args.posts):
+        post = CommunityPostModel(
+            community_id=community.id,
+            user_id=user.id,
+            title=f"Post {index}",
+            content=PARAGRAPH,
+            created_at=now - timedelta(minutes=index),
+        )
+        session.add(post)
+        if index % 3 == 0:
+            await session.flush()
+            session.add(CommunityPostLikeModel(post_id=post.id, user_id=user.id))
+    resume = ResumeModel(
+        view_url="https://storage.example/resume.pdf",
+        user_id=user.id,
+        storage_file_id="resumes/bench.pdf",
+        original_filename="resume.pdf",
+        folder_id="resumes",
+        ai_summary="Experienced with Python, SQL, Excel, Tableau and statistics.",
+    )
+    session.add(resume)
+    await session.commit()
+    await seed_capstone_analytics_minimum(session)
+    return {"user_id": str(user.id), "community_id": str(community.id), "resume_id": str(resume.id)}
+
+
+async def measure(client: AsyncClient, label: str, url: str, args) -> None:
+    response = await client.get(url)
+    response.raise_for_status()
+    size = len(response.content)
+    cpu, wall = [], []
+    for _ in range(args.rounds):
+        started_wall, started_cpu = time.perf_counter(), time.process_time()
+        for _ in range(args.requests):
+            (await client.get(url)).raise_for_status()
+        cpu.append((time.process_time() - started_cpu) / args.requests)
+        wall.append((time.perf_counter() - started_wall) / args.requests)
+    # The best round is the least disturbed by the rest of the machine.
+    print(
+        f"{label:<16} cpu {min(cpu) * 1000:7.2f} ms/req (median {statistics.median(cpu) * 1000:6.2f})   "
+        f"wall {min(wall) * 1000:7.2f} ms/req   body {size / 1024:7.1f} KiB"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100, help="Requests per round.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--postings", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{directory}/bench.db")
+        event.listen(engine.sync_engine, "connect", register_sqlite_functions)
+        sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with sessions() as session:
+            ids = await seed(session, args)
+            user = await session.get(User, uuid.UUID(ids["user_id"]))
+
+        async def override_session():
+            async with sessions() as session:
+                yield session
+
+        for dependency in (get_session, get_read_session, get_analytics_session, get_background_session):
+            app.dependency_overrides[dependency] = override_session
+        app.dependency_overrides[current_active_user] = lambda: user
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            await measure(client, "jobs board", f"/api/v1/jobs/board?limit={min(args.postings, 100)}", args)
+            await measure(
+                client,
+                "gap analysis",
+                f"/api/v1/capstone/gap-analysis?resume_id={ids['resume_id']}&target_role=Data%20Analyst",
+                args,
+            )
+            await measure(client, "community feed", f"/api/v1/communities/{ids['community_id']}/posts", args)
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
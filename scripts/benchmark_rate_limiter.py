@@ -0,0 +1,122 @@
+"""
+Load test the request rate limiter: strict shared checks against hybrid
+(worker-local leases), over a counter store with simulated Redis latency.
+
+Several limiter instances (one per simulated worker) share one store. Normal
+clients stay under their limit; one abusive client sends twice its limit, to
+show how far hybrid mode drifts from the configured limit.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py [--requests 20000] [--workers 4] [--clients 50] [--rtt-ms 0.5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from starlette.requests import Request  # noqa: E402
+
+from app.middleware.rate_limit import RateLimitRule, RequestRateLimiter  # noqa: E402
+from app.services.ratelimit.counterStore import InMemoryCounterStore  # noqa: E402
+from app.services.ratelimit.quotaLeaser import QuotaLeaser  # noqa: E402
+
+
+class SimulatedRedis(InMemoryCounterStore):
+    """In-memory store that sleeps one round trip per call and counts calls."""
+
+    def __init__(self, rtt_seconds: float):
+        super().__init__()
+        self.rtt_seconds = rtt_seconds
+        self.calls = 0
+
+    async def _round_trip(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.rtt_seconds)
+
+    async def check_limits(self, checks):
+        await self._round_trip()
+        return await super().check_limits(checks)
+
+    async def lease_tokens(self, key, **kwargs):
+        await self._round_trip()
+        return await super().lease_tokens(key, **kwargs)
+
+
+def make_request(ip: str) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/api/v1/admin/users", "headers": [], "client": (ip, 1)})
+
+
+async def run(mode: str, args) -> None:
+    store = SimulatedRedis(args.rtt_ms / 1000)
+    rule = RateLimitRule(
+        key="admin_api",
+        max_requests=args.limit,
+        window_seconds=60,
+        methods=("GET",),
+        path_prefixes=("/api/v1/admin",),
+        algorithm="gcra",
+    )
+    workers = [
+        RequestRateLimiter(
+            [rule],
+            store_factory=lambda: store,
+            leaser=QuotaLeaser(lambda: store, lease_size=args.lease_size, lease_ttl_seconds=2)
+            if mode == "hybrid"
+            else None,
+        )
+        for _ in range(args.workers)
+    ]
+
+    normal_ips = [f"10.0.0.{i}" for i in range(args.clients)]
+    # Each normal client sends a third of its limit; the abuser twice its limit.
+    per_client = min(args.requests // args.clients, args.limit // 3)
+    schedule = [ip for _ in range(per_client) for ip in normal_ips] + ["203.0.113.9"] * (2 * args.limit)
+    latencies: list[float] = []
+    admitted = {"normal": 0, "abuse": 0}
+
+    async def one(index: int, ip: str) -> None:
+        started = time.perf_counter()
+        allowed, _ = await workers[index % len(workers)].check(make_request(ip))
+        latencies.append(time.perf_counter() - started)
+        admitted["abuse" if ip.startswith("203.") else "normal"] += allowed
+
+    started = time.perf_counter()
+    for offset in range(0, len(schedule), args.concurrency):
+        batch = schedule[offset : offset + args.concurrency]
+        await asyncio.gather(*(one(offset + i, ip) for i, ip in enumerate(batch)))
+    elapsed = time.perf_counter() - started
+    for worker in workers:
+        if worker._leaser is not None:
+            await worker._leaser.drain()
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{mode:<7} {len(schedule) / elapsed:9.0f} req/s   store calls/req {store.calls / len(schedule):5.3f}   "
+        f"p50 {statistics.median(latencies) * 1000:6.3f} ms   p99 {p99 * 1000:6.3f} ms   "
+        f"normal admitted {admitted['normal']}/{per_client * len(normal_ips)}   "
+        f"abuser admitted {admitted['abuse']} (limit {args.limit})"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--limit", type=int, default=1200)
+    parser.add_argument("--lease-size", type=int, default=10)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    await run("strict", args)
+    await run("hybrid", args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark resume text extraction: the previous temp-file + thread-pool path
+against the in-memory, process-pool engine.
+
+Usage:
+    python scripts/benchmark_resume_extraction.py [--documents 200] [--concurrency 16] [--pages 3]
+"""
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fitz  # noqa: E402
+
+from app.core.resume_analyzer.resume_text_extractor import (  # noqa: E402
+    extract_resume_text_from_bytes,
+    shutdown_resume_text_extractors,
+)
+
+_LINE = "Senior backend engineer: Python, FastAPI, PostgreSQL, Redis, AWS, Kubernetes and CI/CD pipelines."
+
+
+def build_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        for row in range(40):
+            page.insert_text((36, 36 + row * 18), _LINE, fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def build_docx(paragraphs: int) -> bytes:
+    body = "".join(f"<w:p><w:r><w:t>{_LINE}</w:t></w:r></w:p>" for _ in range(paragraphs))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>",
+        )
+    return buffer.getvalue()
+
+
+# --- previous implementation, kept verbatim in spirit for comparison --------
+_legacy_pdf_pool = ThreadPoolExecutor(max_workers=5)
+_legacy_docx_pool = ThreadPoolExecutor(max_workers=3)
+
+
+def _legacy_pdf(path: str) -> str:
+    text = ""
+    with fitz.open(path) as doc:
+        for page in doc:
+            text += page.get_text()
+    return text
+
+
+def _legacy_docx(path: str) -> str:
+    from xml.etree import ElementTree as ET
+
+    with zipfile.ZipFile(path) as zf:
+        root = ET.fromstring(zf.read("word/document.xml"))
+    ns = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    return "\n".join(
+        "".join(node.text for node in p.iter(f"{ns}t") if node.text) for p in root.iter(f"{ns}p")
+    ).strip()
+
+
+async def legacy_extract(file_bytes: bytes, *, filename: str, content_type: str) -> str:
+    suffix = os.path.splitext(filename)[-1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(file_bytes)
+        path = tmp.name
+    try:
+        loop = asyncio.get_running_loop()
+        if suffix == ".pdf":
+            return await loop.run_in_executor(_legacy_pdf_pool, _legacy_pdf, path)
+        return await loop.run_in_executor(_legacy_docx_pool, _legacy_docx, path)
+    finally:
+        os.unlink(path)
+
+
+async def run(extract, documents: list[tuple[bytes, str]], concurrency: int) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(data: bytes, filename: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await extract(data, filename=filename, content_type="")
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(data, filename) for data, filename in documents))
+    return time.perf_counter() - started, latencies
+
+
+def report(name: str, elapsed: float, latencies: list[float]) -> None:
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<10} {len(latencies) / elapsed:8.1f} docs/s   "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms   p99 {p99 * 1000:7.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--pages", type=int, default=3)
+    args = parser.parse_args()
+
+    pdf, docx = build_pdf(args.pages), build_docx(args.pages * 40)
+    documents = [(pdf, "resume.pdf") if i % 2 == 0 else (docx, "resume.docx") for i in range(args.documents)]
+
+    # Warm both paths (process spawn, imports) before timing.
+    await run(extract_resume_text_from_bytes, documents[:8], args.concurrency)
+    await run(legacy_extract, documents[:8], args.concurrency)
+
+    report("legacy", *await run(legacy_extract, documents, args.concurrency))
+    report("engine", *await run(extract_resume_text_from_bytes, documents, args.concurrency))
+    shutdown_resume_text_extractors()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""
+EXPLAIN the service layer's hot statements against a seeded PostgreSQL and
+report sequential scans, with a suggested index for each.
+
+By default each statement runs with ``enable_seqscan = off``: a sequential
+scan that remains means no index can answer it, whatever the table sizes of
+the seeded database. The expected index of every statement must also appear
+in its plan. Exits 1 when either check fails, so it can gate a deploy.
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://... python scripts/explain_hot_queries.py [--only community_feed] [--no-analyze] [--allow-seqscan]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.services.diagnostics.hotQueries import HOT_QUERIES  # noqa: E402
+from app.services.diagnostics.queryPlanAdvisor import analyze_plan, explain, format_report  # noqa: E402
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", ""))
+    parser.add_argument("--only", action="append", default=[], help="Hot query name; repeatable.")
+    parser.add_argument("--no-analyze", action="store_true", help="Plan only; do not execute the statements.")
+    parser.add_argument("--allow-seqscan", action="store_true", help="Let the planner pick sequential scans.")
+    args = parser.parse_args()
+
+    if not args.database_url.startswith("postgresql"):
+        parser.error("a PostgreSQL DATABASE_URL is required")
+
+    queries = [hq for hq in HOT_QUERIES if not args.only or hq.name in args.only]
+    engine = create_async_engine(args.database_url)
+    failures = 0
+    try:
+        async with engine.connect() as connection:
+            for hq in queries:
+                document = await explain(
+                    connection, hq.build(), analyze=not args.no_analyze, allow_seqscan=args.allow_seqscan
+                )
+                report = analyze_plan(hq.name, document)
+                print(format_report(report))
+                problems = []
+                if any(finding.relation == hq.table for finding in report.seq_scans):
+                    problems.append(f"sequential scan on {hq.table}")
+                if hq.expected_index not in report.index_names:
+                    problems.append(f"{hq.expected_index} unused")
+                if problems:
+                    failures += 1
+                    print(f"  FAIL ({hq.source}): {'; '.join(problems)}")
+    finally:
+        await engine.dispose()
+
+    print(f"\n{len(queries) - failures}/{len(queries)} hot queries answered by their index")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,6 +1,8 @@
 """
 Pytest fixtures and configuration for tests
 """
+pytest_plugins = ["tests.query_budget"]
+
 import asyncio
 import os
 import uuid
@@ -19,11 +21,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
 from app.app import app, rate_limiter
-from app.db import Base, get_session
+from app.db import Base, get_analytics_session, get_background_session, get_read_session, get_session
 from app.models.userModel import User
 from app.models.companyModel import Company
 from app.models.companyRecruiterModel import CompanyRecruiter
 from app.services.accounts.userService import UserManager, get_user_manager
+from app.services.jobs.jobSearchCache import reset_job_search_cache
 from app.services.ratelimit.counterStore import reset_counter_store
 from fastapi_users.password import PasswordHelper
 
@@ -84,11 +87,13 @@ async def setup_db() -> AsyncGenerator[None, None]:
     from app.models.interviewAvailabilityModel import InterviewAvailabilityModel
     from app.models.jobPostingModel import JobPosting
     from app.models.resumeModel import ResumeModel
+    from app.models.resumeTextModel import ResumeTextModel
     from app.models.resourceModel import ResourceLessonModel, ResourceLessonProgressModel, ResourceModel, ResourceModuleModel
     from app.models.questionnaireModel import UserQuestionnaire
     from app.models.postModel import PostModel
     from app.models.jobAnalysisModel import JobAnalysisModel
     from app.models.aiUsageModel import AIQuotaGrantModel, AIUsageEventModel
+    from app.models.llmResultCacheModel import LLMResultCacheModel
     from app.models.resumeEmbeddingsModel import ResumeEmbedding
     from app.models.skillModel import (
         CourseModel,
@@ -127,8 +132,12 @@ async def client(setup_db) -> AsyncGenerator[AsyncClient, None]:
             yield session
     
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
+    app.dependency_overrides[get_analytics_session] = override_get_session
+    app.dependency_overrides[get_background_session] = override_get_session
     rate_limiter._events.clear()
     await reset_counter_store()
+    reset_job_search_cache()
 
     # Create test client
     async with AsyncClient(
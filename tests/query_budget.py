@@ -0,0 +1,130 @@
+"""Pytest plugin: SQL query budgets per endpoint.
+
+Every request a test makes through the app is checked against
+``QUERY_BUDGETS`` (keyed by ``"METHOD /route/template"``), so an endpoint that
+starts issuing more queries — typically a new N+1 — fails the suite. A test can
+set its own ceiling with ``@pytest.mark.query_budget(n)``.
+
+``QUERY_BUDGET_REPORT=path.json`` writes the most queries seen per endpoint
+over the run, to review when a budget needs to move.
+"""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from app.middleware.sql_instrumentation import request_observers
+
+# Most SQL statements one request may issue with the suite's fixtures.
+QUERY_BUDGETS: dict[str, int] = {
+    "DELETE /api/v1/applications/{application_id}": 14,
+    "DELETE /api/v1/companies/me/job-postings/{job_posting_id}": 5,
+    "DELETE /api/v1/companies/me/recruiters/{recruiter_id}": 3,
+    "DELETE /api/v1/friends/{friend_id}": 6,
+    "DELETE /api/v1/profile/cv/{resume_id}": 2,
+    "GET /api/v1/applications": 4,
+    "GET /api/v1/applications/eligible-resumes": 2,
+    "GET /api/v1/capstone/analytics/roles": 4,
+    "GET /api/v1/capstone/analytics/status": 10,
+    "GET /api/v1/capstone/catalog/quality": 6,
+    "GET /api/v1/capstone/gap-analysis": 25,
+    "GET /api/v1/capstone/learning-route/runs": 2,
+    "GET /api/v1/capstone/resumes/{resume_id}/skills": 4,
+    "GET /api/v1/communities": 2,
+    "GET /api/v1/communities/tags": 2,
+    "GET /api/v1/communities/{community_id}/posts": 4,
+    "GET /api/v1/companies/me": 2,
+    "GET /api/v1/companies/me/applicants": 7,
+    "GET /api/v1/companies/me/applications/{application_id}/resume/download": 7,
+    "GET /api/v1/companies/me/applications/{application_id}/resume/preview": 10,
+    "GET /api/v1/companies/me/recruiters": 2,
+    "GET /api/v1/company_dashboard": 6,
+    "GET /api/v1/conversations": 6,
+    "GET /api/v1/conversations/{conversation_id}/messages": 4,
+    "GET /api/v1/friends": 3,
+    "GET /api/v1/friends/requests/incoming": 3,
+    "GET /api/v1/friends/requests/outgoing": 3,
+    "GET /api/v1/friends/status": 3,
+    "GET /api/v1/jobs/board": 3,
+    "GET /api/v1/jobs/board/{job_posting_id}": 3,
+    "GET /api/v1/jobs/keywords": 3,
+    "GET /api/v1/posts": 2,
+    "GET /api/v1/profile/cv": 2,
+    "GET /api/v1/questionnaire/profile": 2,
+    "GET /api/v1/resources/file": 1,
+    "GET /api/v1/students_dashboard": 10,
+    "GET /api/v1/users/me": 1,
+    "GET /career-lab": 1,
+    "PATCH /api/v1/applications/{application_id}": 12,
+    "PATCH /api/v1/capstone/resumes/{resume_id}/skills/{resume_skill_id}": 6,
+    "PATCH /api/v1/companies/me/applicants/{application_id}": 15,
+    "PATCH /api/v1/companies/me/recruiters/{recruiter_id}": 4,
+    "PATCH /api/v1/profile": 4,
+    "POST /api/v1/admin/companies/{company_id}/job-postings/import": 7,
+    "POST /api/v1/applications": 12,
+    "POST /api/v1/applications/{application_id}/interview-selection": 14,
+    "POST /api/v1/auth/company/login": 1,
+    "POST /api/v1/auth/company/register": 4,
+    "POST /api/v1/auth/register": 3,
+    "POST /api/v1/capstone/analytics/seed": 122,
+    "POST /api/v1/capstone/job-postings/skills/sync-open": 8,
+    "POST /api/v1/capstone/learning-route/evaluate-baselines": 25,
+    "POST /api/v1/capstone/learning-route/optimize": 27,
+    "POST /api/v1/capstone/resumes/{resume_id}/skills/manual": 8,
+    "POST /api/v1/capstone/resumes/{resume_id}/skills/sync": 17,
+    "POST /api/v1/communities/{community_id}/posts": 5,
+    "POST /api/v1/companies/me/applicants/{application_id}/interview-availabilities": 14,
+    "POST /api/v1/companies/me/job-postings": 5,
+    "POST /api/v1/companies/me/job-postings/import": 9,
+    "POST /api/v1/companies/me/recruiters": 4,
+    "POST /api/v1/conversations/direct": 12,
+    "POST /api/v1/conversations/{conversation_id}/messages": 9,
+    "POST /api/v1/conversations/{conversation_id}/read": 4,
+    "POST /api/v1/friends/requests": 6,
+    "POST /api/v1/friends/requests/{request_id}/accept": 6,
+    "POST /api/v1/friends/requests/{request_id}/cancel": 5,
+    "POST /api/v1/friends/requests/{request_id}/reject": 5,
+    "POST /api/v1/jobs/keywords/analyze": 10,
+    "POST /api/v1/jobs/search": 3,
+    "POST /api/v1/profile/cv/upload": 5,
+    "POST /api/v1/upload_post": 3,
+    "POST /auth/jwt/login": 1,
+    "POST /auth/jwt/logout": 1,
+}
+
+_observed: dict[str, int] = {}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries): fail if any request in the test issues more SQL statements",
+    )
+
+
+def pytest_unconfigure(config):
+    path = os.getenv("QUERY_BUDGET_REPORT")
+    if path and _observed:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(dict(sorted(_observed.items())), handle, indent=2)
+
+
+@pytest.fixture(autouse=True)
+def _enforce_query_budgets(request):
+    marker = request.node.get_closest_marker("query_budget")
+    violations: list[str] = []
+
+    def observe(label, stats):
+        _observed[label] = max(_observed.get(label, 0), stats.count)
+        budget = marker.args[0] if marker else QUERY_BUDGETS.get(label)
+        if budget is not None and stats.count > budget:
+            repeated = ", ".join(f"{count}x {shape[:120]}" for shape, count in stats.repeated_shapes(2)[:3])
+            violations.append(f"{label}: {stats.count} queries > budget {budget}" + (f" (repeated: {repeated})" if repeated else ""))
+
+    request_observers.append(observe)
+    yield
+    request_observers.remove(observe)
+    if violations:
+        pytest.fail("SQL query budget exceeded:\n" + "\n".join(violations), pytrace=False)
@@ -74,3 +74,47 @@ async def test_active_grant_expands_reservation_budget(db_session, test_user):
 
     with pytest.raises(HTTPException):
         await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+
+
+@pytest.mark.asyncio
+async def test_steady_state_reserve_runs_no_db_queries(db_session, test_user):
+    from sqlalchemy import event
+
+    from tests.conftest import test_engine
+
+    await reset_counter_store()
+    service = AIUsageService(db_session)
+    await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+        await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+        with pytest.raises(HTTPException):
+            await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_new_grant_invalidates_the_cached_limit(db_session, test_user):
+    await reset_counter_store()
+    service = AIUsageService(db_session)
+    for _ in range(3):
+        await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+    with pytest.raises(HTTPException):
+        await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+
+    await service.add_quota_grant(user_id=test_user.id, daily_extra_units=1, reason="support")
+    await db_session.rollback()  # the grant is already committed
+
+    await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+    with pytest.raises(HTTPException):
+        await service.reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
@@ -25,3 +25,22 @@ def test_ai_request_rate_limiter_tracks_ips_independently():
 
     with pytest.raises(HTTPException):
         limiter.check_ip("127.0.0.1")
+
+
+def test_ai_request_rate_limiter_gcra_keeps_one_entry_per_ip(monkeypatch):
+    import app.services.ai.aiRequestRateLimitService as rate_limit_module
+
+    clock = [1000.0]
+    monkeypatch.setattr(rate_limit_module, "monotonic", lambda: clock[0])
+    limiter = AIRequestRateLimitService(max_requests=2, window_seconds=60, algorithm="gcra")
+
+    limiter.check_ip("127.0.0.1")
+    limiter.check_ip("127.0.0.1")
+    with pytest.raises(HTTPException):
+        limiter.check_ip("127.0.0.1")
+    assert list(limiter._arrivals) == ["127.0.0.1"]
+    assert limiter._events == {}
+
+    # One slot refills every window / max_requests seconds.
+    clock[0] += 30
+    limiter.check_ip("127.0.0.1")
@@ -7,6 +7,7 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.resume_analyzer.resume_text_extractor import ResumeTextExtractionError
 from app.models.applicationModel import ApplicationModel, ApplicationStatus
 from app.models.applicationAnalyticsModel import ApplicationEventType, ApplicationStatusEventModel
 from app.models.jobPostingModel import JobPosting
@@ -15,6 +16,7 @@ from app.models.interviewAvailabilityModel import InterviewAvailabilityModel, In
 from app.models.resumeModel import ResumeModel
 from app.models.userModel import User
 from app.services.resumes.resumeService import ResumeService
+from app.services.storage.storageStreaming import StorageStream
 
 
 @pytest.mark.asyncio
@@ -67,6 +69,10 @@ async def test_company_can_list_applicants_with_resume_details(
     assert data[0]["resume"]["download_url"].endswith(f"/api/v1/companies/me/applications/{application.id}/resume/download")
 
 
+async def _stream_via_download(self, file_key: str, byte_range=None):
+    return StorageStream.from_bytes(await self.download_resume_file(file_key), byte_range)
+
+
 @pytest.mark.asyncio
 async def test_company_resume_download_requires_company_access_and_streams_file(
     client: AsyncClient,
@@ -80,7 +86,9 @@ async def test_company_resume_download_requires_company_access_and_streams_file(
         assert file_key == "resumes/candidate.pdf"
         return b"%PDF-1.4 candidate resume"
 
-    monkeypatch.setattr(ResumeService, "download_file_from_s3", fake_download)
+    monkeypatch.setattr(ResumeService, "stream_resume_file", _stream_via_download)
+
+    monkeypatch.setattr(ResumeService, "download_resume_file", fake_download)
 
     resume = ResumeModel(
         id=uuid.uuid4(),
@@ -116,6 +124,15 @@ async def test_company_resume_download_requires_company_access_and_streams_file(
     assert response.status_code == 200
     assert response.content == b"%PDF-1.4 candidate resume"
     assert "attachment; filename=\"candidate_resume.pdf\"" == response.headers["content-disposition"]
+    assert response.headers["accept-ranges"] == "bytes"
+
+    partial = await client.get(
+        f"/api/v1/companies/me/applications/{application.id}/resume/download",
+        headers={**company_auth_headers, "Range": "bytes=0-7"},
+    )
+    assert partial.status_code == 206
+    assert partial.content == b"%PDF-1.4"
+    assert partial.headers["content-range"] == "bytes 0-7/25"
 
 
 @pytest.mark.asyncio
@@ -131,7 +148,9 @@ async def test_company_resume_preview_streams_pdf_inline(
         assert file_key == "resumes/candidate.pdf"
         return b"%PDF-1.4 candidate resume"
 
-    monkeypatch.setattr(ResumeService, "download_file_from_s3", fake_download)
+    monkeypatch.setattr(ResumeService, "stream_resume_file", _stream_via_download)
+
+    monkeypatch.setattr(ResumeService, "download_resume_file", fake_download)
 
     resume = ResumeModel(
         id=uuid.uuid4(),
@@ -198,7 +217,7 @@ async def test_company_resume_preview_renders_docx_as_html(
         assert file_key == "resumes/candidate.docx"
         return docx_buffer.getvalue()
 
-    monkeypatch.setattr(ResumeService, "download_file_from_s3", fake_download)
+    monkeypatch.setattr(ResumeService, "download_resume_file", fake_download)
 
     resume = ResumeModel(
         id=uuid.uuid4(),
@@ -238,6 +257,48 @@ async def test_company_resume_preview_renders_docx_as_html(
     assert "Python developer with FastAPI experience." in response.text
 
 
+@pytest.mark.asyncio
+async def test_company_resume_preview_degrades_when_docx_extraction_fails(
+    client: AsyncClient,
+    company_auth_headers: dict,
+    test_user: User,
+    test_company,
+    db_session: AsyncSession,
+    monkeypatch,
+):
+    async def interrupted(self, storage_file_id: str, *, filename: str, content_type: str = ""):
+        raise ResumeTextExtractionError(f"Text extraction of {filename} was interrupted")
+
+    monkeypatch.setattr(ResumeService, "get_resume_text", interrupted)
+
+    resume = ResumeModel(
+        id=uuid.uuid4(),
+        user_id=test_user.id,
+        view_url="https://example.com/resume.docx",
+        storage_file_id="resumes/candidate.docx",
+        original_filename="candidate_resume.docx",
+        folder_id="test-bucket",
+    )
+    application = ApplicationModel(
+        id=uuid.uuid4(),
+        user_id=test_user.id,
+        company_id=test_company.id,
+        resume_id=resume.id,
+        job_title="Backend Developer",
+        status=ApplicationStatus.APPLIED,
+    )
+    db_session.add_all([resume, application])
+    await db_session.commit()
+
+    response = await client.get(
+        f"/api/v1/companies/me/applications/{application.id}/resume/preview",
+        headers=company_auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert "Resume preview unavailable" in response.text
+
+
 @pytest.mark.asyncio
 async def test_company_can_move_applicant_to_in_review_and_student_dashboard_reflects_it(
     client: AsyncClient,
@@ -1,6 +1,6 @@
 import pytest
 
-from app.services.ratelimit.counterStore import InMemoryCounterStore
+from app.services.ratelimit.counterStore import InMemoryCounterStore, LimitCheck
 
 
 @pytest.mark.asyncio
@@ -31,3 +31,78 @@ async def test_sliding_window_blocks_after_max():
     assert allowed1 and allowed2
     assert not allowed3
     assert retry >= 1
+
+
+@pytest.mark.asyncio
+async def test_string_values_round_trip_and_expire():
+    store = InMemoryCounterStore()
+    await store.set_str("v", "payload", ttl_seconds=60)
+    assert await store.get_str("v") == "payload"
+
+    await store.set_str("v", "payload", ttl_seconds=0)
+    assert await store.get_str("v") is None
+
+
+@pytest.mark.asyncio
+async def test_check_limits_is_all_or_nothing():
+    store = InMemoryCounterStore()
+    checks = [
+        LimitCheck("burst", limit=5, window_seconds=60),
+        LimitCheck("daily", limit=2, window_seconds=86_400, kind="counter"),
+    ]
+
+    assert (await store.check_limits(checks)).allowed
+    assert (await store.check_limits(checks)).allowed
+    denied = await store.check_limits(checks)
+
+    assert not denied.allowed
+    assert denied.denied_index == 1
+    assert denied.retry_after >= 1
+    # The denied batch consumed nothing from the rule that still had room.
+    assert await store.get_int("daily") == 2
+    assert len(store._windows["burst"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_check_limits_reports_first_denied_window():
+    store = InMemoryCounterStore()
+    await store.sliding_window_allow("w", max_requests=1, window_seconds=60)
+
+    result = await store.check_limits([LimitCheck("w", limit=1, window_seconds=60)])
+
+    assert not result.allowed
+    assert result.denied_index == 0
+    assert 1 <= result.retry_after <= 60
+
+
+@pytest.mark.asyncio
+async def test_gcra_allows_burst_then_refills_at_steady_rate(monkeypatch):
+    import app.services.ratelimit.counterStore as counter_store
+
+    clock = [1000.0]
+    monkeypatch.setattr(counter_store.time, "time", lambda: clock[0])
+    store = InMemoryCounterStore()
+
+    assert await store.gcra_allow("g", limit=3, period_seconds=60) == (True, 0)
+    assert await store.gcra_allow("g", limit=3, period_seconds=60) == (True, 0)
+    assert await store.gcra_allow("g", limit=3, period_seconds=60) == (True, 0)
+    assert await store.gcra_allow("g", limit=3, period_seconds=60) == (False, 20)
+    # A single timestamp per key, however many requests were made.
+    assert store._gcra == {"g": 1060.0}
+
+    clock[0] += 20
+    assert await store.gcra_allow("g", limit=3, period_seconds=60) == (True, 0)
+    assert (await store.gcra_allow("g", limit=3, period_seconds=60))[0] is False
+
+
+@pytest.mark.asyncio
+async def test_check_limits_supports_gcra():
+    store = InMemoryCounterStore()
+    checks = [LimitCheck("g", limit=1, window_seconds=60, kind="gcra")]
+
+    assert (await store.check_limits(checks)).allowed
+    denied = await store.check_limits(checks)
+
+    assert not denied.allowed
+    assert denied.denied_index == 0
+    assert 1 <= denied.retry_after <= 60
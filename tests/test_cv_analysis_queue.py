@@ -0,0 +1,275 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.resume_analyzer.resume_feature import ResumeFeatureRequest
+from app.models.aiUsageModel import AIUsageEventModel
+from app.models.jobAnalysisModel import JobAnalysisModel, JobStatus
+from app.models.resumeModel import ResumeModel
+from app.models.userModel import User
+from app.services.ai.aiBudgetGuard import AIBudgetExhausted
+from app.services.ai.aiUsageService import AIFeature, AIUsageService
+from app.services.ai.cvAnalysisService import CVAnalysisService
+from app.services.ratelimit.counterStore import get_counter_store, reset_counter_store
+from app.workers.cvAnalysisWorker import CVAnalysisWorker
+
+RESUME_TEXT = "Jordan Lee\nPython FastAPI PostgreSQL engineer with five years of backend experience"
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch: pytest.MonkeyPatch):
+    llm_calls: list[str] = []
+
+    async def fake_download(self, file_key: str):
+        return b"resume bytes"
+
+    async def fake_extract(file_bytes: bytes, *, filename: str, content_type: str):
+        return RESUME_TEXT
+
+    async def fake_ask_llm_model(resume_text: str):
+        llm_calls.append(resume_text)
+        return ResumeFeatureRequest(
+            resume_text=resume_text,
+            resume_summary="Backend engineer.",
+            resume_keywords=["Python", "FastAPI"],
+            resume_key_skills=["Python"],
+        )
+
+    monkeypatch.setattr("app.services.resumes.resumeService.ResumeService.download_resume_file", fake_download)
+    monkeypatch.setattr("app.core.resume_analyzer.resume_text_extractor.extract_resume_text_from_bytes", fake_extract)
+    monkeypatch.setattr("app.services.ai.cvAnalysisService.ask_llm_model", fake_ask_llm_model)
+    return llm_calls
+
+
+@pytest.fixture
+async def resume(db_session: AsyncSession, test_user: User) -> ResumeModel:
+    resume = ResumeModel(
+        id=uuid.uuid4(),
+        user_id=test_user.id,
+        view_url="https://example.com/resume.pdf",
+        storage_file_id="resumes/user.pdf",
+        original_filename="resume.pdf",
+        folder_id="test-bucket",
+    )
+    db_session.add(resume)
+    await db_session.commit()
+    return resume
+
+
+def _worker(db_session: AsyncSession, **kwargs) -> CVAnalysisWorker:
+    return CVAnalysisWorker(async_sessionmaker(db_session.bind, expire_on_commit=False), **kwargs)
+
+
+async def _load_job(db_session: AsyncSession, job_id: uuid.UUID) -> JobAnalysisModel:
+    db_session.expire_all()
+    return await db_session.scalar(select(JobAnalysisModel).where(JobAnalysisModel.id == job_id))
+
+
+@pytest.mark.asyncio
+async def test_analyze_endpoint_enqueues_without_running_the_llm(
+    client: AsyncClient,
+    auth_headers: dict,
+    resume: ResumeModel,
+    db_session: AsyncSession,
+    fake_pipeline: list[str],
+):
+    response = await client.post("/api/v1/jobs/keywords/analyze", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    job_id = uuid.UUID(response.json()["job_id"])
+    job = await _load_job(db_session, job_id)
+    assert job.quota_key and job.quota_key.startswith("ai:quota:")
+    assert fake_pipeline == []
+
+    assert await _worker(db_session).run_once() == 1
+
+    job = await _load_job(db_session, job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert job.keywords == "Python, FastAPI"
+    assert job.attempts == 1
+    assert len(fake_pipeline) == 1
+    usage = await db_session.scalar(select(func.count(AIUsageEventModel.id)))
+    assert usage == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_back_off_then_dead_letter_and_release_quota(
+    db_session: AsyncSession,
+    test_user: User,
+    resume: ResumeModel,
+    fake_pipeline: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    await reset_counter_store()
+
+    async def flaky_llm(resume_text: str):
+        raise RuntimeError("provider timed out")
+
+    monkeypatch.setattr("app.services.ai.cvAnalysisService.ask_llm_model", flaky_llm)
+    reservation = await AIUsageService(db_session).reserve(user_id=test_user.id, feature=AIFeature.CV_JOB_SEARCH)
+    job = await CVAnalysisService(db_session).create_pending_analysis(
+        user_id=test_user.id,
+        resume_id=resume.id,
+        reservation=reservation,
+    )
+    job_id = job.id
+    worker = _worker(db_session, max_attempts=2)
+
+    assert await worker.run_once() == 1
+    job = await _load_job(db_session, job_id)
+    assert job.status == JobStatus.PENDING
+    assert job.attempts == 1
+    assert job.available_at > datetime.utcnow()
+    assert await get_counter_store().get_int(reservation.key) == 1
+
+    # Not due yet.
+    assert await worker.run_once() == 0
+
+    job.available_at = datetime.utcnow() - timedelta(seconds=1)
+    await db_session.commit()
+    assert await worker.run_once() == 1
+
+    job = await _load_job(db_session, job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == 2
+    assert job.dead_lettered_at is not None
+    assert "taking longer than expected" in job.error_message
+    assert await get_counter_store().get_int(reservation.key) == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_refusal_fails_without_retry(
+    db_session: AsyncSession,
+    test_user: User,
+    resume: ResumeModel,
+    fake_pipeline: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async def refuse(**kwargs):
+        raise AIBudgetExhausted()
+
+    monkeypatch.setattr("app.services.ai.cvAnalysisService.ensure_llm_budget", refuse)
+    job = await CVAnalysisService(db_session).create_pending_analysis(user_id=test_user.id, resume_id=resume.id)
+    job_id = job.id
+
+    assert await _worker(db_session).run_once() == 1
+
+    job = await _load_job(db_session, job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == 1
+    assert job.dead_lettered_at is None
+    assert fake_pipeline == []
+
+
+@pytest.mark.asyncio
+async def test_permanent_provider_errors_fail_without_retry(
+    db_session: AsyncSession,
+    test_user: User,
+    resume: ResumeModel,
+    fake_pipeline: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async def rejected(resume_text: str):
+        raise RuntimeError("429 RESOURCE_EXHAUSTED: quota exceeded")
+
+    monkeypatch.setattr("app.services.ai.cvAnalysisService.ask_llm_model", rejected)
+    job = await CVAnalysisService(db_session).create_pending_analysis(user_id=test_user.id, resume_id=resume.id)
+    job_id = job.id
+
+    assert await _worker(db_session).run_once() == 1
+
+    job = await _load_job(db_session, job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == 1
+    assert job.dead_lettered_at is None
+    assert "provider limit" in job.error_message
+
+
+@pytest.mark.asyncio
+async def test_jobs_with_a_live_lease_are_invisible_until_it_lapses(
+    db_session: AsyncSession,
+    test_user: User,
+    resume: ResumeModel,
+    fake_pipeline: list[str],
+):
+    job = JobAnalysisModel(
+        id=uuid.uuid4(),
+        user_id=test_user.id,
+        resume_id=resume.id,
+        status=JobStatus.PROCESSING,
+        attempts=1,
+        lease_expires_at=datetime.utcnow() + timedelta(minutes=5),
+    )
+    db_session.add(job)
+    await db_session.commit()
+    job_id = job.id
+    worker = _worker(db_session)
+
+    assert await worker.run_once() == 0
+
+    # The worker holding the lease died; once it lapses the job is retried.
+    job.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+    await db_session.commit()
+    assert await worker.run_once() == 1
+
+    job = await _load_job(db_session, job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert job.attempts == 2
+    assert job.lease_expires_at is None
+
+
+@pytest.mark.asyncio
+async def test_running_jobs_renew_their_lease(
+    db_session: AsyncSession,
+    test_user: User,
+    resume: ResumeModel,
+    fake_pipeline: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    leases: list[datetime] = []
+    job = await CVAnalysisService(db_session).create_pending_analysis(user_id=test_user.id, resume_id=resume.id)
+    job_id = job.id
+
+    async def slow_llm(resume_text: str):
+        leases.append((await _load_job(db_session, job_id)).lease_expires_at)
+        await asyncio.sleep(0.2)
+        leases.append((await _load_job(db_session, job_id)).lease_expires_at)
+        return ResumeFeatureRequest(resume_text=resume_text, resume_summary="Backend engineer.")
+
+    monkeypatch.setattr("app.services.ai.cvAnalysisService.ask_llm_model", slow_llm)
+
+    assert await _worker(db_session, heartbeat_interval_seconds=0.05).run_once() == 1
+
+    assert leases[1] > leases[0]
+    job = await _load_job(db_session, job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert job.lease_expires_at is None
+
+
+@pytest.mark.asyncio
+async def test_run_loop_processes_jobs_until_stopped(
+    db_session: AsyncSession,
+    test_user: User,
+    resume: ResumeModel,
+    fake_pipeline: list[str],
+):
+    worker = _worker(db_session, poll_interval_seconds=0.01)
+    runner = asyncio.create_task(worker.run())
+    job = await CVAnalysisService(db_session).create_pending_analysis(user_id=test_user.id, resume_id=resume.id)
+    job_id = job.id
+
+    for _ in range(200):
+        job = await _load_job(db_session, job_id)
+        if job.status == JobStatus.COMPLETED:
+            break
+        await asyncio.sleep(0.01)
+    worker.stop()
+    await asyncio.wait_for(runner, timeout=5)
+
+    assert job.status == JobStatus.COMPLETED
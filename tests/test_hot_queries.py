@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import Base
+from app.services.diagnostics.hotQueries import HOT_QUERIES
+from app.services.diagnostics.queryPlanAdvisor import analyze_plan, compile_postgres, explain, suggest_index
+
+
+@pytest.mark.parametrize("hq", HOT_QUERIES, ids=lambda hq: hq.name)
+def test_every_hot_query_has_its_index_declared(hq):
+    indexes = {index.name for index in Base.metadata.tables[hq.table].indexes}
+
+    assert hq.expected_index in indexes
+    assert hq.table in compile_postgres(hq.build())
+
+
+def test_seq_scan_under_a_sort_suggests_a_composite_index():
+    document = [
+        {
+            "Plan": {
+                "Node Type": "Sort",
+                "Sort Key": ["community_posts.created_at DESC"],
+                "Shared Hit Blocks": 12,
+                "Plans": [
+                    {
+                        "Node Type": "Seq Scan",
+                        "Relation Name": "community_posts",
+                        "Alias": "community_posts",
+                        "Filter": "(community_id = '00000000-0000-4000-8000-000000000004'::uuid)",
+                        "Rows Removed by Filter": 4980,
+                    }
+                ],
+            },
+            "Planning Time": 0.2,
+            "Execution Time": 3.5,
+        }
+    ]
+
+    report = analyze_plan("community_feed", document)
+
+    (finding,) = report.seq_scans
+    assert finding.rows_removed == 4980
+    assert finding.suggestion.keys == ("community_id", "created_at")
+    assert report.shared_hit_blocks == 12
+
+
+def test_expression_filters_become_expression_index_keys():
+    suggestion = suggest_index(
+        "job_skills",
+        "((job_posting_id IS NOT NULL) AND (lower((target_role)::text) = 'data analyst'::text))",
+    )
+
+    assert suggestion.ddl() == (
+        "CREATE INDEX CONCURRENTLY ix_job_skills_lower_target_role_job_posting_id "
+        "ON job_skills ((lower(target_role)), job_posting_id);"
+    )
+
+
+def test_row_comparisons_suggest_a_keyset_index():
+    suggestion = suggest_index("job_postings", "(ROW(created_at, id) < ROW('2100-01-01'::timestamp, '0'::uuid))")
+
+    assert suggestion.keys == ("created_at", "id")
+    assert suggest_index("job_postings", None) is None
+
+
+def test_plans_that_use_an_index_report_no_findings():
+    document = [
+        {
+            "Plan": {
+                "Node Type": "Limit",
+                "Plans": [
+                    {
+                        "Node Type": "Index Scan Backward",
+                        "Index Name": "ix_messages_conversation_created_at",
+                        "Relation Name": "messages",
+                    }
+                ],
+            }
+        }
+    ]
+
+    report = analyze_plan("latest_message", document)
+
+    assert report.seq_scans == []
+    assert report.index_names == {"ix_messages_conversation_created_at"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hq", HOT_QUERIES, ids=lambda hq: hq.name)
+async def test_hot_queries_are_answered_by_an_index(db_session: AsyncSession, hq):
+    if db_session.bind.dialect.name != "postgresql":
+        pytest.skip("EXPLAIN plans require a PostgreSQL backend")
+
+    connection = await db_session.connection()
+    report = analyze_plan(hq.name, await explain(connection, hq.build(), analyze=False))
+
+    assert not [finding for finding in report.seq_scans if finding.relation == hq.table]
+    assert hq.expected_index in report.index_names
@@ -0,0 +1,165 @@
+import io
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image, ImageFilter
+
+import app.db
+from app.models.postModel import PostModel
+from app.services.storage import imageVariants
+from app.services.storage.imageVariants import (
+    build_image_variants,
+    render_image_variants,
+    select_image_variant,
+    shutdown_image_variant_workers,
+)
+from app.services.community.postService import PostService
+from app.services.storage.mediaStorageService import (
+    MediaUploadResult,
+    S3MediaStorageService,
+    imagekit_variant_manifest,
+)
+from tests.conftest import TestSessionLocal
+
+
+def _photo(width: int = 2400, height: int = 1800, *, orientation: int | None = None) -> bytes:
+    noise = Image.effect_noise((width, height), 40).convert("RGB")
+    gradient = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    image = Image.blend(noise, gradient, 0.6).filter(ImageFilter.GaussianBlur(1))
+    exif = Image.Exif()
+    exif[0x010F] = "Camera Maker"
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=92, exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+class FakeStorage:
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+
+    async def upload_file(self, file_bytes: bytes, file_name: str, content_type: str = "", folder: str = "images"):
+        key = f"{folder}/{file_name}"
+        self.files[key] = file_bytes
+        return {"file_key": key, "file_url": f"https://media.example/{key}"}
+
+    async def delete_file(self, file_key: str) -> bool:
+        return self.files.pop(file_key, None) is not None
+
+
+def test_variants_are_resized_oriented_and_stripped_of_metadata():
+    original = _photo(orientation=6)  # rotated 90 degrees on display
+
+    rendered = render_image_variants(original, (320, 640, 1080, 4000), 40_000_000)
+
+    assert (rendered.width, rendered.height) == (1800, 2400)
+    assert [(v.width, v.height, v.format) for v in rendered.variants[:2]] == [(320, 427, "webp"), (320, 427, "jpg")]
+    # Never upscaled: the widest variant is the original width.
+    assert max(v.width for v in rendered.variants) == 1800
+    for variant in rendered.variants:
+        with Image.open(io.BytesIO(variant.data)) as image:
+            assert image.size == (variant.width, variant.height)
+            assert not image.getexif()
+    feed_variant = next(v for v in rendered.variants if v.width == 640 and v.format == "webp")
+    assert len(feed_variant.data) * 10 < len(original)
+
+
+def test_feed_picks_the_smallest_covering_variant():
+    manifest = {
+        "variants": [
+            {"width": w, "format": f, "url": f"{w}.{f}"}
+            for w in (320, 640, 1080)
+            for f in ("webp", "jpg")
+        ]
+    }
+
+    assert select_image_variant(manifest, width=500)["url"] == "640.webp"
+    assert select_image_variant(manifest, width=500, accept_webp=False)["url"] == "640.jpg"
+    assert select_image_variant(manifest, width=3000)["url"] == "1080.webp"
+    assert select_image_variant(None, width=640) is None
+
+
+@pytest.mark.asyncio
+async def test_variants_render_in_the_process_pool_and_bad_input_is_ignored(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(imageVariants, "MEDIA_VARIANT_WORKERS", 1)
+    try:
+        rendered = await build_image_variants(_photo(800, 600), widths=(320,))
+        assert [v.width for v in rendered.variants] == [320, 320]
+        assert await build_image_variants(b"not an image") is None
+    finally:
+        shutdown_image_variant_workers()
+
+
+@pytest.mark.asyncio
+async def test_s3_media_stores_variants_and_manifest_next_to_the_original(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(imageVariants, "MEDIA_VARIANT_WORKERS", 0)
+    storage = FakeStorage()
+    service = S3MediaStorageService(storage_service=storage)
+    media = MediaUploadResult(url="https://media.example/posts/photo.jpg", file_type="image", name="photo.jpg", key="posts/photo.jpg")
+
+    manifest = await service.create_image_variants(media, _photo(1000, 750))
+
+    assert [(v["width"], v["format"]) for v in manifest["variants"]] == [
+        (320, "webp"), (320, "jpg"), (640, "webp"), (640, "jpg"), (1000, "webp"), (1000, "jpg"),
+    ]
+    assert manifest["variants"][2]["url"] == "https://media.example/posts/photo.jpg.variants/w640.webp"
+    assert "posts/photo.jpg.variants/manifest.json" in storage.files
+
+
+@pytest.mark.asyncio
+async def test_upload_post_renders_variants_after_the_response(
+    client: AsyncClient,
+    auth_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(imageVariants, "MEDIA_VARIANT_WORKERS", 0)
+    monkeypatch.setattr(app.db, "async_session", TestSessionLocal)
+    storage = FakeStorage()
+    monkeypatch.setattr(
+        "app.routes.postRoute.get_media_storage_service",
+        lambda: S3MediaStorageService(storage_service=storage),
+    )
+
+    response = await client.post(
+        "/api/v1/upload_post",
+        headers=auth_headers,
+        data={"caption": "Team photo"},
+        files={"file": ("photo.jpg", io.BytesIO(_photo(1600, 1200)), "image/jpeg")},
+    )
+    feed = await client.get("/api/v1/posts", params={"width": 600}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["url"] == "https://media.example/posts/photo.jpg"
+    [post] = feed.json()
+    assert post["display_url"] == "https://media.example/posts/photo.jpg.variants/w640.webp"
+    assert len(post["variants"]) == 6
+    async with TestSessionLocal() as session:
+        stored = await session.get(PostModel, uuid.UUID(post["id"]))
+        assert stored.media_variants["width"] == 1600
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_post_deletes_its_stored_variants(db_session, test_user, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(imageVariants, "MEDIA_VARIANT_WORKERS", 0)
+    storage = FakeStorage()
+    service = S3MediaStorageService(storage_service=storage)
+    await storage.upload_file(b"original", "photo.jpg", folder="posts")
+    media = MediaUploadResult(url="https://media.example/posts/photo.jpg", file_type="image", name="photo.jpg", key="posts/photo.jpg")
+    post = PostModel(caption="Team photo", url=media.url, file_type="image", file_name="photo.jpg", user_id=test_user.id)
+    post.media_variants = await service.create_image_variants(media, _photo(1000, 750))
+    db_session.add(post)
+    await db_session.commit()
+
+    await PostService(db_session).delete_post(post.id, media_service=service)
+
+    assert list(storage.files) == ["posts/photo.jpg"]
+
+
+def test_imagekit_variants_extend_an_existing_query_string():
+    signed = imagekit_variant_manifest("https://ik.example/posts/photo.jpg?updatedAt=1700000000", 1000, 750)
+    plain = imagekit_variant_manifest("https://ik.example/posts/photo.jpg", 1000, 750)
+
+    assert signed["variants"][0]["url"] == "https://ik.example/posts/photo.jpg?updatedAt=1700000000&tr=w-320,f-webp"
+    assert plain["variants"][0]["url"] == "https://ik.example/posts/photo.jpg?tr=w-320,f-webp"
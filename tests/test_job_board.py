@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 import uuid
 
 import pytest
@@ -190,7 +191,7 @@ async def test_job_search_returns_students_compass_first_and_then_linkedin(
     db_session.add(job_posting)
     await db_session.commit()
 
-    def fake_linkedin_jobs(**kwargs):
+    async def fake_linkedin_jobs(**kwargs):
         return [
             DummyLinkedInJob(
                 title="Python Developer External",
@@ -231,7 +232,7 @@ async def test_job_search_falls_back_to_linkedin_when_no_internal_matches(
     auth_headers: dict,
     monkeypatch: pytest.MonkeyPatch,
 ):
-    def fake_linkedin_jobs(**kwargs):
+    async def fake_linkedin_jobs(**kwargs):
         return [
             DummyLinkedInJob(
                 title="Data Analyst",
@@ -371,3 +372,100 @@ async def test_company_viewer_cannot_manage_job_postings(
     delete_response = await client.delete(f"/api/v1/companies/me/job-postings/{protected_job.id}")
     assert delete_response.status_code == 403
     assert delete_response.json()["detail"] == "Only company recruiters can manage job postings"
+
+
+@pytest.mark.asyncio
+async def test_student_job_board_paginates_with_cursor(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_company: Company,
+    db_session: AsyncSession,
+):
+    created_at = datetime(2026, 3, 1, 12, 0, 0)
+    db_session.add_all(
+        [
+            JobPosting(
+                id=uuid.uuid4(),
+                company_id=test_company.id,
+                title=f"Role {index}",
+                description="Long description body.",
+                is_active=True,
+                # Two postings share a timestamp to exercise the id tie-breaker.
+                created_at=created_at + timedelta(minutes=index // 2),
+            )
+            for index in range(5)
+        ]
+    )
+    await db_session.commit()
+
+    seen_titles: list[str] = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/jobs/board", headers=auth_headers, params=params)
+        assert response.status_code == 200
+        seen_titles.extend(job["title"] for job in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert len(seen_titles) == 5
+    assert set(seen_titles) == {f"Role {index}" for index in range(5)}
+    assert seen_titles[0] == "Role 4"
+
+
+@pytest.mark.asyncio
+async def test_student_job_board_summary_view_omits_long_bodies(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_company: Company,
+    db_session: AsyncSession,
+):
+    job_posting = JobPosting(
+        id=uuid.uuid4(),
+        company_id=test_company.id,
+        title="Backend Engineer",
+        description="Very long description.",
+        requirements="Python",
+        benefits="Remote stipend",
+        is_active=True,
+    )
+    db_session.add(job_posting)
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/v1/jobs/board",
+        headers=auth_headers,
+        params={"view": "summary"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["title"] == "Backend Engineer"
+    assert data[0]["company_name"] == test_company.company_name
+    assert "description" not in data[0]
+    assert "requirements" not in data[0]
+    assert "benefits" not in data[0]
+
+    detail_response = await client.get(f"/api/v1/jobs/board/{job_posting.id}", headers=auth_headers)
+
+    assert detail_response.status_code == 200
+    assert detail_response.json()["description"] == "Very long description."
+    assert detail_response.json()["benefits"] == "Remote stipend"
+
+
+@pytest.mark.asyncio
+async def test_student_job_board_rejects_malformed_cursor(
+    client: AsyncClient,
+    auth_headers: dict,
+):
+    response = await client.get(
+        "/api/v1/jobs/board",
+        headers=auth_headers,
+        params={"cursor": "not-a-cursor"},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,189 @@
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.companyModel import Company
+from app.models.jobPostingModel import JobPosting
+from app.models.skillModel import JobSkillModel, SkillModel
+
+
+def _events(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+
+@pytest.mark.asyncio
+async def test_company_ndjson_import_inserts_valid_rows_and_reports_errors(
+    client: AsyncClient,
+    company_auth_headers: dict,
+    test_company: Company,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr("app.services.jobs.jobPostingImportService.JOB_POSTING_IMPORT_BATCH_SIZE", 2)
+    db_session.add(SkillModel(normalized_name="python", display_name="Python", category="technical"))
+    await db_session.commit()
+
+    lines = [
+        {"title": "Python Developer", "description": "Build APIs with Python."},
+        {"description": "Missing title"},
+        {"title": "Data Analyst", "location": "Toronto"},
+        "not json",
+        {"title": "QA Engineer", "is_active": False},
+    ]
+    body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n"
+
+    async def chunked():
+        encoded = body.encode("utf-8")
+        for start in range(0, len(encoded), 7):
+            yield encoded[start:start + 7]
+
+    response = await client.post(
+        "/api/v1/companies/me/job-postings/import",
+        headers={**company_auth_headers, "Content-Type": "application/x-ndjson"},
+        content=chunked(),
+    )
+
+    assert response.status_code == 200
+    events = _events(response)
+    assert [event["row"] for event in events if event["event"] == "row_error"] == [2, 4]
+    assert [event["inserted"] for event in events if event["event"] == "progress"] == [2, 3]
+    summary = events[-1]
+    assert summary["event"] == "complete"
+    assert summary["inserted"] == 3
+    assert summary["failed"] == 2
+    assert summary["aborted"] is False
+    assert summary["skills"]["jobs_with_matches"] == 1
+
+    titles = (
+        await db_session.execute(select(JobPosting.title).where(JobPosting.company_id == test_company.id))
+    ).scalars().all()
+    assert sorted(titles) == ["Data Analyst", "Python Developer", "QA Engineer"]
+    skill_links = await db_session.execute(select(func.count(JobSkillModel.id)))
+    assert skill_links.scalar_one() == 1
+
+
+@pytest.mark.asyncio
+async def test_company_csv_import_handles_quoted_multiline_fields(
+    client: AsyncClient,
+    company_auth_headers: dict,
+    test_company: Company,
+    db_session: AsyncSession,
+):
+    body = (
+        "title,description,is_active\n"
+        '"Backend Engineer","Line one\nLine two, with comma",true\n'
+        "Frontend Engineer,,false\n"
+    )
+
+    response = await client.post(
+        "/api/v1/companies/me/job-postings/import",
+        headers={**company_auth_headers, "Content-Type": "text/csv"},
+        content=body.encode("utf-8"),
+    )
+
+    assert response.status_code == 200
+    assert _events(response)[-1]["inserted"] == 2
+    backend = (
+        await db_session.execute(select(JobPosting).where(JobPosting.title == "Backend Engineer"))
+    ).scalar_one()
+    assert backend.description == "Line one\nLine two, with comma"
+    frontend = (
+        await db_session.execute(select(JobPosting).where(JobPosting.title == "Frontend Engineer"))
+    ).scalar_one()
+    assert frontend.description is None
+    assert frontend.is_active is False
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unknown_content_type(
+    client: AsyncClient,
+    company_auth_headers: dict,
+):
+    response = await client.post(
+        "/api/v1/companies/me/job-postings/import",
+        headers={**company_auth_headers, "Content-Type": "application/octet-stream"},
+        content=b"title\nRole\n",
+    )
+
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_import_requires_company_auth(client: AsyncClient, auth_headers: dict):
+    response = await client.post(
+        "/api/v1/companies/me/job-postings/import",
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        content=b'{"title": "Role"}\n',
+    )
+
+    assert response.status_code == 401
+
+
+@pytest.fixture
+async def admin_headers(client: AsyncClient, test_user, db_session: AsyncSession) -> dict:
+    test_user.is_superuser = True
+    await db_session.commit()
+    response = await client.post(
+        "/auth/jwt/login",
+        data={"username": test_user.email, "password": "password123"},
+    )
+    assert response.status_code in (200, 204)
+    # Admin writes require a same-origin request.
+    return {"Origin": "http://test"}
+
+
+@pytest.mark.asyncio
+async def test_admin_can_import_postings_for_a_company(
+    client: AsyncClient,
+    admin_headers: dict,
+    test_company: Company,
+    db_session: AsyncSession,
+):
+    response = await client.post(
+        f"/api/v1/admin/companies/{test_company.id}/job-postings/import",
+        headers={**admin_headers, "Content-Type": "text/csv"},
+        content=b"title,location\nSupport Engineer,Remote\n,Toronto\n",
+    )
+
+    assert response.status_code == 200
+    events = _events(response)
+    assert [event["row"] for event in events if event["event"] == "row_error"] == [2]
+    assert events[-1]["inserted"] == 1
+    created = (
+        await db_session.execute(select(JobPosting).where(JobPosting.company_id == test_company.id))
+    ).scalar_one()
+    assert created.title == "Support Engineer"
+
+
+@pytest.mark.asyncio
+async def test_admin_import_returns_404_for_unknown_company(
+    client: AsyncClient,
+    admin_headers: dict,
+):
+    response = await client.post(
+        f"/api/v1/admin/companies/{uuid.uuid4()}/job-postings/import",
+        headers={**admin_headers, "Content-Type": "application/x-ndjson"},
+        content=b'{"title": "Role"}\n',
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Company not found"
+
+
+@pytest.mark.asyncio
+async def test_admin_import_requires_superuser(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_company: Company,
+):
+    response = await client.post(
+        f"/api/v1/admin/companies/{test_company.id}/job-postings/import",
+        headers={**auth_headers, "Origin": "http://test", "Content-Type": "application/x-ndjson"},
+        content=b'{"title": "Role"}\n',
+    )
+
+    assert response.status_code == 403
@@ -0,0 +1,152 @@
+import asyncio
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.companyModel import Company
+from app.models.jobPostingModel import JobPosting
+from app.services.jobs.jobSearchCache import JobSearchCache
+from app.services.ratelimit.counterStore import reset_counter_store
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_loads_are_coalesced():
+    cache = JobSearchCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return [{"title": "Python Developer"}]
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("jobsearch:test", loader, ttl_seconds=60) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert all(result == [{"title": "Python Developer"}] for result in results)
+    assert await cache.get_or_load("jobsearch:test", loader, ttl_seconds=60) == results[0]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_shared_and_not_cached():
+    cache = JobSearchCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("jobsearch:fail", loader, ttl_seconds=60) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("jobsearch:fail", loader, ttl_seconds=60)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_internal_results_are_invalidated_by_generation_bump():
+    await reset_counter_store()
+    cache = JobSearchCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return [calls]
+
+    first = await cache.internal_results(keywords="Python ", location="remote", limit=10, loader=loader)
+    second = await cache.internal_results(keywords="python", location="Remote", limit=10, loader=loader)
+    await cache.invalidate_internal()
+    third = await cache.internal_results(keywords="python", location="Remote", limit=10, loader=loader)
+
+    assert first == second == [1]
+    assert third == [2]
+
+
+@pytest.mark.asyncio
+async def test_job_search_reflects_new_posting_after_company_creates_it(
+    client: AsyncClient,
+    auth_headers: dict,
+    company_auth_headers: dict,
+    test_company: Company,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    linkedin_calls = 0
+
+    async def fake_linkedin_jobs(**kwargs):
+        nonlocal linkedin_calls
+        linkedin_calls += 1
+        return []
+
+    monkeypatch.setattr("app.services.jobs.jobSearchService.fetch_linkedin_jobs", fake_linkedin_jobs)
+    db_session.add(
+        JobPosting(
+            id=uuid.uuid4(),
+            company_id=test_company.id,
+            title="Python Developer",
+            is_active=True,
+        )
+    )
+    await db_session.commit()
+    search = {"keywords": "python", "location": "", "limit": 10, "remote": False}
+
+    first = await client.post("/api/v1/jobs/search", headers=auth_headers, json=search)
+    assert len(first.json()["students_compass"]) == 1
+
+    create_response = await client.post(
+        "/api/v1/companies/me/job-postings",
+        headers=company_auth_headers,
+        json={"title": "Senior Python Engineer", "is_active": True},
+    )
+    assert create_response.status_code == 201
+
+    second = await client.post("/api/v1/jobs/search", headers=auth_headers, json=search)
+
+    assert {job["title"] for job in second.json()["students_compass"]} == {
+        "Python Developer",
+        "Senior Python Engineer",
+    }
+    # External results are cached independently and survive posting changes.
+    assert linkedin_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_followers_retry_when_the_leader_is_cancelled():
+    cache = JobSearchCache()
+    calls = 0
+    leader_started = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        leader_started.set()
+        await asyncio.sleep(0.05)
+        return calls
+
+    leader = asyncio.create_task(cache.get_or_load("jobsearch:cancel", loader, ttl_seconds=60))
+    await leader_started.wait()
+    followers = [
+        asyncio.create_task(cache.get_or_load("jobsearch:cancel", loader, ttl_seconds=60))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    results = await asyncio.gather(*followers)
+
+    assert leader.cancelled()
+    assert results == [2, 2, 2]
+    assert calls == 2
@@ -0,0 +1,86 @@
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+from pydantic import TypeAdapter
+
+from app.app import app
+from app.responses import FastJSONResponse, adapter_response
+from app.schemas.jobPostingSchema import JobBoardPostingRead, JobBoardPostingSummaryRead
+
+
+def test_fast_json_response_renders_uuids_datetimes_and_models():
+    posting_id = uuid.uuid4()
+    created_at = datetime(2026, 10, 19, 8, 30)
+    summary = JobBoardPostingSummaryRead(
+        id=posting_id,
+        company_id=posting_id,
+        title="Data Analyst",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+    response = FastJSONResponse({"id": posting_id, "at": created_at, "items": [summary], "name": "Éva"})
+
+    body = json.loads(response.body)
+    assert body["id"] == str(posting_id)
+    assert body["at"] == "2026-10-19T08:30:00"
+    assert body["items"][0]["title"] == "Data Analyst"
+    assert body["name"] == "Éva"
+    assert response.headers["content-type"] == "application/json"
+    assert app.router.default_response_class is FastJSONResponse
+
+
+def test_adapter_response_reads_company_fields_through_the_relationship():
+    created_at = datetime(2026, 10, 19)
+    company = SimpleNamespace(company_name="Acme", location="Toronto", description=None, website="https://acme.example")
+    row = SimpleNamespace(
+        id=uuid.uuid4(),
+        company_id=uuid.uuid4(),
+        company=company,
+        title="Data Analyst",
+        responsibilities=None,
+        location="Remote",
+        job_type=None,
+        workplace_type=None,
+        seniority_level=None,
+        salary_range=None,
+        listed_context=None,
+        source_context=None,
+        application_url=None,
+        is_active=True,
+        expires_at=None,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    orphan = SimpleNamespace(**{**vars(row), "company": None})
+
+    response = adapter_response(
+        TypeAdapter(list[JobBoardPostingSummaryRead]), [row, orphan], headers={"X-Next-Cursor": "abc"}
+    )
+
+    first, second = json.loads(response.body)
+    assert (first["company_name"], first["company_location"], first["company_website"]) == (
+        "Acme",
+        "Toronto",
+        "https://acme.example",
+    )
+    assert second["company_name"] is None
+    assert "description" not in first
+    assert response.headers["X-Next-Cursor"] == "abc"
+
+
+def test_board_schemas_still_accept_company_fields_by_name():
+    posting = JobBoardPostingRead(
+        id=uuid.uuid4(),
+        company_id=uuid.uuid4(),
+        title="Data Analyst",
+        created_at=datetime(2026, 10, 19),
+        updated_at=datetime(2026, 10, 19),
+        company_name="Acme",
+        company_website="https://acme.example",
+    )
+
+    assert posting.company_name == "Acme"
+    assert posting.model_dump()["company_website"] == "https://acme.example"
@@ -0,0 +1,154 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.core.JobsScraper import linkedin_scraper
+
+TOTAL_JOBS = 23
+PAGE_SIZE = 10
+
+
+def _render_cards(start: int, page_size: int = PAGE_SIZE) -> str:
+    cards = []
+    for index in range(start, min(start + page_size, TOTAL_JOBS)):
+        cards.append(
+            f"""
+            <div class="base-card">
+              <a class="base-card__full-link" href="https://linkedin.example/jobs/{index}"></a>
+              <h3 class="base-search-card__title">Job {index}</h3>
+              <h4 class="base-search-card__subtitle">Company {index}</h4>
+              <span class="job-search-card__location">Remote</span>
+              <time datetime="2026-03-10"></time>
+            </div>
+            """
+        )
+    return "".join(cards)
+
+
+@pytest.fixture
+def page_sizes() -> dict[int, int]:
+    """Per-``start`` overrides of how many cards the stub serves."""
+    return {}
+
+
+@pytest.fixture
+def linkedin_stub(monkeypatch: pytest.MonkeyPatch, page_sizes: dict[int, int]):
+    requests_seen: list[dict] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+            requests_seen.append(params)
+            start = int(params.get("start", "0"))
+            body = _render_cards(start, page_sizes.get(start, PAGE_SIZE)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(linkedin_scraper, "BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/search")
+    linkedin_scraper.clear_linkedin_page_cache()
+
+    yield requests_seen
+
+    server.shutdown()
+    server.server_close()
+    linkedin_scraper.clear_linkedin_page_cache()
+
+
+@pytest.mark.asyncio
+async def test_fetch_linkedin_jobs_pages_until_limit(linkedin_stub):
+    jobs = await linkedin_scraper.fetch_linkedin_jobs(
+        keywords="python",
+        location="Remote",
+        limit=15,
+        remote=True,
+        throttle_seconds=0,
+    )
+    await linkedin_scraper.close_linkedin_client()
+
+    assert [job.title for job in jobs] == [f"Job {index}" for index in range(15)]
+    assert sorted(int(params["start"]) for params in linkedin_stub) == [0, 10]
+    assert all(params["f_WT"] == "2" for params in linkedin_stub)
+
+
+@pytest.mark.asyncio
+async def test_fetch_linkedin_jobs_stops_when_results_run_out(linkedin_stub):
+    jobs = await linkedin_scraper.fetch_linkedin_jobs(
+        keywords="python",
+        location="Remote",
+        limit=50,
+        throttle_seconds=0,
+    )
+    await linkedin_scraper.close_linkedin_client()
+
+    assert len(jobs) == TOTAL_JOBS
+    assert len({job.url for job in jobs}) == TOTAL_JOBS
+
+
+@pytest.mark.asyncio
+async def test_fetch_linkedin_jobs_serves_repeat_pages_from_cache(linkedin_stub):
+    first = await linkedin_scraper.fetch_linkedin_jobs(
+        keywords="python",
+        location="Remote",
+        limit=10,
+        throttle_seconds=0,
+    )
+    requests_after_first = len(linkedin_stub)
+    second = await linkedin_scraper.fetch_linkedin_jobs(
+        keywords="python",
+        location="Remote",
+        limit=10,
+        throttle_seconds=0,
+    )
+    await linkedin_scraper.close_linkedin_client()
+
+    assert [job.url for job in second] == [job.url for job in first]
+    assert len(linkedin_stub) == requests_after_first
+
+
+@pytest.mark.asyncio
+async def test_fetch_linkedin_jobs_advances_by_short_page_length(linkedin_stub, page_sizes):
+    page_sizes[10] = 4
+
+    jobs = await linkedin_scraper.fetch_linkedin_jobs(
+        keywords="python",
+        location="Remote",
+        limit=TOTAL_JOBS,
+        throttle_seconds=0,
+    )
+    await linkedin_scraper.close_linkedin_client()
+
+    assert [job.title for job in jobs] == [f"Job {index}" for index in range(TOTAL_JOBS)]
+    assert 14 in {int(params["start"]) for params in linkedin_stub}
+
+
+@pytest.mark.asyncio
+async def test_fetch_linkedin_jobs_does_not_cache_empty_pages(linkedin_stub, page_sizes):
+    page_sizes[0] = 0
+    empty = await linkedin_scraper.fetch_linkedin_jobs(
+        keywords="python",
+        location="Remote",
+        limit=5,
+        throttle_seconds=0,
+    )
+    page_sizes.clear()
+    jobs = await linkedin_scraper.fetch_linkedin_jobs(
+        keywords="python",
+        location="Remote",
+        limit=5,
+        throttle_seconds=0,
+    )
+    await linkedin_scraper.close_linkedin_client()
+
+    assert empty == []
+    assert [job.title for job in jobs] == [f"Job {index}" for index in range(5)]
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+import app.core.resume_analyzer.llm_model as llm_model
+from app.core.resume_analyzer.llm_gateway import AIMDLimiter, LLMGateway, LLMPriority, reset_llm_gateway
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeModels:
+    """Local stand-in for ``client.aio.models`` that holds every call until released."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def generate_content(self, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        return _Response('{"resume_text": "x", "resume_keywords": ["Python"]}')
+
+
+class _FakeClient:
+    def __init__(self):
+        self.aio = type("Aio", (), {"models": _FakeModels()})()
+
+
+@pytest.fixture(autouse=True)
+def fresh_gateway():
+    reset_llm_gateway()
+    yield
+    reset_llm_gateway()
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_prompts_share_one_provider_call(monkeypatch):
+    fake = _FakeClient()
+    monkeypatch.setattr(llm_model, "client", fake)
+
+    callers = [asyncio.create_task(llm_model.ask_llm_model("same resume text")) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    fake.aio.models.release.set()
+    results = await asyncio.gather(*callers)
+
+    assert fake.aio.models.calls == 1
+    assert all(result.resume_keywords == ["Python"] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_followers_retry_when_the_leader_is_cancelled():
+    gateway = LLMGateway()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return calls
+
+    leader = asyncio.create_task(gateway.call(slow, key="k"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(gateway.call(slow, key="k"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == 2
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_overload_halves_the_limit_and_success_grows_it_back():
+    gateway = LLMGateway(initial_concurrency=8, min_concurrency=1, max_concurrency=8)
+
+    async def throttled():
+        raise RuntimeError("503 UNAVAILABLE: model overloaded")
+
+    with pytest.raises(RuntimeError):
+        await gateway.call(throttled)
+    assert int(gateway.limiter.limit) == 4
+
+    # A burst of pushback inside the cooldown only counts once.
+    with pytest.raises(RuntimeError):
+        await gateway.call(throttled)
+    assert int(gateway.limiter.limit) == 4
+
+    async def ok():
+        return "ok"
+
+    for _ in range(30):
+        await gateway.call(ok)
+    assert int(gateway.limiter.limit) == 8
+
+
+@pytest.mark.asyncio
+async def test_timeouts_count_as_overload_and_are_recorded():
+    gateway = LLMGateway(initial_concurrency=4)
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await gateway.call(hang, label="resume_audit", timeout=0.01)
+
+    assert int(gateway.limiter.limit) == 2
+    assert gateway.latency.snapshot()[("resume_audit", "timeout")]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interactive_callers_are_admitted_before_background_work():
+    limiter = AIMDLimiter(initial=1, minimum=1, maximum=1)
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def wait(name: str, priority: LLMPriority):
+        await limiter.acquire(priority)
+        order.append(name)
+        limiter.release()
+
+    waiters = [
+        asyncio.create_task(wait("background-1", LLMPriority.BACKGROUND)),
+        asyncio.create_task(wait("background-2", LLMPriority.BACKGROUND)),
+        asyncio.create_task(wait("interactive", LLMPriority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*waiters)
+
+    assert order == ["interactive", "background-1", "background-2"]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_latency_histogram_buckets_by_label_and_outcome():
+    gateway = LLMGateway()
+
+    async def ok():
+        return None
+
+    async def broken():
+        raise RuntimeError("bad json")
+
+    await gateway.call(ok, label="resume_keywords")
+    await gateway.call(ok, label="resume_keywords")
+    with pytest.raises(RuntimeError):
+        await gateway.call(broken, label="resume_keywords")
+
+    snapshot = gateway.latency.snapshot()
+    assert snapshot[("resume_keywords", "ok")]["count"] == 2
+    assert snapshot[("resume_keywords", "ok")]["buckets"][0] == 2
+    assert snapshot[("resume_keywords", "error")]["count"] == 1
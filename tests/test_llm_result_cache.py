@@ -0,0 +1,160 @@
+import uuid
+
+import pytest
+from fastapi_users.password import PasswordHelper
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.resume_analyzer.llm_model import resume_text_sha256
+from app.core.resume_analyzer.resume_feature import ResumeFeatureRequest
+from app.models.aiUsageModel import AIUsageEventModel
+from app.models.jobAnalysisModel import JobAnalysisModel, JobStatus
+from app.models.llmResultCacheModel import LLMResultCacheModel
+from app.models.resumeModel import ResumeModel
+from app.models.userModel import User
+from app.services.ai.aiUsageService import AIFeature, AIUsageService
+from app.services.ai.cvAnalysisService import CVAnalysisService
+from app.services.ai.llmResultCache import (
+    LLMResultCache,
+    get_llm_result_cache_stats,
+    reset_llm_result_cache_stats,
+)
+from app.services.ratelimit.counterStore import get_counter_store, reset_counter_store
+from app.services.resumes.resumeService import ResumeService
+from app.workers.cvAnalysisWorker import CVAnalysisWorker
+
+RESUME_TEXT = "Jordan Lee\nData engineer: Python, Spark, Airflow and dbt across three production platforms."
+
+
+@pytest.fixture
+def llm_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    async def fake_download(self, file_key: str):
+        return file_key.encode("utf-8")
+
+    async def fake_extract(file_bytes: bytes, *, filename: str, content_type: str):
+        # Same document re-extracted with different layout whitespace.
+        return RESUME_TEXT if file_bytes.endswith(b"a.pdf") else RESUME_TEXT.replace(" ", "  ")
+
+    async def fake_ask_llm_model(resume_text: str):
+        calls.append(resume_text)
+        return ResumeFeatureRequest(
+            resume_text=resume_text,
+            resume_summary="Data engineer.",
+            resume_keywords=["Python", "Spark", "Airflow"],
+        )
+
+    monkeypatch.setattr("app.services.resumes.resumeService.ResumeService.download_resume_file", fake_download)
+    monkeypatch.setattr("app.core.resume_analyzer.resume_text_extractor.extract_resume_text_from_bytes", fake_extract)
+    monkeypatch.setattr("app.services.ai.cvAnalysisService.ask_llm_model", fake_ask_llm_model)
+    reset_llm_result_cache_stats()
+    return calls
+
+
+async def _other_user(db_session: AsyncSession) -> User:
+    user = User(
+        id=uuid.uuid4(),
+        email="second@example.com",
+        hashed_password=PasswordHelper().hash("password123"),
+        is_active=True,
+        is_verified=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def _resume(db_session: AsyncSession, user: User, storage_file_id: str) -> ResumeModel:
+    resume = ResumeModel(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        view_url="https://example.com/resume.pdf",
+        storage_file_id=storage_file_id,
+        original_filename="resume.pdf",
+        folder_id="test-bucket",
+    )
+    db_session.add(resume)
+    await db_session.commit()
+    return resume
+
+
+async def _analyze(db_session: AsyncSession, user_id: uuid.UUID, resume_id: uuid.UUID):
+    reservation = await AIUsageService(db_session).reserve(user_id=user_id, feature=AIFeature.CV_JOB_SEARCH)
+    job = await CVAnalysisService(db_session).create_pending_analysis(
+        user_id=user_id,
+        resume_id=resume_id,
+        reservation=reservation,
+    )
+    job_id = job.id
+    worker = CVAnalysisWorker(async_sessionmaker(db_session.bind, expire_on_commit=False))
+    assert await worker.run_once() == 1
+    db_session.expire_all()
+    job = await db_session.scalar(select(JobAnalysisModel).where(JobAnalysisModel.id == job_id))
+    return (job.status, job.keywords), reservation
+
+
+@pytest.mark.asyncio
+async def test_identical_resume_text_is_analyzed_once_across_users(
+    db_session: AsyncSession,
+    test_user: User,
+    llm_calls: list[str],
+):
+    await reset_counter_store()
+    other = await _other_user(db_session)
+    other_id = other.id
+    first = (test_user.id, (await _resume(db_session, test_user, "resumes/a.pdf")).id)
+    second = (other_id, (await _resume(db_session, other, "resumes/b.pdf")).id)
+
+    first_job, _ = await _analyze(db_session, *first)
+    second_job, second_reservation = await _analyze(db_session, *second)
+
+    assert len(llm_calls) == 1
+    assert first_job == second_job == (JobStatus.COMPLETED, "Python, Spark, Airflow")
+    # The cache hit spent neither quota nor a usage event.
+    assert await get_counter_store().get_int(second_reservation.key) == 0
+    usage = await db_session.scalar(
+        select(func.count(AIUsageEventModel.id)).where(AIUsageEventModel.user_id == other_id)
+    )
+    assert usage == 0
+    stats = get_llm_result_cache_stats()
+    assert (stats.hits, stats.misses, stats.writes) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+    entry = await db_session.scalar(select(LLMResultCacheModel))
+    assert entry.hit_count == 1
+    assert "Jordan Lee" not in entry.payload
+
+
+@pytest.mark.asyncio
+async def test_prompt_version_change_misses_the_cache(db_session: AsyncSession, llm_calls: list[str]):
+    result = ResumeFeatureRequest(resume_text=RESUME_TEXT, resume_keywords=["Python"])
+    await LLMResultCache(db_session, prompt_version="v1").put(RESUME_TEXT, result)
+    await db_session.commit()
+
+    assert (await LLMResultCache(db_session, prompt_version="v1").get(RESUME_TEXT)).resume_keywords == ["Python"]
+    assert await LLMResultCache(db_session, prompt_version="v2").get(RESUME_TEXT) is None
+    assert await LLMResultCache(db_session, prompt_version="v1", ttl_seconds=0).get(RESUME_TEXT) is None
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_resume_purges_its_cached_analyses(
+    db_session: AsyncSession,
+    test_user: User,
+    llm_calls: list[str],
+):
+    user_id = test_user.id
+    resume = await _resume(db_session, test_user, "resumes/a.pdf")
+    resume_id = resume.id
+    await _analyze(db_session, user_id, resume_id)
+    resume = await db_session.get(ResumeModel, resume_id)
+    assert resume.text_sha256 == resume_text_sha256(RESUME_TEXT)
+    assert await db_session.scalar(select(func.count()).select_from(LLMResultCacheModel)) == 1
+
+    class NullStorage:
+        async def delete_file(self, file_key: str) -> None:
+            return None
+
+    assert await ResumeService(db_session, storage_service=NullStorage()).delete_resume(resume_id, user_id)
+
+    assert await db_session.scalar(select(func.count()).select_from(LLMResultCacheModel)) == 0
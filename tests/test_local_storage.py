@@ -0,0 +1,137 @@
+import io
+import time
+from urllib.parse import urlsplit
+
+import pytest
+from httpx import AsyncClient
+
+import app.config as config
+from app.services.storage import localStorageService
+from app.services.storage.localStorageService import LocalStorageService, sign_stored_url, verify_signed_url
+from app.services.storage.mediaStorageService import get_media_storage_service
+from app.services.storage.storageService import get_storage_service
+from app.services.storage.storageStreaming import ByteRange, RangeNotSatisfiable
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def storage_root(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(localStorageService, "LOCAL_STORAGE_ROOT", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_objects_are_written_atomically_into_a_sharded_tree(storage_root):
+    service = LocalStorageService(bucket_name="test-bucket")
+
+    result = await service.upload_fileobj(io.BytesIO(CONTENT), "guide.pdf", folder="resources")
+    path = service.local_path(result["file_key"])
+
+    assert result["file_key"] == "resources/guide.pdf"
+    assert path.relative_to(storage_root / "test-bucket").parts[:2] == (path.name[:2], path.name[2:4])
+    assert [p.name for p in path.parent.iterdir()] == [path.name]  # no temp file left behind
+    assert await service.download_file("resources/guide.pdf") == CONTENT
+
+    await service.upload_file(b"v2", "guide.pdf", folder="resources")
+    assert await service.download_file("resources/guide.pdf") == b"v2"
+    assert await service.delete_file("resources/guide.pdf") is True
+    assert await service.delete_file("resources/guide.pdf") is False
+    with pytest.raises(ValueError):
+        service.local_path("resources/../../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_stream_file_serves_ranges_from_disk(storage_root):
+    service = LocalStorageService(bucket_name="test-bucket")
+    await service.upload_file(CONTENT, "guide.pdf", folder="resources")
+
+    stream = await service.stream_file("resources/guide.pdf", ByteRange(1000, None))
+
+    assert stream.path == str(service.local_path("resources/guide.pdf"))
+    assert stream.content_range == "bytes 1000-1023/1024"
+    assert b"".join([chunk async for chunk in stream]) == CONTENT[1000:]
+    with pytest.raises(RangeNotSatisfiable):
+        await service.stream_file("resources/guide.pdf", ByteRange(5000, None))
+
+
+@pytest.mark.asyncio
+async def test_signed_urls_are_served_with_file_response_and_expire(client: AsyncClient, storage_root):
+    service = LocalStorageService(bucket_name="test-bucket")
+    result = await service.upload_file(CONTENT, "resume.pdf")
+    url = urlsplit(sign_stored_url(result["file_url"]))
+    target = f"{url.path}?{url.query}"
+
+    full = await client.get(target)
+    ranged = await client.get(target, headers={"Range": "bytes=10-19"})
+    tampered = await client.get(target.replace("resume.pdf", "other.pdf"))
+
+    assert full.status_code == 200
+    assert full.content == CONTENT
+    assert full.headers["content-type"] == "application/pdf"
+    assert ranged.status_code == 206
+    assert ranged.content == CONTENT[10:20]
+    assert ranged.headers["content-range"] == "bytes 10-19/1024"
+    assert tampered.status_code == 403
+
+    expired = int(time.time()) - 1
+    signature = localStorageService.sign_storage_key("test-bucket", "resumes/resume.pdf", expired)
+    assert not verify_signed_url("test-bucket", "resumes/resume.pdf", expired, signature)
+    response = await client.get(url.path, params={"expires": expired, "signature": signature})
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_uploads_return_a_stable_url_that_is_signed_when_served(client: AsyncClient, storage_root):
+    service = LocalStorageService(bucket_name="test-bucket")
+    result = await service.upload_file(CONTENT, "my resume.pdf")
+
+    assert result["file_url"] == service.object_url("resumes/my resume.pdf")
+    assert "?" not in result["file_url"]
+    assert (await client.get(urlsplit(result["file_url"]).path)).status_code == 422
+
+    # URLs stored with a since-expired signature are signed afresh.
+    legacy = service.file_url("resumes/my resume.pdf", expiration=-60)
+    for stored in (result["file_url"], legacy):
+        url = urlsplit(sign_stored_url(stored))
+        response = await client.get(f"{url.path}?{url.query}")
+        assert response.status_code == 200
+        assert response.content == CONTENT
+    assert sign_stored_url("https://bucket.s3.amazonaws.com/resumes/a.pdf") == "https://bucket.s3.amazonaws.com/resumes/a.pdf"
+
+
+@pytest.mark.asyncio
+async def test_resource_endpoint_uses_file_response_for_local_storage(
+    client: AsyncClient,
+    auth_headers: dict,
+    storage_root,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    service = LocalStorageService(bucket_name="test-bucket")
+    await service.upload_file(CONTENT, "guide.pdf", folder="resources")
+    monkeypatch.setattr(
+        "app.services.resources.resourceService.get_storage_service",
+        lambda bucket_name=None: service,
+    )
+
+    tail = await client.get(
+        "/api/v1/resources/file",
+        params={"key": "resources/guide.pdf"},
+        headers={**auth_headers, "Range": "bytes=-24"},
+    )
+
+    assert tail.status_code == 206
+    assert tail.content == CONTENT[-24:]
+    assert tail.headers["content-range"] == "bytes 1000-1023/1024"
+
+
+def test_backend_is_selected_by_environment(storage_root, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(config, "STORAGE_BACKEND", "local")
+
+    resumes = get_storage_service()
+    media = get_media_storage_service("local")
+
+    assert isinstance(resumes, LocalStorageService)
+    assert isinstance(media.storage_service, LocalStorageService)
+    assert "expires=0" in media.storage_service.public_url("images/photo.png")
+    assert "expires=0" not in resumes.file_url("resumes/resume.pdf")
@@ -0,0 +1,112 @@
+import json
+import os
+
+import pytest
+from httpx import AsyncClient
+
+from app import config, metrics
+from app.metrics import Counter, Gauge, Histogram, MetricsRegistry, format_metrics, merge_snapshots
+
+
+def _worker_snapshot(pid: int, *, requests: int, checked_out: int) -> dict:
+    return {
+        "pid": pid,
+        "metrics": {
+            "demo_requests_total": {"type": "counter", "help": "Requests.", "labels": ["route"], "samples": [[["/a"], requests]]},
+            "demo_checked_out": {"type": "gauge", "help": "Checked out.", "labels": [], "samples": [[[], checked_out]]},
+            "demo_seconds": {
+                "type": "histogram",
+                "help": "Latency.",
+                "labels": [],
+                "buckets": [0.1, 1.0],
+                "samples": [[[], [requests, 0, 0, requests * 0.05]]],
+            },
+        },
+    }
+
+
+def test_worker_snapshots_are_summed_and_dead_workers_drop_their_gauges():
+    merged = merge_snapshots(
+        [_worker_snapshot(101, requests=3, checked_out=2), _worker_snapshot(102, requests=4, checked_out=5)],
+        live_pids={101},
+    )
+    text = format_metrics(merged)
+
+    assert 'demo_requests_total{route="/a"} 7' in text
+    assert "demo_checked_out 2" in text
+    assert 'demo_seconds_bucket{le="0.1"} 7' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 7' in text
+    assert "demo_seconds_count 7" in text
+    assert "# TYPE demo_seconds histogram" in text
+
+
+def test_histogram_buckets_are_cumulative_and_labels_escaped(monkeypatch):
+    registry = MetricsRegistry()
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    latency = Histogram("demo_latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    errors = Counter("demo_errors_total", "Errors.")
+    pool = Gauge("demo_pool", "Pool.")
+    latency.labels('/say"hi"').observe(0.05)
+    latency.labels('/say"hi"').observe(0.5)
+    latency.labels('/say"hi"').observe(3)
+    errors.inc()
+    pool.set(4)
+
+    text = format_metrics(merge_snapshots([registry.snapshot()]))
+
+    assert 'demo_latency_seconds_bucket{route="/say\\"hi\\"",le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{route="/say\\"hi\\"",le="1"} 2' in text
+    assert 'demo_latency_seconds_bucket{route="/say\\"hi\\"",le="+Inf"} 3' in text
+    assert 'demo_latency_seconds_sum{route="/say\\"hi\\""} 3.55' in text
+    assert "demo_errors_total 1" in text
+    assert "demo_pool 4" in text
+
+
+def test_scrape_merges_the_files_of_every_worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_MULTIPROC_DIR", str(tmp_path))
+    metrics.RATE_LIMIT_DECISIONS.labels("demo_rule", "denied").inc()
+    own = metrics.collect_metrics()["rate_limit_decisions_total"]["samples"][("demo_rule", "denied")]
+    # A worker that has exited: its counters still count.
+    exited = {
+        "pid": 2**22 + 7,
+        "metrics": {
+            "rate_limit_decisions_total": {
+                **metrics.RATE_LIMIT_DECISIONS.describe(),
+                "samples": [[["demo_rule", "denied"], 5]],
+            }
+        },
+    }
+    (tmp_path / "exited.json").write_text(json.dumps(exited))
+
+    text = metrics.render_metrics()
+
+    assert (tmp_path / f"{os.getpid()}.json").exists()
+    assert f'rate_limit_decisions_total{{rule="demo_rule",decision="denied"}} {int(own) + 5}' in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_latency(client: AsyncClient, auth_headers: dict):
+    await client.get("/api/v1/posts", headers=auth_headers)
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/posts",status="200"}' in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_requires_the_token_when_configured(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(config, "METRICS_TOKEN", "scrape-secret")
+
+    assert (await client.get("/metrics")).status_code == 404
+    assert (await client.get("/metrics", headers={"Authorization": "Bearer wrong"})).status_code == 404
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_is_hidden_in_production_without_a_token(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(config, "IS_PRODUCTION", True)
+
+    assert (await client.get("/metrics")).status_code == 404
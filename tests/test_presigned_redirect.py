@@ -0,0 +1,126 @@
+import io
+import uuid
+import zipfile
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.config as config
+from app.models.applicationModel import ApplicationModel, ApplicationStatus
+from app.models.jobPostingModel import JobPosting
+from app.models.resumeModel import ResumeModel
+from app.models.userModel import User
+from app.services.resumes.resumeService import ResumeService
+from app.services.storage.presignedUrls import PresignedUrlCache, reset_presigned_url_cache
+from app.services.storage.s3Service import S3Service
+
+
+@pytest.fixture
+def redirect_mode(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(config, "STORAGE_SERVE_MODE", "redirect")
+    reset_presigned_url_cache()
+    yield
+    reset_presigned_url_cache()
+
+
+async def _application_with_resume(db_session: AsyncSession, user: User, company, *, key: str, filename: str):
+    resume = ResumeModel(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        view_url=f"https://example.com/{filename}",
+        storage_file_id=key,
+        original_filename=filename,
+        folder_id="test-bucket",
+    )
+    job_posting = JobPosting(id=uuid.uuid4(), company_id=company.id, title="Backend Developer", description="Role")
+    application = ApplicationModel(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        company_id=company.id,
+        job_posting_id=job_posting.id,
+        resume_id=resume.id,
+        job_title="Backend Developer",
+        status=ApplicationStatus.APPLIED,
+    )
+    db_session.add_all([resume, job_posting, application])
+    await db_session.commit()
+    return application
+
+
+def test_cached_urls_are_refreshed_before_they_expire():
+    cache = PresignedUrlCache(max_entries=2)
+    cache.put(("bucket", "a"), "https://a", ttl_seconds=300, now=0)
+
+    assert cache.get(("bucket", "a"), now=239) == "https://a"
+    assert cache.get(("bucket", "a"), now=240) is None
+
+    for name in ("a", "b", "c"):
+        cache.put(("bucket", name), f"https://{name}", ttl_seconds=300, now=0)
+    assert cache.get(("bucket", "a"), now=1) is None
+    assert cache.get(("bucket", "c"), now=1) == "https://c"
+
+
+@pytest.mark.asyncio
+async def test_resource_file_redirects_to_a_cached_presigned_url(
+    client: AsyncClient,
+    auth_headers: dict,
+    redirect_mode,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    service = S3Service(bucket_name="test-bucket")
+    monkeypatch.setattr(
+        "app.services.resources.resourceService.get_storage_service",
+        lambda bucket_name=None: service,
+    )
+
+    first = await client.get("/api/v1/resources/file", params={"key": "resources/guide.pdf"}, headers=auth_headers)
+    second = await client.get("/api/v1/resources/file", params={"key": "resources/guide.pdf"}, headers=auth_headers)
+
+    assert first.status_code == 307
+    assert first.headers["cache-control"] == "private, no-store"
+    location = urlsplit(first.headers["location"])
+    query = parse_qs(location.query)
+    assert "test-bucket" in location.netloc + location.path
+    assert location.path.endswith("/resources/guide.pdf")
+    assert query["response-content-type"] == ["application/pdf"]
+    assert query["response-content-disposition"] == ['inline; filename="guide.pdf"']
+    assert second.headers["location"] == first.headers["location"]
+
+
+@pytest.mark.asyncio
+async def test_company_resume_download_redirects_but_docx_preview_is_rendered(
+    client: AsyncClient,
+    company_auth_headers: dict,
+    test_user: User,
+    test_company,
+    db_session: AsyncSession,
+    redirect_mode,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    docx_buffer = io.BytesIO()
+    with zipfile.ZipFile(docx_buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            "<w:body><w:p><w:r><w:t>Jane Candidate</w:t></w:r></w:p></w:body></w:document>",
+        )
+
+    async def fake_download(self, file_key: str):
+        return docx_buffer.getvalue()
+
+    monkeypatch.setattr(ResumeService, "download_resume_file", fake_download)
+    application = await _application_with_resume(
+        db_session, test_user, test_company, key="resumes/candidate.docx", filename="candidate_resume.docx"
+    )
+    base = f"/api/v1/companies/me/applications/{application.id}/resume"
+
+    download = await client.get(f"{base}/download", headers=company_auth_headers)
+    preview = await client.get(f"{base}/preview", headers=company_auth_headers)
+
+    assert download.status_code == 307
+    disposition = parse_qs(urlsplit(download.headers["location"]).query)["response-content-disposition"]
+    assert disposition == ['attachment; filename="candidate_resume.docx"']
+    assert preview.status_code == 200
+    assert "Jane Candidate" in preview.text
@@ -0,0 +1,75 @@
+import pytest
+
+from app.services.ratelimit.counterStore import InMemoryCounterStore, LimitCheck
+from app.services.ratelimit.quotaLeaser import QuotaLeaser
+
+
+class CountingStore(InMemoryCounterStore):
+    def __init__(self):
+        super().__init__()
+        self.leases = 0
+
+    async def lease_tokens(self, key, **kwargs):
+        self.leases += 1
+        return await super().lease_tokens(key, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_leases_serve_most_requests_locally_and_hold_the_limit():
+    store = CountingStore()
+    leaser = QuotaLeaser(lambda: store, lease_size=10, lease_ttl_seconds=60)
+    check = LimitCheck("rl:admin_api:1.2.3.4", limit=100, window_seconds=60, kind="gcra")
+
+    admitted = 0
+    for _ in range(150):
+        result = await leaser.acquire(check)
+        admitted += result.allowed
+        await leaser.drain()
+
+    # The burst allowance is 100; leasing never hands out more than the bucket.
+    assert admitted == 100
+    assert store.leases < 40
+    # Refusals are cached until their retry_after, not re-checked each time.
+    assert (await leaser.acquire(check)).retry_after >= 1
+
+
+@pytest.mark.asyncio
+async def test_near_the_limit_leases_shrink_to_single_requests():
+    store = CountingStore()
+    leaser = QuotaLeaser(lambda: store, lease_size=10, lease_ttl_seconds=60)
+    check = LimitCheck("k", limit=4, window_seconds=60, kind="gcra")
+
+    results = [await leaser.acquire(check) for _ in range(5)]
+
+    assert [result.allowed for result in results] == [True, True, True, True, False]
+    assert results[-1].retry_after >= 1
+    # Grants of 2, 1, 1 — then a refused strict check.
+    assert store.leases == 4
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_not_spent():
+    clock = [0.0]
+    store = CountingStore()
+    leaser = QuotaLeaser(lambda: store, lease_size=10, lease_ttl_seconds=2, clock=lambda: clock[0])
+    check = LimitCheck("k", limit=100, window_seconds=60, kind="gcra")
+
+    await leaser.acquire(check)
+    clock[0] = 5
+    await leaser.acquire(check)
+
+    assert store.leases == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_do_not_drop_leased_cells():
+    import asyncio
+
+    store = CountingStore()
+    leaser = QuotaLeaser(lambda: store, lease_size=10, lease_ttl_seconds=60)
+    check = LimitCheck("k", limit=100, window_seconds=60, kind="gcra")
+
+    results = await asyncio.gather(*(leaser.acquire(check) for _ in range(200)))
+    await leaser.drain()
+
+    assert sum(result.allowed for result in results) == 100
@@ -0,0 +1,57 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from starlette.requests import Request
+
+import app.db as db
+from app.services.ratelimit.counterStore import reset_counter_store
+
+
+def _request(method: str = "GET", cookie: str | None = "studentscompass_auth=token-1") -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": method, "path": "/", "headers": headers})
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """Pretend a replica is configured; sessions report which engine they use."""
+
+    def factory(name):
+        @asynccontextmanager
+        async def session():
+            yield name
+
+        return session
+
+    monkeypatch.setattr(db, "read_engine", object())
+    monkeypatch.setattr(db, "async_session", factory("primary"))
+    monkeypatch.setattr(db, "async_read_session", factory("replica"))
+
+
+async def _route(request: Request) -> str:
+    async for session in db.get_read_session(request):
+        return session
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_the_replica_until_the_caller_writes(replica):
+    await reset_counter_store()
+
+    assert await _route(_request()) == "replica"
+
+    await db.mark_recent_write(_request("POST"))
+
+    assert await _route(_request()) == "primary"
+    # Other users are unaffected by this caller's write.
+    assert await _route(_request(cookie="studentscompass_auth=token-2")) == "replica"
+    assert await _route(_request(cookie=None)) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_without_a_replica_reads_use_the_primary():
+    await reset_counter_store()
+    assert not db.has_read_replica()
+
+    async for session in db.get_read_session(_request()):
+        assert session.bind is db.engine
+    assert db.pool_stats()["primary"]["pool"]
@@ -16,3 +16,36 @@ async def test_registration_is_rate_limited_per_ip(client: AsyncClient):
 
     assert 429 in statuses
     assert statuses[-1] == 429
+
+
+@pytest.mark.asyncio
+async def test_matching_rules_are_checked_in_one_store_call():
+    from starlette.requests import Request
+
+    from app.middleware.rate_limit import RequestRateLimiter
+    from app.services.ratelimit.counterStore import InMemoryCounterStore
+
+    class CountingStore(InMemoryCounterStore):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        async def check_limits(self, checks):
+            self.batches.append([check.key for check in checks])
+            return await super().check_limits(checks)
+
+    store = CountingStore()
+    limiter = RequestRateLimiter.from_env()
+    limiter._store_factory = lambda: store
+
+    def request(method, path):
+        return Request({"type": "http", "method": method, "path": path, "headers": [], "client": ("203.0.113.7", 1)})
+
+    assert await limiter.check(request("POST", "/api/v1/auth/register")) == (True, 0)
+    assert await limiter.check(request("GET", "/api/v1/admin/users")) == (True, 0)
+    assert await limiter.check(request("GET", "/api/v1/auth/register")) == (True, 0)
+
+    assert store.batches == [
+        ["rl:auth_register_burst:203.0.113.7", "rl:auth_register_daily:203.0.113.7"],
+        ["rl:admin_api:203.0.113.7"],
+    ]
@@ -2,17 +2,24 @@ import pytest
 import uuid
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.resume_analyzer.resume_feature import ResumeFeatureRequest
 from app.models.jobAnalysisModel import JobAnalysisModel, JobStatus
 from app.models.resumeModel import ResumeModel
 from app.models.userModel import User
-from app.routes.jobRoute import process_cv_analysis
+from app.workers.cvAnalysisWorker import CVAnalysisWorker
+
+
+async def _run_worker(db_session: AsyncSession) -> int:
+    worker = CVAnalysisWorker(async_sessionmaker(db_session.bind, expire_on_commit=False))
+    processed = await worker.run_once()
+    db_session.expire_all()
+    return processed
 
 
 @pytest.mark.asyncio
-async def test_process_cv_analysis_persists_summary_and_resume_phone(
+async def test_worker_persists_summary_and_resume_phone(
     db_session: AsyncSession,
     test_user: User,
     monkeypatch,
@@ -37,7 +44,7 @@ async def test_process_cv_analysis_persists_summary_and_resume_phone(
 
     monkeypatch.setattr("app.services.resumes.resumeService.ResumeService.download_resume_file", fake_download)
     monkeypatch.setattr(
-        "app.services.ai.cvAnalysisService.extract_resume_text_from_bytes",
+        "app.core.resume_analyzer.resume_text_extractor.extract_resume_text_from_bytes",
         fake_extract_resume_text_from_bytes,
     )
     monkeypatch.setattr("app.services.ai.cvAnalysisService.ask_llm_model", fake_ask_llm_model)
@@ -58,14 +65,12 @@ async def test_process_cv_analysis_persists_summary_and_resume_phone(
     )
     db_session.add_all([resume, job])
     await db_session.commit()
+    job_id, resume_id = job.id, resume.id
 
-    async def session_factory():
-        yield db_session
+    assert await _run_worker(db_session) == 1
 
-    await process_cv_analysis(job.id, test_user.id, resume.id, session_factory)
-
-    refreshed_job = await db_session.scalar(select(JobAnalysisModel).where(JobAnalysisModel.id == job.id))
-    refreshed_resume = await db_session.scalar(select(ResumeModel).where(ResumeModel.id == resume.id))
+    refreshed_job = await db_session.scalar(select(JobAnalysisModel).where(JobAnalysisModel.id == job_id))
+    refreshed_resume = await db_session.scalar(select(ResumeModel).where(ResumeModel.id == resume_id))
 
     assert refreshed_job.status == JobStatus.COMPLETED
     assert refreshed_job.keywords == "Python, FastAPI, PostgreSQL"
@@ -75,7 +80,7 @@ async def test_process_cv_analysis_persists_summary_and_resume_phone(
 
 
 @pytest.mark.asyncio
-async def test_process_cv_analysis_reuses_cached_resume_analysis(
+async def test_worker_reuses_cached_resume_analysis(
     db_session: AsyncSession,
     test_user: User,
 ):
@@ -104,14 +109,12 @@ async def test_process_cv_analysis_reuses_cached_resume_analysis(
     )
     db_session.add_all([resume, cached_job, pending_job])
     await db_session.commit()
+    job_id, resume_id = pending_job.id, resume.id
 
-    async def session_factory():
-        yield db_session
-
-    await process_cv_analysis(pending_job.id, test_user.id, resume.id, session_factory)
+    assert await _run_worker(db_session) == 1
 
-    refreshed_job = await db_session.scalar(select(JobAnalysisModel).where(JobAnalysisModel.id == pending_job.id))
-    refreshed_resume = await db_session.scalar(select(ResumeModel).where(ResumeModel.id == resume.id))
+    refreshed_job = await db_session.scalar(select(JobAnalysisModel).where(JobAnalysisModel.id == job_id))
+    refreshed_resume = await db_session.scalar(select(ResumeModel).where(ResumeModel.id == resume_id))
 
     assert refreshed_job.status == JobStatus.COMPLETED
     assert refreshed_job.keywords == "Python, FastAPI"
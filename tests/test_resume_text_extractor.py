@@ -0,0 +1,112 @@
+import asyncio
+import io
+import time
+import zipfile
+
+import fitz
+import pytest
+
+import app.core.resume_analyzer.resume_text_extractor as text_extractor
+from app.core.resume_analyzer.read_pdf_data import extract_text_from_pdf_bytes
+
+
+def _pdf(pages: list[str]) -> bytes:
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _docx(paragraphs: list[str]) -> bytes:
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>",
+        )
+    return buffer.getvalue()
+
+
+def _hang(data: bytes, kind: str) -> str:
+    time.sleep(30)
+    return "never"
+
+
+@pytest.mark.asyncio
+async def test_pdf_and_docx_are_extracted_in_worker_processes():
+    pdf_text = await text_extractor.extract_resume_text_from_bytes(
+        _pdf(["Jane Candidate", "Python developer"]),
+        filename="resume.pdf",
+        content_type="application/pdf",
+    )
+    docx_text = await text_extractor.extract_resume_text_from_bytes(
+        _docx(["Jane Candidate", "FastAPI developer"]),
+        filename="resume.docx",
+        content_type="",
+    )
+
+    assert "Jane Candidate" in pdf_text and "Python developer" in pdf_text
+    assert docx_text == "Jane Candidate\nFastAPI developer"
+    assert await text_extractor.extract_resume_text_from_bytes(b"x", filename="a.txt", content_type="") == ""
+
+
+def test_pdf_page_limit_and_corrupt_input():
+    data = _pdf(["first page", "second page", "third page"])
+
+    text = extract_text_from_pdf_bytes(data, max_pages=2, cpu_seconds=5)
+
+    assert "second page" in text and "third page" not in text
+    assert extract_text_from_pdf_bytes(b"not a pdf", max_pages=2, cpu_seconds=5) == ""
+
+
+def test_oversized_docx_xml_is_refused(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(text_extractor, "MAX_DOCX_XML_BYTES", 100)
+
+    assert text_extractor.extract_text_from_docx_bytes(_docx(["x" * 200]), cpu_seconds=5) == ""
+
+
+def _slow(data: bytes, kind: str) -> str:
+    time.sleep(0.7)
+    return "slow"
+
+
+@pytest.mark.asyncio
+async def test_stuck_document_times_out_without_recycling_the_pool(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(text_extractor, "RESUME_EXTRACTION_TIMEOUT_SECONDS", 1)
+    monkeypatch.setattr(text_extractor, "_extract_text_sync", _hang)
+    pool = text_extractor._get_extraction_pool()
+
+    with pytest.raises(text_extractor.ResumeTextExtractionError):
+        await text_extractor.extract_resume_text_from_bytes(b"%PDF", filename="a.pdf", content_type="")
+
+    monkeypatch.undo()
+    text = await text_extractor.extract_resume_text_from_bytes(
+        _docx(["Recovered"]),
+        filename="resume.docx",
+        content_type="",
+    )
+    assert text == "Recovered"
+    assert text_extractor._extraction_pool is pool
+
+
+@pytest.mark.asyncio
+async def test_time_queued_for_a_worker_does_not_count_toward_the_timeout(monkeypatch: pytest.MonkeyPatch):
+    text_extractor.shutdown_resume_text_extractors()
+    monkeypatch.setattr(text_extractor, "RESUME_EXTRACTION_WORKERS", 1)
+    monkeypatch.setattr(text_extractor, "RESUME_EXTRACTION_TIMEOUT_SECONDS", 1)
+    monkeypatch.setattr(text_extractor, "_extract_text_sync", _slow)
+    try:
+        texts = await asyncio.gather(
+            *(
+                text_extractor.extract_resume_text_from_bytes(b"%PDF", filename=f"{index}.pdf", content_type="")
+                for index in range(3)
+            )
+        )
+    finally:
+        text_extractor.shutdown_resume_text_extractors()
+
+    assert texts == ["slow", "slow", "slow"]
@@ -0,0 +1,115 @@
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.core.resume_analyzer.resume_text_extractor as text_extractor
+import app.services.resumes.resumeService as resume_service_module
+from app.models.resumeTextModel import ResumeTextModel
+from app.models.userModel import User
+from app.services.resumes.resumeService import ResumeService
+from app.services.storage.uploadSpool import SpooledUpload
+
+RESUME_TEXT = "Jordan Lee\nPython FastAPI PostgreSQL engineer with five years of backend experience"
+
+
+class FakeStorage:
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.downloads = 0
+
+    async def upload_file(self, file_bytes: bytes, file_name: str, mime_type: str) -> dict:
+        key = f"resumes/{file_name}"
+        self.files[key] = file_bytes
+        return {"file_key": key, "file_url": f"https://storage.example/{key}"}
+
+    async def download_file(self, file_key: str) -> bytes:
+        self.downloads += 1
+        return self.files[file_key]
+
+    async def delete_file(self, file_key: str) -> None:
+        self.files.pop(file_key, None)
+
+
+@pytest.fixture
+def extractions(monkeypatch: pytest.MonkeyPatch) -> list[bytes]:
+    calls: list[bytes] = []
+
+    async def fake_extract(file_bytes: bytes, *, filename: str, content_type: str):
+        calls.append(file_bytes)
+        return RESUME_TEXT
+
+    monkeypatch.setattr(text_extractor, "extract_resume_text_from_bytes", fake_extract)
+    return calls
+
+
+async def _upload(service: ResumeService, user: User):
+    resume, _ = await service.create_resume_from_upload(
+        user_id=user.id,
+        storage_location_id="test-bucket",
+        upload=SpooledUpload.from_bytes(b"%PDF-1.4 resume"),
+        file_name="resume.pdf",
+        mime_type="application/pdf",
+    )
+    return resume
+
+
+@pytest.mark.asyncio
+async def test_text_is_extracted_once_at_upload_and_served_from_the_store(
+    db_session: AsyncSession,
+    test_user: User,
+    extractions: list[bytes],
+):
+    storage = FakeStorage()
+    service = ResumeService(db_session, storage_service=storage)
+    resume = await _upload(service, test_user)
+
+    for _ in range(3):
+        assert await service.get_resume_text(resume.storage_file_id, filename="resume.pdf") == RESUME_TEXT
+
+    assert len(extractions) == 1
+    assert storage.downloads == 0
+    stored = await db_session.get(ResumeTextModel, resume.storage_file_id)
+    assert stored.text_length == len(RESUME_TEXT)
+    assert RESUME_TEXT.encode("utf-8") not in stored.compressed_text
+
+
+@pytest.mark.asyncio
+async def test_missing_or_outdated_text_is_extracted_from_storage(
+    db_session: AsyncSession,
+    test_user: User,
+    extractions: list[bytes],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    storage = FakeStorage()
+    storage.files["resumes/legacy.pdf"] = b"%PDF-1.4 legacy"
+    service = ResumeService(db_session, storage_service=storage)
+
+    # Uploaded before the store existed: parsed on first read only.
+    assert await service.get_resume_text("resumes/legacy.pdf", filename="legacy.pdf") == RESUME_TEXT
+    assert await service.get_resume_text("resumes/legacy.pdf", filename="legacy.pdf") == RESUME_TEXT
+    assert (storage.downloads, len(extractions)) == (1, 1)
+
+    monkeypatch.setattr(
+        resume_service_module,
+        "RESUME_TEXT_EXTRACTOR_VERSION",
+        resume_service_module.RESUME_TEXT_EXTRACTOR_VERSION + "-next",
+    )
+    assert await service.get_resume_text("resumes/legacy.pdf", filename="legacy.pdf") == RESUME_TEXT
+    assert (storage.downloads, len(extractions)) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_resume_drops_its_stored_text(
+    db_session: AsyncSession,
+    test_user: User,
+    extractions: list[bytes],
+):
+    service = ResumeService(db_session, storage_service=FakeStorage())
+    resume = await _upload(service, test_user)
+
+    assert await service.delete_resume(resume.id, test_user.id)
+
+    assert await db_session.scalar(select(func.count()).select_from(ResumeTextModel)) == 0
+    assert await service.delete_resume(uuid.uuid4(), test_user.id) is False
@@ -0,0 +1,58 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.middleware.sql_instrumentation import (
+    QueryStats,
+    reset_sql_route_metrics,
+    sql_route_metrics,
+    statement_shape,
+    track_queries,
+)
+
+
+def test_statement_shape_collapses_parameters_and_in_lists():
+    first = statement_shape("SELECT *\n  FROM posts WHERE id IN (?, ?, ?) AND score > 10 LIMIT 50")
+    second = statement_shape("SELECT * FROM posts WHERE id IN (?) AND score > 3 LIMIT 20")
+
+    assert first == second == "SELECT * FROM posts WHERE id IN (?) AND score > ? LIMIT ?"
+
+
+def test_repeated_shapes_are_reported_as_likely_n_plus_one():
+    stats = QueryStats()
+    stats.record("SELECT * FROM users", 0.002)
+    for author_id in range(6):
+        stats.record(f"SELECT * FROM profiles WHERE user_id = {author_id}", 0.001)
+
+    assert stats.count == 7
+    assert stats.repeated_shapes(5) == [("SELECT * FROM profiles WHERE user_id = ?", 6)]
+    assert stats.slowest[0] == (0.002, "SELECT * FROM users")
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(3)
+async def test_requests_report_server_timing_and_route_metrics(client: AsyncClient, auth_headers: dict):
+    reset_sql_route_metrics()
+
+    response = await client.get("/api/v1/posts", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    metrics = sql_route_metrics()["GET /api/v1/posts"]
+    assert metrics.requests == 1
+    assert 1 <= metrics.queries <= 3
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_leave_no_timing_state_on_the_connection(db_session):
+    connection = await db_session.connection()
+
+    with track_queries() as stats:
+        with pytest.raises(OperationalError):
+            await connection.execute(text("SELECT * FROM no_such_table"))
+        await connection.execute(text("SELECT 1"))
+
+    assert stats.count == 1
+    assert stats.shapes == {"SELECT ?": 1}
+    assert not any("started" in str(key) for key in connection.info)
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from app.services.storage import storageCache
+from app.services.storage.s3Service import S3Service
+from app.services.storage.storageCache import CachedStorageService, DiskLRUCache, reset_storage_cache
+from app.services.storage.storageService import get_storage_service
+from app.services.storage.storageStreaming import ByteRange
+
+
+class FakeBackend:
+    """Byte-only backend that counts how often objects are fetched."""
+
+    bucket_name = "test-bucket"
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.downloads = 0
+
+    async def upload_file(self, file_bytes: bytes, file_name: str, content_type: str = "", folder: str = "resources"):
+        key = f"{folder}/{file_name}"
+        self.files[key] = file_bytes
+        return {"file_key": key, "file_url": f"https://storage.example/{key}"}
+
+    async def download_file(self, file_key: str) -> bytes:
+        self.downloads += 1
+        return self.files[file_key]
+
+    async def delete_file(self, file_key: str) -> bool:
+        return self.files.pop(file_key, None) is not None
+
+
+def _cached(tmp_path, backend=None, *, max_bytes=1000, max_object_bytes=1000):
+    cache = DiskLRUCache(tmp_path, max_bytes=max_bytes, max_object_bytes=max_object_bytes)
+    return CachedStorageService(backend or FakeBackend(), cache)
+
+
+@pytest.mark.asyncio
+async def test_reads_go_through_the_cache_and_writes_invalidate_it(tmp_path):
+    service = _cached(tmp_path)
+    backend = service.storage_service
+    await service.upload_file(b"guide v1", "guide.pdf")
+
+    for _ in range(3):
+        assert await service.download_file("resources/guide.pdf") == b"guide v1"
+    assert backend.downloads == 1
+    assert (service.cache.stats.hits, service.cache.stats.misses) == (2, 1)
+
+    await service.upload_file(b"guide v2", "guide.pdf")
+    assert await service.download_file("resources/guide.pdf") == b"guide v2"
+    assert backend.downloads == 2
+
+    await service.delete_file("resources/guide.pdf")
+    assert service.cache.stats.entries == 0
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+@pytest.mark.asyncio
+async def test_streams_are_served_from_cached_files_with_ranges(tmp_path):
+    service = _cached(tmp_path)
+    await service.upload_file(bytes(range(100)), "guide.pdf")
+
+    first = await service.stream_file("resources/guide.pdf", ByteRange(90, None))
+    second = await service.stream_file("resources/guide.pdf")
+
+    assert b"".join([chunk async for chunk in first]) == bytes(range(90, 100))
+    assert first.content_range == "bytes 90-99/100"
+    assert second.path == first.path and second.path.startswith(str(tmp_path))
+    assert service.storage_service.downloads == 1
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_objects_are_evicted_over_budget(tmp_path):
+    service = _cached(tmp_path, max_bytes=250, max_object_bytes=200)
+    for name in ("a", "b", "c"):
+        await service.upload_file(name.encode() * 100, name)
+    await service.download_file("resources/a")
+    await service.download_file("resources/b")
+    await service.download_file("resources/a")  # b is now least recently used
+    await service.download_file("resources/c")
+    await service.upload_file(b"x" * 300, "big")
+    await service.download_file("resources/big")  # over the per-object cap
+
+    stats = service.cache.stats
+    assert (stats.entries, stats.bytes, stats.evictions) == (2, 200, 1)
+    assert service.cache.lookup("test-bucket", "resources/b", count=False) is None
+    assert service.cache.lookup("test-bucket", "resources/a", count=False) is not None
+
+    # A restarted process keeps the surviving entries.
+    reloaded = DiskLRUCache(tmp_path, max_bytes=250, max_object_bytes=200)
+    assert (reloaded.stats.entries, reloaded.stats.bytes) == (2, 200)
+
+
+def test_get_storage_service_wraps_s3_when_the_cache_is_configured(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(storageCache, "STORAGE_CACHE_DIR", str(tmp_path))
+    reset_storage_cache()
+    try:
+        service = get_storage_service(bucket_name="test-bucket")
+        assert isinstance(service, CachedStorageService)
+        assert isinstance(service.storage_service, S3Service)
+        assert service.cache is get_storage_service(bucket_name="other").cache
+    finally:
+        reset_storage_cache()
+
+
+@pytest.mark.asyncio
+async def test_a_file_evicted_by_another_worker_is_refilled(tmp_path):
+    service = _cached(tmp_path)
+    await service.upload_file(b"guide v1", "guide.pdf")
+    first = await service.stream_file("resources/guide.pdf")
+    other_worker = DiskLRUCache(tmp_path, max_bytes=1000, max_object_bytes=1000)
+    await other_worker.invalidate("test-bucket", "resources/guide.pdf")
+
+    second = await service.stream_file("resources/guide.pdf")
+
+    assert b"".join([chunk async for chunk in second]) == b"guide v1"
+    assert second.path == first.path
+    assert service.storage_service.downloads == 2
+    assert not [path for path in tmp_path.rglob(".fill-*")]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_fetch_the_object_once(tmp_path):
+    service = _cached(tmp_path)
+    await service.upload_file(b"guide", "guide.pdf")
+
+    streams = await asyncio.gather(*[service.stream_file("resources/guide.pdf") for _ in range(5)])
+
+    assert {stream.path for stream in streams} == {streams[0].path}
+    assert service.storage_service.downloads == 1
+    assert service.cache._fills == {}
@@ -0,0 +1,136 @@
+import io
+
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+from httpx import AsyncClient
+
+from app.services.storage import s3Service
+from app.services.storage.s3Service import S3Service, shutdown_storage_io
+from app.services.storage.storageStreaming import (
+    ByteRange,
+    RangeNotSatisfiable,
+    StorageStream,
+    parse_range_header,
+)
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def stubbed_s3(monkeypatch: pytest.MonkeyPatch):
+    """A real S3Service whose client is answered locally by botocore's Stubber."""
+    monkeypatch.setattr(s3Service, "STORAGE_STREAM_CHUNK_BYTES", 100)
+    shutdown_storage_io()
+    service = S3Service(bucket_name="test-bucket")
+    with Stubber(service.s3_client) as stubber:
+        yield service, stubber
+    shutdown_storage_io()
+
+
+def _get_object(stubber: Stubber, key: str, data: bytes, *, byte_range: str | None = None, content_range=None):
+    expected = {"Bucket": "test-bucket", "Key": key}
+    if byte_range:
+        expected["Range"] = byte_range
+    response = {
+        "Body": StreamingBody(io.BytesIO(data), len(data)),
+        "ContentLength": len(data),
+        "ContentType": "application/pdf",
+    }
+    if content_range:
+        response["ContentRange"] = content_range
+    stubber.add_response("get_object", response, expected)
+
+
+def test_parse_range_header():
+    assert parse_range_header("bytes=0-99") == ByteRange(0, 99)
+    assert parse_range_header("bytes=100-") == ByteRange(100, None)
+    assert parse_range_header("bytes=-500") == ByteRange(None, 500)
+    # Unsupported or malformed: serve the whole object.
+    assert parse_range_header("bytes=0-1,5-9") is None
+    assert parse_range_header("items=0-1") is None
+    assert parse_range_header("bytes=9-1") is None
+    assert parse_range_header(None) is None
+
+    assert ByteRange(None, 10).resolve(100) == (90, 99)
+    with pytest.raises(RangeNotSatisfiable):
+        ByteRange(100, None).resolve(100)
+
+
+@pytest.mark.asyncio
+async def test_stream_file_reads_the_body_in_bounded_chunks(stubbed_s3):
+    service, stubber = stubbed_s3
+    _get_object(stubber, "resources/guide.pdf", CONTENT)
+
+    stream = await service.stream_file("resources/guide.pdf")
+    chunks = [chunk async for chunk in stream]
+
+    assert b"".join(chunks) == CONTENT
+    assert max(len(chunk) for chunk in chunks) == 100
+    assert (stream.content_length, stream.total_size, stream.partial) == (len(CONTENT), len(CONTENT), False)
+
+
+@pytest.mark.asyncio
+async def test_stream_file_forwards_ranges_and_maps_invalid_ones(stubbed_s3):
+    service, stubber = stubbed_s3
+    _get_object(
+        stubber,
+        "resources/guide.pdf",
+        CONTENT[10:20],
+        byte_range="bytes=10-19",
+        content_range=f"bytes 10-19/{len(CONTENT)}",
+    )
+    stubber.add_client_error("get_object", service_error_code="InvalidRange", http_status_code=416)
+
+    stream = await service.stream_file("resources/guide.pdf", ByteRange(10, 19))
+    assert b"".join([chunk async for chunk in stream]) == CONTENT[10:20]
+    assert stream.total_size == len(CONTENT)
+    assert stream.content_range == f"bytes 10-19/{len(CONTENT)}"
+
+    with pytest.raises(RangeNotSatisfiable):
+        await service.stream_file("resources/guide.pdf", ByteRange(5000, None))
+
+
+@pytest.mark.asyncio
+async def test_resource_file_endpoint_streams_ranges_end_to_end(
+    client: AsyncClient,
+    auth_headers: dict,
+    stubbed_s3,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    service, stubber = stubbed_s3
+    monkeypatch.setattr(
+        "app.services.resources.resourceService.get_storage_service",
+        lambda bucket_name=None: service,
+    )
+    _get_object(stubber, "resources/guide.pdf", CONTENT)
+    _get_object(
+        stubber,
+        "resources/guide.pdf",
+        CONTENT[-24:],
+        byte_range="bytes=-24",
+        content_range=f"bytes 1000-1023/{len(CONTENT)}",
+    )
+
+    full = await client.get("/api/v1/resources/file", params={"key": "resources/guide.pdf"}, headers=auth_headers)
+    tail = await client.get(
+        "/api/v1/resources/file",
+        params={"key": "resources/guide.pdf"},
+        headers={**auth_headers, "Range": "bytes=-24"},
+    )
+
+    assert full.status_code == 200
+    assert full.content == CONTENT
+    assert full.headers["content-length"] == str(len(CONTENT))
+    assert full.headers["accept-ranges"] == "bytes"
+    assert tail.status_code == 206
+    assert tail.content == CONTENT[-24:]
+    assert tail.headers["content-range"] == "bytes 1000-1023/1024"
+
+
+@pytest.mark.asyncio
+async def test_byte_backends_are_adapted_with_local_ranges():
+    stream = StorageStream.from_bytes(CONTENT, ByteRange(1020, None))
+
+    assert b"".join([chunk async for chunk in stream]) == CONTENT[1020:]
+    assert stream.content_range == "bytes 1020-1023/1024"
@@ -0,0 +1,98 @@
+import io
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.core.resume_analyzer.resume_text_extractor as text_extractor
+import app.services.storage.uploadSpool as upload_spool
+from app.models.resumeModel import ResumeModel
+from app.models.userModel import User
+from app.services.resumes.resumeService import ResumeService
+from app.services.storage.uploadSpool import SpooledUpload, UploadTooLarge, spool_upload
+
+
+class StreamingStorage:
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.deleted: list[str] = []
+
+    async def upload_file(self, *args, **kwargs) -> dict:
+        raise AssertionError("resume uploads must use the streaming path")
+
+    async def upload_fileobj(self, fileobj, file_name: str, content_type: str = "", folder: str = "resumes") -> dict:
+        key = f"{folder}/{file_name}"
+        self.objects[key] = fileobj.read()
+        return {"file_key": key, "file_url": f"https://storage.example/{key}"}
+
+    async def download_file(self, file_key: str) -> bytes:
+        return self.objects[file_key]
+
+    async def delete_file(self, file_key: str) -> bool:
+        self.deleted.append(file_key)
+        return True
+
+
+@pytest.fixture(autouse=True)
+def fake_extract(monkeypatch: pytest.MonkeyPatch):
+    async def extract(file_bytes: bytes, *, filename: str, content_type: str):
+        return "Python developer"
+
+    monkeypatch.setattr(text_extractor, "extract_resume_text_from_bytes", extract)
+
+
+@pytest.mark.asyncio
+async def test_spool_hashes_in_chunks_and_rolls_over_to_disk(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(upload_spool, "UPLOAD_SPOOL_MEMORY_BYTES", 1024)
+    data = bytes(range(256)) * 20
+
+    upload = await spool_upload(UploadFile(io.BytesIO(data)), max_bytes=len(data), chunk_size=100)
+
+    assert upload.size == len(data)
+    assert upload.sha256 == SpooledUpload.from_bytes(data).sha256
+    assert upload.file._rolled  # past the threshold the spool lives on disk
+    assert upload.read_bytes() == data
+    upload.close()
+
+
+@pytest.mark.asyncio
+async def test_spool_stops_reading_once_the_cap_is_crossed():
+    source = io.BytesIO(b"x" * 10_000)
+
+    with pytest.raises(UploadTooLarge):
+        await spool_upload(UploadFile(source), max_bytes=1_000, chunk_size=256)
+
+    assert source.tell() < 2_000
+
+
+@pytest.mark.asyncio
+async def test_identical_reupload_reuses_the_stored_object(db_session: AsyncSession, test_user: User):
+    storage = StreamingStorage()
+    service = ResumeService(db_session, storage_service=storage)
+
+    async def upload(data: bytes, name: str) -> ResumeModel:
+        resume, _ = await service.create_resume_from_upload(
+            user_id=test_user.id,
+            storage_location_id="test-bucket",
+            upload=SpooledUpload.from_bytes(data),
+            file_name=name,
+            mime_type="application/pdf",
+        )
+        return resume
+
+    first = await upload(b"%PDF-1.4 same", "resume.pdf")
+    second = await upload(b"%PDF-1.4 same", "resume-copy.pdf")
+    third = await upload(b"%PDF-1.4 different", "resume.pdf")
+
+    assert second.storage_file_id == first.storage_file_id
+    assert third.storage_file_id != first.storage_file_id
+    assert len(storage.objects) == 2
+
+    # The shared object survives until its last resume is deleted.
+    assert await service.delete_resume(first.id, test_user.id)
+    assert storage.deleted == []
+    assert await service.get_resume_text(second.storage_file_id, filename="resume-copy.pdf") == "Python developer"
+    assert await service.delete_resume(second.id, test_user.id)
+    assert storage.deleted == [second.storage_file_id]
+    assert await db_session.scalar(select(func.count()).select_from(ResumeModel)) == 1